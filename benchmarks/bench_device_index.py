@@ -0,0 +1,99 @@
+"""
+Benchmark device entity discovery.
+
+Compares the registry scan previously used to find the entities of one
+device (link monitoring, mirrored sensor and fertiliser discovery) with the
+device index of the shared ``EntityRegistryIndex`` on a 20k-entity registry
+with 2,000 devices of ten entities each.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_device_index
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from benchmarks.common import (
+    FakeHass,
+    FakeRegistryEntry,
+    build_registry,
+    print_table,
+    time_call,
+)
+from custom_components.plant_assistant.entity_index import EntityRegistryIndex
+
+REGISTRY_SIZE = 20_000
+ENTITIES_PER_DEVICE = 10
+LOOKUPS = 200
+DOMAINS = ("sensor", "binary_sensor", "switch", "number")
+
+
+def _build_device_registry() -> Any:
+    """Build a registry where every entity belongs to a device."""
+    registry = build_registry(0)
+    for i in range(REGISTRY_SIZE):
+        domain = DOMAINS[i % len(DOMAINS)]
+        registry.add(
+            FakeRegistryEntry(
+                entity_id=f"{domain}.device_entity_{i}",
+                unique_id=f"device_unique_{i}",
+                platform="other",
+                device_id=f"device_{i // ENTITIES_PER_DEVICE}",
+            )
+        )
+    return registry
+
+
+def _scan(registry: Any, device_id: str, domain: str | None) -> list[Any]:
+    """Find a device's entities the way the registry scans used to."""
+    return [
+        entry
+        for entry in registry.entities.values()
+        if entry.device_id == device_id and (domain is None or entry.domain == domain)
+    ]
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    registry = _build_device_registry()
+    device_count = REGISTRY_SIZE // ENTITIES_PER_DEVICE
+    step = max(1, device_count // LOOKUPS)
+    device_ids = [f"device_{i}" for i in range(0, device_count, step)][:LOOKUPS]
+
+    index = EntityRegistryIndex(FakeHass(), registry)
+    build_time = time_call(index.async_setup, repeat=3)
+
+    rows = []
+    for domain in (None, "sensor"):
+
+        def scan_all(domain: str | None = domain) -> None:
+            for device_id in device_ids:
+                _scan(registry, device_id, domain)
+
+        def lookup_all(domain: str | None = domain) -> None:
+            for device_id in device_ids:
+                index.async_get_device_entries(device_id, domain)
+
+        scan_time = time_call(scan_all, repeat=3)
+        lookup_time = time_call(lookup_all)
+        rows.append(
+            [
+                domain or "all",
+                f"{scan_time / len(device_ids) * 1e6:.1f}",
+                f"{lookup_time / len(device_ids) * 1e6:.3f}",
+                f"{scan_time / lookup_time:.0f}x",
+            ]
+        )
+
+    print_table(
+        f"Device entity discovery, {REGISTRY_SIZE:,} entities "
+        f"(index build {build_time * 1e3:.1f} ms)",
+        ["domain", "scan us/device", "index us/device", "speedup"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark unique_id -> entity_id resolution.
+
+Compares the linear registry scan previously used by ``_resolve_entity_id``
+with the shared ``EntityRegistryIndex`` for registries of 1k, 10k and 50k
+entries.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_entity_index
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from benchmarks.common import (
+    FakeHass,
+    build_registry,
+    print_table,
+    time_call,
+)
+from custom_components.plant_assistant.entity_index import EntityRegistryIndex
+
+SIZES = (1_000, 10_000, 50_000)
+LOOKUPS = 200
+
+
+def _linear_scan(registry: Any, unique_id: str) -> str | None:
+    """Resolve a unique_id the way the registry scan used to."""
+    for entity_entry in registry.entities.values():
+        if entity_entry.unique_id == unique_id:
+            return entity_entry.entity_id
+    return None
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    rows = []
+    for size in SIZES:
+        registry = build_registry(size)
+        # Spread lookups across the registry; later entries are worst case
+        # for the linear scan.
+        step = max(1, size // LOOKUPS)
+        unique_ids = [f"other_unique_{i}" for i in range(0, size, step)][:LOOKUPS]
+
+        def scan_all(
+            registry: Any = registry, unique_ids: list[str] = unique_ids
+        ) -> None:
+            for unique_id in unique_ids:
+                _linear_scan(registry, unique_id)
+
+        hass = FakeHass()
+        index = EntityRegistryIndex(hass, registry)
+
+        build_time = time_call(index.async_setup, repeat=3)
+
+        def lookup_all(
+            index: EntityRegistryIndex = index, unique_ids: list[str] = unique_ids
+        ) -> None:
+            for unique_id in unique_ids:
+                index.async_get_entity_id(unique_id)
+
+        scan_time = time_call(scan_all, repeat=3)
+        lookup_time = time_call(lookup_all)
+
+        rows.append(
+            [
+                f"{size:,}",
+                f"{scan_time / len(unique_ids) * 1e6:.1f}",
+                f"{build_time * 1e3:.2f}",
+                f"{lookup_time / len(unique_ids) * 1e6:.3f}",
+            ]
+        )
+
+    print_table(
+        "unique_id resolution",
+        ["entries", "scan us/lookup", "index build ms", "index us/lookup"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
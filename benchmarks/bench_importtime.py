@@ -0,0 +1,149 @@
+"""
+Benchmark the cold import of the entity platforms with ``-X importtime``.
+
+Each scenario imports, in a fresh interpreter, the Home Assistant modules that
+are already loaded when the integration's platforms are set up, followed by
+the integration modules under test. The ``-X importtime`` report of the
+latter is parsed to get:
+
+- ``import``: the cumulative import time of the integration modules, i.e.
+  everything they load that Home Assistant had not loaded yet,
+- ``modules``: how many modules that is,
+- the heavy Home Assistant dependencies pulled in on the way.
+
+The scenarios start from the ``sensor`` and ``binary_sensor`` platforms alone
+(no irrigation zones, no illuminance sensors) and add the submodules that are
+only imported when a location needs them. The minimum over several runs is
+reported, as the interpreters compete with nothing else but the disk cache.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_importtime
+    python -m benchmarks.bench_importtime --runs 10 --with-recorder
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import subprocess
+import sys
+
+from benchmarks.common import ROOT, print_table
+
+PACKAGE = "custom_components.plant_assistant"
+# Loaded by Home Assistant before it forwards the entry to the platforms
+PRELOADED = (
+    "homeassistant.config_entries",
+    "homeassistant.components.sensor",
+    "homeassistant.components.binary_sensor",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.restore_state",
+)
+# Loaded as well on installs with ``default_config``
+RECORDER = "homeassistant.components.recorder"
+HEAVY_DEPENDENCIES = (
+    "homeassistant.components.integration.sensor",
+    "homeassistant.components.utility_meter.sensor",
+    RECORDER,
+)
+PLATFORMS = (f"{PACKAGE}.sensor", f"{PACKAGE}.binary_sensor")
+SCENARIOS: dict[str, tuple[str, ...]] = {
+    "platforms": PLATFORMS,
+    "+ zones": (
+        *PLATFORMS,
+        f"{PACKAGE}.sensor_zone",
+        f"{PACKAGE}.binary_sensor_zone",
+    ),
+    "+ zones, light, statistics": (
+        *PLATFORMS,
+        f"{PACKAGE}.sensor_zone",
+        f"{PACKAGE}.binary_sensor_zone",
+        f"{PACKAGE}.sensor_dli",
+        f"{PACKAGE}.sensor_statistics",
+    ),
+}
+MARKER = "plant-assistant-importtime-marker"
+_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def measure(modules: tuple[str, ...], *, with_recorder: bool) -> tuple[int, set[str]]:
+    """
+    Return the import time in microseconds and the modules loaded by ``modules``.
+
+    Only what is imported after the preloaded Home Assistant modules counts.
+    """
+    preloaded = (*PRELOADED, RECORDER) if with_recorder else PRELOADED
+    code = "\n".join(
+        (
+            *(f"import {module}" for module in preloaded),
+            "import sys",
+            f"print({MARKER!r}, file=sys.stderr, flush=True)",
+            *(f"import {module}" for module in modules),
+        )
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    _, _, report = result.stderr.partition(MARKER)
+
+    total = 0
+    loaded = set()
+    for line in report.splitlines():
+        match = _LINE.match(line)
+        if match is None:
+            continue
+        _, cumulative, indent, name = match.groups()
+        loaded.add(name)
+        # Nested imports are included in their top-level import's cumulative
+        if not indent:
+            total += int(cumulative)
+    return total, loaded
+
+
+def main() -> None:
+    """Run the import time benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--with-recorder",
+        action="store_true",
+        help="preload the recorder, as on installs with default_config",
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for scenario, modules in SCENARIOS.items():
+        timings = []
+        loaded: set[str] = set()
+        for _ in range(args.runs):
+            total, loaded = measure(modules, with_recorder=args.with_recorder)
+            timings.append(total)
+        heavy = [
+            dependency.removeprefix("homeassistant.components.")
+            for dependency in HEAVY_DEPENDENCIES
+            if dependency in loaded
+        ]
+        rows.append(
+            [
+                scenario,
+                f"{min(timings) / 1e3:.1f} ms",
+                len(loaded),
+                ", ".join(heavy) or "-",
+            ]
+        )
+
+    preloaded = "with recorder preloaded" if args.with_recorder else "without recorder"
+    print_table(
+        f"Cold import of the platforms, {preloaded} (min of {args.runs} runs)",
+        ["scenario", "import", "modules", "heavy dependencies"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
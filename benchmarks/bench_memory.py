@@ -0,0 +1,179 @@
+"""
+Benchmark the memory an install retains once every platform is set up.
+
+Builds synthetic installs of 10, 100 and 500 locations with
+``benchmarks.bench_startup`` and traces, with ``tracemalloc``, every
+allocation made while the platforms are set up. A one-location install is
+started untraced first, so the modules the platforms import lazily are
+loaded before measuring. The install's own fakes and the event loop are
+created before tracing starts, so only what the integration keeps alive is
+counted. Reported per install size:
+
+- ``entities``: entities created by the platforms,
+- ``retained KiB``: memory still allocated once setup has finished and the
+  garbage collector has run,
+- ``bytes/location`` and ``bytes/entity``: the retained memory spread over
+  the install's locations and entities,
+- ``marginal bytes/location``: the retained memory added per location since
+  the previous, smaller install, free of any fixed cost left in the totals,
+- ``peak KiB``: the highest traced memory during setup.
+
+With ``--top`` the integration's source lines holding the most retained
+memory in the largest install are listed as well.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --zones 20 --locations 10 --top 15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import gc
+import logging
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from benchmarks.bench_startup import (
+    DEFAULT_SLOTS,
+    Counters,
+    Install,
+    async_run_startup,
+    build_install,
+)
+from benchmarks.common import print_table
+
+# (zones, locations per zone) giving 10, 100 and 500 locations
+SCENARIOS = ((2, 5), (10, 10), (50, 10))
+INTEGRATION_PATH = str(
+    Path(__file__).resolve().parent.parent / "custom_components" / "plant_assistant"
+)
+
+
+@dataclass
+class MemoryResult:
+    """Memory retained by one install after startup."""
+
+    locations: int
+    entities: int = 0
+    retained_bytes: int = 0
+    peak_bytes: int = 0
+    # (source line, bytes retained) of the integration's largest allocations
+    top_lines: list[tuple[str, int]] = field(default_factory=list)
+
+
+def _top_lines(snapshot: tracemalloc.Snapshot, count: int) -> list[tuple[str, int]]:
+    """Return the integration's ``count`` source lines retaining the most."""
+    snapshot = snapshot.filter_traces(
+        (tracemalloc.Filter(inclusive=True, filename_pattern=f"{INTEGRATION_PATH}/*"),)
+    )
+    return [
+        (
+            f"{Path(stat.traceback[0].filename).name}:{stat.traceback[0].lineno}",
+            stat.size,
+        )
+        for stat in snapshot.statistics("lineno")[:count]
+    ]
+
+
+@functools.cache
+def _warm_up(slots: int) -> None:
+    """Start a one-location install untraced to import the lazy modules."""
+    asyncio.run(async_run_startup(build_install(1, 1, slots)))
+
+
+def run_memory(
+    zones: int, locations_per_zone: int, slots: int = DEFAULT_SLOTS, top: int = 0
+) -> MemoryResult:
+    """Start an install under ``tracemalloc`` and measure what it retains."""
+    _warm_up(slots)
+    install = build_install(zones, locations_per_zone, slots)
+    result = MemoryResult(locations=zones * locations_per_zone)
+
+    async def _after_setup(install: Install, _counters: Counters) -> None:
+        gc.collect()
+        result.entities = len(install.entities)
+        result.retained_bytes, result.peak_bytes = tracemalloc.get_traced_memory()
+        if top:
+            result.top_lines = _top_lines(tracemalloc.take_snapshot(), top)
+
+    async def _traced() -> None:
+        # Traced from inside the loop so the loop itself is not counted
+        gc.collect()
+        tracemalloc.start()
+        await async_run_startup(install, after_setup=_after_setup)
+
+    try:
+        asyncio.run(_traced())
+    finally:
+        tracemalloc.stop()
+    return result
+
+
+def _marginal(result: MemoryResult, previous: MemoryResult | None) -> str:
+    """Return the bytes retained per location added since ``previous``."""
+    if previous is None or result.locations == previous.locations:
+        return "-"
+    added = result.retained_bytes - previous.retained_bytes
+    return f"{added / (result.locations - previous.locations):,.0f}"
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--zones", type=int)
+    parser.add_argument("--locations", type=int, help="locations per zone")
+    parser.add_argument("--slots", type=int, default=DEFAULT_SLOTS)
+    parser.add_argument(
+        "--top", type=int, default=0, help="list the N largest source lines"
+    )
+    args = parser.parse_args()
+    logging.getLogger("custom_components.plant_assistant").setLevel(logging.ERROR)
+
+    scenarios = SCENARIOS
+    if args.zones or args.locations:
+        scenarios = ((args.zones or 1, args.locations or 1),)
+
+    results = [
+        run_memory(zones, locations_per_zone, args.slots, args.top)
+        for zones, locations_per_zone in scenarios
+    ]
+    print_table(
+        f"Retained memory after startup ({args.slots} slots per location)",
+        [
+            "locations",
+            "entities",
+            "retained KiB",
+            "bytes/location",
+            "bytes/entity",
+            "marginal bytes/location",
+            "peak KiB",
+        ],
+        [
+            [
+                result.locations,
+                result.entities,
+                f"{result.retained_bytes / 1024:,.0f}",
+                f"{result.retained_bytes / result.locations:,.0f}",
+                f"{result.retained_bytes / max(result.entities, 1):,.0f}",
+                _marginal(result, previous),
+                f"{result.peak_bytes / 1024:,.0f}",
+            ]
+            for previous, result in zip([None, *results], results, strict=False)
+        ],
+    )
+    if args.top:
+        largest = results[-1]
+        print_table(
+            f"Largest retained allocations: {largest.locations} locations",
+            ["source line", "KiB"],
+            [[line, f"{size / 1024:,.1f}"] for line, size in largest.top_lines],
+        )
+
+
+if __name__ == "__main__":
+    main()
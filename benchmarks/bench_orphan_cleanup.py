@@ -0,0 +1,163 @@
+"""
+Benchmark the orphaned entity cleanup pass.
+
+Compares the per-platform registry scans previously run by the sensor and
+datetime platforms, which re-derived their unique_id suffixes for every
+registry entry, with the single integration-level pass using the precompiled
+``ORPHAN_MATCHER``. The registry holds 50 locations of this integration, five
+of which are orphaned, next to 10k entries of other integrations.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_orphan_cleanup
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from benchmarks.common import (
+    FakeRegistryEntry,
+    build_registry,
+    print_table,
+    time_call,
+)
+from custom_components.plant_assistant.const import (
+    AGGREGATED_SENSOR_MAPPINGS,
+    DOMAIN,
+    MONITORING_SENSOR_MAPPINGS,
+)
+from custom_components.plant_assistant.orphan_cleanup import (
+    IGNORE_UNTIL_ROLES,
+    THRESHOLD_SENSOR_ROLES,
+    find_orphaned_entities,
+)
+
+LOCATIONS = 50
+ORPHANED_LOCATIONS = 5
+OTHER_ENTITIES = 10_000
+ENTRY_ID = "main_entry"
+
+
+def _build() -> tuple[Any, set[str]]:
+    """Build the registry and the unique_ids the configuration expects."""
+    registry = build_registry(OTHER_ENTITIES)
+    expected: set[str] = set()
+    sensor_roles = [
+        *(m["suffix"] for m in MONITORING_SENSOR_MAPPINGS.values()),
+        *(m["suffix"] for m in AGGREGATED_SENSOR_MAPPINGS.values()),
+        *THRESHOLD_SENSOR_ROLES,
+        "humidity_linked",
+        "plant_count",
+    ]
+    for location in range(LOCATIONS):
+        subentry_id = f"subentry{location:02d}"
+        roles = [("sensor", f"location_{location}_{role}") for role in sensor_roles]
+        roles += [("datetime", role) for role in IGNORE_UNTIL_ROLES]
+        roles += [("switch", "irrigation")]
+        for domain, role in roles:
+            unique_id = f"{DOMAIN}_{subentry_id}_{role}"
+            registry.add(
+                FakeRegistryEntry(
+                    entity_id=f"{domain}.{subentry_id}_{role}",
+                    unique_id=unique_id,
+                    platform=DOMAIN,
+                    config_entry_id=ENTRY_ID,
+                )
+            )
+            if location >= ORPHANED_LOCATIONS:
+                expected.add(unique_id)
+    return registry, expected
+
+
+def _legacy_sensor_scan(registry: Any, expected: set[str]) -> list[str]:
+    """Find orphaned sensors the way the sensor platform used to."""
+    orphaned = []
+    for entity_id, entity_entry in registry.entities.items():
+        if (
+            entity_entry.platform != DOMAIN
+            or entity_entry.domain != "sensor"
+            or not entity_entry.unique_id
+            or entity_entry.config_entry_id != ENTRY_ID
+        ):
+            continue
+        unique_id = entity_entry.unique_id
+        aggregated_suffixes = {
+            f"_{m['suffix']}" for m in AGGREGATED_SENSOR_MAPPINGS.values()
+        }
+        if unique_id not in expected and any(
+            suffix in unique_id for suffix in aggregated_suffixes
+        ):
+            orphaned.append(entity_id)
+            continue
+        if unique_id not in expected and any(
+            role in unique_id for role in THRESHOLD_SENSOR_ROLES
+        ):
+            orphaned.append(entity_id)
+            continue
+        monitoring_suffixes = [
+            f"_{m.get('suffix', key)}" for key, m in MONITORING_SENSOR_MAPPINGS.items()
+        ]
+        monitoring_suffixes.append("_monitor_")
+        if unique_id not in expected and (
+            any(suffix in unique_id for suffix in monitoring_suffixes)
+            or "_humidity_linked" in unique_id
+        ):
+            orphaned.append(entity_id)
+    return orphaned
+
+
+def _legacy_datetime_scan(registry: Any, expected: set[str]) -> list[str]:
+    """Find orphaned datetime entities the way the datetime platform used to."""
+    orphaned = []
+    for entity_id, entity_entry in registry.entities.items():
+        if (
+            entity_entry.platform != DOMAIN
+            or entity_entry.domain != "datetime"
+            or not entity_entry.unique_id
+            or entity_entry.config_entry_id != ENTRY_ID
+        ):
+            continue
+        keywords = [f"_{role}" for role in IGNORE_UNTIL_ROLES]
+        if (
+            any(keyword in entity_entry.unique_id for keyword in keywords)
+            and entity_entry.unique_id not in expected
+        ):
+            orphaned.append(entity_id)
+    return orphaned
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    registry, expected = _build()
+
+    def legacy() -> list[str]:
+        return _legacy_sensor_scan(registry, expected) + _legacy_datetime_scan(
+            registry, expected
+        )
+
+    def single_pass() -> list[str]:
+        return find_orphaned_entities(registry.entities, ENTRY_ID, expected)
+
+    if sorted(legacy()) != sorted(single_pass()):
+        msg = "Legacy and single pass cleanup disagree"
+        raise RuntimeError(msg)
+
+    rows = [
+        [
+            name,
+            f"{len(registry.entities):,}",
+            len(func()),
+            f"{time_call(func, repeat=7) * 1e3:.2f}",
+        ]
+        for name, func in (("per-platform scans", legacy), ("single pass", single_pass))
+    ]
+    print_table(
+        f"Orphan cleanup, {LOCATIONS} locations",
+        ["strategy", "entries", "orphans", "ms/setup"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""
+Benchmark batched recorder statistics queries.
+
+Builds an in-memory SQLite database with the recorder's ``statistics_meta``
+and ``statistics`` layout, filled with a week of hourly means per source
+sensor, then compares one query per sensor (the previous behaviour on every
+state change) with ``RecorderStatisticsService`` answering all sensors from
+one multi-id query per cycle.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_recorder_statistics
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+from datetime import timedelta
+from typing import Any
+
+from benchmarks.common import FakeHass, print_table
+from custom_components.plant_assistant.recorder_statistics import (
+    RecorderStatisticsService,
+)
+
+LOCATIONS = (10, 40, 200)
+HOURS = 7 * 24
+# State updates per sensor within one statistics cycle (30 s reporting)
+UPDATES_PER_CYCLE = 10
+
+_STATISTICS_QUERY = (
+    "SELECT statistics_meta.statistic_id, statistics.start_ts, statistics.mean "
+    "FROM statistics JOIN statistics_meta "
+    "ON statistics.metadata_id = statistics_meta.id "
+    "WHERE statistics_meta.statistic_id IN ({placeholders}) "
+    "AND statistics.start_ts >= ? ORDER BY statistics.metadata_id, start_ts"
+)
+
+
+def _build_database(sensors: int) -> sqlite3.Connection:
+    """Create and fill an in-memory recorder statistics database."""
+    connection = sqlite3.connect(":memory:")
+    connection.executescript(
+        """
+        CREATE TABLE statistics_meta (
+            id INTEGER PRIMARY KEY,
+            statistic_id TEXT UNIQUE
+        );
+        CREATE TABLE statistics (
+            id INTEGER PRIMARY KEY,
+            metadata_id INTEGER,
+            start_ts REAL,
+            mean REAL
+        );
+        CREATE INDEX ix_statistics_statistic_id_start_ts
+            ON statistics (metadata_id, start_ts);
+        """
+    )
+    now = time.time()
+    for sensor in range(sensors):
+        cursor = connection.execute(
+            "INSERT INTO statistics_meta (statistic_id) VALUES (?)",
+            (f"sensor.location_{sensor}_temperature",),
+        )
+        connection.executemany(
+            "INSERT INTO statistics (metadata_id, start_ts, mean) VALUES (?, ?, ?)",
+            [
+                (cursor.lastrowid, now - hour * 3600, 15.0 + hour % 10)
+                for hour in range(HOURS)
+            ],
+        )
+    connection.commit()
+    return connection
+
+
+def _query(
+    connection: sqlite3.Connection, statistic_ids: set[str], start_ts: float
+) -> dict[str, list[dict[str, Any]]]:
+    """Read hourly means the way ``statistics_during_period`` does."""
+    placeholders = ",".join("?" * len(statistic_ids))
+    rows = connection.execute(
+        _STATISTICS_QUERY.replace("{placeholders}", placeholders),
+        (*statistic_ids, start_ts),
+    )
+    result: dict[str, list[dict[str, Any]]] = {}
+    for statistic_id, start, mean in rows:
+        result.setdefault(statistic_id, []).append({"start": start, "mean": mean})
+    return result
+
+
+class SQLiteRecorder:
+    """Recorder stand-in that runs statistics queries against SQLite."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        """Initialize the recorder."""
+        self.connection = connection
+        self.queries = 0
+
+    async def async_add_executor_job(self, _func: Any, *args: Any) -> Any:
+        """Run the statistics query synchronously, as the benchmark is serial."""
+        _hass, start_time, _end_time, statistic_ids = args[:4]
+        self.queries += 1
+        return _query(self.connection, statistic_ids, start_time.timestamp())
+
+
+async def _run_batched(
+    recorder: SQLiteRecorder, statistic_ids: list[str]
+) -> tuple[float, int]:
+    """Serve one cycle of updates through the shared service."""
+    service = RecorderStatisticsService(FakeHass())  # type: ignore[arg-type]
+    lookback = timedelta(days=7)
+    for statistic_id in statistic_ids:
+        service.async_subscribe(statistic_id, lookback)
+
+    start = time.perf_counter()
+    for _ in range(UPDATES_PER_CYCLE):
+        await asyncio.gather(
+            *(
+                service.async_get_hourly_means(recorder, statistic_id, lookback)
+                for statistic_id in statistic_ids
+            )
+        )
+    return time.perf_counter() - start, recorder.queries
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    rows = []
+    for locations in LOCATIONS:
+        connection = _build_database(locations)
+        statistic_ids = [
+            f"sensor.location_{sensor}_temperature" for sensor in range(locations)
+        ]
+        start_ts = time.time() - timedelta(days=7).total_seconds()
+
+        start = time.perf_counter()
+        for _ in range(UPDATES_PER_CYCLE):
+            for statistic_id in statistic_ids:
+                _query(connection, {statistic_id}, start_ts)
+        per_sensor_time = time.perf_counter() - start
+        per_sensor_queries = UPDATES_PER_CYCLE * locations
+
+        batched_time, batched_queries = asyncio.run(
+            _run_batched(SQLiteRecorder(connection), statistic_ids)
+        )
+        connection.close()
+
+        rows.append(
+            [
+                locations,
+                per_sensor_queries,
+                f"{per_sensor_time * 1e3:.1f}",
+                batched_queries,
+                f"{batched_time * 1e3:.1f}",
+            ]
+        )
+
+    print_table(
+        f"Week of hourly means, {UPDATES_PER_CYCLE} updates per sensor per cycle",
+        ["locations", "per-sensor queries", "ms", "batched queries", "ms"],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,706 @@
+"""
+Benchmark platform startup on synthetic large installs.
+
+Generates an install of N irrigation zones with M locations each and K plant
+slots per location, next to a configurable number of unrelated registry
+entries, on the in-process fakes of ``benchmarks.common``. Every location has
+a monitoring device, a linked humidity sensor and one OpenPlantbook plant per
+slot; even zones are linked to an ESPHome irrigation controller.
+
+The sensor, datetime and binary_sensor platforms are then set up in the order
+Home Assistant forwards them. For each platform the benchmark reports:
+
+- ``setup``: ``async_setup_entry`` excluding entity constructors,
+- ``construct``: time spent in the integration's entity constructors,
+- ``added``: ``async_added_to_hass`` of every created entity, including the
+  tasks it schedules,
+- the peak memory traced while running all three phases.
+
+Entities are registered in the fake entity registry after their platform is
+set up, and registry listeners notified, so later platforms find them like
+they would on a cold start. Event tracking, timers, restore state and the
+recorder are replaced by counting stand-ins; state writes are counted, not
+applied.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --zones 20 --locations 10 --slots 4
+
+or under pytest-benchmark with ``pytest benchmarks/test_bench_startup.py``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import importlib
+import inspect
+import logging
+import pkgutil
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+from homeassistant.core import CoreState, Event
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import slugify
+from homeassistant.util.unit_system import METRIC_SYSTEM
+
+from benchmarks.common import (
+    FakeDeviceEntry,
+    FakeDeviceRegistry,
+    FakeEntityRegistry,
+    FakeHass,
+    FakeRegistryEntry,
+    build_registry,
+    print_table,
+)
+from custom_components.plant_assistant.const import DOMAIN, OPENPLANTBOOK_DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable, Iterator
+    from types import ModuleType
+
+# Platforms in the order they are forwarded by ``async_setup_entry``
+PLATFORMS = ("sensor", "datetime", "binary_sensor")
+# Installs to compare when run without arguments: (zones, locations per zone)
+SCENARIOS = ((8, 5), (20, 10))
+DEFAULT_SLOTS = 3
+DEFAULT_OTHER_ENTITIES = 5_000
+ENTRY_ID = "plant_assistant_main"
+
+# Monitoring device sensors: (entity suffix, device_class, unit, state)
+MONITORING_SENSORS = (
+    ("temperature", "temperature", "°C", "21.5"),
+    ("illuminance", "illuminance", "lx", "5400"),
+    ("soil_moisture", "moisture", "%", "38"),
+    ("soil_conductivity", "conductivity", "µS/cm", "820"),
+    ("battery", "battery", "%", "87"),
+    ("signal_strength", "signal_strength", "dBm", "-61"),
+)
+# ESPHome irrigation controller entities: (domain, unique_id suffix)
+CONTROLLER_ENTITIES = (
+    ("switch", "master_schedule"),
+    ("switch", "sunrise_schedule"),
+    ("switch", "afternoon_schedule"),
+    ("switch", "sunset_schedule"),
+    ("switch", "allow_rain_water_delivery"),
+    ("switch", "allow_water_main_delivery"),
+    ("sensor", "error_count"),
+    ("binary_sensor", "running"),
+)
+PLANT_ATTRIBUTES = {
+    "minimum_light": 2500,
+    "maximum_light": 60000,
+    "minimum_temperature": 8,
+    "maximum_temperature": 32,
+    "minimum_humidity": 30,
+    "maximum_humidity": 80,
+    "minimum_moisture": 20,
+    "maximum_moisture": 60,
+    "minimum_soil_ec": 350,
+    "maximum_soil_ec": 2000,
+}
+# Helpers imported by name into the integration's modules
+_TRACKING_HELPERS = (
+    "async_track_state_change_event",
+    "async_track_state_report_event",
+    "async_track_point_in_time",
+    "async_track_time_interval",
+    "async_call_later",
+    "async_dispatcher_connect",
+)
+# Modules whose tracking helpers are replaced, besides the integration's own
+_PATCHED_MODULE_PREFIXES = (
+    "custom_components.plant_assistant",
+    "homeassistant.components.integration.",
+    "homeassistant.components.utility_meter.",
+)
+
+
+@dataclass
+class FakeSubentry:
+    """Minimal stand-in for a ``ConfigSubentry``."""
+
+    subentry_id: str
+    data: dict[str, Any]
+    title: str
+    subentry_type: str = "location"
+
+
+@dataclass
+class FakeConfigEntry:
+    """Minimal stand-in for the main Plant Assistant ``ConfigEntry``."""
+
+    entry_id: str
+    data: dict[str, Any]
+    options: dict[str, Any]
+    subentries: dict[str, FakeSubentry]
+    title: str = "Plant Assistant"
+    domain: str = DOMAIN
+    _on_unload: list[Callable[[], Any]] = field(default_factory=list)
+
+    def async_on_unload(self, func: Callable[[], Any]) -> None:
+        """Record an unload callback."""
+        self._on_unload.append(func)
+
+    def add_update_listener(self, _listener: Any) -> Callable[[], None]:
+        """Accept an update listener and return a no-op remover."""
+        return lambda: None
+
+
+class FakeConfigEntries:
+    """Config entries manager stand-in holding the main entry."""
+
+    def __init__(self, entry: FakeConfigEntry) -> None:
+        """Initialize the manager."""
+        self.entry = entry
+
+    def async_entries(self, domain: str | None = None) -> list[FakeConfigEntry]:
+        """Return the config entries of ``domain``."""
+        return [self.entry] if domain in (None, DOMAIN) else []
+
+    def async_get_entry(self, entry_id: str) -> FakeConfigEntry | None:
+        """Return the main entry if ``entry_id`` matches."""
+        return self.entry if entry_id == self.entry.entry_id else None
+
+
+class FakeRecorder:
+    """Recorder stand-in that answers every statistics query with no rows."""
+
+    def __init__(self) -> None:
+        """Initialize the recorder."""
+        self.queries = 0
+
+    async def async_add_executor_job(self, _func: Any, *_args: Any) -> Any:
+        """Return an empty statistics result."""
+        self.queries += 1
+        return {}
+
+
+class StartupHass(FakeHass):
+    """``FakeHass`` with the config, tasks and executor used during setup."""
+
+    def __init__(self, entry: FakeConfigEntry) -> None:
+        """Initialize the fake instance for ``entry``."""
+        super().__init__()
+        self.config_entries = FakeConfigEntries(entry)
+        self.config = type("Config", (), {"time_zone": "UTC", "units": METRIC_SYSTEM})()
+        self.recorder = FakeRecorder()
+        self.tasks: set[asyncio.Task[Any]] = set()
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.state = CoreState.running
+
+    def async_create_task(self, target: Any, *_args: Any, **_kwargs: Any) -> Any:
+        """Schedule ``target`` on the running loop and keep track of it."""
+        task = asyncio.get_running_loop().create_task(target)
+        self.tasks.add(task)
+        task.add_done_callback(self.tasks.discard)
+        return task
+
+    async_create_background_task = async_create_task
+
+    def async_run_hass_job(self, job: Any, *args: Any) -> Any:
+        """Run a ``HassJob`` target, scheduling it if it is a coroutine."""
+        result = job.target(*args)
+        if inspect.iscoroutine(result):
+            return self.async_create_task(result)
+        return result
+
+    async def async_add_executor_job(self, func: Any, *args: Any) -> Any:
+        """Run ``func`` inline; executor jobs are not what is measured."""
+        return func(*args)
+
+    async def async_add_import_executor_job(self, func: Any, *args: Any) -> Any:
+        """Run ``func`` inline, as the platforms import their submodules lazily."""
+        return func(*args)
+
+    async def async_drain_tasks(self) -> int:
+        """Wait for scheduled tasks, returning how many failed."""
+        failed = 0
+        while self.tasks:
+            results = await asyncio.gather(*self.tasks, return_exceptions=True)
+            failed += sum(isinstance(result, BaseException) for result in results)
+        return failed
+
+
+@dataclass
+class Install:
+    """A generated install and its fakes."""
+
+    hass: StartupHass
+    entry: FakeConfigEntry
+    entity_registry: FakeEntityRegistry
+    device_registry: FakeDeviceRegistry
+    # Entities created by the platforms, in setup order
+    entities: list[Entity] = field(default_factory=list)
+
+
+@dataclass
+class PlatformResult:
+    """Measurements of one platform's startup."""
+
+    platform: str
+    entities: int = 0
+    setup: float = 0.0
+    construct: float = 0.0
+    added: float = 0.0
+    peak_bytes: int = 0
+    failed_tasks: int = 0
+
+
+@dataclass
+class Counters:
+    """Calls into the stand-ins during a run."""
+
+    subscriptions: int = 0
+    timers: int = 0
+    state_writes: int = 0
+    # (tracked entity_ids, action) of every state change subscription
+    state_listeners: list[tuple[tuple[str, ...], Callable[..., Any]]] = field(
+        default_factory=list
+    )
+
+
+def _add_entity(  # noqa: PLR0913
+    install: Install,
+    entity_id: str,
+    unique_id: str,
+    platform: str,
+    device_id: str | None,
+    state: str,
+    attributes: dict[str, Any] | None = None,
+) -> None:
+    """Add an external entity to the registry and the state machine."""
+    install.entity_registry.add(
+        FakeRegistryEntry(
+            entity_id=entity_id,
+            unique_id=unique_id,
+            platform=platform,
+            device_id=device_id,
+        )
+    )
+    install.hass.states.async_set(entity_id, state, attributes)
+
+
+def build_install(
+    zones: int,
+    locations_per_zone: int,
+    slots: int = DEFAULT_SLOTS,
+    other_entities: int = DEFAULT_OTHER_ENTITIES,
+) -> Install:
+    """Generate an install with ``zones`` x ``locations_per_zone`` locations."""
+    irrigation_zones: dict[str, dict[str, Any]] = {}
+    subentries: dict[str, FakeSubentry] = {}
+    entry = FakeConfigEntry(
+        entry_id=ENTRY_ID,
+        data={"name": "Plant Assistant"},
+        options={"irrigation_zones": irrigation_zones},
+        subentries=subentries,
+    )
+    hass = StartupHass(entry)
+    install = Install(
+        hass=hass,
+        entry=entry,
+        entity_registry=build_registry(other_entities),
+        device_registry=FakeDeviceRegistry(),
+    )
+    devices = install.device_registry
+
+    for zone in range(zones):
+        zone_id = f"zone_{zone}"
+        zone_data: dict[str, Any] = {"id": zone_id, "name": f"Zone {zone}"}
+        if zone % 2 == 0:
+            controller = devices.add(
+                FakeDeviceEntry(
+                    id=f"controller_{zone}",
+                    name=f"Irrigation Controller {zone}",
+                    identifiers={("esphome", f"controller_{zone}")},
+                )
+            )
+            zone_data["linked_device_id"] = controller.id
+            for domain, suffix in CONTROLLER_ENTITIES:
+                _add_entity(
+                    install,
+                    f"{domain}.controller_{zone}_{suffix}",
+                    f"controller_{zone}_{suffix}",
+                    "esphome",
+                    controller.id,
+                    "on" if domain != "sensor" else "0",
+                    {"device_class": "running"} if suffix == "running" else None,
+                )
+        irrigation_zones[zone_id] = zone_data
+
+        for location in range(locations_per_zone):
+            name = f"Zone {zone} Bed {location}"
+            slug = slugify(name)
+            subentry_id = f"location_{zone}_{location}"
+            devices.add(
+                FakeDeviceEntry(
+                    id=f"{subentry_id}_device",
+                    name=name,
+                    identifiers={(DOMAIN, subentry_id)},
+                    config_entries={ENTRY_ID},
+                )
+            )
+            monitor = devices.add(
+                FakeDeviceEntry(id=f"{slug}_monitor", name=f"{name} Monitor")
+            )
+            for suffix, device_class, unit, state in MONITORING_SENSORS:
+                _add_entity(
+                    install,
+                    f"sensor.{slug}_monitor_{suffix}",
+                    f"{slug}_monitor_{suffix}",
+                    "xiaomi_ble",
+                    monitor.id,
+                    state,
+                    {"device_class": device_class, "unit_of_measurement": unit},
+                )
+            humidity_entity_id = f"sensor.{slug}_air_humidity"
+            _add_entity(
+                install,
+                humidity_entity_id,
+                f"{slug}_air_humidity",
+                "mqtt",
+                None,
+                "55",
+                {"device_class": "humidity", "unit_of_measurement": "%"},
+            )
+
+            plant_slots = {}
+            for slot in range(slots):
+                plant = devices.add(
+                    FakeDeviceEntry(id=f"{slug}_plant_{slot}", name=f"Plant {slot}")
+                )
+                _add_entity(
+                    install,
+                    f"sensor.{slug}_plant_{slot}",
+                    f"{slug}_plant_{slot}",
+                    OPENPLANTBOOK_DOMAIN,
+                    plant.id,
+                    "ok",
+                    dict(PLANT_ATTRIBUTES),
+                )
+                plant_slots[f"slot_{slot + 1}"] = {
+                    "name": f"Slot {slot + 1}",
+                    "plant_device_id": plant.id,
+                }
+
+            subentries[subentry_id] = FakeSubentry(
+                subentry_id=subentry_id,
+                title=name,
+                data={
+                    "name": name,
+                    "device_id": f"{subentry_id}_device",
+                    "zone_id": zone_id,
+                    "monitoring_device_id": monitor.id,
+                    "humidity_entity_id": humidity_entity_id,
+                    "humidity_entity_unique_id": f"{slug}_air_humidity",
+                    "plant_slots": plant_slots,
+                },
+            )
+    return install
+
+
+def _integration_entity_classes(module: ModuleType) -> Iterator[type[Entity]]:
+    """Yield the entity classes defined by an integration module."""
+    for obj in vars(module).values():
+        if (
+            inspect.isclass(obj)
+            and issubclass(obj, Entity)
+            and obj.__module__.startswith("custom_components.plant_assistant")
+        ):
+            yield obj
+
+
+class ConstructionTimer:
+    """Accumulate the time spent in the outermost entity constructor."""
+
+    def __init__(self) -> None:
+        """Initialize the timer."""
+        self.elapsed = 0.0
+        self._depth = 0
+
+    def wrap(self, init: Callable[..., None]) -> Callable[..., None]:
+        """Return ``init`` wrapped to add its runtime to ``elapsed``."""
+
+        @functools.wraps(init)
+        def _timed_init(entity: Any, *args: Any, **kwargs: Any) -> None:
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                init(entity, *args, **kwargs)
+            finally:
+                self._depth -= 1
+                if not self._depth:
+                    self.elapsed += time.perf_counter() - start
+
+        return _timed_init
+
+
+_sleep = asyncio.sleep
+
+
+@contextlib.contextmanager
+def _patched_hass(install: Install, counters: Counters) -> Iterator[None]:
+    """Point the integration at the fakes and count tracking calls."""
+
+    def _track(*_args: Any, **_kwargs: Any) -> Callable[[], None]:
+        counters.subscriptions += 1
+        return lambda: None
+
+    def _track_state_change(
+        _hass: Any, entity_ids: str | Iterable[str], action: Any, *_args: Any
+    ) -> Callable[[], None]:
+        ids = (entity_ids,) if isinstance(entity_ids, str) else tuple(entity_ids)
+        counters.state_listeners.append((ids, action))
+        return _track()
+
+    def _timer(*_args: Any, **_kwargs: Any) -> Callable[[], None]:
+        counters.timers += 1
+        return lambda: None
+
+    def _write(_entity: Any, *_args: Any, **_kwargs: Any) -> None:
+        counters.state_writes += 1
+
+    def _nothing_restored(_entity: Any) -> None:
+        return None
+
+    async def _no_delay(*_args: Any, **_kwargs: Any) -> None:
+        await _sleep(0)
+
+    # The submodules the platforms import lazily are patched as well
+    package = importlib.import_module("custom_components.plant_assistant")
+    for module_info in pkgutil.iter_modules(package.__path__):
+        importlib.import_module(f"{package.__name__}.{module_info.name}")
+    modules = [
+        importlib.import_module(name)
+        for name in list(importlib.sys.modules)
+        if name.startswith(_PATCHED_MODULE_PREFIXES)
+    ]
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(
+            patch.object(er, "async_get", return_value=install.entity_registry)
+        )
+        stack.enter_context(
+            patch.object(dr, "async_get", return_value=install.device_registry)
+        )
+        stack.enter_context(patch.object(Entity, "async_write_ha_state", _write))
+        stack.enter_context(
+            patch.object(Entity, "async_schedule_update_ha_state", _write)
+        )
+        stack.enter_context(
+            patch.object(RestoreEntity, "_async_get_restored_data", _nothing_restored)
+        )
+        # Fixed delays waiting for other entities are not what is measured
+        stack.enter_context(patch.object(asyncio, "sleep", _no_delay))
+        for module in modules:
+            for name in _TRACKING_HELPERS:
+                if hasattr(module, name):
+                    timer = "time" in name or name == "async_call_later"
+                    helper = _timer if timer else _track
+                    if name == "async_track_state_change_event":
+                        helper = _track_state_change
+                    stack.enter_context(patch.object(module, name, helper))
+            if hasattr(module, "get_instance"):
+                stack.enter_context(
+                    patch.object(
+                        module, "get_instance", return_value=install.hass.recorder
+                    )
+                )
+        yield
+
+
+def _register(install: Install, platform: str, entities: Iterable[Entity]) -> None:
+    """Register created entities the way the entity platform would."""
+    registry = install.entity_registry
+    bus = install.hass.bus
+    for entity in entities:
+        entity.hass = install.hass  # type: ignore[assignment]
+        if not entity.entity_id:
+            base = f"{platform}.{slugify(str(entity.name or entity.unique_id))}"
+            entity_id, suffix = base, 2
+            while entity_id in registry.entities:
+                entity_id, suffix = f"{base}_{suffix}", suffix + 1
+            entity.entity_id = entity_id
+        device_id = None
+        device_info = entity.device_info or {}
+        if identifiers := device_info.get("identifiers"):
+            device = install.device_registry.async_get_device(identifiers)
+            device_id = device.id if device else None
+        if entity.unique_id:
+            registry.add(
+                FakeRegistryEntry(
+                    entity_id=entity.entity_id,
+                    unique_id=entity.unique_id,
+                    platform=DOMAIN,
+                    device_id=device_id,
+                    config_entry_id=ENTRY_ID,
+                )
+            )
+            # Keep listeners such as the entity index in sync, as the
+            # registry's own event would
+            event = Event(
+                er.EVENT_ENTITY_REGISTRY_UPDATED,
+                {"action": "create", "entity_id": entity.entity_id},
+            )
+            for listener in list(bus.listeners.get(event.event_type, ())):
+                listener(event)
+        install.hass.states.async_set(entity.entity_id, "unknown")
+
+
+async def _async_setup_platform(
+    install: Install, platform: str, timer: ConstructionTimer
+) -> tuple[list[Entity], float]:
+    """Run one platform's ``async_setup_entry`` and return its entities."""
+    module = importlib.import_module(f"custom_components.plant_assistant.{platform}")
+    entities: list[Entity] = []
+
+    def _add_entities(
+        new_entities: Iterable[Entity], *_args: Any, **_kwargs: Any
+    ) -> None:
+        entities.extend(new_entities)
+
+    with contextlib.ExitStack() as stack:
+        for cls in set(_integration_entity_classes(module)):
+            if "__init__" in vars(cls):
+                stack.enter_context(
+                    patch.object(cls, "__init__", timer.wrap(vars(cls)["__init__"]))
+                )
+        start = time.perf_counter()
+        await module.async_setup_entry(install.hass, install.entry, _add_entities)
+        elapsed = time.perf_counter() - start
+    return entities, elapsed
+
+
+async def _async_run_platform(install: Install, platform: str) -> PlatformResult:
+    """Set up one platform and add its entities to hass."""
+    result = PlatformResult(platform)
+    timer = ConstructionTimer()
+    entities, elapsed = await _async_setup_platform(install, platform, timer)
+    result.entities = len(entities)
+    result.construct = timer.elapsed
+    result.setup = elapsed - timer.elapsed
+
+    _register(install, platform, entities)
+    install.entities.extend(entities)
+    start = time.perf_counter()
+    for entity in entities:
+        await entity.async_added_to_hass()
+    result.failed_tasks = await install.hass.async_drain_tasks()
+    result.added = time.perf_counter() - start
+    return result
+
+
+async def async_run_startup(
+    install: Install,
+    *,
+    trace_memory: bool = False,
+    after_setup: Callable[[Install, Counters], Awaitable[Any]] | None = None,
+) -> tuple[list[PlatformResult], Counters]:
+    """
+    Set up every platform of ``install`` in forwarding order.
+
+    ``after_setup`` is awaited once every platform is set up, while the
+    stand-ins are still in place.
+    """
+    install.hass.loop = asyncio.get_running_loop()
+    counters = Counters()
+    results = []
+    with _patched_hass(install, counters):
+        for platform in PLATFORMS:
+            if trace_memory:
+                tracemalloc.start()
+            result = await _async_run_platform(install, platform)
+            if trace_memory:
+                result.peak_bytes = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            results.append(result)
+        if after_setup is not None:
+            await after_setup(install, counters)
+    return results, counters
+
+
+def run_startup(
+    zones: int,
+    locations_per_zone: int,
+    slots: int = DEFAULT_SLOTS,
+    other_entities: int = DEFAULT_OTHER_ENTITIES,
+) -> tuple[list[PlatformResult], Counters]:
+    """
+    Time the startup of a fresh install, then trace its memory on another.
+
+    Memory is traced in a separate run as tracing slows down the timed code.
+    """
+    results, counters = asyncio.run(
+        async_run_startup(
+            build_install(zones, locations_per_zone, slots, other_entities)
+        )
+    )
+    traced, _ = asyncio.run(
+        async_run_startup(
+            build_install(zones, locations_per_zone, slots, other_entities),
+            trace_memory=True,
+        )
+    )
+    for result, traced_result in zip(results, traced, strict=True):
+        result.peak_bytes = traced_result.peak_bytes
+    return results, counters
+
+
+def main() -> None:
+    """Run the benchmark and print a results table per install size."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--zones", type=int)
+    parser.add_argument("--locations", type=int, help="locations per zone")
+    parser.add_argument("--slots", type=int, default=DEFAULT_SLOTS)
+    parser.add_argument("--other", type=int, default=DEFAULT_OTHER_ENTITIES)
+    args = parser.parse_args()
+    # Warnings about entities set up by a later platform are expected here
+    logging.getLogger("custom_components.plant_assistant").setLevel(logging.ERROR)
+
+    scenarios = SCENARIOS
+    if args.zones or args.locations:
+        scenarios = ((args.zones or 1, args.locations or 1),)
+
+    for zones, locations_per_zone in scenarios:
+        results, counters = run_startup(
+            zones, locations_per_zone, args.slots, args.other
+        )
+        print_table(
+            f"Startup: {zones} zones x {locations_per_zone} locations x "
+            f"{args.slots} slots, {args.other:,} other entities "
+            f"({counters.subscriptions} subscriptions, {counters.timers} timers, "
+            f"{counters.state_writes} state writes)",
+            [
+                "platform",
+                "entities",
+                "setup ms",
+                "construct ms",
+                "added ms",
+                "peak KiB",
+            ],
+            [
+                [
+                    result.platform,
+                    result.entities,
+                    f"{result.setup * 1e3:.1f}",
+                    f"{result.construct * 1e3:.1f}",
+                    f"{result.added * 1e3:.1f}",
+                    f"{result.peak_bytes / 1024:,.0f}",
+                ]
+                for result in results
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
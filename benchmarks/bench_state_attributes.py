@@ -0,0 +1,165 @@
+"""
+Benchmark the state write cost of the monitors and mirrors.
+
+Starts a synthetic install with ``benchmarks.bench_startup`` and, for every
+monitor and mirror sensor class, measures what Home Assistant reads from an
+entity on ``async_write_ha_state``: ``available``, the state, the icon and
+``extra_state_attributes`` merged into a fresh attribute dict. Reported per
+class:
+
+- ``entities``: instances created for the install,
+- ``cached µs``: cost of one write with the attributes served from the
+  entity's attribute cache, as for writes whose inputs did not change,
+- ``rebuilt µs``: cost of one write with the cache dropped first, as for a
+  write after an input change (and for every write before the cache),
+- ``attrs``: attributes per state.
+
+Mirror sensors have no cache and expose a read-only view of their copied
+source attributes, so both columns match for them.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_state_attributes
+    python -m benchmarks.bench_state_attributes --zones 20 --locations 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import STATE_UNAVAILABLE
+
+from benchmarks.bench_startup import (
+    SCENARIOS,
+    Counters,
+    Install,
+    async_run_startup,
+    build_install,
+)
+from benchmarks.common import print_table
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.entity import Entity
+
+DEFAULT_WRITES = 200
+MEASURED_CLASSES = (
+    "ThresholdMonitorBinarySensor",
+    "StatusMonitorBinarySensor",
+    "IgnoredStatusesMonitorBinarySensor",
+    "PlantCountStatusMonitorBinarySensor",
+    "LinkMonitorBinarySensor",
+    "LinkStatusBinarySensor",
+    "RecentlyWateredBinarySensor",
+    "MonitoringSensor",
+    "HumidityLinkedSensor",
+)
+
+
+def write_payload(entity: Entity) -> tuple[str, dict[str, Any]]:
+    """Read the state and attributes the way a state write does."""
+    attr: dict[str, Any] = {}
+    if not entity.available:
+        return STATE_UNAVAILABLE, attr
+    state = entity.state
+    if extra := entity.extra_state_attributes:
+        attr.update(extra)
+    if icon := entity.icon:
+        attr["icon"] = icon
+    return "unknown" if state is None else str(state), attr
+
+
+def _time_writes(entities: list[Entity], writes: int, *, rebuild: bool) -> float:
+    """Return the mean seconds per write over ``writes`` rounds."""
+    caches = [getattr(entity, "_attribute_cache", None) for entity in entities]
+    elapsed = 0.0
+    for _ in range(writes):
+        if rebuild:
+            for cache in caches:
+                if cache is not None:
+                    cache.clear()
+        start = time.perf_counter()
+        for entity in entities:
+            write_payload(entity)
+        elapsed += time.perf_counter() - start
+    return elapsed / (writes * len(entities))
+
+
+def measure_writes(install: Install, writes: int) -> dict[str, dict[str, float]]:
+    """Return the write costs of the measured classes of an install."""
+    by_class: defaultdict[str, list[Entity]] = defaultdict(list)
+    for entity in install.entities:
+        name = type(entity).__name__
+        if name in MEASURED_CLASSES:
+            by_class[name].append(entity)
+
+    results = {}
+    for name in MEASURED_CLASSES:
+        if not (entities := by_class.get(name)):
+            continue
+        # Build every cache once, as the first write after setup does
+        attrs = sum(len(write_payload(entity)[1]) for entity in entities)
+        results[name] = {
+            "entities": len(entities),
+            "cached": _time_writes(entities, writes, rebuild=False),
+            "rebuilt": _time_writes(entities, writes, rebuild=True),
+            "attrs": attrs / len(entities),
+        }
+    return results
+
+
+def run_write_costs(
+    zones: int, locations_per_zone: int, writes: int = DEFAULT_WRITES
+) -> dict[str, dict[str, float]]:
+    """Start an install and measure its monitors' state write costs."""
+    measured: dict[str, dict[str, float]] = {}
+
+    async def _after_setup(install: Install, _counters: Counters) -> None:
+        measured.update(measure_writes(install, writes))
+
+    asyncio.run(
+        async_run_startup(
+            build_install(zones, locations_per_zone), after_setup=_after_setup
+        )
+    )
+    return measured
+
+
+def main() -> None:
+    """Run the benchmark and print a results table per install size."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--zones", type=int)
+    parser.add_argument("--locations", type=int, help="locations per zone")
+    parser.add_argument("--writes", type=int, default=DEFAULT_WRITES)
+    args = parser.parse_args()
+    logging.getLogger("custom_components.plant_assistant").setLevel(logging.ERROR)
+
+    scenarios = SCENARIOS
+    if args.zones or args.locations:
+        scenarios = ((args.zones or 1, args.locations or 1),)
+
+    for zones, locations_per_zone in scenarios:
+        results = run_write_costs(zones, locations_per_zone, args.writes)
+        print_table(
+            f"State write cost: {zones * locations_per_zone} locations "
+            f"({args.writes} writes per entity)",
+            ["class", "entities", "cached µs", "rebuilt µs", "attrs"],
+            [
+                [
+                    name,
+                    int(result["entities"]),
+                    f"{result['cached'] * 1e6:.2f}",
+                    f"{result['rebuilt'] * 1e6:.2f}",
+                    f"{result['attrs']:.1f}",
+                ]
+                for name, result in results.items()
+            ],
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+Benchmark the state change subscriptions of a started install.
+
+Starts a synthetic install with ``benchmarks.bench_startup`` and groups the
+state change listeners it registered by tracked entity. Reported:
+
+- ``tracked``: distinct entities with at least one listener,
+- ``subscriptions``: listeners registered with Home Assistant, counting a
+  listener of several entities once per entity,
+- ``shared``: entities with more than one listener, and ``max``: the most
+  listeners on one entity,
+- ``events/s`` and ``handler µs``: numeric changes of every tracked sensor
+  delivered per second including the tasks and flushes they cause, and the
+  time spent in the listeners per change,
+- ``callbacks/event``: listener invocations per change.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_state_subscriptions
+    python -m benchmarks.bench_state_subscriptions --zones 20 --locations 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import Event
+
+from benchmarks.bench_startup import (
+    SCENARIOS,
+    Counters,
+    Install,
+    async_run_startup,
+    build_install,
+)
+from benchmarks.common import FakeState, print_table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_ROUNDS = 10
+NUMERIC_VALUES = ("10", "40", "70")
+
+
+def listeners_by_entity(counters: Counters) -> dict[str, list[Callable[..., Any]]]:
+    """Return the state change listeners registered per entity."""
+    listeners: defaultdict[str, list[Callable[..., Any]]] = defaultdict(list)
+    for entity_ids, action in counters.state_listeners:
+        for entity_id in entity_ids:
+            listeners[entity_id].append(action)
+    return dict(listeners)
+
+
+async def async_fire_sensor_changes(
+    listeners: dict[str, list[Callable[..., Any]]],
+    rounds: int,
+) -> dict[str, float]:
+    """Deliver ``rounds`` numeric changes of every tracked sensor."""
+    sensors = [entity_id for entity_id in listeners if entity_id.startswith("sensor.")]
+    events = callbacks = 0
+    elapsed = handling = 0.0
+    for round_number in range(rounds):
+        value = NUMERIC_VALUES[round_number % len(NUMERIC_VALUES)]
+        changes = [
+            Event(
+                "state_changed",
+                {
+                    "entity_id": entity_id,
+                    "old_state": None,
+                    "new_state": FakeState(entity_id, value),
+                },
+            )
+            for entity_id in sensors
+        ]
+        start = time.perf_counter()
+        for event in changes:
+            handler_start = time.perf_counter()
+            for action in listeners[event.data["entity_id"]]:
+                action(event)
+                callbacks += 1
+            handling += time.perf_counter() - handler_start
+            # Let scheduled tasks and coalesced writes run, as between events
+            await asyncio.sleep(0)
+        elapsed += time.perf_counter() - start
+        events += len(changes)
+
+    return {
+        "events": events,
+        "elapsed": elapsed,
+        "handling": handling,
+        "callbacks": callbacks,
+    }
+
+
+def run_state_subscriptions(
+    zones: int, locations_per_zone: int, rounds: int = DEFAULT_ROUNDS
+) -> dict[str, float]:
+    """Start an install, count its subscriptions and deliver sensor changes."""
+    measured: dict[str, float] = {}
+
+    async def _after_setup(_install: Install, counters: Counters) -> None:
+        listeners = listeners_by_entity(counters)
+        counts = [len(actions) for actions in listeners.values()]
+        measured["tracked"] = len(listeners)
+        measured["subscriptions"] = sum(counts)
+        measured["shared"] = sum(1 for count in counts if count > 1)
+        measured["max"] = max(counts, default=0)
+        measured.update(await async_fire_sensor_changes(listeners, rounds))
+
+    asyncio.run(
+        async_run_startup(
+            build_install(zones, locations_per_zone), after_setup=_after_setup
+        )
+    )
+    return measured
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--zones", type=int)
+    parser.add_argument("--locations", type=int, help="locations per zone")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    args = parser.parse_args()
+    logging.getLogger("custom_components.plant_assistant").setLevel(logging.ERROR)
+
+    scenarios = SCENARIOS
+    if args.zones or args.locations:
+        scenarios = ((args.zones or 1, args.locations or 1),)
+
+    rows = []
+    for zones, locations_per_zone in scenarios:
+        result = run_state_subscriptions(zones, locations_per_zone, args.rounds)
+        events = result["events"] or 1
+        rows.append(
+            [
+                zones * locations_per_zone,
+                int(result["tracked"]),
+                int(result["subscriptions"]),
+                int(result["shared"]),
+                int(result["max"]),
+                f"{result['events'] / (result['elapsed'] or 1e-9):,.0f}",
+                f"{result['handling'] / events * 1e6:.2f}",
+                f"{result['callbacks'] / events:.2f}",
+            ]
+        )
+
+    print_table(
+        f"State change subscriptions ({args.rounds} rounds of sensor changes)",
+        [
+            "locations",
+            "tracked",
+            "subscriptions",
+            "shared",
+            "max",
+            "events/s",
+            "handler µs",
+            "callbacks/event",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,222 @@
+"""
+Benchmark the location status monitors' handling of input changes.
+
+Starts a synthetic install with ``benchmarks.bench_startup`` and collects the
+state change subscriptions of the soil moisture, soil conductivity,
+temperature, humidity, battery level and daily light integral status
+monitors. Their inputs (readings, thresholds, weekly durations and
+ignore-until datetimes) then receive ``state_changed`` events in rounds, each
+followed by a loop iteration so coalesced state writes are flushed. Reported:
+
+- ``subscriptions``: Home Assistant state change subscriptions feeding the
+  monitors, directly or through the shared state multiplexer,
+- ``inputs``: distinct entities they track,
+- ``events/s``: input changes handled per second, including the flushes,
+- ``handler µs``: time in the monitors' handlers per input change,
+- ``callbacks/event`` and ``writes/event``: handler invocations and state
+  writes caused by one input change.
+
+Numeric inputs cycle through values below, between and above the thresholds
+and ignore-until inputs between a past and a future datetime, so monitors
+flip between problem and normal.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_threshold_monitors
+    python -m benchmarks.bench_threshold_monitors --zones 20 --locations 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import Event
+from homeassistant.helpers.entity import Entity
+
+from benchmarks.bench_startup import (
+    SCENARIOS,
+    Counters,
+    Install,
+    async_run_startup,
+    build_install,
+)
+from benchmarks.common import FakeState, print_table
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+DEFAULT_ROUNDS = 20
+# unique_id suffixes of the status monitors
+STATUS_MONITOR_KEYS = (
+    "soil_moisture_status",
+    "soil_conductivity_status",
+    "temperature_status",
+    "humidity_status",
+    "monitor_battery_level_status",
+    "dli_status",
+)
+# Shared per-location owner of the monitors' subscriptions, where present
+EVALUATOR_CLASS = "LocationThresholdEvaluator"
+# Integration-wide owner of the source subscriptions, where present
+MULTIPLEXER_CLASS = "StateChangeMultiplexer"
+NUMERIC_VALUES = ("0", "5", "50", "5000")
+
+
+def _is_status_monitor_listener(
+    action: Callable[..., Any], entity_ids: tuple[str, ...]
+) -> bool:
+    """Return True if a state change listener feeds a status monitor."""
+    owner = getattr(action, "__self__", None)
+    if type(owner).__name__ == MULTIPLEXER_CLASS:
+        return any(
+            _is_status_monitor_listener(consumer, entity_ids)
+            for entity_id in entity_ids
+            for consumer in owner.consumers(entity_id)
+        )
+    if type(owner).__name__ == EVALUATOR_CLASS:
+        return True
+    return isinstance(owner, Entity) and str(owner.unique_id).endswith(
+        STATUS_MONITOR_KEYS
+    )
+
+
+def status_monitor_inputs(
+    counters: Counters,
+) -> tuple[int, dict[str, list[Callable[..., Any]]]]:
+    """Return the monitors' subscription count and their listeners by input."""
+    subscriptions = 0
+    listeners: defaultdict[str, list[Callable[..., Any]]] = defaultdict(list)
+    for entity_ids, action in counters.state_listeners:
+        if not _is_status_monitor_listener(action, entity_ids):
+            continue
+        subscriptions += 1
+        for entity_id in entity_ids:
+            listeners[entity_id].append(action)
+    return subscriptions, dict(listeners)
+
+
+def _value(entity_id: str, round_number: int, now: datetime) -> str:
+    """Return the state an input takes in a round."""
+    if entity_id.startswith("datetime."):
+        offset = timedelta(hours=1 if round_number % 2 else -1)
+        return (now + offset).isoformat()
+    return NUMERIC_VALUES[round_number % len(NUMERIC_VALUES)]
+
+
+async def async_fire_input_changes(
+    listeners: dict[str, list[Callable[..., Any]]],
+    counters: Counters,
+    rounds: int,
+) -> dict[str, float]:
+    """Deliver ``rounds`` changes of every input and measure the handling."""
+    now = datetime.now(UTC)
+    events = callbacks = 0
+    writes_before = counters.state_writes
+    elapsed = handling = 0.0
+    for round_number in range(rounds):
+        changes = [
+            Event(
+                "state_changed",
+                {
+                    "entity_id": entity_id,
+                    "old_state": None,
+                    "new_state": FakeState(
+                        entity_id, _value(entity_id, round_number, now)
+                    ),
+                },
+            )
+            for entity_id in listeners
+        ]
+        start = time.perf_counter()
+        for event in changes:
+            handler_start = time.perf_counter()
+            for action in listeners[event.data["entity_id"]]:
+                action(event)
+                callbacks += 1
+            handling += time.perf_counter() - handler_start
+            # Let coalesced state writes flush, as between real events
+            await asyncio.sleep(0)
+        elapsed += time.perf_counter() - start
+        events += len(changes)
+
+    return {
+        "events": events,
+        "elapsed": elapsed,
+        "handling": handling,
+        "callbacks": callbacks,
+        "writes": counters.state_writes - writes_before,
+    }
+
+
+def run_input_changes(
+    zones: int, locations_per_zone: int, rounds: int = DEFAULT_ROUNDS
+) -> dict[str, float]:
+    """Start an install and measure its monitors handling input changes."""
+    measured: dict[str, float] = {}
+
+    async def _after_setup(_install: Install, counters: Counters) -> None:
+        subscriptions, listeners = status_monitor_inputs(counters)
+        measured.update(await async_fire_input_changes(listeners, counters, rounds))
+        measured["subscriptions"] = subscriptions
+        measured["inputs"] = len(listeners)
+
+    asyncio.run(
+        async_run_startup(
+            build_install(zones, locations_per_zone), after_setup=_after_setup
+        )
+    )
+    return measured
+
+
+def main() -> None:
+    """Run the benchmark and print a results table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--zones", type=int)
+    parser.add_argument("--locations", type=int, help="locations per zone")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS)
+    args = parser.parse_args()
+    logging.getLogger("custom_components.plant_assistant").setLevel(logging.ERROR)
+
+    scenarios = SCENARIOS
+    if args.zones or args.locations:
+        scenarios = ((args.zones or 1, args.locations or 1),)
+
+    rows = []
+    for zones, locations_per_zone in scenarios:
+        result = run_input_changes(zones, locations_per_zone, args.rounds)
+        events = result["events"] or 1
+        rows.append(
+            [
+                zones * locations_per_zone,
+                int(result["subscriptions"]),
+                int(result["inputs"]),
+                f"{result['events'] / (result['elapsed'] or 1e-9):,.0f}",
+                f"{result['handling'] / events * 1e6:.2f}",
+                f"{result['callbacks'] / events:.2f}",
+                f"{result['writes'] / events:.2f}",
+            ]
+        )
+
+    print_table(
+        f"Status monitor input changes ({args.rounds} rounds)",
+        [
+            "locations",
+            "subscriptions",
+            "inputs",
+            "events/s",
+            "handler µs",
+            "callbacks/event",
+            "writes/event",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Benchmark location threshold aggregation.
+
+Compares computing every aggregated location metric with the list-of-dicts
+helpers in ``aggregation`` and ``dli`` against the columnar
+``PlantThresholdStore`` for 10, 1k and 100k plants, both for a single
+location holding every plant and for the whole-install batch mode with the
+plants spread over locations of ten.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_threshold_store
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any
+
+from benchmarks.common import print_table, time_call
+from custom_components.plant_assistant import aggregation, dli
+from custom_components.plant_assistant.const import AGGREGATED_SENSOR_MAPPINGS
+from custom_components.plant_assistant.plant_snapshot import (
+    PLANT_THRESHOLD_ATTRIBUTES,
+)
+from custom_components.plant_assistant.threshold_store import (
+    PlantThresholdStore,
+    aggregate_locations,
+)
+
+SIZES = (10, 1_000, 100_000)
+PLANTS_PER_LOCATION = 10
+
+
+def _build_plants(size: int) -> list[dict[str, Any]]:
+    """Build plant attribute dicts, with some missing and string values."""
+    rng = random.Random(size)  # noqa: S311 - deterministic synthetic data
+    plants = []
+    for _ in range(size):
+        plant: dict[str, Any] = {}
+        for key in PLANT_THRESHOLD_ATTRIBUTES:
+            roll = rng.random()
+            if roll < 0.05:
+                plant[key] = None
+            elif roll < 0.15:
+                plant[key] = str(rng.randint(1, 50_000))
+            else:
+                plant[key] = rng.randint(1, 50_000)
+        plants.append(plant)
+    return plants
+
+
+def _aggregate_dicts(plants: list[dict[str, Any]]) -> dict[str, Any]:
+    """Compute every metric the way each location sensor used to."""
+    results = {}
+    for metric_key, config in AGGREGATED_SENSOR_MAPPINGS.items():
+        convert = config.get("convert_illuminance_to_dli")
+        if config["aggregation_type"] == "max_of_mins":
+            helper = dli.max_of_mins_dli if convert else aggregation.max_of_mins
+            results[metric_key] = helper(plants, config["plant_attr_min"])
+        else:
+            helper = dli.min_of_maxs_dli if convert else aggregation.min_of_maxs
+            results[metric_key] = helper(plants, config["plant_attr_max"])
+    return results
+
+
+def _build_store(plants: list[dict[str, Any]]) -> PlantThresholdStore:
+    """Load plants into a columnar store."""
+    store = PlantThresholdStore(PLANT_THRESHOLD_ATTRIBUTES)
+    for i, plant in enumerate(plants):
+        store.set_row(f"sensor.plant_{i}", plant)
+    return store
+
+
+def main() -> None:
+    """Run the benchmark and print results tables."""
+    location_rows = []
+    batch_rows = []
+    for size in SIZES:
+        plants = _build_plants(size)
+        store = _build_store(plants)
+        if store.aggregate_metrics(AGGREGATED_SENSOR_MAPPINGS) != _aggregate_dicts(
+            plants
+        ):
+            msg = f"Columnar results differ from the helpers for {size} plants"
+            raise AssertionError(msg)
+
+        repeat = 3 if size > 1_000 else 50
+        dicts_time = time_call(lambda plants=plants: _aggregate_dicts(plants), repeat)
+        store_time = time_call(
+            lambda store=store: store.aggregate_metrics(AGGREGATED_SENSOR_MAPPINGS),
+            repeat,
+        )
+        load_time = time_call(lambda plants=plants: _build_store(plants), 3)
+        location_rows.append(
+            [
+                f"{size:,}",
+                f"{dicts_time * 1e3:.3f}",
+                f"{store_time * 1e3:.3f}",
+                f"{dicts_time / store_time:.1f}x",
+                f"{load_time * 1e3:.2f}",
+            ]
+        )
+
+        locations = {
+            f"location_{start}": plants[start : start + PLANTS_PER_LOCATION]
+            for start in range(0, size, PLANTS_PER_LOCATION)
+        }
+        stores = {key: _build_store(value) for key, value in locations.items()}
+        per_location_time = time_call(
+            lambda locations=locations: [
+                _aggregate_dicts(value) for value in locations.values()
+            ],
+            repeat,
+        )
+        batch_time = time_call(
+            lambda stores=stores: aggregate_locations(
+                stores, AGGREGATED_SENSOR_MAPPINGS
+            ),
+            repeat,
+        )
+        batch_rows.append(
+            [
+                f"{size:,}",
+                f"{len(locations):,}",
+                f"{per_location_time * 1e3:.3f}",
+                f"{batch_time * 1e3:.3f}",
+                f"{per_location_time / batch_time:.1f}x",
+            ]
+        )
+
+    print_table(
+        f"All {len(AGGREGATED_SENSOR_MAPPINGS)} metrics, one location",
+        ["plants", "dicts ms", "columnar ms", "speedup", "store load ms"],
+        location_rows,
+    )
+    print_table(
+        f"Whole-install batch, {PLANTS_PER_LOCATION} plants per location",
+        ["plants", "locations", "dicts ms", "batch ms", "speedup"],
+        batch_rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
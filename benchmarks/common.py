@@ -0,0 +1,280 @@
+"""
+Shared helpers for Plant Assistant benchmarks.
+
+Benchmarks run outside of a Home Assistant instance, so these helpers provide
+just enough of ``hass`` and the entity registry for the integration code under
+test to operate on synthetic data.
+"""
+
+from __future__ import annotations
+
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@dataclass
+class FakeRegistryEntry:
+    """Minimal stand-in for an entity registry entry."""
+
+    entity_id: str
+    unique_id: str
+    platform: str
+    device_id: str | None = None
+    config_entry_id: str | None = None
+    name: str | None = None
+
+    @property
+    def domain(self) -> str:
+        """Return the entity domain."""
+        return self.entity_id.split(".", 1)[0]
+
+
+class FakeRegistryItems(dict[str, FakeRegistryEntry]):
+    """Entity registry items with the lookups used by ``er`` helper functions."""
+
+    def get_entries_for_device_id(
+        self, device_id: str, *_args: Any
+    ) -> list[FakeRegistryEntry]:
+        """Return the entries of a device."""
+        return [entry for entry in self.values() if entry.device_id == device_id]
+
+    def get_entries_for_config_entry_id(
+        self, config_entry_id: str
+    ) -> list[FakeRegistryEntry]:
+        """Return the entries of a config entry."""
+        return [
+            entry for entry in self.values() if entry.config_entry_id == config_entry_id
+        ]
+
+
+@dataclass
+class FakeEntityRegistry:
+    """Minimal stand-in for the Home Assistant entity registry."""
+
+    entities: FakeRegistryItems = field(default_factory=FakeRegistryItems)
+
+    def async_get(self, entity_id: str) -> FakeRegistryEntry | None:
+        """Return a registry entry by entity_id."""
+        return self.entities.get(entity_id)
+
+    def async_get_entity_id(
+        self, domain: str, platform: str, unique_id: str
+    ) -> str | None:
+        """Return the entity_id of a unique_id."""
+        for entry in self.entities.values():
+            if (
+                entry.unique_id == unique_id
+                and entry.platform == platform
+                and entry.domain == domain
+            ):
+                return entry.entity_id
+        return None
+
+    def async_remove(self, entity_id: str) -> None:
+        """Remove an entry."""
+        self.entities.pop(entity_id, None)
+
+    def add(self, entry: FakeRegistryEntry) -> None:
+        """Add an entry to the registry."""
+        self.entities[entry.entity_id] = entry
+
+
+@dataclass
+class FakeDeviceEntry:
+    """Minimal stand-in for a device registry entry."""
+
+    id: str
+    name: str
+    identifiers: set[tuple[str, str]] = field(default_factory=set)
+    config_entries: set[str] = field(default_factory=set)
+    name_by_user: str | None = None
+    manufacturer: str | None = None
+    model: str | None = None
+    via_device_id: str | None = None
+
+
+@dataclass
+class FakeDeviceRegistry:
+    """Minimal stand-in for the Home Assistant device registry."""
+
+    devices: dict[str, FakeDeviceEntry] = field(default_factory=dict)
+
+    def async_get(self, device_id: str) -> FakeDeviceEntry | None:
+        """Return a device by id."""
+        return self.devices.get(device_id)
+
+    def async_get_device(
+        self, identifiers: set[tuple[str, str]] | None = None, **_kwargs: Any
+    ) -> FakeDeviceEntry | None:
+        """Return the first device sharing one of ``identifiers``."""
+        for device in self.devices.values():
+            if identifiers and device.identifiers & identifiers:
+                return device
+        return None
+
+    def async_get_or_create(
+        self,
+        *,
+        config_entry_id: str,
+        identifiers: set[tuple[str, str]],
+        name: str | None = None,
+        **_kwargs: Any,
+    ) -> FakeDeviceEntry:
+        """Return the device with ``identifiers``, creating it if needed."""
+        if device := self.async_get_device(identifiers):
+            device.config_entries.add(config_entry_id)
+            return device
+        device = FakeDeviceEntry(
+            id=f"device_{len(self.devices)}",
+            name=name or "",
+            identifiers=set(identifiers),
+            config_entries={config_entry_id},
+        )
+        return self.add(device)
+
+    def async_update_device(
+        self, device_id: str, **changes: Any
+    ) -> FakeDeviceEntry | None:
+        """Apply ``changes`` to a device."""
+        if device := self.devices.get(device_id):
+            for key, value in changes.items():
+                if hasattr(device, key):
+                    setattr(device, key, value)
+        return device
+
+    def add(self, device: FakeDeviceEntry) -> FakeDeviceEntry:
+        """Add a device to the registry."""
+        self.devices[device.id] = device
+        return device
+
+
+@dataclass
+class FakeState:
+    """Minimal stand-in for a ``State``."""
+
+    entity_id: str
+    state: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+    last_changed: datetime = field(default_factory=lambda: datetime.now(UTC))
+    last_updated: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def domain(self) -> str:
+        """Return the entity domain."""
+        return self.entity_id.split(".", 1)[0]
+
+    @property
+    def name(self) -> str:
+        """Return the friendly name or the entity_id."""
+        return str(self.attributes.get("friendly_name", self.entity_id))
+
+
+class FakeStateMachine:
+    """State machine stand-in backed by a dict."""
+
+    def __init__(self) -> None:
+        """Initialize an empty state machine."""
+        self.states: dict[str, FakeState] = {}
+
+    def get(self, entity_id: str) -> FakeState | None:
+        """Return the state of an entity."""
+        return self.states.get(entity_id)
+
+    def async_all(self, domain_filter: str | None = None) -> list[FakeState]:
+        """Return all states, optionally of one domain."""
+        return [
+            state
+            for state in self.states.values()
+            if domain_filter is None or state.domain == domain_filter
+        ]
+
+    def async_entity_ids(self, domain_filter: str | None = None) -> list[str]:
+        """Return all entity_ids, optionally of one domain."""
+        return [state.entity_id for state in self.async_all(domain_filter)]
+
+    def async_available(self, entity_id: str) -> bool:
+        """Return True if no state exists for ``entity_id``."""
+        return entity_id not in self.states
+
+    def async_set(
+        self, entity_id: str, state: str, attributes: dict[str, Any] | None = None
+    ) -> None:
+        """Set the state of an entity."""
+        self.states[entity_id] = FakeState(entity_id, state, attributes or {})
+
+
+class FakeBus:
+    """Event bus stand-in that records listeners without dispatching."""
+
+    def __init__(self) -> None:
+        """Initialize the bus."""
+        self.listeners: dict[str, list[Callable[..., Any]]] = {}
+
+    def async_listen(
+        self, event_type: str, listener: Callable[..., Any], **_kwargs: Any
+    ) -> Callable[[], None]:
+        """Register a listener and return an unsubscribe callable."""
+        self.listeners.setdefault(event_type, []).append(listener)
+
+        def _unsubscribe() -> None:
+            self.listeners[event_type].remove(listener)
+
+        return _unsubscribe
+
+
+class FakeHass:
+    """Minimal stand-in for ``HomeAssistant`` used by the benchmarks."""
+
+    def __init__(self) -> None:
+        """Initialize the fake instance."""
+        self.data: dict[str, Any] = {}
+        self.bus = FakeBus()
+        self.states = FakeStateMachine()
+
+
+def build_registry(size: int, platform: str = "other") -> FakeEntityRegistry:
+    """Build a registry with ``size`` unrelated sensor entries."""
+    registry = FakeEntityRegistry()
+    for i in range(size):
+        registry.add(
+            FakeRegistryEntry(
+                entity_id=f"sensor.{platform}_{i}",
+                unique_id=f"{platform}_unique_{i}",
+                platform=platform,
+            )
+        )
+    return registry
+
+
+def time_call(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Return the median wall time in seconds of ``func`` over ``repeat`` runs."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def print_table(title: str, headers: list[str], rows: list[list[Any]]) -> None:
+    """Print benchmark results as an aligned text table."""
+    widths = [
+        max(len(str(h)), *(len(str(r[i])) for r in rows)) if rows else len(str(h))
+        for i, h in enumerate(headers)
+    ]
+    print(f"\n{title}")
+    print("  ".join(str(h).rjust(w) for h, w in zip(headers, widths, strict=True)))
+    for row in rows:
+        print("  ".join(str(c).rjust(w) for c, w in zip(row, widths, strict=True)))
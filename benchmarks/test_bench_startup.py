@@ -0,0 +1,63 @@
+"""
+Platform startup benchmarks for pytest-benchmark.
+
+Run from the repository root::
+
+    pytest benchmarks/test_bench_startup.py --benchmark-only
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from benchmarks.bench_startup import (
+    PLATFORMS,
+    SCENARIOS,
+    Install,
+    async_run_startup,
+    build_install,
+)
+
+if TYPE_CHECKING:
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize(
+    ("zones", "locations_per_zone"),
+    SCENARIOS,
+    ids=[f"{zones * locations}-locations" for zones, locations in SCENARIOS],
+)
+def test_startup(
+    benchmark: BenchmarkFixture, zones: int, locations_per_zone: int
+) -> None:
+    """Benchmark setting up every platform on a fresh install."""
+
+    def setup() -> tuple[tuple[Install], dict[str, Any]]:
+        return (build_install(zones, locations_per_zone),), {}
+
+    def run(install: Install) -> Any:
+        # asyncio.run() would clear the current event loop, which the Home
+        # Assistant pytest plugin expects to find in the next test
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(async_run_startup(install))
+        finally:
+            loop.close()
+
+    results, counters = benchmark.pedantic(run, setup=setup, rounds=3)
+
+    if [result.platform for result in results] != list(PLATFORMS):
+        pytest.fail("Not every platform was set up")
+    if not all(result.entities for result in results):
+        pytest.fail("A platform created no entities")
+    if any(result.failed_tasks for result in results):
+        pytest.fail("Tasks scheduled while adding entities failed")
+    benchmark.extra_info.update(
+        {f"{result.platform}_entities": result.entities for result in results}
+        | {"subscriptions": counters.subscriptions}
+    )
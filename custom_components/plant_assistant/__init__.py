@@ -15,7 +15,50 @@ from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 
 from . import device as device_helper
-from .const import DOMAIN
+from .callback_profiler import (
+    CallbackProfiler,
+    async_enable_callback_profiler,
+    async_unload_callback_profiler,
+)
+from .const import (
+    CALLBACK_PROFILER_KEY,
+    CONF_CALLBACK_PROFILING,
+    CONF_MIRROR_WRITE_FILTERS,
+    CONF_STATE_WRITE_DEBOUNCE,
+    DEFAULT_CALLBACK_PROFILING,
+    DEFAULT_STATE_WRITE_DEBOUNCE,
+    DOMAIN,
+    MIRROR_WRITE_FILTERS_KEY,
+    RECONFIGURE_KEY,
+    STATE_MULTIPLEXER_KEY,
+    WRITE_COALESCER_KEY,
+)
+from .device_availability import async_unload_device_availability_trackers
+from .entity_index import async_unload_entity_index
+from .ignore_until import async_unload_ignore_until_scheduler
+from .irrigation_events import async_unload_irrigation_event_dispatcher
+from .mirror_registry import async_unload_mirror_registry
+from .mirror_write_filter import (
+    MirrorWriteFilters,
+    async_get_mirror_write_filters,
+    async_unload_mirror_write_filters,
+)
+from .orphan_cleanup import async_cleanup_orphaned_entities
+from .plant_snapshot import async_unload_plant_snapshots
+from .reconfigure import (
+    ReconfigureManager,
+    async_get_reconfigure_manager,
+    async_unload_reconfigure_manager,
+)
+from .state_multiplexer import (
+    StateChangeMultiplexer,
+    async_unload_state_multiplexer,
+)
+from .write_coalescer import (
+    StateWriteCoalescer,
+    async_get_write_coalescer,
+    async_unload_write_coalescer,
+)
 
 if TYPE_CHECKING:
     from homeassistant import config_entries
@@ -142,6 +185,26 @@ async def async_setup_entry(
         entry.options
     )
 
+    async_get_write_coalescer(hass).debounce = float(
+        entry.options.get(CONF_STATE_WRITE_DEBOUNCE, DEFAULT_STATE_WRITE_DEBOUNCE)
+    )
+    async_get_mirror_write_filters(hass).async_configure(
+        entry.options.get(CONF_MIRROR_WRITE_FILTERS)
+    )
+
+    # Wrap the entity callbacks before the platforms subscribe them
+    if entry.options.get(CONF_CALLBACK_PROFILING, DEFAULT_CALLBACK_PROFILING):
+        await async_enable_callback_profiler(hass)
+    else:
+        async_unload_callback_profiler(hass)
+
+    # Remember the configuration the entities are created from, so updates
+    # can be diffed against it
+    async_get_reconfigure_manager(hass).async_remember(entry)
+
+    # Remove entities the configuration no longer creates, once for all platforms
+    async_cleanup_orphaned_entities(hass, entry)
+
     # Set up options update listener
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
@@ -160,7 +223,10 @@ async def async_update_options(
         entry.options
     )
 
-    # Reload the integration when options change
+    # Apply the change to the affected entities only, reloading the
+    # integration when the diff cannot be applied in place
+    if async_get_reconfigure_manager(hass).async_apply(entry):
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
@@ -168,6 +234,11 @@ async def async_unload_entry(
     hass: HomeAssistant, entry: config_entries.ConfigEntry[Any]
 ) -> bool:  # pragma: no cover - requires HA runtime
     """Unload a config entry."""
+    # Unload the platforms first: their entities still use the shared
+    # services below while they are removed.
+    if not await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+        return False
+
     # Remove this entry's data
     domain_data = hass.data.get(DOMAIN, {})
     entries_data = domain_data.get("entries", {})
@@ -176,10 +247,20 @@ async def async_unload_entry(
     # Only clear domain data if no other entries exist
     if not entries_data:
         # Entity monitoring cleanup is handled per-sensor
+        async_unload_entity_index(hass)
+        async_unload_irrigation_event_dispatcher(hass)
+        async_unload_ignore_until_scheduler(hass)
+        async_unload_write_coalescer(hass)
+        async_unload_plant_snapshots(hass)
+        async_unload_device_availability_trackers(hass)
+        async_unload_mirror_registry(hass)
+        async_unload_mirror_write_filters(hass)
+        async_unload_state_multiplexer(hass)
+        async_unload_reconfigure_manager(hass)
+        async_unload_callback_profiler(hass)
         hass.data.pop(DOMAIN, None)
 
-    result = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
-    return bool(result)
+    return True
 
 
 async def async_get_config_entry_diagnostics(
@@ -204,6 +285,26 @@ async def async_get_config_entry_diagnostics(
     ) as exc:  # pragma: no cover - best-effort
         diagnostics["mappings_error"] = str(exc)
 
+    coalescer = hass.data.get(DOMAIN, {}).get(WRITE_COALESCER_KEY)
+    if isinstance(coalescer, StateWriteCoalescer):
+        diagnostics["state_writes"] = coalescer.as_dict()
+
+    mirror_filters = hass.data.get(DOMAIN, {}).get(MIRROR_WRITE_FILTERS_KEY)
+    if isinstance(mirror_filters, MirrorWriteFilters):
+        diagnostics["mirror_write_filters"] = mirror_filters.as_dict()
+
+    multiplexer = hass.data.get(DOMAIN, {}).get(STATE_MULTIPLEXER_KEY)
+    if isinstance(multiplexer, StateChangeMultiplexer):
+        diagnostics["state_subscriptions"] = multiplexer.as_dict()
+
+    reconfigure = hass.data.get(DOMAIN, {}).get(RECONFIGURE_KEY)
+    if isinstance(reconfigure, ReconfigureManager):
+        diagnostics["reconfigure"] = reconfigure.as_dict()
+
+    profiler = hass.data.get(DOMAIN, {}).get(CALLBACK_PROFILER_KEY)
+    if isinstance(profiler, CallbackProfiler):
+        diagnostics["callback_profiling"] = profiler.as_dict()
+
     return diagnostics
 
 
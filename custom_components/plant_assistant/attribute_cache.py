@@ -0,0 +1,55 @@
+"""
+Cached state attributes for Plant Assistant monitors.
+
+Home Assistant reads ``extra_state_attributes`` on every state write, and the
+location monitors used to rebuild their whole attribute dict each time: the
+tag list, the alert texts, ``dt_util.now()`` and the ISO formatting of their
+ignore-until datetimes. An ``AttributeCache`` keeps the last mapping built
+together with a key describing its inputs, and only calls the builder again
+once that key changes. The mapping is returned read-only, so callers cannot
+alter the cached copy.
+"""
+
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Mapping
+
+_UNSET: Any = object()
+
+
+class AttributeCache:
+    """Read-only attribute mapping rebuilt only when its key changes."""
+
+    __slots__ = ("_attributes", "_key", "builds")
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._key: Hashable = _UNSET
+        self._attributes: Mapping[str, Any] | None = None
+        self.builds = 0
+
+    def get(
+        self, key: Hashable, build: Callable[[], dict[str, Any]]
+    ) -> Mapping[str, Any]:
+        """
+        Return the attributes for ``key``, calling ``build`` if it changed.
+
+        Args:
+            key: Value of every input the attributes depend on.
+            build: Returns the attributes for the current inputs.
+
+        """
+        if self._attributes is None or key != self._key:
+            self._attributes = MappingProxyType(build())
+            self._key = key
+            self.builds += 1
+        return self._attributes
+
+    def clear(self) -> None:
+        """Drop the cached attributes."""
+        self._key = _UNSET
+        self._attributes = None
@@ -0,0 +1,2886 @@
+"""
+Irrigation zone binary sensors for the Plant Assistant integration.
+
+The schedule, water delivery, error, ESPHome running and overall status
+monitors of irrigation zones linked to an ESPHome irrigation controller.
+Imported by the binary_sensor platform only when a zone has a linked
+controller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_track_state_change_event,
+)
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
+
+from .callback_profiler import profiled_callback
+from .const import DOMAIN
+from .device import shared_device_info
+from .ignore_until import IgnoreUntilExpiryMixin
+from .sensor import _resolve_entity_id, find_device_entities_by_pattern
+from .write_coalescer import CoalescedWriteMixin
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import Event, HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+# Error count threshold for problem status
+ERROR_COUNT_THRESHOLD = 3
+
+
+@dataclass(slots=True)
+class MasterScheduleStatusMonitorConfig:
+    """Configuration for MasterScheduleStatusMonitorBinarySensor."""
+
+    hass: HomeAssistant
+    entry_id: str
+    location_name: str
+    irrigation_zone_name: str
+    master_schedule_switch_entity_id: str
+    zone_device_identifier: tuple[str, str]
+    master_schedule_switch_unique_id: str | None = None
+
+
+@dataclass(slots=True)
+class ScheduleMisconfigurationStatusMonitorConfig:
+    """Configuration for ScheduleMisconfigurationStatusMonitorBinarySensor."""
+
+    hass: HomeAssistant
+    entry_id: str
+    location_name: str
+    irrigation_zone_name: str
+    master_schedule_switch_entity_id: str
+    sunrise_switch_entity_id: str
+    afternoon_switch_entity_id: str
+    sunset_switch_entity_id: str
+    zone_device_identifier: tuple[str, str]
+    master_schedule_switch_unique_id: str | None = None
+    sunrise_switch_unique_id: str | None = None
+    afternoon_switch_unique_id: str | None = None
+    sunset_switch_unique_id: str | None = None
+
+
+@dataclass(slots=True)
+class WaterDeliveryPreferenceStatusMonitorConfig:
+    """Configuration for WaterDeliveryPreferenceStatusMonitorBinarySensor."""
+
+    hass: HomeAssistant
+    entry_id: str
+    location_name: str
+    irrigation_zone_name: str
+    master_schedule_switch_entity_id: str
+    allow_rain_water_delivery_switch_entity_id: str
+    allow_water_main_delivery_switch_entity_id: str
+    zone_device_identifier: tuple[str, str]
+    master_schedule_switch_unique_id: str | None = None
+    allow_rain_water_delivery_switch_unique_id: str | None = None
+    allow_water_main_delivery_switch_unique_id: str | None = None
+
+
+@dataclass(slots=True)
+class ErrorStatusMonitorConfig:
+    """Configuration for ErrorStatusMonitorBinarySensor."""
+
+    hass: HomeAssistant
+    entry_id: str
+    location_name: str
+    irrigation_zone_name: str
+    error_count_entity_id: str
+    zone_device_identifier: tuple[str, str]
+    error_count_entity_unique_id: str | None = None
+
+
+@dataclass(slots=True)
+class ESPHomeRunningStatusMonitorConfig:
+    """Configuration for ESPHomeRunningStatusMonitorBinarySensor."""
+
+    hass: HomeAssistant
+    entry_id: str
+    location_name: str
+    irrigation_zone_name: str
+    monitoring_device_id: str
+    zone_device_identifier: tuple[str, str]
+
+
+@dataclass(slots=True)
+class IrrigationZoneStatusMonitorConfig:
+    """Configuration for IrrigationZoneStatusMonitorBinarySensor."""
+
+    hass: HomeAssistant
+    entry_id: str
+    location_name: str
+    irrigation_zone_name: str
+    zone_id: str
+    zone_device_identifier: tuple[str, str]
+
+
+class MasterScheduleStatusMonitorBinarySensor(
+    IgnoreUntilExpiryMixin, CoalescedWriteMixin, BinarySensorEntity, RestoreEntity
+):
+    """
+    Binary sensor that monitors master schedule status for an irrigation zone.
+
+    This sensor turns ON (problem detected) when the master schedule switch
+    for an irrigation zone associated with an esphome device has been turned off.
+    The sensor respects the Schedule Ignore Until datetime entity - if the current
+    time is before the ignore until datetime, the problem is not raised.
+    """
+
+    def __init__(self, config: MasterScheduleStatusMonitorConfig) -> None:
+        """
+        Initialize the Master Schedule Status Monitor binary sensor.
+
+        Args:
+            config: Configuration object containing sensor parameters.
+
+        """
+        self.hass = config.hass
+        self.entry_id = config.entry_id
+        self.zone_device_identifier = config.zone_device_identifier
+        self.location_name = config.location_name
+        self.irrigation_zone_name = config.irrigation_zone_name
+        self.master_schedule_switch_entity_id = config.master_schedule_switch_entity_id
+        self._master_schedule_switch_unique_id = config.master_schedule_switch_unique_id
+
+        # Set entity attributes
+        self._attr_name = f"{self.location_name} Schedule Status"
+
+        # Generate unique_id
+        location_name_safe = self.location_name.lower().replace(" ", "_")
+        self._attr_unique_id = (
+            f"{DOMAIN}_{self.entry_id}_{location_name_safe}_schedule_status"
+        )
+
+        # Set binary sensor properties
+        self._attr_device_class = BinarySensorDeviceClass.PROBLEM
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(self.zone_device_identifier)
+
+        self._state: bool | None = None
+        self._master_schedule_on: bool | None = None
+        self._ignore_until_datetime: Any = None
+        self._unsubscribe_handlers: list[Any] = []
+
+        # Initialize with current state of master schedule switch entity
+        if switch_state := self.hass.states.get(self.master_schedule_switch_entity_id):
+            self._master_schedule_on = switch_state.state == "on"
+
+    def _update_state(self) -> None:
+        """Update binary sensor state based on master schedule switch status."""
+        # If master schedule switch state is unavailable, set state to None
+        if self._master_schedule_on is None:
+            self._state = None
+            return
+
+        # Check if we're currently in the ignore period
+        if self._ignore_until_datetime is not None:
+            try:
+                now = dt_util.now()
+                if now < self._ignore_until_datetime:
+                    # Current time is before ignore until datetime, no problem
+                    self._state = False
+                    return
+            except (TypeError, AttributeError) as exc:
+                _LOGGER.debug("Error checking ignore until datetime: %s", exc)
+
+        # Binary sensor is ON (problem) when master schedule switch is OFF
+        self._state = not self._master_schedule_on
+
+    async def _find_schedule_ignore_until_entity(self) -> str | None:
+        """
+        Find schedule ignore until datetime entity for this irrigation zone.
+
+        Returns the entity_id if found, None otherwise.
+        """
+        try:
+            ent_reg = er.async_get(self.hass)
+
+            # Build the expected unique_id pattern based on zone device identifier
+            zone_device_domain = self.zone_device_identifier[0]
+            zone_device_id = self.zone_device_identifier[1]
+
+            for entity in ent_reg.entities.values():
+                if (
+                    entity.platform == DOMAIN
+                    and entity.domain == "datetime"
+                    and entity.unique_id
+                    and "schedule_ignore_until" in entity.unique_id
+                    and zone_device_domain in entity.unique_id
+                    and zone_device_id in entity.unique_id
+                ):
+                    _LOGGER.debug(
+                        "Found schedule ignore until datetime: %s",
+                        entity.entity_id,
+                    )
+                    return entity.entity_id
+
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.debug("Error finding schedule ignore until entity: %s", exc)
+
+        return None
+
+    @profiled_callback
+    def _master_schedule_state_changed(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Handle master schedule switch state changes."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            self._master_schedule_on = None
+        else:
+            self._master_schedule_on = new_state.state == "on"
+
+        self._update_state()
+        self.async_write_ha_state()
+
+    @profiled_callback
+    def _schedule_ignore_until_state_changed(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Handle schedule ignore until datetime changes."""
+        new_state = event.data.get("new_state")
+        if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._ignore_until_datetime = None
+        else:
+            try:
+                parsed_datetime = dt_util.parse_datetime(new_state.state)
+                if parsed_datetime is not None:
+                    # Ensure timezone info
+                    if parsed_datetime.tzinfo is None:
+                        parsed_datetime = parsed_datetime.replace(
+                            tzinfo=dt_util.get_default_time_zone()
+                        )
+                    self._ignore_until_datetime = parsed_datetime
+                else:
+                    self._ignore_until_datetime = None
+            except (ValueError, TypeError) as exc:
+                _LOGGER.debug("Error parsing schedule ignore until datetime: %s", exc)
+                self._ignore_until_datetime = None
+
+        self._update_state()
+        self.async_write_ha_state()
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if master schedule is off (problem detected)."""
+        return self._state
+
+    @property
+    def icon(self) -> str:
+        """Return icon based on sensor state."""
+        if self._state is True:
+            return "mdi:clock-remove"
+        return "mdi:clock-check"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return entity specific state attributes."""
+        attrs = {
+            "type": "Warning",
+            "message": "Master Schedule Off" if self._state else "Master Schedule On",
+            "task": True,
+            "tags": [
+                self.irrigation_zone_name.lower().replace(" ", "_"),
+            ],
+            "master_schedule_on": self._master_schedule_on,
+            "source_entity": self.master_schedule_switch_entity_id,
+        }
+
+        # Add ignore until information if available
+        if self._ignore_until_datetime:
+            now = dt_util.now()
+            attrs["ignore_until"] = self._ignore_until_datetime.isoformat()
+            attrs["currently_ignoring"] = now < self._ignore_until_datetime
+
+        return attrs
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        switch_state = self.hass.states.get(self.master_schedule_switch_entity_id)
+        return switch_state is not None
+
+    async def _restore_previous_state(self) -> None:
+        """Restore previous state if available."""
+        last_state = await self.async_get_last_state()
+
+        if last_state is not None and last_state.state not in (
+            "unknown",
+            "unavailable",
+            None,
+        ):
+            try:
+                self._state = last_state.state == "on"
+                _LOGGER.info(
+                    "Restored master schedule status for %s: %s",
+                    self.location_name,
+                    self._state,
+                )
+            except (AttributeError, ValueError):
+                pass
+
+    async def _setup_schedule_ignore_until_subscription(self) -> None:
+        """Find and subscribe to schedule ignore until datetime entity."""
+        ignore_until_entity_id = await self._find_schedule_ignore_until_entity()
+        if ignore_until_entity_id:
+            if ignore_until_state := self.hass.states.get(ignore_until_entity_id):
+                try:
+                    parsed_datetime = dt_util.parse_datetime(ignore_until_state.state)
+                    if parsed_datetime is not None:
+                        if parsed_datetime.tzinfo is None:
+                            parsed_datetime = parsed_datetime.replace(
+                                tzinfo=dt_util.get_default_time_zone()
+                            )
+                        self._ignore_until_datetime = parsed_datetime
+                except (ValueError, TypeError) as exc:
+                    _LOGGER.debug(
+                        "Error parsing schedule ignore until datetime: %s", exc
+                    )
+
+            try:
+                self._unsubscribe_handlers.append(
+                    async_track_state_change_event(
+                        self.hass,
+                        ignore_until_entity_id,
+                        self._schedule_ignore_until_state_changed,
+                    )
+                )
+                _LOGGER.debug(
+                    "Subscribed to schedule ignore until datetime: %s",
+                    ignore_until_entity_id,
+                )
+            except (AttributeError, KeyError, ValueError) as exc:
+                _LOGGER.warning(
+                    "Failed to subscribe to schedule ignore until entity %s: %s",
+                    ignore_until_entity_id,
+                    exc,
+                )
+        else:
+            _LOGGER.debug(
+                "Schedule ignore until datetime not found for zone %s",
+                self.irrigation_zone_name,
+            )
+
+    async def _setup_master_schedule_subscription(self) -> None:
+        """Subscribe to master schedule switch entity state changes."""
+        # Re-resolve entity_id immediately before subscription to handle any
+        # renames that occurred during initialization
+        from .sensor import _resolve_entity_id  # noqa: PLC0415
+
+        self.master_schedule_switch_entity_id = (
+            _resolve_entity_id(
+                self.hass,
+                self.master_schedule_switch_entity_id,
+                self._master_schedule_switch_unique_id,
+            )
+            or self.master_schedule_switch_entity_id
+        )
+        try:
+            self._unsubscribe_handlers.append(
+                async_track_state_change_event(
+                    self.hass,
+                    self.master_schedule_switch_entity_id,
+                    self._master_schedule_state_changed,
+                )
+            )
+            _LOGGER.debug(
+                "Subscribed to master schedule switch: %s",
+                self.master_schedule_switch_entity_id,
+            )
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to subscribe to master schedule entity %s: %s",
+                self.master_schedule_switch_entity_id,
+                exc,
+            )
+
+    async def _resolve_entity_references(self) -> None:
+        """Resolve entity references using unique_id if entity_id not found."""
+        # Import helper at runtime to avoid circular imports
+        from .sensor import _resolve_entity_id  # noqa: PLC0415
+
+        # Resolve master schedule switch
+        resolved_entity_id = _resolve_entity_id(
+            self.hass,
+            self.master_schedule_switch_entity_id,
+            self._master_schedule_switch_unique_id,
+        )
+        if (
+            resolved_entity_id
+            and resolved_entity_id != self.master_schedule_switch_entity_id
+        ):
+            _LOGGER.info(
+                "Resolved master_schedule_switch for %s: %s -> %s",
+                self.location_name,
+                self.master_schedule_switch_entity_id,
+                resolved_entity_id,
+            )
+            self.master_schedule_switch_entity_id = resolved_entity_id
+
+    async def async_added_to_hass(self) -> None:
+        """Add entity to hass and subscribe to state changes."""
+        # Restore previous state if available
+        await super().async_added_to_hass()
+        await self._restore_previous_state()
+
+        # Resolve entity references before subscriptions
+        await self._resolve_entity_references()
+
+        # Set up subscriptions
+        await self._setup_schedule_ignore_until_subscription()
+        await self._setup_master_schedule_subscription()
+
+        # Update initial state
+        self._update_state()
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        for unsubscribe in self._unsubscribe_handlers:
+            unsubscribe()
+        self._unsubscribe_handlers.clear()
+
+
+class ScheduleMisconfigurationStatusMonitorBinarySensor(
+    IgnoreUntilExpiryMixin, CoalescedWriteMixin, BinarySensorEntity, RestoreEntity
+):
+    """
+    Binary sensor that monitors schedule misconfiguration for an irrigation zone.
+
+    This sensor turns ON (problem detected) when the master schedule switch is on,
+    but all three time-based switches (sunrise, afternoon, sunset) are off, indicating
+    a schedule misconfiguration. The sensor respects the Schedule Misconfiguration
+    Ignore Until datetime entity - if the current time is before the ignore until
+    datetime, the problem is not raised.
+    """
+
+    def __init__(self, config: ScheduleMisconfigurationStatusMonitorConfig) -> None:
+        """
+        Initialize the Schedule Misconfiguration Status Monitor binary sensor.
+
+        Args:
+            config: Configuration object containing sensor parameters.
+
+        """
+        self.hass = config.hass
+        self.entry_id = config.entry_id
+        self.zone_device_identifier = config.zone_device_identifier
+        self.location_name = config.location_name
+        self.irrigation_zone_name = config.irrigation_zone_name
+        self.master_schedule_switch_entity_id = config.master_schedule_switch_entity_id
+        self.sunrise_switch_entity_id = config.sunrise_switch_entity_id
+        self.afternoon_switch_entity_id = config.afternoon_switch_entity_id
+        self.sunset_switch_entity_id = config.sunset_switch_entity_id
+        self._master_schedule_switch_unique_id = config.master_schedule_switch_unique_id
+        self._sunrise_switch_unique_id = config.sunrise_switch_unique_id
+        self._afternoon_switch_unique_id = config.afternoon_switch_unique_id
+        self._sunset_switch_unique_id = config.sunset_switch_unique_id
+
+        # Set entity attributes
+        self._attr_name = f"{self.location_name} Schedule Misconfiguration Status"
+
+        # Generate unique_id
+        location_name_safe = self.location_name.lower().replace(" ", "_")
+        self._attr_unique_id = (
+            f"{DOMAIN}_{self.entry_id}_{location_name_safe}_"
+            "schedule_misconfiguration_status"
+        )
+
+        # Set binary sensor properties
+        self._attr_device_class = BinarySensorDeviceClass.PROBLEM
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(self.zone_device_identifier)
+
+        self._state: bool | None = None
+        self._master_schedule_on: bool | None = None
+        self._sunrise_on: bool | None = None
+        self._afternoon_on: bool | None = None
+        self._sunset_on: bool | None = None
+        self._ignore_until_datetime: Any = None
+        self._unsubscribe_handlers: list[Any] = []
+
+        # Initialize with current state of switch entities
+        if master_state := self.hass.states.get(self.master_schedule_switch_entity_id):
+            self._master_schedule_on = master_state.state == "on"
+        if sunrise_state := self.hass.states.get(self.sunrise_switch_entity_id):
+            self._sunrise_on = sunrise_state.state == "on"
+        if afternoon_state := self.hass.states.get(self.afternoon_switch_entity_id):
+            self._afternoon_on = afternoon_state.state == "on"
+        if sunset_state := self.hass.states.get(self.sunset_switch_entity_id):
+            self._sunset_on = sunset_state.state == "on"
+
+    def _update_state(self) -> None:
+        """Update binary sensor state based on schedule switch status."""
+        # If any switch state is unavailable, set state to None
+        if (
+            self._master_schedule_on is None
+            or self._sunrise_on is None
+            or self._afternoon_on is None
+            or self._sunset_on is None
+        ):
+            self._state = None
+            return
+
+        # Check if we're currently in the ignore period
+        if self._ignore_until_datetime is not None:
+            try:
+                now = dt_util.now()
+                if now < self._ignore_until_datetime:
+                    # Current time is before ignore until datetime, no problem
+                    self._state = False
+                    return
+            except (TypeError, AttributeError) as exc:
+                _LOGGER.debug("Error checking ignore until datetime: %s", exc)
+
+        # Binary sensor is ON (problem) when:
+        # - Master schedule switch is ON AND
+        # - All three time-based switches (sunrise, afternoon, sunset) are OFF
+        all_time_switches_off = (
+            not self._sunrise_on and not self._afternoon_on and not self._sunset_on
+        )
+        self._state = self._master_schedule_on and all_time_switches_off
+
+    async def _find_schedule_misconfiguration_ignore_until_entity(self) -> str | None:
+        """
+        Find schedule misconfiguration ignore until datetime entity for this zone.
+
+        Returns the entity_id if found, None otherwise.
+        """
+        try:
+            ent_reg = er.async_get(self.hass)
+
+            # Build the expected unique_id pattern based on zone device identifier
+            zone_device_domain = self.zone_device_identifier[0]
+            zone_device_id = self.zone_device_identifier[1]
+
+            for entity in ent_reg.entities.values():
+                if (
+                    entity.platform == DOMAIN
+                    and entity.domain == "datetime"
+                    and entity.unique_id
+                    and "schedule_misconfiguration_ignore_until" in entity.unique_id
+                    and zone_device_domain in entity.unique_id
+                    and zone_device_id in entity.unique_id
+                ):
+                    _LOGGER.debug(
+                        "Found schedule misconfiguration ignore until datetime: %s",
+                        entity.entity_id,
+                    )
+                    return entity.entity_id
+
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.debug(
+                "Error finding schedule misconfiguration ignore until entity: %s", exc
+            )
+
+        return None
+
+    @profiled_callback
+    def _master_schedule_state_changed(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Handle master schedule switch state changes."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            self._master_schedule_on = None
+        else:
+            self._master_schedule_on = new_state.state == "on"
+
+        self._update_state()
+        self.async_write_ha_state()
+
+    @profiled_callback
+    def _sunrise_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle sunrise switch state changes."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            self._sunrise_on = None
+        else:
+            self._sunrise_on = new_state.state == "on"
+
+        self._update_state()
+        self.async_write_ha_state()
+
+    @profiled_callback
+    def _afternoon_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle afternoon switch state changes."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            self._afternoon_on = None
+        else:
+            self._afternoon_on = new_state.state == "on"
+
+        self._update_state()
+        self.async_write_ha_state()
+
+    @profiled_callback
+    def _sunset_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle sunset switch state changes."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            self._sunset_on = None
+        else:
+            self._sunset_on = new_state.state == "on"
+
+        self._update_state()
+        self.async_write_ha_state()
+
+    @profiled_callback
+    def _schedule_misconfiguration_ignore_until_state_changed(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Handle schedule misconfiguration ignore until datetime changes."""
+        new_state = event.data.get("new_state")
+        if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._ignore_until_datetime = None
+        else:
+            try:
+                parsed_datetime = dt_util.parse_datetime(new_state.state)
+                if parsed_datetime is not None:
+                    # Ensure timezone info
+                    if parsed_datetime.tzinfo is None:
+                        parsed_datetime = parsed_datetime.replace(
+                            tzinfo=dt_util.get_default_time_zone()
+                        )
+                    self._ignore_until_datetime = parsed_datetime
+                else:
+                    self._ignore_until_datetime = None
+            except (ValueError, TypeError) as exc:
+                _LOGGER.debug(
+                    "Error parsing schedule misconfiguration ignore until datetime: %s",
+                    exc,
+                )
+                self._ignore_until_datetime = None
+
+        self._update_state()
+        self.async_write_ha_state()
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if schedule is misconfigured (problem detected)."""
+        return self._state
+
+    @property
+    def icon(self) -> str:
+        """Return icon based on sensor state."""
+        if self._state is True:
+            return "mdi:clock-alert"
+        return "mdi:clock-check"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return entity specific state attributes."""
+        attrs = {
+            "type": "Warning",
+            "message": ("Schedule Misconfigured" if self._state else "Schedule OK"),
+            "task": True,
+            "tags": [
+                self.irrigation_zone_name.lower().replace(" ", "_"),
+            ],
+            "master_schedule_on": self._master_schedule_on,
+            "sunrise_on": self._sunrise_on,
+            "afternoon_on": self._afternoon_on,
+            "sunset_on": self._sunset_on,
+            "source_entity_master": self.master_schedule_switch_entity_id,
+            "source_entity_sunrise": self.sunrise_switch_entity_id,
+            "source_entity_afternoon": self.afternoon_switch_entity_id,
+            "source_entity_sunset": self.sunset_switch_entity_id,
+        }
+
+        # Add ignore until information if available
+        if self._ignore_until_datetime:
+            now = dt_util.now()
+            attrs["ignore_until"] = self._ignore_until_datetime.isoformat()
+            attrs["currently_ignoring"] = now < self._ignore_until_datetime
+
+        return attrs
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        master_state = self.hass.states.get(self.master_schedule_switch_entity_id)
+        sunrise_state = self.hass.states.get(self.sunrise_switch_entity_id)
+        afternoon_state = self.hass.states.get(self.afternoon_switch_entity_id)
+        sunset_state = self.hass.states.get(self.sunset_switch_entity_id)
+
+        # Entity is available if all switches exist and are not unavailable/unknown
+        for state in [master_state, sunrise_state, afternoon_state, sunset_state]:
+            if state is None:
+                return False
+            if state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                return False
+
+        return True
+
+    async def _restore_previous_state(self) -> None:
+        """Restore previous state if available."""
+        last_state = await self.async_get_last_state()
+
+        if last_state is not None and last_state.state not in (
+            "unknown",
+            "unavailable",
+            None,
+        ):
+            try:
+                self._state = last_state.state == "on"
+                _LOGGER.info(
+                    "Restored schedule misconfiguration status for %s: %s",
+                    self.location_name,
+                    self._state,
+                )
+            except (AttributeError, ValueError):
+                pass
+
+    async def _setup_schedule_misconfiguration_ignore_until_subscription(self) -> None:
+        """Find and subscribe to schedule misconfiguration ignore until entity."""
+        ignore_until_entity_id = (
+            await self._find_schedule_misconfiguration_ignore_until_entity()
+        )
+        if ignore_until_entity_id:
+            if ignore_until_state := self.hass.states.get(ignore_until_entity_id):
+                try:
+                    parsed_datetime = dt_util.parse_datetime(ignore_until_state.state)
+                    if parsed_datetime is not None:
+                        if parsed_datetime.tzinfo is None:
+                            parsed_datetime = parsed_datetime.replace(
+                                tzinfo=dt_util.get_default_time_zone()
+                            )
+                        self._ignore_until_datetime = parsed_datetime
+                except (ValueError, TypeError) as exc:
+                    _LOGGER.debug(
+                        "Error parsing schedule misconfiguration ignore until "
+                        "datetime: %s",
+                        exc,
+                    )
+
+            try:
+                self._unsubscribe_handlers.append(
+                    async_track_state_change_event(
+                        self.hass,
+                        ignore_until_entity_id,
+                        self._schedule_misconfiguration_ignore_until_state_changed,
+                    )
+                )
+                _LOGGER.debug(
+                    "Subscribed to schedule misconfiguration ignore until datetime: %s",
+                    ignore_until_entity_id,
+                )
+            except (AttributeError, KeyError, ValueError) as exc:
+                _LOGGER.warning(
+                    "Failed to subscribe to schedule misconfiguration ignore until "
+                    "entity %s: %s",
+                    ignore_until_entity_id,
+                    exc,
+                )
+        else:
+            _LOGGER.debug(
+                "Schedule misconfiguration ignore until datetime not found for zone %s",
+                self.irrigation_zone_name,
+            )
+
+    async def _setup_master_schedule_subscription(self) -> None:
+        """Subscribe to master schedule switch entity state changes."""
+        try:
+            self._unsubscribe_handlers.append(
+                async_track_state_change_event(
+                    self.hass,
+                    self.master_schedule_switch_entity_id,
+                    self._master_schedule_state_changed,
+                )
+            )
+            _LOGGER.debug(
+                "Subscribed to master schedule switch: %s",
+                self.master_schedule_switch_entity_id,
+            )
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to subscribe to master schedule entity %s: %s",
+                self.master_schedule_switch_entity_id,
+                exc,
+            )
+
+    async def _setup_sunrise_subscription(self) -> None:
+        """Subscribe to sunrise switch entity state changes."""
+        # Re-resolve entity_id immediately before subscription to handle any
+        # renames that occurred during initialization
+        from .sensor import _resolve_entity_id  # noqa: PLC0415
+
+        self.sunrise_switch_entity_id = (
+            _resolve_entity_id(
+                self.hass,
+                self.sunrise_switch_entity_id,
+                self._sunrise_switch_unique_id,
+            )
+            or self.sunrise_switch_entity_id
+        )
+        try:
+            self._unsubscribe_handlers.append(
+                async_track_state_change_event(
+                    self.hass,
+                    self.sunrise_switch_entity_id,
+                    self._sunrise_state_changed,
+                )
+            )
+            _LOGGER.debug(
+                "Subscribed to sunrise switch: %s",
+                self.sunrise_switch_entity_id,
+            )
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to subscribe to sunrise switch entity %s: %s",
+                self.sunrise_switch_entity_id,
+                exc,
+            )
+
+    async def _setup_afternoon_subscription(self) -> None:
+        """Subscribe to afternoon switch entity state changes."""
+        # Re-resolve entity_id immediately before subscription to handle any
+        # renames that occurred during initialization
+        from .sensor import _resolve_entity_id  # noqa: PLC0415
+
+        self.afternoon_switch_entity_id = (
+            _resolve_entity_id(
+                self.hass,
+                self.afternoon_switch_entity_id,
+                self._afternoon_switch_unique_id,
+            )
+            or self.afternoon_switch_entity_id
+        )
+        try:
+            self._unsubscribe_handlers.append(
+                async_track_state_change_event(
+                    self.hass,
+                    self.afternoon_switch_entity_id,
+                    self._afternoon_state_changed,
+                )
+            )
+            _LOGGER.debug(
+                "Subscribed to afternoon switch: %s",
+                self.afternoon_switch_entity_id,
+            )
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to subscribe to afternoon switch entity %s: %s",
+                self.afternoon_switch_entity_id,
+                exc,
+            )
+
+    async def _setup_sunset_subscription(self) -> None:
+        """Subscribe to sunset switch entity state changes."""
+        # Re-resolve entity_id immediately before subscription to handle any
+        # renames that occurred during initialization
+        from .sensor import _resolve_entity_id  # noqa: PLC0415
+
+        self.sunset_switch_entity_id = (
+            _resolve_entity_id(
+                self.hass,
+                self.sunset_switch_entity_id,
+                self._sunset_switch_unique_id,
+            )
+            or self.sunset_switch_entity_id
+        )
+        try:
+            self._unsubscribe_handlers.append(
+                async_track_state_change_event(
+                    self.hass,
+                    self.sunset_switch_entity_id,
+                    self._sunset_state_changed,
+                )
+            )
+            _LOGGER.debug(
+                "Subscribed to sunset switch: %s",
+                self.sunset_switch_entity_id,
+            )
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to subscribe to sunset switch entity %s: %s",
+                self.sunset_switch_entity_id,
+                exc,
+            )
+
+    async def _resolve_entity_references(self) -> None:
+        """Resolve entity references using unique_id if entity_id not found."""
+        # Import helper at runtime to avoid circular imports
+        from .sensor import _resolve_entity_id  # noqa: PLC0415
+
+        # Resolve master schedule switch
+        resolved_entity_id = _resolve_entity_id(
+            self.hass,
+            self.master_schedule_switch_entity_id,
+            self._master_schedule_switch_unique_id,
+        )
+        if (
+            resolved_entity_id
+            and resolved_entity_id != self.master_schedule_switch_entity_id
+        ):
+            _LOGGER.info(
+                "Resolved master_schedule_switch for %s: %s -> %s",
+                self.location_name,
+                self.master_schedule_switch_entity_id,
+                resolved_entity_id,
+            )
+            self.master_schedule_switch_entity_id = resolved_entity_id
+
+        # Resolve sunrise switch
+        resolved_entity_id = _resolve_entity_id(
+            self.hass, self.sunrise_switch_entity_id, self._sunrise_switch_unique_id
+        )
+        if resolved_entity_id and resolved_entity_id != self.sunrise_switch_entity_id:
+            _LOGGER.info(
+                "Resolved sunrise_switch for %s: %s -> %s",
+                self.location_name,
+                self.sunrise_switch_entity_id,
+                resolved_entity_id,
+            )
+            self.sunrise_switch_entity_id = resolved_entity_id
+
+        # Resolve afternoon switch
+        resolved_entity_id = _resolve_entity_id(
+            self.hass, self.afternoon_switch_entity_id, self._afternoon_switch_unique_id
+        )
+        if resolved_entity_id and resolved_entity_id != self.afternoon_switch_entity_id:
+            _LOGGER.info(
+                "Resolved afternoon_switch for %s: %s -> %s",
+                self.location_name,
+                self.afternoon_switch_entity_id,
+                resolved_entity_id,
+            )
+            self.afternoon_switch_entity_id = resolved_entity_id
+
+        # Resolve sunset switch
+        resolved_entity_id = _resolve_entity_id(
+            self.hass, self.sunset_switch_entity_id, self._sunset_switch_unique_id
+        )
+        if resolved_entity_id and resolved_entity_id != self.sunset_switch_entity_id:
+            _LOGGER.info(
+                "Resolved sunset_switch for %s: %s -> %s",
+                self.location_name,
+                self.sunset_switch_entity_id,
+                resolved_entity_id,
+            )
+            self.sunset_switch_entity_id = resolved_entity_id
+
+    async def async_added_to_hass(self) -> None:
+        """Add entity to hass and subscribe to state changes."""
+        # Restore previous state if available
+        await super().async_added_to_hass()
+        await self._restore_previous_state()
+
+        # Resolve entity references before subscriptions
+        await self._resolve_entity_references()
+
+        # Set up subscriptions
+        await self._setup_schedule_misconfiguration_ignore_until_subscription()
+        await self._setup_master_schedule_subscription()
+        await self._setup_sunrise_subscription()
+        await self._setup_afternoon_subscription()
+        await self._setup_sunset_subscription()
+
+        # Update initial state
+        self._update_state()
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        for unsubscribe in self._unsubscribe_handlers:
+            unsubscribe()
+        self._unsubscribe_handlers.clear()
+
+
+class WaterDeliveryPreferenceStatusMonitorBinarySensor(
+    IgnoreUntilExpiryMixin, CoalescedWriteMixin, BinarySensorEntity, RestoreEntity
+):
+    """
+    Binary sensor that monitors water delivery preference status for an irrigation zone.
+
+    This sensor turns ON (problem detected) when the master schedule switch is on,
+    but both the Allow Rain Water Delivery and Allow Water Main Delivery switches
+    are off, indicating no water delivery methods are available. The sensor respects
+    the Water Delivery Preference Ignore Until datetime entity - if the current time
+    is before the ignore until datetime, the problem is not raised.
+    """
+
+    def __init__(self, config: WaterDeliveryPreferenceStatusMonitorConfig) -> None:
+        """
+        Initialize the Water Delivery Preference Status Monitor binary sensor.
+
+        Args:
+            config: Configuration object containing sensor parameters.
+
+        """
+        self.hass = config.hass
+        self.entry_id = config.entry_id
+        self.zone_device_identifier = config.zone_device_identifier
+        self.location_name = config.location_name
+        self.irrigation_zone_name = config.irrigation_zone_name
+        self.master_schedule_switch_entity_id = config.master_schedule_switch_entity_id
+        self.allow_rain_water_delivery_switch_entity_id = (
+            config.allow_rain_water_delivery_switch_entity_id
+        )
+        self.allow_water_main_delivery_switch_entity_id = (
+            config.allow_water_main_delivery_switch_entity_id
+        )
+        self._master_schedule_switch_unique_id = config.master_schedule_switch_unique_id
+        self._allow_rain_water_delivery_switch_unique_id = (
+            config.allow_rain_water_delivery_switch_unique_id
+        )
+        self._allow_water_main_delivery_switch_unique_id = (
+            config.allow_water_main_delivery_switch_unique_id
+        )
+
+        # Set entity attributes
+        self._attr_name = f"{self.location_name} Water Delivery Preference Status"
+
+        # Generate unique_id
+        location_name_safe = self.location_name.lower().replace(" ", "_")
+        self._attr_unique_id = (
+            f"{DOMAIN}_{self.entry_id}_{location_name_safe}_"
+            "water_delivery_preference_status"
+        )
+
+        # Set binary sensor properties
+        self._attr_device_class = BinarySensorDeviceClass.PROBLEM
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(self.zone_device_identifier)
+
+        self._state: bool | None = None
+        self._master_schedule_on: bool | None = None
+        self._allow_rain_water_delivery_on: bool | None = None
+        self._allow_water_main_delivery_on: bool | None = None
+        self._ignore_until_datetime: Any = None
+        self._unsubscribe_handlers: list[Any] = []
+
+        # Initialize with current state of switch entities
+        if master_state := self.hass.states.get(self.master_schedule_switch_entity_id):
+            self._master_schedule_on = master_state.state == "on"
+        if rain_state := self.hass.states.get(
+            self.allow_rain_water_delivery_switch_entity_id
+        ):
+            self._allow_rain_water_delivery_on = rain_state.state == "on"
+        if main_state := self.hass.states.get(
+            self.allow_water_main_delivery_switch_entity_id
+        ):
+            self._allow_water_main_delivery_on = main_state.state == "on"
+
+    def _update_state(self) -> None:
+        """Update binary sensor state based on delivery preference switch status."""
+        # If any switch state is unavailable, set state to None
+        if (
+            self._master_schedule_on is None
+            or self._allow_rain_water_delivery_on is None
+            or self._allow_water_main_delivery_on is None
+        ):
+            self._state = None
+            return
+
+        # Check if we're currently in the ignore period
+        if self._ignore_until_datetime is not None:
+            try:
+                now = dt_util.now()
+                if now < self._ignore_until_datetime:
+                    # Current time is before ignore until datetime, no problem
+                    self._state = False
+                    return
+            except (TypeError, AttributeError) as exc:
+                _LOGGER.debug("Error checking ignore until datetime: %s", exc)
+
+        # Binary sensor is ON (problem) when:
+        # - Master schedule switch is ON AND
+        # - Both delivery preference switches are OFF
+        both_delivery_methods_off = (
+            not self._allow_rain_water_delivery_on
+            and not self._allow_water_main_delivery_on
+        )
+        self._state = self._master_schedule_on and both_delivery_methods_off
+
+    async def _find_water_delivery_preference_ignore_until_entity(
+        self,
+    ) -> str | None:
+        """
+        Find water delivery preference ignore until datetime entity for this zone.
+
+        Returns the entity_id if found, None otherwise.
+        """
+        try:
+            ent_reg = er.async_get(self.hass)
+
+            # Build the expected unique_id pattern based on zone device identifier
+            zone_device_domain = self.zone_device_identifier[0]
+            zone_device_id = self.zone_device_identifier[1]
+
+            for entity in ent_reg.entities.values():
+                if (
+                    entity.platform == DOMAIN
+                    and entity.domain == "datetime"
+                    and entity.unique_id
+                    and "water_delivery_preference_ignore_until" in entity.unique_id
+                    and zone_device_domain in entity.unique_id
+                    and zone_device_id in entity.unique_id
+                ):
+                    _LOGGER.debug(
+                        "Found water delivery preference ignore until datetime: %s",
+                        entity.entity_id,
+                    )
+                    return entity.entity_id
+
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.debug(
+                "Error finding water delivery preference ignore until entity: %s", exc
+            )
+
+        return None
+
+    @profiled_callback
+    def _master_schedule_state_changed(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Handle master schedule switch state changes."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            self._master_schedule_on = None
+        else:
+            self._master_schedule_on = new_state.state == "on"
+
+        self._update_state()
+        self.async_write_ha_state()
+
+    @profiled_callback
+    def _allow_rain_water_delivery_state_changed(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Handle allow rain water delivery switch state changes."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            self._allow_rain_water_delivery_on = None
+        else:
+            self._allow_rain_water_delivery_on = new_state.state == "on"
+
+        self._update_state()
+        self.async_write_ha_state()
+
+    @profiled_callback
+    def _allow_water_main_delivery_state_changed(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Handle allow water main delivery switch state changes."""
+        new_state = event.data.get("new_state")
+        if new_state is None:
+            self._allow_water_main_delivery_on = None
+        else:
+            self._allow_water_main_delivery_on = new_state.state == "on"
+
+        self._update_state()
+        self.async_write_ha_state()
+
+    @profiled_callback
+    def _water_delivery_preference_ignore_until_state_changed(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Handle water delivery preference ignore until datetime changes."""
+        new_state = event.data.get("new_state")
+        if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._ignore_until_datetime = None
+        else:
+            try:
+                parsed_datetime = dt_util.parse_datetime(new_state.state)
+                if parsed_datetime is not None:
+                    # Ensure timezone info
+                    if parsed_datetime.tzinfo is None:
+                        parsed_datetime = parsed_datetime.replace(
+                            tzinfo=dt_util.get_default_time_zone()
+                        )
+                    self._ignore_until_datetime = parsed_datetime
+                else:
+                    self._ignore_until_datetime = None
+            except (ValueError, TypeError) as exc:
+                _LOGGER.debug(
+                    "Error parsing water delivery preference ignore until datetime: %s",
+                    exc,
+                )
+                self._ignore_until_datetime = None
+
+        self._update_state()
+        self.async_write_ha_state()
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if water delivery preference misconfigured (problem)."""
+        return self._state
+
+    @property
+    def icon(self) -> str:
+        """Return icon based on sensor state."""
+        if self._state is True:
+            return "mdi:water-alert"
+        return "mdi:water-check"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return entity specific state attributes."""
+        attrs = {
+            "type": "Warning",
+            "message": (
+                "Water Delivery Unset" if self._state else "Water Delivery Available"
+            ),
+            "task": True,
+            "tags": [
+                self.irrigation_zone_name.lower().replace(" ", "_"),
+            ],
+            "master_schedule_on": self._master_schedule_on,
+            "allow_rain_water_delivery_on": self._allow_rain_water_delivery_on,
+            "allow_water_main_delivery_on": self._allow_water_main_delivery_on,
+            "source_entity_master": self.master_schedule_switch_entity_id,
+            "source_entity_rain_delivery": (
+                self.allow_rain_water_delivery_switch_entity_id
+            ),
+            "source_entity_main_delivery": (
+                self.allow_water_main_delivery_switch_entity_id
+            ),
+        }
+
+        # Add ignore until information if available
+        if self._ignore_until_datetime:
+            now = dt_util.now()
+            attrs["ignore_until"] = self._ignore_until_datetime.isoformat()
+            attrs["currently_ignoring"] = now < self._ignore_until_datetime
+
+        return attrs
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        master_state = self.hass.states.get(self.master_schedule_switch_entity_id)
+        rain_state = self.hass.states.get(
+            self.allow_rain_water_delivery_switch_entity_id
+        )
+        main_state = self.hass.states.get(
+            self.allow_water_main_delivery_switch_entity_id
+        )
+
+        # Entity is available if all switches exist and are not unavailable/unknown
+        for state in [master_state, rain_state, main_state]:
+            if state is None:
+                return False
+            if state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                return False
+
+        return True
+
+    async def _restore_previous_state(self) -> None:
+        """Restore previous state if available."""
+        last_state = await self.async_get_last_state()
+
+        if last_state is not None and last_state.state not in (
+            "unknown",
+            "unavailable",
+            None,
+        ):
+            try:
+                self._state = last_state.state == "on"
+                _LOGGER.info(
+                    "Restored water delivery preference status for %s: %s",
+                    self.location_name,
+                    self._state,
+                )
+            except (AttributeError, ValueError):
+                pass
+
+    async def _setup_water_delivery_preference_ignore_until_subscription(
+        self,
+    ) -> None:
+        """Find and subscribe to water delivery preference ignore until entity."""
+        ignore_until_entity_id = (
+            await self._find_water_delivery_preference_ignore_until_entity()
+        )
+        if ignore_until_entity_id:
+            if ignore_until_state := self.hass.states.get(ignore_until_entity_id):
+                try:
+                    parsed_datetime = dt_util.parse_datetime(ignore_until_state.state)
+                    if parsed_datetime is not None:
+                        if parsed_datetime.tzinfo is None:
+                            parsed_datetime = parsed_datetime.replace(
+                                tzinfo=dt_util.get_default_time_zone()
+                            )
+                        self._ignore_until_datetime = parsed_datetime
+                except (ValueError, TypeError) as exc:
+                    _LOGGER.debug(
+                        "Error parsing water delivery preference ignore until "
+                        "datetime: %s",
+                        exc,
+                    )
+
+            try:
+                self._unsubscribe_handlers.append(
+                    async_track_state_change_event(
+                        self.hass,
+                        ignore_until_entity_id,
+                        self._water_delivery_preference_ignore_until_state_changed,
+                    )
+                )
+                _LOGGER.debug(
+                    "Subscribed to water delivery preference ignore until datetime: %s",
+                    ignore_until_entity_id,
+                )
+            except (AttributeError, KeyError, ValueError) as exc:
+                _LOGGER.warning(
+                    "Failed to subscribe to water delivery preference ignore until "
+                    "entity %s: %s",
+                    ignore_until_entity_id,
+                    exc,
+                )
+        else:
+            _LOGGER.debug(
+                "Water delivery preference ignore until datetime not found for zone %s",
+                self.irrigation_zone_name,
+            )
+
+    async def _setup_master_schedule_subscription(self) -> None:
+        """Subscribe to master schedule switch entity state changes."""
+        try:
+            self._unsubscribe_handlers.append(
+                async_track_state_change_event(
+                    self.hass,
+                    self.master_schedule_switch_entity_id,
+                    self._master_schedule_state_changed,
+                )
+            )
+            _LOGGER.debug(
+                "Subscribed to master schedule switch: %s",
+                self.master_schedule_switch_entity_id,
+            )
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to subscribe to master schedule entity %s: %s",
+                self.master_schedule_switch_entity_id,
+                exc,
+            )
+
+    async def _setup_allow_rain_water_delivery_subscription(self) -> None:
+        """Subscribe to allow rain water delivery switch entity state changes."""
+        # Re-resolve entity_id immediately before subscription to handle any
+        # renames that occurred during initialization
+        from .sensor import _resolve_entity_id  # noqa: PLC0415
+
+        self.allow_rain_water_delivery_switch_entity_id = (
+            _resolve_entity_id(
+                self.hass,
+                self.allow_rain_water_delivery_switch_entity_id,
+                self._allow_rain_water_delivery_switch_unique_id,
+            )
+            or self.allow_rain_water_delivery_switch_entity_id
+        )
+        try:
+            self._unsubscribe_handlers.append(
+                async_track_state_change_event(
+                    self.hass,
+                    self.allow_rain_water_delivery_switch_entity_id,
+                    self._allow_rain_water_delivery_state_changed,
+                )
+            )
+            _LOGGER.debug(
+                "Subscribed to allow rain water delivery switch: %s",
+                self.allow_rain_water_delivery_switch_entity_id,
+            )
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to subscribe to allow rain water delivery entity %s: %s",
+                self.allow_rain_water_delivery_switch_entity_id,
+                exc,
+            )
+
+    async def _setup_allow_water_main_delivery_subscription(self) -> None:
+        """Subscribe to allow water main delivery switch entity state changes."""
+        # Re-resolve entity_id immediately before subscription to handle any
+        # renames that occurred during initialization
+        from .sensor import _resolve_entity_id  # noqa: PLC0415
+
+        self.allow_water_main_delivery_switch_entity_id = (
+            _resolve_entity_id(
+                self.hass,
+                self.allow_water_main_delivery_switch_entity_id,
+                self._allow_water_main_delivery_switch_unique_id,
+            )
+            or self.allow_water_main_delivery_switch_entity_id
+        )
+        try:
+            self._unsubscribe_handlers.append(
+                async_track_state_change_event(
+                    self.hass,
+                    self.allow_water_main_delivery_switch_entity_id,
+                    self._allow_water_main_delivery_state_changed,
+                )
+            )
+            _LOGGER.debug(
+                "Subscribed to allow water main delivery switch: %s",
+                self.allow_water_main_delivery_switch_entity_id,
+            )
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to subscribe to allow water main delivery entity %s: %s",
+                self.allow_water_main_delivery_switch_entity_id,
+                exc,
+            )
+
+    async def _resolve_entity_references(self) -> None:
+        """Resolve entity references using unique_id if entity_id not found."""
+        # Import helper at runtime to avoid circular imports
+        from .sensor import _resolve_entity_id  # noqa: PLC0415
+
+        # Resolve master schedule switch
+        resolved_entity_id = _resolve_entity_id(
+            self.hass,
+            self.master_schedule_switch_entity_id,
+            self._master_schedule_switch_unique_id,
+        )
+        if (
+            resolved_entity_id
+            and resolved_entity_id != self.master_schedule_switch_entity_id
+        ):
+            _LOGGER.info(
+                "Resolved master_schedule_switch for %s: %s -> %s",
+                self.location_name,
+                self.master_schedule_switch_entity_id,
+                resolved_entity_id,
+            )
+            self.master_schedule_switch_entity_id = resolved_entity_id
+
+        # Resolve allow rain water delivery switch
+        resolved_entity_id = _resolve_entity_id(
+            self.hass,
+            self.allow_rain_water_delivery_switch_entity_id,
+            self._allow_rain_water_delivery_switch_unique_id,
+        )
+        if (
+            resolved_entity_id
+            and resolved_entity_id != self.allow_rain_water_delivery_switch_entity_id
+        ):
+            _LOGGER.info(
+                "Resolved allow_rain_water_delivery_switch for %s: %s -> %s",
+                self.location_name,
+                self.allow_rain_water_delivery_switch_entity_id,
+                resolved_entity_id,
+            )
+            self.allow_rain_water_delivery_switch_entity_id = resolved_entity_id
+
+        # Resolve allow water main delivery switch
+        resolved_entity_id = _resolve_entity_id(
+            self.hass,
+            self.allow_water_main_delivery_switch_entity_id,
+            self._allow_water_main_delivery_switch_unique_id,
+        )
+        if (
+            resolved_entity_id
+            and resolved_entity_id != self.allow_water_main_delivery_switch_entity_id
+        ):
+            _LOGGER.info(
+                "Resolved allow_water_main_delivery_switch for %s: %s -> %s",
+                self.location_name,
+                self.allow_water_main_delivery_switch_entity_id,
+                resolved_entity_id,
+            )
+            self.allow_water_main_delivery_switch_entity_id = resolved_entity_id
+
+    async def async_added_to_hass(self) -> None:
+        """Add entity to hass and subscribe to state changes."""
+        # Restore previous state if available
+        await super().async_added_to_hass()
+        await self._restore_previous_state()
+
+        # Resolve entity references before subscriptions
+        await self._resolve_entity_references()
+
+        # Set up subscriptions
+        await self._setup_water_delivery_preference_ignore_until_subscription()
+        await self._setup_master_schedule_subscription()
+        await self._setup_allow_rain_water_delivery_subscription()
+        await self._setup_allow_water_main_delivery_subscription()
+
+        # Update initial state
+        self._update_state()
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        for unsubscribe in self._unsubscribe_handlers:
+            unsubscribe()
+        self._unsubscribe_handlers.clear()
+
+
+class ErrorStatusMonitorBinarySensor(
+    CoalescedWriteMixin, BinarySensorEntity, RestoreEntity
+):
+    """
+    Binary sensor that monitors error count status for an irrigation zone.
+
+    This sensor turns ON (problem detected) when the error count reaches 3 or more,
+    indicating that the irrigation zone has accumulated multiple errors.
+    """
+
+    def __init__(self, config: ErrorStatusMonitorConfig) -> None:
+        """
+        Initialize the Error Status Monitor binary sensor.
+
+        Args:
+            config: Configuration object containing sensor parameters.
+
+        """
+        self.hass = config.hass
+        self.entry_id = config.entry_id
+        self.zone_device_identifier = config.zone_device_identifier
+        self.location_name = config.location_name
+        self.irrigation_zone_name = config.irrigation_zone_name
+        self.error_count_entity_id = config.error_count_entity_id
+        self.error_count_entity_unique_id = config.error_count_entity_unique_id
+
+        # Set entity attributes
+        self._attr_name = f"{self.location_name} Error Status"
+
+        # Generate unique_id
+        zone_device_domain = config.zone_device_identifier[0]
+        zone_device_id = config.zone_device_identifier[1]
+        unique_id_parts = (
+            DOMAIN,
+            self.entry_id,
+            zone_device_domain,
+            zone_device_id,
+            "error_status",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set binary sensor properties
+        self._attr_device_class = BinarySensorDeviceClass.PROBLEM
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(self.zone_device_identifier)
+
+        self._state: bool | None = None
+        self._error_count: int = 0
+        self._unsubscribe = None
+
+        # Resolve error count entity ID using resilient lookup
+        resolved_entity_id = _resolve_entity_id(
+            self.hass, self.error_count_entity_id, self.error_count_entity_unique_id
+        )
+        if resolved_entity_id and resolved_entity_id != self.error_count_entity_id:
+            _LOGGER.debug(
+                "Resolved error count entity ID: %s -> %s",
+                self.error_count_entity_id,
+                resolved_entity_id,
+            )
+            self.error_count_entity_id = resolved_entity_id
+
+        # Capture unique_id if not already stored
+        if not self.error_count_entity_unique_id:
+            self.error_count_entity_unique_id = self._get_entity_unique_id(
+                self.error_count_entity_id
+            )
+
+        # Initialize with current state of error count entity
+        if error_count_state := self.hass.states.get(self.error_count_entity_id):
+            try:
+                self._error_count = int(error_count_state.state)
+            except (ValueError, TypeError):
+                self._error_count = 0
+
+    def _get_entity_unique_id(self, entity_id: str) -> str | None:
+        """Get unique_id for an entity_id."""
+        try:
+            entity_reg = er.async_get(self.hass)
+            if entity_reg is not None:
+                entity_entry = entity_reg.async_get(entity_id)
+                if entity_entry and entity_entry.unique_id:
+                    return entity_entry.unique_id
+        except (TypeError, AttributeError, ValueError):
+            pass
+        return None
+
+    def _update_state(self) -> None:
+        """Update binary sensor state based on error count."""
+        # Binary sensor is ON (problem) when error count >= ERROR_COUNT_THRESHOLD
+        self._state = self._error_count >= ERROR_COUNT_THRESHOLD
+
+    @profiled_callback
+    def _error_count_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle error count sensor state changes."""
+        new_state = event.data.get("new_state")
+        if new_state is None or new_state.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._error_count = 0
+        else:
+            try:
+                self._error_count = int(new_state.state)
+            except (ValueError, TypeError):
+                self._error_count = 0
+
+        self._update_state()
+        self.async_write_ha_state()
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if error count is 3 or more (problem detected)."""
+        return self._state
+
+    @property
+    def icon(self) -> str:
+        """Return icon based on sensor state."""
+        if self._state is True:
+            return "mdi:alert-circle-outline"
+        return "mdi:check-circle-outline"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return entity specific state attributes."""
+        error_label = "Error" if self._error_count == 1 else "Errors"
+        return {
+            "type": "Warning",
+            "message": f"{self._error_count} {error_label}",
+            "task": True,
+            "tags": [
+                self.irrigation_zone_name.lower().replace(" ", "_"),
+            ],
+            "error_count": self._error_count,
+            "error_threshold": ERROR_COUNT_THRESHOLD,
+            "source_entity": self.error_count_entity_id,
+        }
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        error_count_state = self.hass.states.get(self.error_count_entity_id)
+        return error_count_state is not None and error_count_state.state not in (
+            STATE_UNAVAILABLE,
+            STATE_UNKNOWN,
+        )
+
+    async def _restore_previous_state(self) -> None:
+        """Restore previous state if available."""
+        last_state = await self.async_get_last_state()
+
+        if last_state is not None and last_state.state not in (
+            "unknown",
+            "unavailable",
+            None,
+        ):
+            try:
+                self._state = last_state.state == "on"
+                self._error_count = last_state.attributes.get("error_count", 0)
+                _LOGGER.info(
+                    "Restored error status monitor for %s: %s (error_count=%d)",
+                    self.location_name,
+                    self._state,
+                    self._error_count,
+                )
+            except (AttributeError, ValueError):
+                pass
+
+    async def async_update_source_entity(self, new_entity_id: str) -> None:
+        """Update the error count entity ID when it is renamed."""
+        _LOGGER.info(
+            "Updating ErrorStatusMonitor %s error count entity from %s to %s",
+            self.entity_id,
+            self.error_count_entity_id,
+            new_entity_id,
+        )
+
+        # Unsubscribe from old entity
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+        # Update the entity ID
+        self.error_count_entity_id = new_entity_id
+
+        # Capture new unique_id
+        self.error_count_entity_unique_id = self._get_entity_unique_id(new_entity_id)
+
+        # Re-subscribe to new entity
+        try:
+            self._unsubscribe = async_track_state_change_event(
+                self.hass,
+                self.error_count_entity_id,
+                self._error_count_state_changed,
+            )
+            _LOGGER.debug(
+                "Re-subscribed to error count sensor: %s",
+                self.error_count_entity_id,
+            )
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to re-subscribe to error count entity %s: %s",
+                self.error_count_entity_id,
+                exc,
+            )
+
+        # Update state from new entity
+        if error_count_state := self.hass.states.get(self.error_count_entity_id):
+            try:
+                self._error_count = int(error_count_state.state)
+            except (ValueError, TypeError):
+                self._error_count = 0
+        else:
+            self._error_count = 0
+
+        self._update_state()
+        self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Add entity to hass and subscribe to state changes."""
+        await super().async_added_to_hass()
+        await self._restore_previous_state()
+
+        # Resolve error count entity ID with fallback to unique_id
+        resolved_entity_id = _resolve_entity_id(
+            self.hass,
+            self.error_count_entity_id,
+            self.error_count_entity_unique_id,
+        )
+        if resolved_entity_id and resolved_entity_id != self.error_count_entity_id:
+            _LOGGER.debug(
+                "Resolved error count entity ID: %s -> %s",
+                self.error_count_entity_id,
+                resolved_entity_id,
+            )
+            self.error_count_entity_id = resolved_entity_id
+
+        # Subscribe to error count sensor state changes
+        try:
+            self._unsubscribe = async_track_state_change_event(
+                self.hass,
+                self.error_count_entity_id,
+                self._error_count_state_changed,
+            )
+            _LOGGER.debug(
+                "Subscribed to error count sensor: %s",
+                self.error_count_entity_id,
+            )
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to subscribe to error count entity %s: %s",
+                self.error_count_entity_id,
+                exc,
+            )
+
+        # Update initial state
+        self._update_state()
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+
+
+class ESPHomeRunningStatusMonitorBinarySensor(
+    CoalescedWriteMixin, BinarySensorEntity, RestoreEntity
+):
+    """
+    Binary sensor that monitors ESPHome binary sensor with 'running' device class.
+
+    This sensor turns ON when the ESPHome device associated with an irrigation zone
+    has a binary sensor with device_class='running' that is ON, indicating the
+    device is currently running/active.
+    """
+
+    def __init__(self, config: ESPHomeRunningStatusMonitorConfig) -> None:
+        """
+        Initialize the ESPHome Running Status Monitor binary sensor.
+
+        Args:
+            config: Configuration object containing sensor parameters.
+
+        """
+        self.hass = config.hass
+        self.entry_id = config.entry_id
+        self.zone_device_identifier = config.zone_device_identifier
+        self.location_name = config.location_name
+        self.irrigation_zone_name = config.irrigation_zone_name
+        self.monitoring_device_id = config.monitoring_device_id
+
+        # Set entity attributes
+        self._attr_name = f"{self.location_name} Irrigation Status"
+
+        # Generate unique_id
+        zone_device_domain = config.zone_device_identifier[0]
+        zone_device_id = config.zone_device_identifier[1]
+        unique_id_parts = (
+            DOMAIN,
+            self.entry_id,
+            zone_device_domain,
+            zone_device_id,
+            "irrigation_status",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set binary sensor properties
+        self._attr_device_class = BinarySensorDeviceClass.RUNNING
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(self.zone_device_identifier)
+
+        self._state: bool | None = None
+        self._running_sensor_entity_id: str | None = None
+        self._running_sensor_entity_unique_id: str | None = None
+        self._unsubscribe = None
+
+    def _get_entity_unique_id(self, entity_id: str) -> str | None:
+        """Get unique_id for an entity_id."""
+        try:
+            entity_reg = er.async_get(self.hass)
+            if entity_reg is not None:
+                entity_entry = entity_reg.async_get(entity_id)
+                if entity_entry and entity_entry.unique_id:
+                    return entity_entry.unique_id
+        except (TypeError, AttributeError, ValueError):
+            pass
+        return None
+
+    def _find_running_binary_sensor(self) -> str | None:
+        """
+        Find binary sensor with device_class='running' on monitoring device.
+
+        Returns the entity_id if found, None otherwise.
+        """
+        try:
+            ent_reg = er.async_get(self.hass)
+
+            # Find all binary sensor entities associated with the monitoring device
+            for entity in ent_reg.entities.values():
+                if (
+                    entity.device_id == self.monitoring_device_id
+                    and entity.domain == "binary_sensor"
+                ):
+                    # Get the entity's state to check device_class attribute
+                    entity_state = self.hass.states.get(entity.entity_id)
+                    if entity_state:
+                        device_class = entity_state.attributes.get("device_class")
+                        if device_class == "running":
+                            _LOGGER.debug(
+                                "Found running binary sensor on device %s: %s",
+                                self.monitoring_device_id,
+                                entity.entity_id,
+                            )
+                            return entity.entity_id
+
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.debug("Error finding running binary sensor: %s", exc)
+
+        return None
+
+    def _update_state(self) -> None:
+        """Update binary sensor state based on running sensor state."""
+        # If no running sensor found, set state to None (sensor unavailable)
+        if self._running_sensor_entity_id is None:
+            self._state = None
+            return
+
+        # Get the current state of the running sensor
+        running_sensor_state = self.hass.states.get(self._running_sensor_entity_id)
+        if running_sensor_state is None:
+            self._state = None
+            return
+
+        # Binary sensor is ON (problem) when running sensor is ON
+        self._state = running_sensor_state.state == "on"
+
+    @profiled_callback
+    def _running_sensor_state_changed(
+        self, _event: Event[EventStateChangedData]
+    ) -> None:
+        """Handle running sensor state changes."""
+        self._update_state()
+        self.async_write_ha_state()
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if device is running."""
+        return self._state
+
+    @property
+    def icon(self) -> str:
+        """Return icon based on sensor state."""
+        if self._state is True:
+            return "mdi:play-circle-outline"
+        return "mdi:stop-circle-outline"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return entity specific state attributes."""
+        return {
+            "type": "Warning",
+            "message": "Device Running" if self._state else "Device Stopped",
+            "task": self._state is True,
+            "tags": [
+                self.irrigation_zone_name.lower().replace(" ", "_"),
+            ],
+            "device_id": self.monitoring_device_id,
+            "running_sensor_entity": self._running_sensor_entity_id,
+            "source_entity": self._running_sensor_entity_id,
+            "source_unique_id": self._running_sensor_entity_unique_id,
+        }
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        # Entity is available if we found a running sensor
+        return self._running_sensor_entity_id is not None
+
+    async def _restore_previous_state(self) -> None:
+        """Restore previous state if available."""
+        last_state = await self.async_get_last_state()
+
+        if last_state is not None and last_state.state not in (
+            "unknown",
+            "unavailable",
+            None,
+        ):
+            try:
+                self._state = last_state.state == "on"
+                _LOGGER.info(
+                    "Restored esphome running status for %s: %s",
+                    self.location_name,
+                    self._state,
+                )
+            except (AttributeError, ValueError):
+                pass
+
+    async def async_update_source_entity(self, new_entity_id: str) -> None:
+        """Update the running sensor entity ID when it is renamed."""
+        _LOGGER.info(
+            "Updating ESPHomeRunningStatusMonitor %s running sensor from %s to %s",
+            self.entity_id,
+            self._running_sensor_entity_id,
+            new_entity_id,
+        )
+
+        # Unsubscribe from old entity
+        if self._unsubscribe:
+            self._unsubscribe()
+            self._unsubscribe = None
+
+        # Update the entity ID
+        self._running_sensor_entity_id = new_entity_id
+
+        # Capture new unique_id
+        self._running_sensor_entity_unique_id = self._get_entity_unique_id(
+            new_entity_id
+        )
+
+        # Re-subscribe to new entity
+        try:
+            self._unsubscribe = async_track_state_change_event(
+                self.hass,
+                self._running_sensor_entity_id,
+                self._running_sensor_state_changed,
+            )
+            _LOGGER.debug(
+                "Re-subscribed to running sensor: %s",
+                self._running_sensor_entity_id,
+            )
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to re-subscribe to running sensor %s: %s",
+                self._running_sensor_entity_id,
+                exc,
+            )
+
+        # Update state from new entity
+        self._update_state()
+        self.async_write_ha_state()
+
+    async def async_added_to_hass(self) -> None:
+        """Add entity to hass and subscribe to running sensor state changes."""
+        await super().async_added_to_hass()
+        await self._restore_previous_state()
+
+        # Find the running binary sensor
+        self._running_sensor_entity_id = self._find_running_binary_sensor()
+
+        # Capture unique_id for resilient tracking
+        if self._running_sensor_entity_id:
+            self._running_sensor_entity_unique_id = self._get_entity_unique_id(
+                self._running_sensor_entity_id
+            )
+
+            # Resolve entity ID with fallback to unique_id
+            resolved_entity_id = _resolve_entity_id(
+                self.hass,
+                self._running_sensor_entity_id,
+                self._running_sensor_entity_unique_id,
+            )
+            if (
+                resolved_entity_id
+                and resolved_entity_id != self._running_sensor_entity_id
+            ):
+                _LOGGER.debug(
+                    "Resolved running sensor entity ID: %s -> %s",
+                    self._running_sensor_entity_id,
+                    resolved_entity_id,
+                )
+                self._running_sensor_entity_id = resolved_entity_id
+
+        if self._running_sensor_entity_id:
+            # Subscribe to running sensor state changes
+            try:
+                self._unsubscribe = async_track_state_change_event(
+                    self.hass,
+                    self._running_sensor_entity_id,
+                    self._running_sensor_state_changed,
+                )
+                _LOGGER.debug(
+                    "Subscribed to running sensor: %s",
+                    self._running_sensor_entity_id,
+                )
+            except (AttributeError, KeyError, ValueError) as exc:
+                _LOGGER.warning(
+                    "Failed to subscribe to running sensor %s: %s",
+                    self._running_sensor_entity_id,
+                    exc,
+                )
+        else:
+            _LOGGER.debug(
+                "Running binary sensor not found for device %s",
+                self.monitoring_device_id,
+            )
+
+        # Update initial state
+        self._update_state()
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+
+
+class IrrigationZoneStatusMonitorBinarySensor(
+    CoalescedWriteMixin, BinarySensorEntity, RestoreEntity
+):
+    """
+    Binary sensor that monitors overall status of an irrigation zone.
+
+    This sensor turns ON (problem detected) when any of the zone's problem
+    binary sensors are ON, OR when any plant location within the zone has
+    its Status sensor ON. This provides a comprehensive view of the entire
+    irrigation zone's health including all associated plant locations.
+    """
+
+    def __init__(self, config: IrrigationZoneStatusMonitorConfig) -> None:
+        """
+        Initialize the Irrigation Zone Status Monitor binary sensor.
+
+        Args:
+            config: Configuration object containing sensor parameters.
+
+        """
+        self.hass = config.hass
+        self.entry_id = config.entry_id
+        self.zone_device_identifier = config.zone_device_identifier
+        self.location_name = config.location_name
+        self.irrigation_zone_name = config.irrigation_zone_name
+        self.zone_id = config.zone_id
+
+        # Set entity attributes
+        self._attr_name = f"{self.location_name} Status"
+
+        # Generate unique_id
+        zone_device_domain = config.zone_device_identifier[0]
+        zone_device_id = config.zone_device_identifier[1]
+        unique_id_parts = (
+            DOMAIN,
+            self.entry_id,
+            zone_device_domain,
+            zone_device_id,
+            "status",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set binary sensor properties
+        self._attr_device_class = BinarySensorDeviceClass.PROBLEM
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(self.zone_device_identifier)
+
+        self._state: bool | None = None
+        self._zone_problem_sensors: dict[str, bool | None] = {}
+        self._location_status_sensors: dict[str, bool | None] = {}
+        self._zone_problem_entity_ids: dict[str, str] = {}
+        self._location_status_entity_ids: dict[str, str] = {}
+        self._zone_problem_entity_unique_ids: dict[str, str] = {}
+        self._location_status_entity_unique_ids: dict[str, str] = {}
+        self._unsubscribe_handlers: list[Any] = []
+
+    def _get_entity_unique_id(self, entity_id: str) -> str | None:
+        """Get unique_id for an entity_id."""
+        try:
+            entity_reg = er.async_get(self.hass)
+            if entity_reg is not None:
+                entity_entry = entity_reg.async_get(entity_id)
+                if entity_entry and entity_entry.unique_id:
+                    return entity_entry.unique_id
+        except (TypeError, AttributeError, ValueError):
+            pass
+        return None
+
+    async def _find_zone_problem_sensors(self) -> dict[str, str]:
+        """
+        Find all problem sensor entities for this irrigation zone.
+
+        Returns a dictionary mapping sensor display name to entity_id.
+        Zone problem sensors that are found:
+        - Schedule Status (master schedule off)
+        - Schedule Misconfiguration Status
+        - Water Delivery Preference Status
+        - Error Status (error count >= 3)
+        - Irrigation Status (ESPHome running)
+        """
+        problem_sensors: dict[str, str] = {}
+        try:
+            ent_reg = er.async_get(self.hass)
+            zone_device_domain = self.zone_device_identifier[0]
+            zone_device_id = self.zone_device_identifier[1]
+
+            for entity in ent_reg.entities.values():
+                if (
+                    entity.platform == DOMAIN
+                    and entity.domain == "binary_sensor"
+                    and entity.unique_id
+                    and self.entry_id in entity.unique_id
+                    and zone_device_domain in entity.unique_id
+                    and zone_device_id in entity.unique_id
+                ):
+                    unique_id = entity.unique_id
+                    is_problem_sensor = False
+                    sensor_name = ""
+
+                    if "schedule_status" in unique_id:
+                        is_problem_sensor = True
+                        sensor_name = "Schedule Status"
+                    elif "schedule_misconfiguration" in unique_id:
+                        is_problem_sensor = True
+                        sensor_name = "Schedule Misconfiguration"
+                    elif "water_delivery_preference" in unique_id:
+                        is_problem_sensor = True
+                        sensor_name = "Water Delivery Preference"
+                    elif "error_status" in unique_id:
+                        is_problem_sensor = True
+                        sensor_name = "Error Status"
+                    elif "irrigation_status" in unique_id:
+                        is_problem_sensor = True
+                        sensor_name = "Irrigation Status"
+
+                    # Exclude the overall status sensor itself
+                    # by checking if the unique_id ends with just
+                    # "status" (not "schedule_status", etc.)
+                    if is_problem_sensor and not unique_id.endswith(
+                        f"{zone_device_id}_status"
+                    ):
+                        problem_sensors[sensor_name] = entity.entity_id
+                        self._zone_problem_entity_unique_ids[entity.entity_id] = (
+                            unique_id
+                        )
+                        _LOGGER.debug(
+                            "Found zone problem sensor for %s: %s -> %s"
+                            " (unique_id: %s)",
+                            self.location_name,
+                            sensor_name,
+                            entity.entity_id,
+                            unique_id,
+                        )
+
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.debug("Error finding zone problem sensors: %s", exc)
+
+        return problem_sensors
+
+    async def _find_location_status_sensors(self) -> dict[str, str]:
+        """
+        Find all plant location Status sensors for this irrigation zone.
+
+        Returns a dictionary mapping location name to status sensor entity_id.
+        """
+        status_sensors: dict[str, str] = {}
+        try:
+            ent_reg = er.async_get(self.hass)
+
+            # Get the parent config entry to access its subentries
+            parent_entry = self.hass.config_entries.async_get_entry(self.entry_id)
+            if not parent_entry:
+                _LOGGER.warning(
+                    "Could not find parent entry with ID: %s", self.entry_id
+                )
+                return status_sensors
+
+            if not parent_entry.subentries:
+                _LOGGER.debug("Parent entry %s has no subentries", self.entry_id)
+                return status_sensors
+
+            _LOGGER.debug(
+                "Found parent entry %s with %d subentries",
+                self.entry_id,
+                len(parent_entry.subentries),
+            )
+
+            # Build a set of subentry IDs that belong to this zone
+            zone_subentry_ids = set()
+            for subentry_id, subentry in parent_entry.subentries.items():
+                zone_id = subentry.data.get("zone_id")
+                location_name = subentry.data.get("name", "Unknown")
+                _LOGGER.debug(
+                    "Checking subentry %s: zone_id=%s, location=%s (target zone=%s)",
+                    subentry_id,
+                    zone_id,
+                    location_name,
+                    self.zone_id,
+                )
+                if zone_id == self.zone_id:
+                    zone_subentry_ids.add(subentry_id)
+                    _LOGGER.debug(
+                        "Matched subentry %s for zone %s (location: %s)",
+                        subentry_id,
+                        self.zone_id,
+                        location_name,
+                    )
+
+            _LOGGER.debug(
+                "Found %d subentries for zone %s: %s",
+                len(zone_subentry_ids),
+                self.zone_id,
+                zone_subentry_ids,
+            )
+
+            # Look through all binary sensors to find status sensors
+            # that belong to our zone's subentries
+            # Note: We check if the subentry_id is in the unique_id because
+            # all entities are registered with the parent entry's config_entry_id
+            for entity in ent_reg.entities.values():
+                if (
+                    entity.platform == DOMAIN
+                    and entity.domain == "binary_sensor"
+                    and entity.unique_id
+                    and entity.unique_id.endswith("_status")
+                ):
+                    # Check if this entity belongs to any of our zone's subentries
+                    # by checking if the subentry_id appears in the unique_id
+                    for subentry_id in zone_subentry_ids:
+                        if subentry_id in entity.unique_id:
+                            # This is a status sensor for a plant location in our zone
+                            # Get the subentry to extract the location name
+                            subentry = parent_entry.subentries.get(subentry_id)
+                            if subentry is not None:
+                                location_name = subentry.data.get(
+                                    "name", "Unknown Location"
+                                )
+                                status_sensors[location_name] = entity.entity_id
+                                self._location_status_entity_unique_ids[
+                                    entity.entity_id
+                                ] = entity.unique_id
+                                _LOGGER.info(
+                                    "Found location status sensor for zone %s: "
+                                    "%s -> %s (unique_id: %s, subentry_id: %s)",
+                                    self.location_name,
+                                    location_name,
+                                    entity.entity_id,
+                                    entity.unique_id,
+                                    subentry_id,
+                                )
+                            break  # Found a match, no need to check other subentries
+
+        except (AttributeError, KeyError, ValueError):
+            _LOGGER.exception("Error finding location status sensors")
+
+        _LOGGER.info(
+            "Irrigation zone %s found %d location status sensors: %s",
+            self.location_name,
+            len(status_sensors),
+            list(status_sensors.keys()),
+        )
+
+        return status_sensors
+
+    async def _refresh_location_status_sensors(self) -> None:
+        """Refresh location status sensors and subscribe to their state changes."""
+        # Find all location status sensors
+        new_location_status_entity_ids = await self._find_location_status_sensors()
+
+        # Resolve all location status entity IDs
+        resolved_location_status_entity_ids = {}
+        for location_name, entity_id in new_location_status_entity_ids.items():
+            unique_id = self._location_status_entity_unique_ids.get(entity_id)
+            resolved_entity_id = _resolve_entity_id(self.hass, entity_id, unique_id)
+            if resolved_entity_id:
+                if resolved_entity_id != entity_id:
+                    _LOGGER.debug(
+                        "Resolved location status sensor entity ID: %s -> %s",
+                        entity_id,
+                        resolved_entity_id,
+                    )
+                    if unique_id:
+                        self._location_status_entity_unique_ids[resolved_entity_id] = (
+                            unique_id
+                        )
+                        del self._location_status_entity_unique_ids[entity_id]
+                resolved_location_status_entity_ids[location_name] = resolved_entity_id
+            else:
+                resolved_location_status_entity_ids[location_name] = entity_id
+
+        # Update the entity IDs
+        self._location_status_entity_ids = resolved_location_status_entity_ids
+
+        # Initialize tracking dictionary
+        for location_name in self._location_status_entity_ids:
+            self._location_status_sensors[location_name] = None
+
+        # Subscribe to state changes for all location status sensors
+        for location_name, entity_id in self._location_status_entity_ids.items():
+            if state := self.hass.states.get(entity_id):
+                self._location_status_sensors[location_name] = state.state == "on"
+
+            unsubscribe = async_track_state_change_event(
+                self.hass,
+                entity_id,
+                self._sensor_state_changed,
+            )
+            self._unsubscribe_handlers.append(unsubscribe)
+
+        # Update state after finding new sensors
+        self._update_state()
+        self.async_write_ha_state()
+
+        _LOGGER.info(
+            "Refreshed location status sensors for zone %s: found %d sensors",
+            self.location_name,
+            len(self._location_status_entity_ids),
+        )
+
+    def _update_state(self) -> None:
+        """Update binary sensor state based on all monitored sensors."""
+        # Check if any zone problem sensor is ON
+        zone_problems = [
+            name for name, is_on in self._zone_problem_sensors.items() if is_on is True
+        ]
+
+        # Check if any location status sensor is ON
+        location_problems = [
+            name
+            for name, is_on in self._location_status_sensors.items()
+            if is_on is True
+        ]
+
+        # Overall status is problem if ANY monitored sensor has a problem
+        self._state = len(zone_problems) > 0 or len(location_problems) > 0
+
+    @profiled_callback
+    def _sensor_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Handle monitored sensor state changes."""
+        entity_id = event.data.get("entity_id")
+        new_state = event.data.get("new_state")
+
+        # Check if it's a zone problem sensor
+        for sensor_name, sensor_entity_id in self._zone_problem_entity_ids.items():
+            if sensor_entity_id == entity_id:
+                if new_state is None:
+                    self._zone_problem_sensors[sensor_name] = None
+                else:
+                    self._zone_problem_sensors[sensor_name] = new_state.state == "on"
+                break
+
+        # Check if it's a location status sensor
+        for location_name, sensor_entity_id in self._location_status_entity_ids.items():
+            if sensor_entity_id == entity_id:
+                if new_state is None:
+                    self._location_status_sensors[location_name] = None
+                else:
+                    self._location_status_sensors[location_name] = (
+                        new_state.state == "on"
+                    )
+                break
+
+        self._update_state()
+        self.async_write_ha_state()
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if any monitored sensor has a problem."""
+        return self._state
+
+    @property
+    def icon(self) -> str:
+        """Return icon based on sensor state."""
+        if self._state is True:
+            return "mdi:alert-circle-outline"
+        return "mdi:check-circle-outline"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return entity specific state attributes."""
+        # Build list of zone problems
+        zone_problems = [
+            name for name, is_on in self._zone_problem_sensors.items() if is_on is True
+        ]
+
+        # Build list of location problems
+        location_problems = [
+            name
+            for name, is_on in self._location_status_sensors.items()
+            if is_on is True
+        ]
+
+        # Total issue count
+        total_issues = len(zone_problems) + len(location_problems)
+        message = (
+            f"{total_issues} Issue" if total_issues == 1 else f"{total_issues} Issues"
+        )
+
+        attrs: dict[str, Any] = {
+            "message": message,
+            "zone_problems": zone_problems,
+            "location_problems": location_problems,
+            "total_zone_sensors_monitored": len(self._zone_problem_sensors),
+            "total_location_sensors_monitored": len(self._location_status_sensors),
+        }
+        return attrs
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        # Available if we have found at least one sensor to monitor
+        return (
+            len(self._zone_problem_sensors) > 0
+            or len(self._location_status_sensors) > 0
+        )
+
+    async def _restore_previous_state(self) -> None:
+        """Restore previous state if available."""
+        last_state = await self.async_get_last_state()
+
+        if last_state is not None and last_state.state not in (
+            "unknown",
+            "unavailable",
+            None,
+        ):
+            try:
+                self._state = last_state.state == "on"
+                _LOGGER.info(
+                    "Restored irrigation zone status monitor for %s: %s",
+                    self.location_name,
+                    self._state,
+                )
+            except (AttributeError, ValueError):
+                pass
+
+    async def async_added_to_hass(self) -> None:
+        """Add entity to hass."""
+        await super().async_added_to_hass()
+        await self._restore_previous_state()
+
+        # Find all zone problem sensors
+        self._zone_problem_entity_ids = await self._find_zone_problem_sensors()
+
+        # Resolve all zone problem entity IDs
+        resolved_zone_problem_entity_ids = {}
+        for sensor_name, entity_id in self._zone_problem_entity_ids.items():
+            unique_id = self._zone_problem_entity_unique_ids.get(entity_id)
+            resolved_entity_id = _resolve_entity_id(self.hass, entity_id, unique_id)
+            if resolved_entity_id:
+                if resolved_entity_id != entity_id:
+                    _LOGGER.debug(
+                        "Resolved zone problem sensor entity ID: %s -> %s",
+                        entity_id,
+                        resolved_entity_id,
+                    )
+                    if unique_id:
+                        self._zone_problem_entity_unique_ids[resolved_entity_id] = (
+                            unique_id
+                        )
+                        del self._zone_problem_entity_unique_ids[entity_id]
+                resolved_zone_problem_entity_ids[sensor_name] = resolved_entity_id
+            else:
+                resolved_zone_problem_entity_ids[sensor_name] = entity_id
+        self._zone_problem_entity_ids = resolved_zone_problem_entity_ids
+
+        # Initialize tracking dictionaries for zone problem sensors
+        for sensor_name in self._zone_problem_entity_ids:
+            self._zone_problem_sensors[sensor_name] = None
+
+        # Subscribe to state changes for all zone problem sensors
+        for sensor_name, entity_id in self._zone_problem_entity_ids.items():
+            if state := self.hass.states.get(entity_id):
+                self._zone_problem_sensors[sensor_name] = state.state == "on"
+
+            unsubscribe = async_track_state_change_event(
+                self.hass,
+                entity_id,
+                self._sensor_state_changed,
+            )
+            self._unsubscribe_handlers.append(unsubscribe)
+
+        # Schedule a delayed refresh to find location status sensors
+        # This is necessary because location status sensors may not be
+        # registered in the entity registry yet when this sensor is added
+        async def _delayed_refresh() -> None:
+            """Refresh location status sensors after a delay."""
+            await asyncio.sleep(2)  # Wait for other entities to be registered
+            await self._refresh_location_status_sensors()
+
+        self.hass.async_create_task(_delayed_refresh())
+
+        # Update initial state (will update again after delayed refresh)
+        self._update_state()
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        for unsubscribe in self._unsubscribe_handlers:
+            if unsubscribe:
+                unsubscribe()
+        self._unsubscribe_handlers.clear()
+
+
+async def _create_master_schedule_status_sensor(
+    config: MasterScheduleStatusMonitorConfig,
+) -> BinarySensorEntity | None:
+    """Create master schedule status monitor sensor."""
+    sensor = MasterScheduleStatusMonitorBinarySensor(config)
+    _LOGGER.debug(
+        "Created master schedule status monitor binary sensor for %s",
+        config.location_name,
+    )
+    return sensor
+
+
+async def _create_schedule_misconfiguration_status_sensor(
+    config: ScheduleMisconfigurationStatusMonitorConfig,
+) -> BinarySensorEntity | None:
+    """Create schedule misconfiguration status monitor sensor."""
+    sensor = ScheduleMisconfigurationStatusMonitorBinarySensor(config)
+    _LOGGER.debug(
+        "Created schedule misconfiguration status monitor binary sensor for %s",
+        config.location_name,
+    )
+    return sensor
+
+
+async def _create_water_delivery_preference_status_sensor(
+    config: WaterDeliveryPreferenceStatusMonitorConfig,
+) -> BinarySensorEntity | None:
+    """Create water delivery preference status monitor sensor."""
+    sensor = WaterDeliveryPreferenceStatusMonitorBinarySensor(config)
+    _LOGGER.debug(
+        "Created water delivery preference status monitor binary sensor for %s",
+        config.location_name,
+    )
+    return sensor
+
+
+async def _create_error_status_sensor(
+    config: ErrorStatusMonitorConfig,
+) -> BinarySensorEntity | None:
+    """Create error status monitor sensor."""
+    sensor = ErrorStatusMonitorBinarySensor(config)
+    _LOGGER.debug(
+        "Created error status monitor binary sensor for %s",
+        config.location_name,
+    )
+    return sensor
+
+
+async def _create_esphome_running_status_sensor(
+    config: ESPHomeRunningStatusMonitorConfig,
+) -> BinarySensorEntity | None:
+    """Create ESPHome running status monitor sensor."""
+    sensor = ESPHomeRunningStatusMonitorBinarySensor(config)
+    _LOGGER.debug(
+        "Created esphome running status monitor binary sensor for %s",
+        config.location_name,
+    )
+    return sensor
+
+
+async def _create_irrigation_zone_status_sensor(
+    config: IrrigationZoneStatusMonitorConfig,
+) -> BinarySensorEntity | None:
+    """Create irrigation zone overall status monitor sensor."""
+    sensor = IrrigationZoneStatusMonitorBinarySensor(config)
+    _LOGGER.debug(
+        "Created irrigation zone status monitor binary sensor for %s",
+        config.location_name,
+    )
+    return sensor
+
+
+async def create_zone_sensors(  # noqa: PLR0912, PLR0913, PLR0915
+    hass: HomeAssistant,
+    entry: ConfigEntry[Any],
+    zone_id: str,
+    zone_name: str,
+    linked_device_id: str,
+    zone_device_identifier: tuple[str, str],
+) -> list[BinarySensorEntity]:
+    """Create all sensors for a single irrigation zone."""
+    zone_sensors: list[BinarySensorEntity] = []
+
+    # Discover switch entities for this device instead of constructing entity IDs
+    # This is more resilient to entity renames and doesn't assume naming patterns
+    # Get all switch entities for this device to find them by unique_id patterns
+    switch_entities = find_device_entities_by_pattern(
+        hass,
+        linked_device_id,
+        "switch",
+        None,  # Get all switches, we'll filter by unique_id
+    )
+
+    _LOGGER.debug(
+        "Found switch entities for zone %s (device %s): %s",
+        zone_name,
+        linked_device_id,
+        switch_entities,
+    )
+
+    # Discover sensor entities for error count
+    sensor_entities = find_device_entities_by_pattern(
+        hass,
+        linked_device_id,
+        "sensor",
+        None,  # Get all sensors, we'll filter by unique_id
+    )
+
+    _LOGGER.debug(
+        "Found sensor entities for zone %s (device %s): %s",
+        zone_name,
+        linked_device_id,
+        sensor_entities,
+    )
+
+    # Filter switches by unique_id patterns
+    master_schedule_entity_id = None
+    master_schedule_unique_id = None
+    sunrise_entity_id = None
+    sunrise_unique_id = None
+    afternoon_entity_id = None
+    afternoon_unique_id = None
+    sunset_entity_id = None
+    sunset_unique_id = None
+    rain_delivery_entity_id = None
+    rain_delivery_unique_id = None
+    main_delivery_entity_id = None
+    main_delivery_unique_id = None
+
+    for entity_id, unique_id in switch_entities.values():
+        if unique_id:
+            if "master_schedule" in unique_id:
+                master_schedule_entity_id = entity_id
+                master_schedule_unique_id = unique_id
+            elif "sunrise_schedule" in unique_id:
+                sunrise_entity_id = entity_id
+                sunrise_unique_id = unique_id
+            elif "afternoon_schedule" in unique_id:
+                afternoon_entity_id = entity_id
+                afternoon_unique_id = unique_id
+            elif "sunset_schedule" in unique_id:
+                sunset_entity_id = entity_id
+                sunset_unique_id = unique_id
+            elif "allow_rain_water_delivery" in unique_id:
+                rain_delivery_entity_id = entity_id
+                rain_delivery_unique_id = unique_id
+            elif "allow_water_main_delivery" in unique_id:
+                main_delivery_entity_id = entity_id
+                main_delivery_unique_id = unique_id
+
+    # Filter sensors by unique_id patterns
+    error_count_entity_id = None
+    error_count_unique_id = None
+
+    for entity_id, unique_id in sensor_entities.values():
+        if unique_id and "error_count" in unique_id:
+            error_count_entity_id = entity_id
+            error_count_unique_id = unique_id
+            break
+
+    if not master_schedule_entity_id:
+        _LOGGER.warning(
+            "Could not find master schedule switch for zone %s (device %s)",
+            zone_name,
+            linked_device_id,
+        )
+        # Don't create sensors if we can't find the master schedule switch
+        return zone_sensors
+
+    # Create master schedule status sensor
+    master_schedule_config = MasterScheduleStatusMonitorConfig(
+        hass=hass,
+        entry_id=entry.entry_id,
+        location_name=zone_name,
+        irrigation_zone_name=zone_name,
+        master_schedule_switch_entity_id=master_schedule_entity_id,
+        master_schedule_switch_unique_id=master_schedule_unique_id,
+        zone_device_identifier=zone_device_identifier,
+    )
+    master_schedule_sensor = await _create_master_schedule_status_sensor(
+        master_schedule_config
+    )
+    if master_schedule_sensor:
+        zone_sensors.append(master_schedule_sensor)
+        _LOGGER.debug(
+            "Created master schedule status sensor for irrigation zone %s "
+            "(entity: %s, unique_id: %s)",
+            zone_name,
+            master_schedule_entity_id,
+            master_schedule_unique_id,
+        )
+
+    # Create schedule misconfiguration status sensor if we have all required switches
+    if all([sunrise_entity_id, afternoon_entity_id, sunset_entity_id]):
+        schedule_misconfiguration_config = ScheduleMisconfigurationStatusMonitorConfig(
+            hass=hass,
+            entry_id=entry.entry_id,
+            location_name=zone_name,
+            irrigation_zone_name=zone_name,
+            master_schedule_switch_entity_id=master_schedule_entity_id,
+            master_schedule_switch_unique_id=master_schedule_unique_id,
+            sunrise_switch_entity_id=sunrise_entity_id,
+            sunrise_switch_unique_id=sunrise_unique_id,
+            afternoon_switch_entity_id=afternoon_entity_id,
+            afternoon_switch_unique_id=afternoon_unique_id,
+            sunset_switch_entity_id=sunset_entity_id,
+            sunset_switch_unique_id=sunset_unique_id,
+            zone_device_identifier=zone_device_identifier,
+        )
+        schedule_misconfiguration_sensor = (
+            await _create_schedule_misconfiguration_status_sensor(
+                schedule_misconfiguration_config
+            )
+        )
+        if schedule_misconfiguration_sensor:
+            zone_sensors.append(schedule_misconfiguration_sensor)
+            _LOGGER.debug(
+                "Created schedule misconfiguration status sensor for irrigation "
+                "zone %s",
+                zone_name,
+            )
+    else:
+        _LOGGER.debug(
+            "Skipping schedule misconfiguration sensor for zone %s - "
+            "not all time schedule switches found",
+            zone_name,
+        )
+
+    # Create water delivery preference status sensor if we have both switches
+    if rain_delivery_entity_id and main_delivery_entity_id:
+        water_delivery_preference_config = WaterDeliveryPreferenceStatusMonitorConfig(
+            hass=hass,
+            entry_id=entry.entry_id,
+            location_name=zone_name,
+            irrigation_zone_name=zone_name,
+            master_schedule_switch_entity_id=master_schedule_entity_id,
+            master_schedule_switch_unique_id=master_schedule_unique_id,
+            allow_rain_water_delivery_switch_entity_id=rain_delivery_entity_id,
+            allow_rain_water_delivery_switch_unique_id=rain_delivery_unique_id,
+            allow_water_main_delivery_switch_entity_id=main_delivery_entity_id,
+            allow_water_main_delivery_switch_unique_id=main_delivery_unique_id,
+            zone_device_identifier=zone_device_identifier,
+        )
+        water_delivery_preference_sensor = (
+            await _create_water_delivery_preference_status_sensor(
+                water_delivery_preference_config
+            )
+        )
+        if water_delivery_preference_sensor:
+            zone_sensors.append(water_delivery_preference_sensor)
+            _LOGGER.debug(
+                "Created water delivery preference status sensor for irrigation "
+                "zone %s",
+                zone_name,
+            )
+    else:
+        _LOGGER.debug(
+            "Skipping water delivery preference sensor for zone %s - "
+            "not all delivery switches found",
+            zone_name,
+        )
+
+    # Create error status sensor if we have the error count sensor
+    if error_count_entity_id:
+        error_status_config = ErrorStatusMonitorConfig(
+            hass=hass,
+            entry_id=entry.entry_id,
+            location_name=zone_name,
+            irrigation_zone_name=zone_name,
+            error_count_entity_id=error_count_entity_id,
+            error_count_entity_unique_id=error_count_unique_id,
+            zone_device_identifier=zone_device_identifier,
+        )
+        error_status_sensor = await _create_error_status_sensor(error_status_config)
+        if error_status_sensor:
+            zone_sensors.append(error_status_sensor)
+            _LOGGER.debug(
+                "Created error status sensor for irrigation zone %s "
+                "(entity: %s, unique_id: %s)",
+                zone_name,
+                error_count_entity_id,
+                error_count_unique_id,
+            )
+    else:
+        _LOGGER.debug(
+            "Skipping error status sensor for zone %s - error count sensor not found",
+            zone_name,
+        )
+
+    # Create ESPHome running status sensor (monitors binary sensor with 'running'
+    # device class on linked ESPHome device)
+    esphome_running_config = ESPHomeRunningStatusMonitorConfig(
+        hass=hass,
+        entry_id=entry.entry_id,
+        location_name=zone_name,
+        irrigation_zone_name=zone_name,
+        monitoring_device_id=linked_device_id,
+        zone_device_identifier=zone_device_identifier,
+    )
+    esphome_running_sensor = await _create_esphome_running_status_sensor(
+        esphome_running_config
+    )
+    if esphome_running_sensor:
+        zone_sensors.append(esphome_running_sensor)
+        _LOGGER.debug(
+            "Created esphome running status sensor for irrigation zone %s",
+            zone_name,
+        )
+
+    # Create overall irrigation zone status sensor (monitors all zone problem sensors
+    # and associated plant location status sensors)
+    irrigation_zone_status_config = IrrigationZoneStatusMonitorConfig(
+        hass=hass,
+        entry_id=entry.entry_id,
+        location_name=zone_name,
+        irrigation_zone_name=zone_name,
+        zone_id=zone_id,
+        zone_device_identifier=zone_device_identifier,
+    )
+    irrigation_zone_status_sensor = await _create_irrigation_zone_status_sensor(
+        irrigation_zone_status_config
+    )
+    if irrigation_zone_status_sensor:
+        zone_sensors.append(irrigation_zone_status_sensor)
+        _LOGGER.debug(
+            "Created overall status sensor for irrigation zone %s",
+            zone_name,
+        )
+
+    return zone_sensors
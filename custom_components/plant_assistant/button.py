@@ -13,11 +13,12 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.components.button import ButtonEntity
 from homeassistant.const import EntityCategory
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_registry import async_get
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import DOMAIN
+from .device import shared_device_info
+from .entity_index import async_get_entity_index
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -130,9 +131,7 @@ class IrrigationZoneErrorCountResetButton(ButtonEntity, RestoreEntity):
         self._attr_unique_id = "_".join(unique_id_parts)
 
         # Set device info to associate with the irrigation zone device
-        self._attr_device_info = DeviceInfo(
-            identifiers={zone_device_id},
-        )
+        self._attr_device_info = shared_device_info(zone_device_id)
 
     async def async_press(self) -> None:
         """Handle button press - reset the error count to 0."""
@@ -153,10 +152,9 @@ class IrrigationZoneErrorCountResetButton(ButtonEntity, RestoreEntity):
             error_count_entity_id = None
 
             # Find entity_id by unique_id
-            for entity_entry in entity_registry.entities.values():
-                if entity_entry.unique_id == error_count_unique_id:
-                    error_count_entity_id = entity_entry.entity_id
-                    break
+            index = async_get_entity_index(self.hass, entity_registry)
+            if index is not None:
+                error_count_entity_id = index.async_get_entity_id(error_count_unique_id)
 
             if not error_count_entity_id:
                 _LOGGER.warning(
@@ -0,0 +1,265 @@
+"""
+Opt-in latency profiling of the integration's event loop callbacks.
+
+The entities, the threshold evaluators and the shared services handle state
+changes, timers and gateway events in ``@callback`` methods, all run in the
+event loop. The event handlers among them are declared with
+``@profiled_callback`` instead of ``@callback``. With the
+``callback_profiling`` option enabled, those methods are replaced by timing
+wrappers before the platforms subscribe, and the call counts, duration
+percentiles and slowest recent invocations per class are reported in the
+config entry diagnostics.
+
+Profiling is off by default. The methods are only replaced while the
+profiler is enabled, so handlers are called directly otherwise.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import sys
+import time
+from collections import defaultdict, deque
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.util import dt as dt_util
+
+from .const import CALLBACK_PROFILER_KEY, DOMAIN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from datetime import datetime
+    from types import ModuleType
+
+_LOGGER = logging.getLogger(__name__)
+
+# Durations kept per callback for the percentiles
+SAMPLE_SIZE = 1000
+# Invocations kept per entity class to report the slowest recent ones
+RECENT_INVOCATIONS = 100
+SLOWEST_REPORTED = 5
+# Platform modules loaded before profiling, with the modules they import
+PROFILED_MODULES = (
+    "sensor",
+    "sensor_dli",
+    "sensor_statistics",
+    "sensor_zone",
+    "binary_sensor",
+    "binary_sensor_zone",
+)
+# Set on the functions declared with @profiled_callback
+_PROFILED = "_plant_assistant_profiled"
+
+
+def profiled_callback[CallableT: Callable[..., Any]](func: CallableT) -> CallableT:
+    """Declare an event handler method as a callback timed by the profiler."""
+    setattr(func, _PROFILED, True)
+    return callback(func)
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    """Return the nearest-rank percentile of sorted durations."""
+    if not ordered:
+        return 0.0
+    rank = max(round(percent / 100 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+class CallbackStats:
+    """Call count and durations of one callback method."""
+
+    __slots__ = ("calls", "max", "samples", "total")
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.calls = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.samples: deque[float] = deque(maxlen=SAMPLE_SIZE)
+
+    def record(self, duration: float) -> None:
+        """Add one invocation."""
+        self.calls += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.samples.append(duration)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics in milliseconds."""
+        ordered = sorted(self.samples)
+        return {
+            "calls": self.calls,
+            "total_ms": round(self.total * 1e3, 3),
+            "p50_ms": round(_percentile(ordered, 50) * 1e3, 3),
+            "p95_ms": round(_percentile(ordered, 95) * 1e3, 3),
+            "p99_ms": round(_percentile(ordered, 99) * 1e3, 3),
+            "max_ms": round(self.max * 1e3, 3),
+        }
+
+
+def _loaded_modules() -> list[ModuleType]:
+    """Return the integration's modules that have been imported."""
+    prefix = f"{__package__}."
+    return [
+        module for name, module in list(sys.modules.items()) if name.startswith(prefix)
+    ]
+
+
+def _profiled_methods(
+    modules: Iterable[ModuleType],
+) -> list[tuple[type, str, Callable[..., Any]]]:
+    """Return the ``@profiled_callback`` methods of the modules' classes."""
+    methods: list[tuple[type, str, Callable[..., Any]]] = []
+    for module in modules:
+        for cls in vars(module).values():
+            if not isinstance(cls, type) or cls.__module__ != module.__name__:
+                continue
+            methods.extend(
+                (cls, name, func)
+                for name, func in vars(cls).items()
+                if getattr(func, _PROFILED, False)
+            )
+    return methods
+
+
+class CallbackProfiler:
+    """Times the profiled callbacks while enabled."""
+
+    def __init__(self) -> None:
+        """Initialize a disabled profiler."""
+        self._stats: defaultdict[str, defaultdict[str, CallbackStats]] = defaultdict(
+            lambda: defaultdict(CallbackStats)
+        )
+        # class name -> (duration, method, entity_id, time) of recent calls
+        self._recent: defaultdict[
+            str, deque[tuple[float, str, str | None, datetime]]
+        ] = defaultdict(lambda: deque(maxlen=RECENT_INVOCATIONS))
+        self._originals: list[tuple[type, str, Callable[..., Any]]] = []
+
+    @property
+    def enabled(self) -> bool:
+        """Return True while the callbacks are wrapped."""
+        return bool(self._originals)
+
+    def _wrap(
+        self, cls: type, name: str, func: Callable[..., Any]
+    ) -> Callable[..., Any]:
+        """
+        Return ``func`` timed and recorded under the caller's class.
+
+        Methods inherited from another class, such as a mixin, are recorded
+        as ``Class.method``.
+        """
+        inherited = f"{cls.__name__}.{name}"
+
+        @callback
+        @functools.wraps(func)
+        def _profiled(owner: Any, *args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return func(owner, *args, **kwargs)
+            finally:
+                owner_cls = type(owner)
+                self.record(
+                    owner_cls.__name__,
+                    name if owner_cls is cls else inherited,
+                    getattr(owner, "entity_id", None),
+                    time.perf_counter() - start,
+                )
+
+        return _profiled
+
+    @callback
+    def record(
+        self, class_name: str, method: str, entity_id: str | None, duration: float
+    ) -> None:
+        """Record one invocation of ``class_name.method``."""
+        self._stats[class_name][method].record(duration)
+        self._recent[class_name].append((duration, method, entity_id, dt_util.utcnow()))
+
+    @callback
+    def async_enable(self, modules: Iterable[ModuleType] | None = None) -> None:
+        """
+        Wrap the ``@profiled_callback`` methods of the classes in ``modules``.
+
+        Defaults to the integration's modules that are already imported;
+        nothing is imported here, see ``async_enable_callback_profiler``.
+        Only handlers subscribed afterwards, i.e. on the next platform setup,
+        are profiled.
+        """
+        if self.enabled:
+            return
+        if modules is None:
+            modules = _loaded_modules()
+
+        self._originals = _profiled_methods(modules)
+        for cls, name, func in self._originals:
+            setattr(cls, name, self._wrap(cls, name, func))
+        _LOGGER.info("Profiling %d callbacks", len(self._originals))
+
+    @callback
+    def async_disable(self) -> None:
+        """Restore the original callbacks."""
+        for cls, name, func in self._originals:
+            setattr(cls, name, func)
+        self._originals = []
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics per class for diagnostics."""
+        return {
+            "enabled": self.enabled,
+            "classes": {
+                class_name: {
+                    "callbacks": {
+                        method: stats.as_dict()
+                        for method, stats in sorted(
+                            methods.items(), key=lambda item: -item[1].total
+                        )
+                    },
+                    "slowest_recent": [
+                        {
+                            "callback": method,
+                            "entity_id": entity_id,
+                            "duration_ms": round(duration * 1e3, 3),
+                            "at": at.isoformat(),
+                        }
+                        for duration, method, entity_id, at in sorted(
+                            self._recent[class_name], key=lambda call: -call[0]
+                        )[:SLOWEST_REPORTED]
+                    ],
+                }
+                for class_name, methods in self._stats.items()
+            },
+        }
+
+
+@callback
+def async_get_callback_profiler(hass: HomeAssistant) -> CallbackProfiler:
+    """Return the shared callback profiler, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    profiler: CallbackProfiler | None = domain_data.get(CALLBACK_PROFILER_KEY)
+    if not isinstance(profiler, CallbackProfiler):
+        profiler = CallbackProfiler()
+        domain_data[CALLBACK_PROFILER_KEY] = profiler
+    return profiler
+
+
+async def async_enable_callback_profiler(hass: HomeAssistant) -> None:
+    """Import the platform modules in the executor, then start profiling."""
+    for name in PROFILED_MODULES:
+        await async_import_module(hass, f"{__package__}.{name}")
+    async_get_callback_profiler(hass).async_enable()
+
+
+@callback
+def async_unload_callback_profiler(hass: HomeAssistant) -> None:
+    """Restore the profiled callbacks and remove the profiler from hass.data."""
+    domain_data = hass.data.get(DOMAIN)
+    if not isinstance(domain_data, dict):
+        return
+    profiler = domain_data.pop(CALLBACK_PROFILER_KEY, None)
+    if isinstance(profiler, CallbackProfiler):
+        profiler.async_disable()
@@ -3,19 +3,24 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_NAME
 from homeassistant.core import callback
+from homeassistant.data_entry_flow import section
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.selector import (
+    BooleanSelector,
     DeviceSelector,
     DeviceSelectorConfig,
     EntitySelector,
     EntitySelectorConfig,
+    NumberSelector,
+    NumberSelectorConfig,
+    NumberSelectorMode,
     SelectOptionDict,
     SelectSelector,
     SelectSelectorConfig,
@@ -26,16 +31,28 @@ from homeassistant.util import slugify
 from .const import (
     ACTION_ADD_SLOT,
     CONF_ACTION,
+    CONF_CALLBACK_PROFILING,
     CONF_HUMIDITY_ENTITY_ID,
     CONF_LINKED_DEVICE_ID,
+    CONF_MIRROR_DEADBAND,
+    CONF_MIRROR_MIN_INTERVAL,
+    CONF_MIRROR_RELATIVE_DEADBAND,
+    CONF_MIRROR_WRITE_FILTERS,
     CONF_MONITORING_DEVICE_ID,
+    CONF_STATE_WRITE_DEBOUNCE,
+    DEFAULT_CALLBACK_PROFILING,
+    DEFAULT_STATE_WRITE_DEBOUNCE,
     DOMAIN,
+    MIRROR_WRITE_FILTER_SENSOR_TYPES,
     OPENPLANTBOOK_DOMAIN,
     STEP_DEVICE_SELECTION,
     STEP_MANUAL_NAME,
     STORAGE_VERSION,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -228,6 +245,119 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             "location": LocationSubentryFlowHandler,
         }
 
+    @classmethod
+    @callback
+    def async_supports_options_flow(
+        cls, config_entry: config_entries.ConfigEntry[Any]
+    ) -> bool:
+        """Return if the entry has options; legacy location entries have none."""
+        return "parent_entry_id" not in config_entry.data
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        _config_entry: config_entries.ConfigEntry[Any],
+    ) -> OptionsFlowHandler:
+        """Return the options flow of the main entry."""
+        return OptionsFlowHandler()
+
+
+def _mirror_write_filter_section(settings: Mapping[str, Any]) -> section:
+    """Return the collapsed form section of one sensor type's write filter."""
+    return section(
+        vol.Schema(
+            {
+                vol.Required(
+                    CONF_MIRROR_DEADBAND,
+                    default=settings.get(CONF_MIRROR_DEADBAND, 0),
+                ): NumberSelector(
+                    NumberSelectorConfig(min=0, step="any", mode=NumberSelectorMode.BOX)
+                ),
+                vol.Required(
+                    CONF_MIRROR_RELATIVE_DEADBAND,
+                    default=settings.get(CONF_MIRROR_RELATIVE_DEADBAND, 0),
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0, max=1, step="any", mode=NumberSelectorMode.BOX
+                    )
+                ),
+                vol.Required(
+                    CONF_MIRROR_MIN_INTERVAL,
+                    default=settings.get(CONF_MIRROR_MIN_INTERVAL, 0),
+                ): NumberSelector(
+                    NumberSelectorConfig(
+                        min=0,
+                        max=3600,
+                        step=1,
+                        unit_of_measurement="s",
+                        mode=NumberSelectorMode.BOX,
+                    )
+                ),
+            }
+        ),
+        {"collapsed": True},
+    )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle the main entry's performance options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> config_entries.ConfigFlowResult:
+        """Edit the options; zones and locations are kept as they are."""
+        options = self.config_entry.options
+        if user_input is not None:
+            # One form section per sensor type; filters left at 0 are dropped
+            user_input = dict(user_input)
+            filters = {}
+            for sensor_type in MIRROR_WRITE_FILTER_SENSOR_TYPES:
+                settings = user_input.pop(sensor_type, None)
+                if settings and any(settings.values()):
+                    filters[sensor_type] = settings
+            return self.async_create_entry(
+                data={
+                    **options,
+                    **user_input,
+                    CONF_MIRROR_WRITE_FILTERS: filters,
+                }
+            )
+
+        current_filters = options.get(CONF_MIRROR_WRITE_FILTERS) or {}
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_STATE_WRITE_DEBOUNCE,
+                        default=options.get(
+                            CONF_STATE_WRITE_DEBOUNCE, DEFAULT_STATE_WRITE_DEBOUNCE
+                        ),
+                    ): NumberSelector(
+                        NumberSelectorConfig(
+                            min=0,
+                            max=60,
+                            step=0.1,
+                            unit_of_measurement="s",
+                            mode=NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_CALLBACK_PROFILING,
+                        default=options.get(
+                            CONF_CALLBACK_PROFILING, DEFAULT_CALLBACK_PROFILING
+                        ),
+                    ): BooleanSelector(),
+                    **{
+                        vol.Required(sensor_type): _mirror_write_filter_section(
+                            current_filters.get(sensor_type) or {}
+                        )
+                        for sensor_type in MIRROR_WRITE_FILTER_SENSOR_TYPES
+                    },
+                }
+            ),
+        )
+
 
 class LocationSubentryFlowHandler(config_entries.ConfigSubentryFlow):
     """Handle subentry flow for adding and modifying plant locations."""
@@ -393,3 +393,60 @@ ATTR_PLANT_DEVICE_IDS = "plant_device_ids"
 
 # Entity monitoring
 ENTITY_MONITOR_KEY = "entity_monitor"
+# Seconds to collect source entity renames before updating config entries
+ENTITY_RENAME_BATCH_DELAY = 0.5
+
+# Shared entity registry index
+ENTITY_INDEX_KEY = "entity_index"
+
+# ESPHome irrigation gateway events
+ESPHOME_IRRIGATION_GATEWAY_EVENT = "esphome.irrigation_gateway_update"
+IRRIGATION_EVENT_DISPATCHER_KEY = "irrigation_event_dispatcher"
+
+# Shared recorder statistics service
+RECORDER_STATISTICS_KEY = "recorder_statistics"
+
+# Scheduled expiry of ignore-until windows
+IGNORE_UNTIL_SCHEDULER_KEY = "ignore_until_scheduler"
+
+# Coalesced entity state writes
+WRITE_COALESCER_KEY = "write_coalescer"
+# Main entry option: seconds to debounce state writes; 0 flushes every loop tick
+CONF_STATE_WRITE_DEBOUNCE = "state_write_debounce"
+DEFAULT_STATE_WRITE_DEBOUNCE = 0.0
+
+# Shared per-location plant attribute snapshots
+PLANT_SNAPSHOTS_KEY = "plant_snapshots"
+
+# Shared per-device availability trackers for link sensors
+DEVICE_AVAILABILITY_KEY = "device_availability"
+
+# Live mirror sensors keyed by their source entity's unique_id
+MIRROR_REGISTRY_KEY = "mirror_registry"
+
+# Shared state change subscriptions of source entities
+STATE_MULTIPLEXER_KEY = "state_multiplexer"
+
+# Diff-based reconfiguration of options and subentry updates
+RECONFIGURE_KEY = "reconfigure"
+
+# Locations whose entities are created concurrently during platform setup
+SUBENTRY_SETUP_CONCURRENCY = 8
+
+# Opt-in latency profiling of entity callbacks, reported in diagnostics
+CALLBACK_PROFILER_KEY = "callback_profiler"
+# Main entry option: profile entity callbacks; applied on the next reload
+CONF_CALLBACK_PROFILING = "callback_profiling"
+DEFAULT_CALLBACK_PROFILING = False
+
+# Deadband and rate limiting of mirror sensor state writes
+MIRROR_WRITE_FILTERS_KEY = "mirror_write_filters"
+# Main entry option: write filter settings keyed by mirrored sensor type
+CONF_MIRROR_WRITE_FILTERS = "mirror_write_filters"
+CONF_MIRROR_DEADBAND = "deadband"
+CONF_MIRROR_RELATIVE_DEADBAND = "relative_deadband"
+CONF_MIRROR_MIN_INTERVAL = "min_interval"
+# Mirrored sensor types with write filter settings in the options flow
+MIRROR_WRITE_FILTER_SENSOR_TYPES = (*MONITORING_SENSOR_MAPPINGS, "humidity")
+# Seconds after which a reading held by the deadband alone is still written
+MIRROR_DEADBAND_FLUSH_DELAY = 300.0
@@ -12,12 +12,11 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.datetime import DateTimeEntity
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers import entity_registry as er
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
+from .device import shared_device_info
 from .sensor import (
     _get_monitoring_device_sensors,
     _has_plants_in_slots,
@@ -90,130 +89,53 @@ def _collect_expected_datetime_entities(
     return expected
 
 
-async def _cleanup_orphaned_datetime_entities(  # noqa: PLR0912
-    hass: HomeAssistant, entry: ConfigEntry[Any]
-) -> None:
-    """Clean up datetime entities that are no longer configured."""
-    try:
-        entity_registry = er.async_get(hass)
-        expected_datetime_entities = set()
-
-        # Collect expected entities from all subentries
-        if entry.subentries:
-            for subentry in entry.subentries.values():
-                expected_datetime_entities.update(
-                    _collect_expected_datetime_entities(subentry)
-                )
+def _expected_datetime_entities_for_subentry(
+    hass: HomeAssistant, subentry: Any
+) -> set[str]:
+    """Return the expected datetime unique_ids of a subentry."""
+    expected = _collect_expected_datetime_entities(subentry)
+    if "device_id" not in subentry.data:
+        return expected
 
-                # Additional entities for soil conductivity and DLI
-                if "device_id" in subentry.data:
-                    monitoring_device_id = subentry.data.get("monitoring_device_id")
-                    has_monitoring_device = bool(monitoring_device_id)
-                    has_plant_slots = _has_plants_in_slots(subentry.data)
+    # Additional entities for soil conductivity and DLI
+    monitoring_device_id = subentry.data.get("monitoring_device_id")
+    if not monitoring_device_id or not _has_plants_in_slots(subentry.data):
+        return expected
 
-                    if has_monitoring_device and has_plant_slots:
-                        try:
-                            device_sensors = _get_monitoring_device_sensors(
-                                hass, monitoring_device_id
-                            )
-                            # Extract entity_id from tuple (entity_id, unique_id)
-                            soil_conductivity_sensor = device_sensors.get(
-                                "soil_conductivity"
-                            )
-                            illuminance_sensor = device_sensors.get("illuminance")
+    try:
+        device_sensors = _get_monitoring_device_sensors(hass, monitoring_device_id)
+    except (ValueError, TypeError) as discovery_error:  # pragma: no cover
+        _LOGGER.debug(
+            "Failed to discover monitoring device sensors "
+            "for %s during datetime cleanup: %s",
+            monitoring_device_id,
+            discovery_error,
+        )
+        return expected
 
-                            soil_conductivity_entity_id = (
-                                soil_conductivity_sensor[0]
-                                if soil_conductivity_sensor
-                                else None
-                            )
-                            illuminance_entity_id = (
-                                illuminance_sensor[0] if illuminance_sensor else None
-                            )
+    # Extract entity_id from tuple (entity_id, unique_id)
+    soil_conductivity_sensor = device_sensors.get("soil_conductivity")
+    illuminance_sensor = device_sensors.get("illuminance")
 
-                            if soil_conductivity_entity_id:
-                                expected_datetime_entities.add(
-                                    f"{DOMAIN}_{subentry.subentry_id}_"
-                                    "soil_conductivity_ignore_until"
-                                )
-                                expected_datetime_entities.add(
-                                    f"{DOMAIN}_{subentry.subentry_id}_"
-                                    "soil_conductivity_high_threshold_ignore_until"
-                                )
-
-                            if illuminance_entity_id:
-                                expected_datetime_entities.add(
-                                    f"{DOMAIN}_{subentry.subentry_id}_"
-                                    "daily_light_integral_high_threshold_ignore_until"
-                                )
-                                expected_datetime_entities.add(
-                                    f"{DOMAIN}_{subentry.subentry_id}_"
-                                    "daily_light_integral_low_threshold_ignore_until"
-                                )
-                        except (
-                            ValueError,
-                            TypeError,
-                        ) as discovery_error:  # pragma: no cover
-                            _LOGGER.debug(
-                                "Failed to discover monitoring device sensors "
-                                "for %s during datetime cleanup: %s",
-                                monitoring_device_id,
-                                discovery_error,
-                            )
-
-        # Find and remove orphaned entities
-        entities_to_remove = []
-        for entity_id, entity_entry in entity_registry.entities.items():
-            if (
-                entity_entry.platform != DOMAIN
-                or entity_entry.domain != "datetime"
-                or not entity_entry.unique_id
-                or entity_entry.config_entry_id != entry.entry_id
-            ):
-                continue
-
-            # Check if this is a datetime entity for our domain
-            unique_id = entity_entry.unique_id
-            datetime_keywords = [
-                "_temperature_low_threshold_ignore_until",
-                "_temperature_high_threshold_ignore_until",
-                "_temperature_ignore_until",
-                "_humidity_ignore_until",
-                "_humidity_high_threshold_ignore_until",
-                "_soil_moisture_ignore_until",
-                "_soil_moisture_high_threshold_ignore_until",
-                "_soil_conductivity_ignore_until",
-                "_soil_conductivity_high_threshold_ignore_until",
-                "_daily_light_integral_high_threshold_ignore_until",
-                "_daily_light_integral_low_threshold_ignore_until",
-                "_battery_low_threshold_ignore_until",
-                "_plant_count_ignore_until",
-                "_monitor_link_ignore_until",
-            ]
-
-            if any(kw in unique_id for kw in datetime_keywords) and (
-                unique_id not in expected_datetime_entities
-            ):
-                entities_to_remove.append(entity_id)
-
-        # Remove orphaned entities
-        for entity_id in entities_to_remove:
-            entity_registry.async_remove(entity_id)
-            _LOGGER.debug("Removed orphaned datetime entity: %s", entity_id)
-
-        if entities_to_remove:
-            _LOGGER.info(
-                "Cleaned up %d orphaned datetime entities for entry %s",
-                len(entities_to_remove),
-                entry.entry_id,
-            )
+    if soil_conductivity_sensor and soil_conductivity_sensor[0]:
+        expected.add(f"{DOMAIN}_{subentry.subentry_id}_soil_conductivity_ignore_until")
+        expected.add(
+            f"{DOMAIN}_{subentry.subentry_id}_"
+            "soil_conductivity_high_threshold_ignore_until"
+        )
 
-    except Exception as exc:  # noqa: BLE001 - Defensive logging
-        _LOGGER.warning(
-            "Failed to cleanup orphaned datetime entities: %s",
-            exc,
+    if illuminance_sensor and illuminance_sensor[0]:
+        expected.add(
+            f"{DOMAIN}_{subentry.subentry_id}_"
+            "daily_light_integral_high_threshold_ignore_until"
+        )
+        expected.add(
+            f"{DOMAIN}_{subentry.subentry_id}_"
+            "daily_light_integral_low_threshold_ignore_until"
         )
 
+    return expected
+
 
 async def async_setup_entry(  # noqa: PLR0912,PLR0915
     hass: HomeAssistant,
@@ -242,9 +164,6 @@ async def async_setup_entry(  # noqa: PLR0912,PLR0915
             len(entry.subentries),
         )
 
-        # Clean up orphaned datetime entities before creating new ones
-        await _cleanup_orphaned_datetime_entities(hass, entry)
-
         for subentry_id, subentry in entry.subentries.items():
             _LOGGER.debug(
                 "Processing subentry %s with data: %s",
@@ -744,8 +663,8 @@ class TemperatureLowThresholdIgnoreUntilEntity(RestoreEntity, DateTimeEntity):
         self._attr_icon = "mdi:thermometer-alert"
         # Device created by device registry with config_subentry_id
         # Following OpenAI integration pattern
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, subentry_id)},
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, subentry_id),
             name=location_name,
             manufacturer="Plant Assistant",
             model="Plant Location",
@@ -892,8 +811,8 @@ class TemperatureHighThresholdIgnoreUntilEntity(RestoreEntity, DateTimeEntity):
 
         # Device created by device registry with config_subentry_id
         # Following OpenAI integration pattern
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, subentry_id)},
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, subentry_id),
             name=location_name,
             manufacturer="Plant Assistant",
             model="Plant Location",
@@ -1038,8 +957,8 @@ class HumidityLowThresholdIgnoreUntilEntity(RestoreEntity, DateTimeEntity):
 
         # Device created by device registry with config_subentry_id
         # Following OpenAI integration pattern
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, subentry_id)},
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, subentry_id),
             name=location_name,
             manufacturer="Plant Assistant",
             model="Plant Location",
@@ -1183,8 +1102,8 @@ class HumidityHighThresholdIgnoreUntilEntity(RestoreEntity, DateTimeEntity):
 
         # Device created by device registry with config_subentry_id
         # Following OpenAI integration pattern
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, subentry_id)},
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, subentry_id),
             name=location_name,
             manufacturer="Plant Assistant",
             model="Plant Location",
@@ -1330,8 +1249,8 @@ class SoilMoistureLowThresholdIgnoreUntilEntity(RestoreEntity, DateTimeEntity):
 
         # Device created by device registry with config_subentry_id
         # Following OpenAI integration pattern
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, subentry_id)},
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, subentry_id),
             name=location_name,
             manufacturer="Plant Assistant",
             model="Plant Location",
@@ -1474,8 +1393,8 @@ class SoilMoistureHighThresholdIgnoreUntilEntity(RestoreEntity, DateTimeEntity):
 
         # Device created by device registry with config_subentry_id
         # Following OpenAI integration pattern
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, subentry_id)},
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, subentry_id),
             name=location_name,
             manufacturer="Plant Assistant",
             model="Plant Location",
@@ -1619,8 +1538,8 @@ class SoilConductivityLowThresholdIgnoreUntilEntity(RestoreEntity, DateTimeEntit
         self._attr_has_entity_name = False
 
         # Device created by device registry with config_subentry_id
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, subentry_id)},
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, subentry_id),
             name=location_name,
             manufacturer="Plant Assistant",
             model="Plant Location",
@@ -1761,8 +1680,8 @@ class SoilConductivityHighThresholdIgnoreUntilEntity(RestoreEntity, DateTimeEnti
         self._attr_icon = "mdi:flash-alert"
         self._attr_has_entity_name = False
 
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, subentry_id)},
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, subentry_id),
             name=location_name,
             manufacturer="Plant Assistant",
             model="Plant Location",
@@ -1905,8 +1824,8 @@ class DailyLightIntegralHighThresholdIgnoreUntilEntity(RestoreEntity, DateTimeEn
 
         # Device created by device registry with config_subentry_id
         # Following OpenAI integration pattern
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, subentry_id)},
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, subentry_id),
             name=location_name,
             manufacturer="Plant Assistant",
             model="Plant Location",
@@ -2051,8 +1970,8 @@ class DailyLightIntegralLowThresholdIgnoreUntilEntity(RestoreEntity, DateTimeEnt
 
         # Device created by device registry with config_subentry_id
         # Following OpenAI integration pattern
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, subentry_id)},
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, subentry_id),
             name=location_name,
             manufacturer="Plant Assistant",
             model="Plant Location",
@@ -2190,8 +2109,8 @@ class PlantCountIgnoreUntilEntity(RestoreEntity, DateTimeEntity):
         self._attr_icon = "mdi:flower-tulip"
         # Device created by device registry with config_subentry_id
         # Following OpenAI integration pattern
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, subentry_id)},
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, subentry_id),
             name=location_name,
             manufacturer="Plant Assistant",
             model="Plant Location",
@@ -2333,8 +2252,8 @@ class BatteryLevelLowThresholdIgnoreUntilEntity(RestoreEntity, DateTimeEntity):
         self._attr_icon = "mdi:battery-alert-variant-outline"
         # Device created by device registry with config_subentry_id
         # Following OpenAI integration pattern
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, subentry_id)},
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, subentry_id),
             name=location_name,
             manufacturer="Plant Assistant",
             model="Plant Location",
@@ -2483,8 +2402,8 @@ class MonitorLinkIgnoreUntilEntity(RestoreEntity, DateTimeEntity):
         self._attr_icon = "mdi:link-off"
         # Device created by device registry with config_subentry_id
         # Following OpenAI integration pattern
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, subentry_id)},
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, subentry_id),
             name=location_name,
             manufacturer="Plant Assistant",
             model="Plant Location",
@@ -2623,9 +2542,7 @@ class IrrigationZoneScheduleIgnoreUntilEntity(RestoreEntity, DateTimeEntity):
         self._attr_icon = "mdi:calendar-remove"
 
         # Device info to associate with the irrigation zone device
-        self._attr_device_info = DeviceInfo(
-            identifiers={zone_device_id},
-        )
+        self._attr_device_info = shared_device_info(zone_device_id)
 
     async def async_added_to_hass(self) -> None:
         """Restore state when entity is added to hass."""
@@ -2755,9 +2672,7 @@ class IrrigationZoneScheduleMisconfigurationIgnoreUntilEntity(
         self._attr_icon = "mdi:alert-circle"
 
         # Device info to associate with the irrigation zone device
-        self._attr_device_info = DeviceInfo(
-            identifiers={zone_device_id},
-        )
+        self._attr_device_info = shared_device_info(zone_device_id)
 
     async def async_added_to_hass(self) -> None:
         """Restore state when entity is added to hass."""
@@ -2888,9 +2803,7 @@ class IrrigationZoneWaterDeliveryPreferenceIgnoreUntilEntity(
         self._attr_icon = "mdi:water-remove"
 
         # Device info to associate with the irrigation zone device
-        self._attr_device_info = DeviceInfo(
-            identifiers={zone_device_id},
-        )
+        self._attr_device_info = shared_device_info(zone_device_id)
 
     async def async_added_to_hass(self) -> None:
         """Restore state when entity is added to hass."""
@@ -3018,9 +2931,7 @@ class IrrigationZoneErrorIgnoreUntilEntity(RestoreEntity, DateTimeEntity):
         self._attr_icon = "mdi:alert-octagon"
 
         # Device info to associate with the irrigation zone device
-        self._attr_device_info = DeviceInfo(
-            identifiers={zone_device_id},
-        )
+        self._attr_device_info = shared_device_info(zone_device_id)
 
     async def async_added_to_hass(self) -> None:
         """Restore state when entity is added to hass."""
@@ -2,12 +2,52 @@
 
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import DOMAIN
 
+# Distinct device descriptions kept for sharing; far above any real install
+_SHARED_DEVICE_INFO_SIZE = 4096
+
+
+def shared_device_info(
+    identifier: tuple[str, str],
+    *,
+    name: str | None = None,
+    manufacturer: str | None = None,
+    model: str | None = None,
+) -> DeviceInfo:
+    """
+    Return the DeviceInfo linking an entity to a device.
+
+    Every entity of a location or zone describes the same device, so one
+    DeviceInfo per distinct description is built and shared by all of them
+    instead of each entity holding its own copy. Callers must not modify it.
+    """
+    return _device_info(identifier, name, manufacturer, model)
+
+
+@functools.lru_cache(maxsize=_SHARED_DEVICE_INFO_SIZE)
+def _device_info(
+    identifier: tuple[str, str],
+    name: str | None,
+    manufacturer: str | None,
+    model: str | None,
+) -> DeviceInfo:
+    """Build the DeviceInfo for one device description."""
+    device_info = DeviceInfo(identifiers={identifier})
+    if name is not None:
+        device_info["name"] = name
+    if manufacturer is not None:
+        device_info["manufacturer"] = manufacturer
+    if model is not None:
+        device_info["model"] = model
+    return device_info
+
 
 def async_get_or_create_zone_device(hass: Any, entry: Any, zone: dict[str, Any]) -> Any:
     """Get or create a device for an irrigation zone."""
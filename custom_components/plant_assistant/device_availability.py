@@ -0,0 +1,248 @@
+"""
+Event-driven availability tracking for monitoring devices.
+
+The link sensors report whether a location's monitoring device is reachable,
+which is derived from the states of the device's entities: the device is
+available while at least one of them is available. Rather than listing the
+device's entities and reading every state on each change, one tracker per
+device subscribes to its entities once and keeps running available and
+unavailable counters, so each state transition is O(1) and listeners are
+only notified when the device's availability actually flips.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_track_state_change_event,
+)
+
+from .const import DEVICE_AVAILABILITY_KEY, DOMAIN
+from .entity_index import async_get_device_entries
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import State
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _entity_available(state: State | None) -> bool | None:
+    """Return True/False for an available/unavailable state, None if missing."""
+    if state is None:
+        return None
+    return state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN)
+
+
+class DeviceAvailabilityTracker:
+    """Running availability counters for the entities of one device."""
+
+    def __init__(self, hass: HomeAssistant, device_id: str) -> None:
+        """Initialize an empty tracker."""
+        self.hass = hass
+        self.device_id = device_id
+        # entity_id -> last known availability; None while the entity has no state
+        self._entities: dict[str, bool | None] = {}
+        self.available_count = 0
+        self.unavailable_count = 0
+        self._listeners: list[Callable[[], None]] = []
+        self._unsubscribe_state: Callable[[], None] | None = None
+        self._unsubscribe_registry: Callable[[], None] | None = None
+
+    @property
+    def entity_ids(self) -> list[str]:
+        """Return the tracked entity ids."""
+        return list(self._entities)
+
+    @property
+    def has_listeners(self) -> bool:
+        """Return True if any link sensor listens to this tracker."""
+        return bool(self._listeners)
+
+    @property
+    def available(self) -> bool | None:
+        """
+        Return the device's availability derived from its entities.
+
+        True if any entity is available, False if all entities with a state
+        are unavailable, None if no entity has a state.
+        """
+        if self.available_count:
+            return True
+        if self.unavailable_count:
+            return False
+        return None
+
+    @callback
+    def async_count(self) -> None:
+        """Read the device's entities and their current states."""
+        self._entities.clear()
+        self.available_count = 0
+        self.unavailable_count = 0
+        try:
+            entries = async_get_device_entries(self.hass, self.device_id)
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.debug(
+                "Error listing entities of device %s: %s", self.device_id, exc
+            )
+            return
+
+        for entry in entries:
+            available = _entity_available(self.hass.states.get(entry.entity_id))
+            self._entities[entry.entity_id] = available
+            self._adjust(1, available=available)
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """
+        Call ``listener`` whenever the device's availability flips.
+
+        The tracker subscribes to its entities when the first listener is
+        added and is dropped once the last listener is removed.
+
+        Returns:
+            A callable that removes the listener.
+
+        """
+        if not self._listeners:
+            self._async_subscribe()
+        self._listeners.append(listener)
+
+        @callback
+        def _remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+            if not self._listeners:
+                async_remove_device_availability_tracker(self.hass, self)
+
+        return _remove_listener
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop tracking the device's entities."""
+        self._async_unsubscribe()
+        self._listeners.clear()
+
+    @callback
+    def _async_subscribe(self) -> None:
+        """Track state changes of the device's entities and registry changes."""
+        self._async_unsubscribe()
+        if self._entities:
+            self._unsubscribe_state = async_track_state_change_event(
+                self.hass, self.entity_ids, self._handle_state_changed
+            )
+        self._unsubscribe_registry = self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._handle_entity_registry_updated
+        )
+        _LOGGER.debug(
+            "Tracking availability of %d entities for device %s",
+            len(self._entities),
+            self.device_id,
+        )
+
+    @callback
+    def _async_unsubscribe(self) -> None:
+        """Remove the state and registry subscriptions."""
+        if self._unsubscribe_state is not None:
+            self._unsubscribe_state()
+            self._unsubscribe_state = None
+        if self._unsubscribe_registry is not None:
+            self._unsubscribe_registry()
+            self._unsubscribe_registry = None
+
+    def _adjust(self, delta: int, *, available: bool | None) -> None:
+        """Add ``delta`` to the counter for an availability value."""
+        if available is True:
+            self.available_count += delta
+        elif available is False:
+            self.unavailable_count += delta
+
+    @callback
+    def _async_notify_if_changed(self, *, previous: bool | None) -> None:
+        """Notify listeners if the device's availability changed."""
+        if self.available == previous:
+            return
+        for listener in list(self._listeners):
+            listener()
+
+    @callback
+    def _handle_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Move one entity between the counters."""
+        entity_id = event.data["entity_id"]
+        if entity_id not in self._entities:
+            return
+
+        old = self._entities[entity_id]
+        new = _entity_available(event.data.get("new_state"))
+        if new is old:
+            return
+
+        previous = self.available
+        self._entities[entity_id] = new
+        self._adjust(-1, available=old)
+        self._adjust(1, available=new)
+        self._async_notify_if_changed(previous=previous)
+
+    @callback
+    def _handle_entity_registry_updated(self, event: Event[Any]) -> None:
+        """Recount when an entity joins or leaves the device."""
+        entity_id = event.data.get("entity_id")
+        old_entity_id = event.data.get("old_entity_id")
+        if entity_id not in self._entities and old_entity_id not in self._entities:
+            entries = async_get_device_entries(self.hass, self.device_id)
+            if not any(entry.entity_id == entity_id for entry in entries):
+                return
+
+        previous = self.available
+        self.async_count()
+        self._async_subscribe()
+        self._async_notify_if_changed(previous=previous)
+
+
+@callback
+def async_get_device_availability_tracker(
+    hass: HomeAssistant, device_id: str
+) -> DeviceAvailabilityTracker:
+    """
+    Return the shared availability tracker for a device.
+
+    A tracker without listeners is not kept current by events, so it is
+    recounted whenever it is requested.
+    """
+    trackers: dict[str, DeviceAvailabilityTracker] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(DEVICE_AVAILABILITY_KEY, {})
+
+    tracker = trackers.get(device_id)
+    if tracker is None:
+        tracker = DeviceAvailabilityTracker(hass, device_id)
+        trackers[device_id] = tracker
+    if not tracker.has_listeners:
+        tracker.async_count()
+    return tracker
+
+
+@callback
+def async_remove_device_availability_tracker(
+    hass: HomeAssistant, tracker: DeviceAvailabilityTracker
+) -> None:
+    """Stop and forget a tracker once no link sensor uses it."""
+    tracker.async_unload()
+    trackers = hass.data.get(DOMAIN, {}).get(DEVICE_AVAILABILITY_KEY, {})
+    if trackers.get(tracker.device_id) is tracker:
+        del trackers[tracker.device_id]
+
+
+@callback
+def async_unload_device_availability_trackers(hass: HomeAssistant) -> None:
+    """Stop all availability trackers and remove them from hass.data."""
+    trackers = hass.data.get(DOMAIN, {}).pop(DEVICE_AVAILABILITY_KEY, {})
+    for tracker in trackers.values():
+        tracker.async_unload()
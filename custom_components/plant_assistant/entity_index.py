@@ -0,0 +1,451 @@
+"""
+Entity registry index for Plant Assistant.
+
+Resolving an entity by unique_id through the entity registry requires a full
+scan of ``entity_registry.entities`` because the registry only indexes by
+``(domain, platform, unique_id)``. Plant Assistant entities routinely only
+know a stored unique_id, so this module keeps a single integration-wide
+index that is built once and kept current by ``entity_registry_updated``
+events, making every lookup a dictionary hit.
+
+Plant Assistant's own entities use unique_ids of the form
+``plant_assistant_<subentry_id>_<location>_<role>``. Once a location has been
+registered the index also keys those entities by ``(subentry_id, role)`` so
+that platform setup can find e.g. the soil moisture mirror of a location
+without substring matching on location names.
+
+The index also groups registry entries by device and domain, so finding the
+entities of one device (link monitoring, mirrored sensor discovery) costs
+O(entities on the device) instead of a registry scan.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import DOMAIN, ENTITY_INDEX_KEY
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class EntityRegistryIndex:
+    """Integration-wide ``(platform, unique_id) -> entity_id`` lookup."""
+
+    def __init__(self, hass: HomeAssistant, entity_registry: Any) -> None:
+        """Initialize the index for a given entity registry."""
+        self.hass = hass
+        self.entity_registry = entity_registry
+        # unique_id -> {entity_id: platform}; insertion order mirrors the
+        # registry iteration order so the first match is stable.
+        self._by_unique_id: dict[str, dict[str, str | None]] = {}
+        # entity_id -> unique_id, used to drop stale keys on remove/rename
+        self._unique_id_by_entity_id: dict[str, str] = {}
+        # subentry_id -> location name as it appears in unique_ids
+        self._locations: dict[str, str] = {}
+        # (subentry_id, role) -> {entity_id: entity domain}
+        self._by_location_role: dict[tuple[str, str], dict[str, str]] = {}
+        # entity_id -> (subentry_id, role), used to drop stale keys
+        self._location_role_by_entity_id: dict[str, tuple[str, str]] = {}
+        # device_id -> {domain -> {entity_id: registry entry}}
+        self._by_device: dict[str, dict[str, dict[str, Any]]] = {}
+        # entity_id -> device_id, used to drop stale keys
+        self._device_by_entity_id: dict[str, str] = {}
+        self._unsubscribe_registry_updated: Callable[[], None] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of indexed registry entries."""
+        return len(self._unique_id_by_entity_id)
+
+    @callback
+    def async_setup(self) -> None:
+        """Build the index and subscribe to registry updates."""
+        self._by_unique_id.clear()
+        self._unique_id_by_entity_id.clear()
+        self._by_location_role.clear()
+        self._location_role_by_entity_id.clear()
+        self._by_device.clear()
+        self._device_by_entity_id.clear()
+
+        try:
+            for entity_entry in self.entity_registry.entities.values():
+                self._add_entry(entity_entry)
+        except (TypeError, AttributeError, ValueError):
+            _LOGGER.debug("Entity registry not iterable - index left empty")
+
+        # Mock hass objects used in tests may not expose an event bus
+        if self._unsubscribe_registry_updated is None:
+            with contextlib.suppress(AttributeError):
+                self._unsubscribe_registry_updated = self.hass.bus.async_listen(
+                    er.EVENT_ENTITY_REGISTRY_UPDATED,
+                    self._handle_entity_registry_updated,
+                )
+
+        _LOGGER.debug("Built entity registry index with %d entries", len(self))
+
+    @callback
+    def async_unload(self) -> None:
+        """Unsubscribe from registry updates and drop the index."""
+        if self._unsubscribe_registry_updated:
+            self._unsubscribe_registry_updated()
+            self._unsubscribe_registry_updated = None
+        self._by_unique_id.clear()
+        self._unique_id_by_entity_id.clear()
+        self._locations.clear()
+        self._by_location_role.clear()
+        self._location_role_by_entity_id.clear()
+        self._by_device.clear()
+        self._device_by_entity_id.clear()
+
+    def async_get_entity_id(
+        self, unique_id: str | None, platform: str | None = None
+    ) -> str | None:
+        """
+        Return the entity_id registered for a unique_id.
+
+        Args:
+            unique_id: The unique_id to resolve.
+            platform: Optional integration platform to disambiguate unique_ids
+                that are reused across integrations.
+
+        Returns:
+            The matching entity_id, or None if the unique_id is not registered.
+
+        """
+        if not unique_id:
+            return None
+
+        candidates = self._by_unique_id.get(unique_id)
+        if not candidates:
+            return None
+
+        if platform is None:
+            return next(iter(candidates))
+
+        for entity_id, entity_platform in candidates.items():
+            if entity_platform == platform:
+                return entity_id
+        return None
+
+    @callback
+    def async_register_location(self, subentry_id: str, location_name: str) -> None:
+        """
+        Index the entities of a plant location by role.
+
+        Registering the same location again is a no-op, so platforms can call
+        this for every location they set up. A changed location name
+        re-indexes that subentry's entities.
+
+        Args:
+            subentry_id: The location's config subentry id.
+            location_name: The location name used when building unique_ids.
+
+        """
+        location_name_safe = location_name.lower().replace(" ", "_")
+        if self._locations.get(subentry_id) == location_name_safe:
+            return
+
+        self._locations[subentry_id] = location_name_safe
+
+        for entity_id, key in list(self._location_role_by_entity_id.items()):
+            if key[0] == subentry_id:
+                self._discard_location_role(entity_id)
+
+        prefix = f"{DOMAIN}_{subentry_id}_"
+        for unique_id, candidates in self._by_unique_id.items():
+            if not unique_id.startswith(prefix):
+                continue
+            for entity_id, platform in candidates.items():
+                if platform == DOMAIN:
+                    self._add_location_role(entity_id, unique_id)
+
+    @callback
+    def async_unregister_location(self, subentry_id: str) -> None:
+        """Stop indexing a removed location's entities by role."""
+        if self._locations.pop(subentry_id, None) is None:
+            return
+        for entity_id, key in list(self._location_role_by_entity_id.items()):
+            if key[0] == subentry_id:
+                self._discard_location_role(entity_id)
+
+    def async_get_location_entity(
+        self, subentry_id: str, role: str, domain: str | None = None
+    ) -> tuple[str, str] | None:
+        """
+        Return the entity registered for a location role.
+
+        Args:
+            subentry_id: The location's config subentry id.
+            role: The unique_id suffix after the location name, for example
+                ``soil_moisture_mirror`` or ``min_soil_moisture``.
+            domain: Optional entity domain such as ``sensor``.
+
+        Returns:
+            Tuple of (entity_id, unique_id), or None if no entity matches.
+
+        """
+        candidates = self._by_location_role.get((subentry_id, role))
+        if not candidates:
+            return None
+
+        for entity_id, entity_domain in candidates.items():
+            if domain is None or entity_domain == domain:
+                return (entity_id, self._unique_id_by_entity_id[entity_id])
+        return None
+
+    def async_get_device_entries(
+        self, device_id: str | None, domain: str | None = None
+    ) -> list[Any]:
+        """
+        Return the registry entries of a device.
+
+        Args:
+            device_id: The device registry id.
+            domain: Optional entity domain such as ``sensor``.
+
+        Returns:
+            The device's entries in registry order, limited to ``domain`` if
+            given.
+
+        """
+        domains = self._by_device.get(device_id) if device_id else None
+        if not domains:
+            return []
+        if domain is not None:
+            return list(domains.get(domain, {}).values())
+        return [entry for entries in domains.values() for entry in entries.values()]
+
+    def _add_entry(self, entity_entry: Any) -> None:
+        """Index a single registry entry."""
+        unique_id = getattr(entity_entry, "unique_id", None)
+        entity_id = getattr(entity_entry, "entity_id", None)
+        if not unique_id or not entity_id:
+            return
+
+        device_id = getattr(entity_entry, "device_id", None)
+        if isinstance(device_id, str) and device_id:
+            self._by_device.setdefault(device_id, {}).setdefault(
+                entity_id.partition(".")[0], {}
+            )[entity_id] = entity_entry
+            self._device_by_entity_id[entity_id] = device_id
+
+        platform = getattr(entity_entry, "platform", None)
+        self._by_unique_id.setdefault(unique_id, {})[entity_id] = platform
+        self._unique_id_by_entity_id[entity_id] = unique_id
+
+        if platform == DOMAIN and self._locations:
+            self._add_location_role(entity_id, unique_id)
+
+    def _add_location_role(self, entity_id: str, unique_id: str) -> None:
+        """Index one of our entities by (subentry_id, role) if it has a location."""
+        prefix = f"{DOMAIN}_"
+        if not unique_id.startswith(prefix):
+            return
+
+        # Subentry ids may themselves contain underscores, so try every split
+        remainder = unique_id[len(prefix) :]
+        separator = remainder.find("_")
+        while separator != -1:
+            subentry_id = remainder[:separator]
+            location_name_safe = self._locations.get(subentry_id)
+            if location_name_safe is not None:
+                # Most roles follow the location name, a few entities
+                # (e.g. ignore-until datetimes) omit it
+                role = remainder[separator + 1 :].removeprefix(f"{location_name_safe}_")
+                key = (subentry_id, role)
+                self._by_location_role.setdefault(key, {})[entity_id] = (
+                    entity_id.partition(".")[0]
+                )
+                self._location_role_by_entity_id[entity_id] = key
+                return
+            separator = remainder.find("_", separator + 1)
+
+    def _discard_location_role(self, entity_id: str) -> None:
+        """Remove an entity_id from the location role index if present."""
+        key = self._location_role_by_entity_id.pop(entity_id, None)
+        if key is None:
+            return
+
+        candidates = self._by_location_role.get(key)
+        if candidates is not None:
+            candidates.pop(entity_id, None)
+            if not candidates:
+                del self._by_location_role[key]
+
+    def _discard_device_entry(self, entity_id: str) -> None:
+        """Remove an entity_id from the device index if present."""
+        device_id = self._device_by_entity_id.pop(entity_id, None)
+        if device_id is None:
+            return
+
+        domains = self._by_device.get(device_id, {})
+        domain = entity_id.partition(".")[0]
+        entries = domains.get(domain)
+        if entries is not None:
+            entries.pop(entity_id, None)
+            if not entries:
+                del domains[domain]
+        if not domains:
+            self._by_device.pop(device_id, None)
+
+    def _discard_entity_id(self, entity_id: str | None) -> None:
+        """Remove an entity_id from the index if present."""
+        if not entity_id:
+            return
+
+        self._discard_location_role(entity_id)
+        self._discard_device_entry(entity_id)
+        unique_id = self._unique_id_by_entity_id.pop(entity_id, None)
+        if unique_id is None:
+            return
+
+        candidates = self._by_unique_id.get(unique_id)
+        if candidates is not None:
+            candidates.pop(entity_id, None)
+            if not candidates:
+                del self._by_unique_id[unique_id]
+
+    @callback
+    def _handle_entity_registry_updated(self, event: Event) -> None:
+        """Keep the index in sync with entity registry changes."""
+        action = event.data.get("action")
+        entity_id = event.data.get("entity_id")
+
+        if action == "remove":
+            self._discard_entity_id(entity_id)
+            return
+
+        if action == "update":
+            # Renames report the previous id in old_entity_id
+            self._discard_entity_id(event.data.get("old_entity_id") or entity_id)
+
+        if action in ("create", "update") and entity_id:
+            try:
+                entity_entry = self.entity_registry.async_get(entity_id)
+            except (TypeError, AttributeError, ValueError):
+                entity_entry = None
+            if entity_entry is not None:
+                self._add_entry(entity_entry)
+
+
+@callback
+def async_get_entity_index(
+    hass: HomeAssistant, entity_registry: Any = None
+) -> EntityRegistryIndex | None:
+    """
+    Return the shared entity registry index, building it on first use.
+
+    Args:
+        hass: The Home Assistant instance.
+        entity_registry: The registry the caller already holds. When omitted
+            the registry is looked up from ``hass``.
+
+    Returns:
+        The shared index, or None if the entity registry is unavailable.
+
+    """
+    if entity_registry is None:
+        try:
+            entity_registry = er.async_get(hass)
+        except (TypeError, AttributeError, KeyError, ValueError):
+            return None
+    if entity_registry is None:
+        return None
+
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    index: EntityRegistryIndex | None = domain_data.get(ENTITY_INDEX_KEY)
+    if (
+        isinstance(index, EntityRegistryIndex)
+        and index.entity_registry is entity_registry
+    ):
+        return index
+
+    if isinstance(index, EntityRegistryIndex):
+        index.async_unload()
+
+    index = EntityRegistryIndex(hass, entity_registry)
+    index.async_setup()
+    domain_data[ENTITY_INDEX_KEY] = index
+    return index
+
+
+@callback
+def async_unload_entity_index(hass: HomeAssistant) -> None:
+    """Tear down the shared entity registry index."""
+    domain_data = hass.data.get(DOMAIN, {})
+    index = domain_data.pop(ENTITY_INDEX_KEY, None)
+    if isinstance(index, EntityRegistryIndex):
+        index.async_unload()
+
+
+@callback
+def async_unregister_location(hass: HomeAssistant, subentry_id: str) -> None:
+    """Forget a removed location in the shared index, if it has been built."""
+    index = hass.data.get(DOMAIN, {}).get(ENTITY_INDEX_KEY)
+    if isinstance(index, EntityRegistryIndex):
+        index.async_unregister_location(subentry_id)
+
+
+@callback
+def async_find_location_entity(
+    hass: HomeAssistant,
+    subentry_id: str,
+    location_name: str,
+    role: str,
+    domain: str | None = None,
+) -> tuple[str, str] | None:
+    """
+    Find one of a location's own entities by role.
+
+    Args:
+        hass: The Home Assistant instance.
+        subentry_id: The location's config subentry id.
+        location_name: The location name, used to strip it from unique_ids.
+        role: The unique_id suffix identifying the entity, for example
+            ``soil_moisture_mirror``.
+        domain: Optional entity domain such as ``sensor``.
+
+    Returns:
+        Tuple of (entity_id, unique_id) if found, None otherwise.
+
+    """
+    index = async_get_entity_index(hass)
+    if index is None:
+        return None
+
+    index.async_register_location(subentry_id, location_name)
+    return index.async_get_location_entity(subentry_id, role, domain)
+
+
+@callback
+def async_get_device_entries(
+    hass: HomeAssistant,
+    device_id: str | None,
+    domain: str | None = None,
+    entity_registry: Any = None,
+) -> list[Any]:
+    """
+    Return the entity registry entries belonging to a device.
+
+    Args:
+        hass: The Home Assistant instance.
+        device_id: The device registry id.
+        domain: Optional entity domain such as ``sensor``.
+        entity_registry: The registry the caller already holds, if any.
+
+    Returns:
+        The device's entries, or an empty list if the device has none or the
+        entity registry is unavailable.
+
+    """
+    index = async_get_entity_index(hass, entity_registry)
+    if index is None:
+        return []
+    return index.async_get_device_entries(device_id, domain)
@@ -7,10 +7,16 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_call_later
 
-from .const import DOMAIN
+from .const import DOMAIN, ENTITY_RENAME_BATCH_DELAY
+from .entity_index import async_get_entity_index
+from .mirror_registry import async_get_mirror_registry
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
     from homeassistant.config_entries import ConfigEntry
 
 _LOGGER = logging.getLogger(__name__)
@@ -30,6 +36,9 @@ class EntityMonitor:
             _LOGGER.debug("Failed to get entity registry - likely in test environment")
             self._entity_registry = None
         self._unsubscribe_registry_updated: Any = None
+        # Renames waiting for the batch window: old entity_id -> new entity_id
+        self._pending_renames: dict[str, str] = {}
+        self._cancel_rename_flush: Callable[[], None] | None = None
 
     async def async_setup(self) -> None:
         """Set up the entity monitor."""
@@ -86,7 +95,9 @@ class EntityMonitor:
         """Handle entity rename by updating mirror entities and config entries."""
         try:
             # Find all mirror entities that reference the old entity ID
-            mirror_entities = await self._find_mirror_entities_for_source(old_entity_id)
+            mirror_entities = await self._find_mirror_entities_for_source(
+                old_entity_id, new_entity_id
+            )
 
             if mirror_entities:
                 _LOGGER.info(
@@ -98,20 +109,19 @@ class EntityMonitor:
                 )
 
                 # Update each mirror entity's source reference
-                for mirror_entity_id in mirror_entities:
+                for mirror_sensor in mirror_entities:
                     await self._update_mirror_entity_source(
-                        mirror_entity_id, old_entity_id, new_entity_id
+                        mirror_sensor, old_entity_id, new_entity_id
                     )
             else:
                 _LOGGER.debug(
                     "No mirror entities found for renamed entity %s", old_entity_id
                 )
 
-            # Update all config entries that reference the renamed entity
-            # This ensures state change listeners are re-subscribed after reload
-            await self._update_all_config_entries_for_rename(
-                old_entity_id, new_entity_id
-            )
+            # Config entries that reference the renamed entity are updated and
+            # reloaded once the batch window closes, so a device rename that
+            # renames several entities reloads each entry only once
+            self._async_queue_rename(old_entity_id, new_entity_id)
 
         except Exception:
             _LOGGER.exception(
@@ -130,14 +140,10 @@ class EntityMonitor:
         if not self._entity_registry or not unique_id:
             return None
 
-        try:
-            for entity_entry in self._entity_registry.entities.values():
-                if entity_entry.unique_id == unique_id:
-                    return entity_entry.entity_id
-        except (TypeError, AttributeError, ValueError):
-            pass
-
-        return None
+        index = async_get_entity_index(self.hass, self._entity_registry)
+        if index is None:
+            return None
+        return index.async_get_entity_id(unique_id)
 
     def _get_unique_id_from_entity_id(self, entity_id: str) -> str | None:
         """
@@ -157,16 +163,45 @@ class EntityMonitor:
 
         return None
 
-    async def _update_all_config_entries_for_rename(
-        self, old_entity_id: str, new_entity_id: str
+    @callback
+    def _async_queue_rename(self, old_entity_id: str, new_entity_id: str) -> None:
+        """Queue a rename and restart the batch window."""
+        # Collapse chained renames (a -> b, b -> c) into a -> c
+        for pending_old, pending_new in self._pending_renames.items():
+            if pending_new == old_entity_id:
+                self._pending_renames[pending_old] = new_entity_id
+        self._pending_renames[old_entity_id] = new_entity_id
+
+        if self._cancel_rename_flush is not None:
+            self._cancel_rename_flush()
+        self._cancel_rename_flush = async_call_later(
+            self.hass, ENTITY_RENAME_BATCH_DELAY, self._async_flush_renames
+        )
+
+    @callback
+    def _async_flush_renames(self, _now: datetime) -> None:
+        """Apply the queued renames to the config entries."""
+        self._cancel_rename_flush = None
+        renames = {old: new for old, new in self._pending_renames.items() if old != new}
+        self._pending_renames = {}
+        if not renames:
+            return
+
+        _LOGGER.debug("Applying %d batched entity renames", len(renames))
+        self.hass.async_create_task(
+            self._update_all_config_entries_for_renames(renames)
+        )
+
+    async def _update_all_config_entries_for_renames(
+        self, renames: dict[str, str]
     ) -> None:
         """
-        Update all config entries that reference the renamed entity.
+        Update all config entries that reference any of the renamed entities.
 
         This method searches through all Plant Assistant config entries to find
-        any that reference the old entity ID and updates them to use the new ID.
-        After updating, it triggers a reload so state change listeners are
-        re-subscribed with the correct entity IDs.
+        any that reference an old entity ID and updates them to use the new ID.
+        Each affected entry is updated and reloaded once for the whole batch,
+        so state change listeners are re-subscribed with the correct entity IDs.
         """
         if not self._entity_registry:
             _LOGGER.debug(
@@ -180,107 +215,65 @@ class EntityMonitor:
 
             for config_entry in config_entries:
                 try:
-                    # Check if this entry references the renamed entity
-                    await self._update_config_entry_source_entity(
-                        config_entry, old_entity_id, new_entity_id
+                    # Check if this entry references any renamed entity
+                    await self._update_config_entry_source_entities(
+                        config_entry, renames
                     )
                 except Exception:
                     _LOGGER.exception(
-                        "Error updating config entry %s for renamed entity %s -> %s",
+                        "Error updating config entry %s for renamed entities %s",
                         config_entry.entry_id,
-                        old_entity_id,
-                        new_entity_id,
+                        renames,
                     )
 
         except Exception:
             _LOGGER.exception(
-                "Error updating config entries for renamed entity %s -> %s",
-                old_entity_id,
-                new_entity_id,
+                "Error updating config entries for renamed entities %s", renames
             )
 
     async def _find_mirror_entities_for_source(
-        self, source_entity_id: str
-    ) -> list[str]:
-        """Find all mirror entities that reference a specific source entity."""
-        mirror_entities: list[str] = []
+        self, source_entity_id: str, new_source_entity_id: str | None = None
+    ) -> list[Any]:
+        """
+        Return the live mirror sensors of a source entity.
 
+        Mirrors are looked up by the source's unique_id in the mirror registry,
+        which survives the rename. The registry already maps the new entity id
+        when the rename event fires, so it is tried before the old one.
+        """
         if not self._entity_registry:
             _LOGGER.debug(
                 "Entity registry not available - skipping mirror entity search"
             )
-            return mirror_entities
+            return []
 
-        try:
-            # First, get the unique_id of the source entity for reliable matching
-            source_unique_id = None
-            try:
-                source_entry = self._entity_registry.async_get(source_entity_id)
-                if source_entry and source_entry.unique_id:
-                    source_unique_id = source_entry.unique_id
-            except (TypeError, AttributeError, ValueError):
-                pass
-
-            # Get all entities for our domain
-            for entity_entry in self._entity_registry.entities.values():
-                if (
-                    entity_entry.domain != "sensor"
-                    or not entity_entry.unique_id.startswith(DOMAIN)
-                ):
-                    continue
-
-                # Check if this is a mirror entity by looking at unique_id pattern
-                if any(
-                    suffix in entity_entry.unique_id
-                    for suffix in [
-                        "_humidity_mirror",
-                        "_temperature_mirror",
-                        "_illuminance_mirror",
-                        "_soil_moisture_mirror",
-                        "_soil_conductivity_mirror",
-                        "_soil_conductivity_status",
-                        "_humidity_linked",  # Humidity linked sensors
-                        "_monitor_",  # Fallback for generic monitoring sensors
-                        "_esphome_running_status",  # ESPHome running status monitor
-                    ]
-                ):
-                    # Get the entity state to check source attributes
-                    state = self.hass.states.get(entity_entry.entity_id)
-                    if state:
-                        # Primary: Match by source_unique_id (most reliable)
-                        # Resilient to entity renames
-                        source_unique_id_match = (
-                            source_unique_id is not None
-                            and state.attributes.get("source_unique_id")
-                            == source_unique_id
-                        )
-
-                        if source_unique_id_match:
-                            mirror_entities.append(entity_entry.entity_id)
-                            _LOGGER.debug(
-                                "Found mirror entity %s referencing source %s "
-                                "(unique_id_match=%s)",
-                                entity_entry.entity_id,
-                                source_entity_id,
-                                source_unique_id_match,
-                            )
-                    else:
-                        _LOGGER.debug(
-                            "Mirror entity %s not found in states",
-                            entity_entry.entity_id,
-                        )
-        except Exception:
-            _LOGGER.exception("Error finding mirror entities")
+        source_unique_id = None
+        for entity_id in (new_source_entity_id, source_entity_id):
+            if entity_id and (
+                source_unique_id := self._get_unique_id_from_entity_id(entity_id)
+            ):
+                break
 
+        mirror_entities = async_get_mirror_registry(self.hass).async_get_mirrors(
+            source_unique_id
+        )
+        for mirror in mirror_entities:
+            _LOGGER.debug(
+                "Found mirror entity %s referencing source %s (unique_id %s)",
+                mirror.entity_id,
+                source_entity_id,
+                source_unique_id,
+            )
         return mirror_entities
 
     async def _update_mirror_entity_source(
         self,
-        mirror_entity_id: str,
+        mirror_sensor: Any,
         old_source_entity_id: str,
         new_source_entity_id: str,
     ) -> None:
         """Update a mirror entity's source entity reference directly."""
+        mirror_entity_id = getattr(mirror_sensor, "entity_id", mirror_sensor)
         try:
             _LOGGER.info(
                 "Updating mirror entity %s source from %s to %s",
@@ -289,33 +282,6 @@ class EntityMonitor:
                 new_source_entity_id,
             )
 
-            # Find the actual sensor object in stored sensors
-            mirror_sensor = None
-
-            # Look through all stored sensors
-            sensors_data = self.hass.data.get(DOMAIN, {}).get("sensors", {})
-            for sensors in sensors_data.values():
-                if not isinstance(sensors, list):
-                    continue
-
-                for sensor in sensors:
-                    if (
-                        hasattr(sensor, "entity_id")
-                        and sensor.entity_id == mirror_entity_id
-                        and hasattr(sensor, "async_update_source_entity")
-                    ):
-                        mirror_sensor = sensor
-                        break
-
-                if mirror_sensor:
-                    break
-
-            if not mirror_sensor:
-                _LOGGER.warning(
-                    "Could not find mirror sensor object for %s", mirror_entity_id
-                )
-                return
-
             # Update the sensor's source entity directly
             await mirror_sensor.async_update_source_entity(new_source_entity_id)
 
@@ -331,21 +297,30 @@ class EntityMonitor:
                 mirror_entity_id,
             )
 
-    async def _update_config_entry_source_entity(  # noqa: PLR0912, PLR0915
+    async def _update_config_entry_source_entities(  # noqa: C901, PLR0912, PLR0915
         self,
         config_entry: ConfigEntry[dict[str, Any]],
-        old_source_entity_id: str,
-        new_source_entity_id: str,
+        renames: dict[str, str],
     ) -> None:
-        """Update the source entity ID in a config entry's options and reload."""
+        """
+        Apply a batch of source entity renames to a config entry and reload.
+
+        Every substitution is applied in one pass over the entry's options or
+        data, and the entry is updated and reloaded at most once: by its update
+        listener if it has one, otherwise here.
+        """
         try:
             # Get current options
             options = dict(config_entry.options)
             data = dict(config_entry.data)
             updated = False
 
-            # Capture the unique_id of the new source entity for resilient tracking
-            new_unique_id = self._get_unique_id_from_entity_id(new_source_entity_id)
+            # Capture the unique_ids of the new source entities for resilient
+            # tracking
+            new_unique_ids = {
+                new_entity_id: self._get_unique_id_from_entity_id(new_entity_id)
+                for new_entity_id in renames.values()
+            }
 
             # Check if this is a main Plant Assistant entry with locations
             if "irrigation_zones" in options:
@@ -415,11 +390,12 @@ class EntityMonitor:
                         expected_entity_id,
                         unique_id_field,
                     ) in switch_field_mappings.items():
-                        if (
-                            expected_entity_id == old_source_entity_id
-                            and new_unique_id
-                            and unique_id_field not in zone_data
-                        ):
+                        if expected_entity_id not in renames:
+                            continue
+                        old_source_entity_id = expected_entity_id
+                        new_source_entity_id = renames[old_source_entity_id]
+                        new_unique_id = new_unique_ids[new_source_entity_id]
+                        if new_unique_id and unique_id_field not in zone_data:
                             # This zone's switch was renamed - store new unique_id
                             zone_data[unique_id_field] = new_unique_id
                             updated = True
@@ -437,12 +413,14 @@ class EntityMonitor:
                         locations = dict(zone_data["locations"])
                         for location_id, location_data_raw in locations.items():
                             location_data = dict(location_data_raw)
+                            old_source_entity_id = location_data.get(
+                                "humidity_entity_id"
+                            )
 
                             # Update humidity entity reference
-                            if (
-                                location_data.get("humidity_entity_id")
-                                == old_source_entity_id
-                            ):
+                            if old_source_entity_id in renames:
+                                new_source_entity_id = renames[old_source_entity_id]
+                                new_unique_id = new_unique_ids[new_source_entity_id]
                                 location_data["humidity_entity_id"] = (
                                     new_source_entity_id
                                 )
@@ -469,7 +447,10 @@ class EntityMonitor:
 
             # Check if this is a subentry with direct entity references
             elif "humidity_entity_id" in data:
-                if data["humidity_entity_id"] == old_source_entity_id:
+                old_source_entity_id = data["humidity_entity_id"]
+                if old_source_entity_id in renames:
+                    new_source_entity_id = renames[old_source_entity_id]
+                    new_unique_id = new_unique_ids[new_source_entity_id]
                     # Update the data (not options for subentries)
                     data["humidity_entity_id"] = new_source_entity_id
                     # Also store unique_id for resilience
@@ -484,24 +465,35 @@ class EntityMonitor:
                         new_unique_id or "unknown",
                     )
 
-            # Check if the renamed entity belongs to a monitoring device
-            monitoring_device_update_needed = (
-                await self._check_monitoring_device_entity_update(
-                    config_entry, old_source_entity_id, new_source_entity_id
-                )
-            )
+            # Check if any renamed entity belongs to a monitoring device
+            monitoring_device_update_needed = False
+            for old_entity_id, new_entity_id in renames.items():
+                if await self._check_monitoring_device_entity_update(
+                    config_entry, old_entity_id, new_entity_id
+                ):
+                    monitoring_device_update_needed = True
+                    break
 
             if updated or monitoring_device_update_needed:
                 if updated:
                     # Update the config entry with new data/options
                     if "irrigation_zones" in options:
-                        self.hass.config_entries.async_update_entry(
+                        changed = self.hass.config_entries.async_update_entry(
                             config_entry, options=options
                         )
                     else:
-                        self.hass.config_entries.async_update_entry(
+                        changed = self.hass.config_entries.async_update_entry(
                             config_entry, data=data
                         )
+                    # The update listener (async_update_options) applies the
+                    # change or reloads the entry itself
+                    if changed and config_entry.update_listeners:
+                        _LOGGER.info(
+                            "Updated config entry %s for source entity changes: %s",
+                            config_entry.entry_id,
+                            renames,
+                        )
+                        return
 
                 # Reload the config entry to apply changes
                 _LOGGER.info(
@@ -511,23 +503,19 @@ class EntityMonitor:
                 await self.hass.config_entries.async_reload(config_entry.entry_id)
 
                 _LOGGER.info(
-                    "Successfully reloaded entry for source entity change: %s -> %s",
-                    old_source_entity_id,
-                    new_source_entity_id,
+                    "Successfully reloaded entry for source entity changes: %s",
+                    renames,
                 )
             else:
                 _LOGGER.debug(
-                    "No configuration updates needed for source entity change:"
-                    " %s -> %s",
-                    old_source_entity_id,
-                    new_source_entity_id,
+                    "No configuration updates needed for source entity changes: %s",
+                    renames,
                 )
 
         except Exception:
             _LOGGER.exception(
-                "Error updating config entry for source entity change %s -> %s",
-                old_source_entity_id,
-                new_source_entity_id,
+                "Error updating config entry for source entity changes %s",
+                renames,
             )
 
     async def _check_monitoring_device_entity_update(
@@ -541,8 +529,11 @@ class EntityMonitor:
             if self._entity_registry is None:
                 return False
 
-            # Get the device that the renamed entity belongs to
-            old_entity_entry = self._entity_registry.async_get(old_source_entity_id)
+            # Get the device that the renamed entity belongs to. Once the
+            # rename is applied the registry only knows the new entity id.
+            old_entity_entry = self._entity_registry.async_get(
+                old_source_entity_id
+            ) or self._entity_registry.async_get(new_source_entity_id)
             if not old_entity_entry or not old_entity_entry.device_id:
                 return False
 
@@ -591,6 +582,11 @@ class EntityMonitor:
 
     async def async_unload(self) -> None:
         """Unload the entity monitor."""
+        if self._cancel_rename_flush is not None:
+            self._cancel_rename_flush()
+            self._cancel_rename_flush = None
+        self._pending_renames.clear()
+
         if self._unsubscribe_registry_updated:
             self._unsubscribe_registry_updated()
             self._unsubscribe_registry_updated = None
@@ -0,0 +1,254 @@
+"""
+Scheduled expiry of ignore-until windows for Plant Assistant monitors.
+
+Monitors that honour an ignore-until datetime only re-evaluate when one of
+their source entities changes, so an expired window on a quiet sensor would
+not raise its problem until the next reading. The scheduler keeps every
+pending expiry in a min-heap and arms a single point-in-time listener for the
+earliest one. When it fires, exactly the monitors whose windows ended are
+re-evaluated and the listener is re-armed for the next deadline.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_track_point_in_time
+from homeassistant.util import dt as dt_util
+
+from .callback_profiler import profiled_callback
+from .const import DOMAIN, IGNORE_UNTIL_SCHEDULER_KEY
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterable
+
+_LOGGER = logging.getLogger(__name__)
+
+# Rebuild the heap once stale entries outnumber live ones by this factor
+_COMPACT_FACTOR = 2
+_COMPACT_MIN_SIZE = 64
+
+
+def parse_ignore_until(value: Any) -> datetime | None:
+    """Parse an ignore-until state value into an aware datetime."""
+    if value is None or value in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        return None
+    try:
+        parsed = dt_util.parse_datetime(str(value))
+    except (ValueError, TypeError):
+        return None
+    if parsed is not None and parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.get_default_time_zone())
+    return parsed
+
+
+class IgnoreUntilScheduler:
+    """Min-heap of ignore-until expiries served by one armed timer."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the scheduler."""
+        self.hass = hass
+        # (deadline timestamp, sequence, key); superseded entries stay in the
+        # heap until popped and are recognised by not matching _deadlines
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._deadlines: dict[Hashable, float] = {}
+        self._actions: dict[Hashable, Callable[[], None]] = {}
+        self._sequence = itertools.count()
+        self._armed_for: float | None = None
+        self._cancel_timer: Callable[[], None] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of pending expiries."""
+        return len(self._deadlines)
+
+    @property
+    def next_deadline(self) -> datetime | None:
+        """Return the deadline the timer is currently armed for."""
+        if self._armed_for is None:
+            return None
+        return dt_util.utc_from_timestamp(self._armed_for)
+
+    @callback
+    def async_schedule(
+        self,
+        key: Hashable,
+        deadline: datetime | None,
+        action: Callable[[], None],
+    ) -> None:
+        """
+        Run ``action`` once ``deadline`` has passed.
+
+        Scheduling a key again replaces its previous deadline. A deadline of
+        None, or one already in the past, cancels the key instead.
+        """
+        if deadline is None or deadline <= dt_util.utcnow():
+            self.async_cancel(key)
+            return
+
+        timestamp = deadline.timestamp()
+        self._actions[key] = action
+        if self._deadlines.get(key) == timestamp:
+            return
+
+        self._deadlines[key] = timestamp
+        heapq.heappush(self._heap, (timestamp, next(self._sequence), key))
+        self._async_arm()
+
+    @callback
+    def async_cancel(self, key: Hashable) -> None:
+        """Forget the pending expiry for ``key``, if any."""
+        self._actions.pop(key, None)
+        if self._deadlines.pop(key, None) is not None:
+            self._async_arm()
+
+    @callback
+    def async_unload(self) -> None:
+        """Cancel the timer and drop all pending expiries."""
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        self._armed_for = None
+        self._heap.clear()
+        self._deadlines.clear()
+        self._actions.clear()
+
+    def _is_current(self, entry: tuple[float, int, Hashable]) -> bool:
+        """Return True if a heap entry is still the deadline for its key."""
+        return self._deadlines.get(entry[2]) == entry[0]
+
+    @callback
+    def _async_arm(self) -> None:
+        """Arm the timer for the earliest pending deadline."""
+        while self._heap and not self._is_current(self._heap[0]):
+            heapq.heappop(self._heap)
+
+        if len(self._heap) > max(
+            _COMPACT_MIN_SIZE, _COMPACT_FACTOR * len(self._deadlines)
+        ):
+            self._heap = [entry for entry in self._heap if self._is_current(entry)]
+            heapq.heapify(self._heap)
+
+        next_deadline = self._heap[0][0] if self._heap else None
+        if next_deadline == self._armed_for:
+            return
+
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        self._armed_for = next_deadline
+        if next_deadline is not None:
+            self._cancel_timer = async_track_point_in_time(
+                self.hass,
+                self._handle_timer,
+                dt_util.utc_from_timestamp(next_deadline),
+            )
+
+    @profiled_callback
+    def _handle_timer(self, now: datetime) -> None:
+        """Re-evaluate every monitor whose ignore-until window has ended."""
+        self._cancel_timer = None
+        self._armed_for = None
+
+        now_timestamp = now.timestamp()
+        due: list[Callable[[], None]] = []
+        while self._heap and self._heap[0][0] <= now_timestamp:
+            entry = heapq.heappop(self._heap)
+            if not self._is_current(entry):
+                continue
+            del self._deadlines[entry[2]]
+            if (action := self._actions.pop(entry[2], None)) is not None:
+                due.append(action)
+
+        _LOGGER.debug("%d ignore-until windows expired", len(due))
+        for action in due:
+            try:
+                action()
+            except Exception:
+                _LOGGER.exception("Error re-evaluating expired ignore-until window")
+
+        self._async_arm()
+
+
+class IgnoreUntilExpiryMixin:
+    """
+    Re-evaluate a monitor when its ignore-until window ends.
+
+    Every state write registers the earliest future ignore-until deadline of
+    the monitor with the shared scheduler, so the monitor runs
+    ``_update_state`` again as soon as that window expires.
+    """
+
+    _ignore_until_attributes = (
+        "_ignore_until_datetime",
+        "_high_threshold_ignore_until_datetime",
+        "_low_threshold_ignore_until_datetime",
+    )
+
+    hass: HomeAssistant
+    _ignore_until_expiry_registered: bool = False
+
+    def _ignore_until_deadlines(self) -> Iterable[Any]:
+        """Return the ignore-until datetimes this monitor honours."""
+        return (getattr(self, name, None) for name in self._ignore_until_attributes)
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and schedule the next ignore-until expiry."""
+        self._async_schedule_ignore_until_expiry()
+        super().async_write_ha_state()  # type: ignore[misc]
+
+    @callback
+    def _async_schedule_ignore_until_expiry(self) -> None:
+        """Register the earliest upcoming ignore-until deadline."""
+        now = dt_util.now()
+        upcoming = [
+            deadline
+            for deadline in self._ignore_until_deadlines()
+            if isinstance(deadline, datetime) and deadline > now
+        ]
+        if not upcoming and not self._ignore_until_expiry_registered:
+            return
+
+        scheduler = async_get_ignore_until_scheduler(self.hass)
+        scheduler.async_schedule(
+            self, min(upcoming, default=None), self._async_ignore_until_expired
+        )
+        if not self._ignore_until_expiry_registered:
+            self._ignore_until_expiry_registered = True
+            self.async_on_remove(  # type: ignore[attr-defined]
+                lambda: scheduler.async_cancel(self)
+            )
+
+    @profiled_callback
+    def _async_ignore_until_expired(self) -> None:
+        """Re-evaluate the monitor after its ignore-until window ended."""
+        self._update_state()  # type: ignore[attr-defined]
+        self.async_write_ha_state()
+
+
+@callback
+def async_get_ignore_until_scheduler(hass: HomeAssistant) -> IgnoreUntilScheduler:
+    """Return the shared ignore-until scheduler, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    scheduler: IgnoreUntilScheduler | None = domain_data.get(IGNORE_UNTIL_SCHEDULER_KEY)
+    if not isinstance(scheduler, IgnoreUntilScheduler):
+        scheduler = IgnoreUntilScheduler(hass)
+        domain_data[IGNORE_UNTIL_SCHEDULER_KEY] = scheduler
+    return scheduler
+
+
+@callback
+def async_unload_ignore_until_scheduler(hass: HomeAssistant) -> None:
+    """Cancel the shared scheduler's timer and remove it from hass.data."""
+    domain_data = hass.data.get(DOMAIN)
+    if not isinstance(domain_data, dict):
+        return
+    scheduler = domain_data.pop(IGNORE_UNTIL_SCHEDULER_KEY, None)
+    if isinstance(scheduler, IgnoreUntilScheduler):
+        scheduler.async_unload()
@@ -0,0 +1,232 @@
+"""
+Shared dispatcher for ESPHome irrigation gateway events.
+
+Every irrigation zone exposes around a dozen entities that are driven by the
+``esphome.irrigation_gateway_update`` event. Rather than each entity listening
+on the bus and re-scanning the payload, a single integration-wide listener
+parses each event once, works out which keys changed since the previous
+event, and routes only those keys to the entities subscribed to them.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import Event, HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    ESPHOME_IRRIGATION_GATEWAY_EVENT,
+    IRRIGATION_EVENT_DISPATCHER_KEY,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+_LOGGER = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class IrrigationZoneUpdate:
+    """The part of a gateway event routed to a single subscriber."""
+
+    data: Mapping[str, Any]
+    event_type: str = ESPHOME_IRRIGATION_GATEWAY_EVENT
+
+
+@dataclass(slots=True, eq=False)
+class _Subscriber:
+    """A registered handler and the event keys it cares about."""
+
+    handler: Callable[[IrrigationZoneUpdate], None]
+    event_keys: tuple[str, ...] | None = field(default=None)
+
+
+def irrigation_zone_key(zone_name: str, field_name: str) -> str:
+    """Return the gateway event key for a zone field, e.g. ``lawn_start_time``."""
+    return f"{zone_name.lower().replace(' ', '_')}_{field_name}"
+
+
+class IrrigationEventDispatcher:
+    """Route ``esphome.irrigation_gateway_update`` events to zone entities."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the dispatcher."""
+        self.hass = hass
+        # zone key (e.g. "lawn_start_time") -> subscribers for that key
+        self._routes: dict[str, list[_Subscriber]] = {}
+        # Subscribers that want every event regardless of content
+        self._broadcast: list[_Subscriber] = []
+        # zone key -> value seen in the previous event
+        self._last_values: dict[str, Any] = {}
+        self._unsubscribe_event: Callable[[], None] | None = None
+
+    @property
+    def subscriber_count(self) -> int:
+        """Return the number of active subscribers."""
+        routed = {id(sub) for subs in self._routes.values() for sub in subs}
+        return len(routed) + len(self._broadcast)
+
+    @callback
+    def async_subscribe(
+        self,
+        zone_name: str | None,
+        fields: Iterable[str] | None,
+        handler: Callable[[IrrigationZoneUpdate], None],
+    ) -> Callable[[], None]:
+        """
+        Subscribe a handler to changes of a zone's event fields.
+
+        Args:
+            zone_name: The irrigation zone name used in the event keys.
+            fields: Field suffixes such as ``start_time``. When None the
+                handler receives every event in full.
+            handler: Called with the subscribed keys that are present in the
+                event, whenever at least one of them changed.
+
+        Returns:
+            A callable that removes the subscription.
+
+        """
+        if fields is None or zone_name is None:
+            subscriber = _Subscriber(handler)
+            self._broadcast.append(subscriber)
+        else:
+            event_keys = tuple(
+                irrigation_zone_key(zone_name, field_name) for field_name in fields
+            )
+            subscriber = _Subscriber(handler, event_keys)
+            for event_key in event_keys:
+                self._routes.setdefault(event_key, []).append(subscriber)
+                # Make sure the new subscriber sees the next value
+                self._last_values.pop(event_key, None)
+
+        self._async_listen()
+
+        @callback
+        def _unsubscribe() -> None:
+            self._async_remove(subscriber)
+
+        return _unsubscribe
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop listening and drop all subscriptions."""
+        if self._unsubscribe_event:
+            self._unsubscribe_event()
+            self._unsubscribe_event = None
+        self._routes.clear()
+        self._broadcast.clear()
+        self._last_values.clear()
+
+    @callback
+    def _async_listen(self) -> None:
+        """Listen for gateway events if not already listening."""
+        if self._unsubscribe_event is None:
+            self._unsubscribe_event = self.hass.bus.async_listen(
+                ESPHOME_IRRIGATION_GATEWAY_EVENT, self._handle_event
+            )
+
+    @callback
+    def _async_remove(self, subscriber: _Subscriber) -> None:
+        """Remove a subscriber and stop listening once none are left."""
+        if subscriber.event_keys is None:
+            with contextlib.suppress(ValueError):
+                self._broadcast.remove(subscriber)
+        else:
+            for event_key in subscriber.event_keys:
+                subscribers = self._routes.get(event_key)
+                if subscribers is None:
+                    continue
+                with contextlib.suppress(ValueError):
+                    subscribers.remove(subscriber)
+                if not subscribers:
+                    del self._routes[event_key]
+                    self._last_values.pop(event_key, None)
+
+        if not self._routes and not self._broadcast and self._unsubscribe_event:
+            self._unsubscribe_event()
+            self._unsubscribe_event = None
+
+    @callback
+    def _handle_event(self, event: Event) -> None:
+        """Parse a gateway event once and notify affected subscribers."""
+        event_data = event.data or {}
+
+        # Collect the subscribers of every routed key whose value changed,
+        # preserving subscription order and notifying each one only once
+        notify: dict[int, _Subscriber] = {}
+        for event_key, value in event_data.items():
+            subscribers = self._routes.get(event_key)
+            if subscribers is None:
+                continue
+            if self._last_values.get(event_key, _MISSING) == value:
+                continue
+            self._last_values[event_key] = value
+            for subscriber in subscribers:
+                notify.setdefault(id(subscriber), subscriber)
+
+        for subscriber in notify.values():
+            data = {
+                event_key: event_data[event_key]
+                for event_key in subscriber.event_keys or ()
+                if event_key in event_data
+            }
+            self._async_deliver(subscriber, IrrigationZoneUpdate(data))
+
+        if self._broadcast:
+            update = IrrigationZoneUpdate(event_data)
+            for subscriber in list(self._broadcast):
+                self._async_deliver(subscriber, update)
+
+    @callback
+    def _async_deliver(
+        self, subscriber: _Subscriber, update: IrrigationZoneUpdate
+    ) -> None:
+        """Call a subscriber, isolating failures from other subscribers."""
+        try:
+            subscriber.handler(update)
+        except Exception:
+            _LOGGER.exception("Error dispatching irrigation gateway event")
+
+
+@callback
+def async_get_irrigation_event_dispatcher(
+    hass: HomeAssistant,
+) -> IrrigationEventDispatcher:
+    """Return the shared irrigation event dispatcher, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    dispatcher: IrrigationEventDispatcher | None = domain_data.get(
+        IRRIGATION_EVENT_DISPATCHER_KEY
+    )
+    if not isinstance(dispatcher, IrrigationEventDispatcher):
+        dispatcher = IrrigationEventDispatcher(hass)
+        domain_data[IRRIGATION_EVENT_DISPATCHER_KEY] = dispatcher
+    return dispatcher
+
+
+@callback
+def async_subscribe_irrigation_zone(
+    hass: HomeAssistant,
+    zone_name: str | None,
+    fields: Iterable[str] | None,
+    handler: Callable[[IrrigationZoneUpdate], None],
+) -> Callable[[], None]:
+    """Subscribe a zone entity to the shared gateway event dispatcher."""
+    return async_get_irrigation_event_dispatcher(hass).async_subscribe(
+        zone_name, fields, handler
+    )
+
+
+@callback
+def async_unload_irrigation_event_dispatcher(hass: HomeAssistant) -> None:
+    """Tear down the shared irrigation event dispatcher."""
+    domain_data = hass.data.get(DOMAIN, {})
+    dispatcher = domain_data.pop(IRRIGATION_EVENT_DISPATCHER_KEY, None)
+    if isinstance(dispatcher, IrrigationEventDispatcher):
+        dispatcher.async_unload()
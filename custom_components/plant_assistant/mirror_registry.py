@@ -0,0 +1,149 @@
+"""
+Registry of live mirror sensors keyed by their source entity's unique_id.
+
+Mirror sensors (``MonitoringSensor`` and ``HumidityLinkedSensor``) copy the
+state of an entity owned by another integration. When that source entity is
+renamed, the entity monitor has to re-point every mirror at the new entity
+id. Instead of scanning the entity registry and the state machine for
+candidates, mirrors using ``MirrorEntityMixin`` register themselves here
+while they are added to hass, so a rename only touches the mirrors of the
+renamed source.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, MIRROR_REGISTRY_KEY
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MirrorEntityRegistry:
+    """Integration-wide map of source unique_id to live mirror sensors."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        # source unique_id -> mirrors in registration order
+        self._mirrors: dict[str, list[Any]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of registered mirrors."""
+        return sum(len(mirrors) for mirrors in self._mirrors.values())
+
+    @callback
+    def async_register(self, source_unique_id: str, mirror: Any) -> Callable[[], None]:
+        """
+        Register ``mirror`` as a mirror of the entity with ``source_unique_id``.
+
+        Returns:
+            A callable that removes the registration.
+
+        """
+        mirrors = self._mirrors.setdefault(source_unique_id, [])
+        if mirror not in mirrors:
+            mirrors.append(mirror)
+
+        @callback
+        def _unregister() -> None:
+            self.async_unregister(source_unique_id, mirror)
+
+        return _unregister
+
+    @callback
+    def async_unregister(self, source_unique_id: str, mirror: Any) -> None:
+        """Remove one registration, dropping the key once it is empty."""
+        mirrors = self._mirrors.get(source_unique_id)
+        if mirrors is None or mirror not in mirrors:
+            return
+        mirrors.remove(mirror)
+        if not mirrors:
+            del self._mirrors[source_unique_id]
+
+    @callback
+    def async_get_mirrors(self, source_unique_id: str | None) -> list[Any]:
+        """Return the live mirrors of a source entity."""
+        if not source_unique_id:
+            return []
+        return list(self._mirrors.get(source_unique_id, ()))
+
+
+class MirrorEntityMixin:
+    """
+    Register a mirror sensor by its source unique_id while it is in hass.
+
+    Subclasses provide ``mirror_source_unique_id`` and call
+    ``async_update_mirror_registration`` after their source changes.
+    """
+
+    hass: HomeAssistant
+    _mirror_unregister: Callable[[], None] | None = None
+
+    if TYPE_CHECKING:
+
+        @property
+        def mirror_source_unique_id(self) -> str | None:
+            """Return the unique_id of the mirrored source entity."""
+
+    async def async_added_to_hass(self) -> None:
+        """Register the mirror once it is added to hass."""
+        await super().async_added_to_hass()  # type: ignore[misc]
+        self._async_register_mirror()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister the mirror before it is removed."""
+        self._async_unregister_mirror()
+        await super().async_will_remove_from_hass()  # type: ignore[misc]
+
+    @callback
+    def async_update_mirror_registration(self) -> None:
+        """Re-register under the current source unique_id if registered."""
+        if self._mirror_unregister is not None:
+            self._async_register_mirror()
+
+    @callback
+    def _async_register_mirror(self) -> None:
+        """Register under the current source unique_id."""
+        self._async_unregister_mirror()
+        source_unique_id = self.mirror_source_unique_id
+        if not source_unique_id:
+            _LOGGER.debug(
+                "Mirror %s has no source unique_id; renames will not be tracked",
+                getattr(self, "entity_id", self),
+            )
+            return
+        self._mirror_unregister = async_get_mirror_registry(self.hass).async_register(
+            source_unique_id, self
+        )
+
+    @callback
+    def _async_unregister_mirror(self) -> None:
+        """Remove the current registration, if any."""
+        if self._mirror_unregister is not None:
+            self._mirror_unregister()
+            self._mirror_unregister = None
+
+
+@callback
+def async_get_mirror_registry(hass: HomeAssistant) -> MirrorEntityRegistry:
+    """Return the shared mirror registry, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    registry: MirrorEntityRegistry | None = domain_data.get(MIRROR_REGISTRY_KEY)
+    if not isinstance(registry, MirrorEntityRegistry):
+        registry = MirrorEntityRegistry()
+        domain_data[MIRROR_REGISTRY_KEY] = registry
+    return registry
+
+
+@callback
+def async_unload_mirror_registry(hass: HomeAssistant) -> None:
+    """Remove the shared mirror registry from hass.data."""
+    domain_data = hass.data.get(DOMAIN)
+    if isinstance(domain_data, dict):
+        domain_data.pop(MIRROR_REGISTRY_KEY, None)
@@ -0,0 +1,264 @@
+"""
+Deadband and rate limiting of mirror sensor state writes.
+
+Mirror sensors copy a monitoring device's readings, and BLE plant sensors
+report every few seconds, often with a value that did not change or only
+moved within the sensor's noise. Every one of those updates used to become a
+state write, a recorder row and a wake-up of the monitors behind the mirror.
+
+The ``mirror_write_filters`` main entry option, edited in the options flow,
+configures per sensor type (``temperature``, ``soil_moisture``,
+``humidity``, ...) a deadband and a minimum interval between writes::
+
+    {"soil_moisture": {"deadband": 0.5, "min_interval": 60}}
+
+Mirrors using ``MirrorWriteFilterMixin`` then skip updates that stay within
+the deadband of the last written value and delay writes that come sooner than
+``min_interval`` after the previous one. A held update is written by a
+trailing flush, so the latest reading always reaches the state machine.
+Updates to or from ``unavailable`` and ``unknown``, and non-numeric states,
+are written straight away.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .callback_profiler import profiled_callback
+from .const import (
+    CONF_MIRROR_DEADBAND,
+    CONF_MIRROR_MIN_INTERVAL,
+    CONF_MIRROR_RELATIVE_DEADBAND,
+    DOMAIN,
+    MIRROR_DEADBAND_FLUSH_DELAY,
+    MIRROR_WRITE_FILTERS_KEY,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+    from datetime import datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+_PASS_THROUGH_STATES = (None, STATE_UNAVAILABLE, STATE_UNKNOWN)
+
+
+def _as_float(state: Any) -> float | None:
+    """Return ``state`` as a finite float, or None if it is not numeric."""
+    try:
+        value = float(state)
+    except (TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+@dataclass(frozen=True, slots=True)
+class MirrorWriteFilter:
+    """Write filter of one sensor type."""
+
+    # Smallest absolute change written straight away
+    deadband: float = 0.0
+    # Smallest change relative to the last written value, e.g. 0.01 for 1%
+    relative_deadband: float = 0.0
+    # Seconds between two writes; later updates wait for the trailing flush
+    min_interval: float = 0.0
+
+    @classmethod
+    def from_option(cls, option: Mapping[str, Any]) -> MirrorWriteFilter:
+        """
+        Build a filter from one sensor type's option.
+
+        Raises:
+            ValueError: If a setting is not a non-negative number.
+
+        """
+        settings = {}
+        for key, name in (
+            (CONF_MIRROR_DEADBAND, "deadband"),
+            (CONF_MIRROR_RELATIVE_DEADBAND, "relative_deadband"),
+            (CONF_MIRROR_MIN_INTERVAL, "min_interval"),
+        ):
+            value = _as_float(option.get(key, 0))
+            if value is None or value < 0:
+                msg = f"{key} must be a non-negative number"
+                raise ValueError(msg)
+            settings[name] = value
+        return cls(**settings)
+
+    @property
+    def enabled(self) -> bool:
+        """Return if the filter holds back any write."""
+        return bool(self.deadband or self.relative_deadband or self.min_interval)
+
+    def within_deadband(self, written: float, value: float) -> bool:
+        """Return if ``value`` is too close to the written value to write."""
+        change = abs(value - written)
+        return change < self.deadband or change < self.relative_deadband * abs(written)
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the settings for diagnostics."""
+        return {
+            CONF_MIRROR_DEADBAND: self.deadband,
+            CONF_MIRROR_RELATIVE_DEADBAND: self.relative_deadband,
+            CONF_MIRROR_MIN_INTERVAL: self.min_interval,
+        }
+
+
+class MirrorWriteFilters:
+    """Integration-wide write filters of the mirror sensors by sensor type."""
+
+    def __init__(self) -> None:
+        """Initialize without filters, so every update is written."""
+        self._filters: dict[str, MirrorWriteFilter] = {}
+        self.writes = 0
+        self.held_writes = 0
+        self.flushes = 0
+
+    def get(self, sensor_type: str | None) -> MirrorWriteFilter | None:
+        """Return the enabled filter of ``sensor_type``, if any."""
+        if sensor_type is None:
+            return None
+        return self._filters.get(sensor_type)
+
+    @callback
+    def async_configure(self, option: Mapping[str, Any] | None) -> None:
+        """Replace the filters with those of the ``mirror_write_filters`` option."""
+        filters = {}
+        for sensor_type, settings in (option or {}).items():
+            try:
+                write_filter = MirrorWriteFilter.from_option(settings)
+            except (AttributeError, ValueError) as exc:
+                _LOGGER.warning(
+                    "Ignoring mirror write filter for %s: %s", sensor_type, exc
+                )
+                continue
+            if write_filter.enabled:
+                filters[sensor_type] = write_filter
+        self._filters = filters
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the filters and counters for diagnostics."""
+        return {
+            "filters": {
+                sensor_type: write_filter.as_dict()
+                for sensor_type, write_filter in self._filters.items()
+            },
+            "writes": self.writes,
+            "held_writes": self.held_writes,
+            "flushes": self.flushes,
+        }
+
+
+class MirrorWriteFilterMixin:
+    """
+    Filter a mirror's source-driven state writes by its sensor type.
+
+    Subclasses keep the mirrored state in ``_state``, set
+    ``_mirror_write_type`` and call ``async_write_mirror_state`` when the
+    source changes. Direct ``async_write_ha_state`` calls are never held.
+    """
+
+    hass: HomeAssistant
+    _state: Any
+    _mirror_write_type: str | None = None
+    _mirror_written_state: Any = None
+    _mirror_written_at: float = -math.inf
+    _mirror_cancel_flush: Callable[[], None] | None = None
+    # Monotonic time the pending trailing flush is due at
+    _mirror_flush_at: float = math.inf
+
+    @profiled_callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember it as the last written one."""
+        self._async_cancel_mirror_flush()
+        self._mirror_written_state = self._state
+        self._mirror_written_at = time.monotonic()
+        super().async_write_ha_state()  # type: ignore[misc]
+
+    @callback
+    def async_write_mirror_state(self) -> None:
+        """Write a source update, unless the sensor type's filter holds it."""
+        filters = async_get_mirror_write_filters(self.hass)
+        write_filter = filters.get(self._mirror_write_type)
+        if write_filter is None:
+            self.async_write_ha_state()
+            return
+
+        written = self._mirror_written_state
+        value = _as_float(self._state)
+        written_value = _as_float(written)
+        if (
+            self._state in _PASS_THROUGH_STATES
+            or written in _PASS_THROUGH_STATES
+            or value is None
+            or written_value is None
+        ):
+            delay = None
+        elif write_filter.within_deadband(written_value, value):
+            delay = write_filter.min_interval or MIRROR_DEADBAND_FLUSH_DELAY
+        else:
+            delay = self._mirror_written_at + write_filter.min_interval
+            delay -= time.monotonic()
+
+        if delay is None or delay <= 0:
+            filters.writes += 1
+            self.async_write_ha_state()
+            return
+
+        filters.held_writes += 1
+        # A pending flush only covers this update if it is due soon enough
+        flush_at = time.monotonic() + delay
+        if flush_at < self._mirror_flush_at:
+            self._async_cancel_mirror_flush()
+            self._mirror_flush_at = flush_at
+            self._mirror_cancel_flush = async_call_later(
+                self.hass, delay, self._async_flush_mirror_state
+            )
+
+    @profiled_callback
+    def _async_flush_mirror_state(self, _now: datetime) -> None:
+        """Write the latest held update."""
+        self._mirror_cancel_flush = None
+        self._mirror_flush_at = math.inf
+        async_get_mirror_write_filters(self.hass).flushes += 1
+        self.async_write_ha_state()
+
+    @callback
+    def _async_cancel_mirror_flush(self) -> None:
+        """Cancel a pending trailing flush."""
+        if self._mirror_cancel_flush is not None:
+            self._mirror_cancel_flush()
+            self._mirror_cancel_flush = None
+        self._mirror_flush_at = math.inf
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop a held update before the mirror is removed."""
+        self._async_cancel_mirror_flush()
+        await super().async_will_remove_from_hass()  # type: ignore[misc]
+
+
+@callback
+def async_get_mirror_write_filters(hass: HomeAssistant) -> MirrorWriteFilters:
+    """Return the shared mirror write filters, creating them on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    filters: MirrorWriteFilters | None = domain_data.get(MIRROR_WRITE_FILTERS_KEY)
+    if not isinstance(filters, MirrorWriteFilters):
+        filters = MirrorWriteFilters()
+        domain_data[MIRROR_WRITE_FILTERS_KEY] = filters
+    return filters
+
+
+@callback
+def async_unload_mirror_write_filters(hass: HomeAssistant) -> None:
+    """Remove the shared mirror write filters from hass.data."""
+    domain_data = hass.data.get(DOMAIN)
+    if isinstance(domain_data, dict):
+        domain_data.pop(MIRROR_WRITE_FILTERS_KEY, None)
@@ -8,10 +8,10 @@ from typing import TYPE_CHECKING, Any
 from homeassistant.components.number import NumberEntity
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import DOMAIN
+from .device import shared_device_info
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -78,9 +78,7 @@ class IrrigationZoneNumber(NumberEntity, RestoreEntity):
 
         # Set device info to associate with the irrigation zone device
         # Use the zone device identifiers directly
-        self._attr_device_info = DeviceInfo(
-            identifiers={zone_device_id},
-        )
+        self._attr_device_info = shared_device_info(zone_device_id)
 
         # Set number entity specific attributes
         self._attr_native_min_value = self._min_value
@@ -0,0 +1,201 @@
+"""
+Integration-level removal of orphaned location entities.
+
+When a location loses its monitoring device, humidity entity or plants, or is
+removed altogether, the entities created for it are left in the entity
+registry as unavailable. The sensor and datetime platforms used to each scan
+the whole registry on every setup, re-deriving the unique_id suffixes they own
+for every entry they looked at.
+
+Cleanup now runs once per main entry setup, before the platforms are
+forwarded. ``OrphanMatcher`` compiles the roles owned by each entity domain
+once, parses a unique_id into ``(owner, role)`` and the registry entries of
+the entry are compared against the unique_ids the current configuration is
+expected to create.
+"""
+
+from __future__ import annotations
+
+import logging
+import re
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+
+from .const import AGGREGATED_SENSOR_MAPPINGS, DOMAIN, MONITORING_SENSOR_MAPPINGS
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+    from collections.abc import Set as AbstractSet
+
+    from homeassistant.config_entries import ConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+# Weekly threshold duration sensors created alongside the aggregated sensors
+THRESHOLD_SENSOR_ROLES = (
+    "temperature_below_threshold_weekly_duration",
+    "temperature_above_threshold_weekly_duration",
+)
+HUMIDITY_LINKED_ROLE = "humidity_linked"
+# Monitoring sensors for source entities without a known sensor type
+MONITOR_FALLBACK_ROLE = r"monitor_.+"
+
+IGNORE_UNTIL_ROLES = (
+    "temperature_low_threshold_ignore_until",
+    "temperature_high_threshold_ignore_until",
+    "temperature_ignore_until",
+    "humidity_ignore_until",
+    "humidity_high_threshold_ignore_until",
+    "soil_moisture_ignore_until",
+    "soil_moisture_high_threshold_ignore_until",
+    "soil_conductivity_ignore_until",
+    "soil_conductivity_high_threshold_ignore_until",
+    "daily_light_integral_high_threshold_ignore_until",
+    "daily_light_integral_low_threshold_ignore_until",
+    "battery_low_threshold_ignore_until",
+    "plant_count_ignore_until",
+    "monitor_link_ignore_until",
+)
+
+
+def _mapping_suffixes(mappings: Mapping[str, Any]) -> list[str]:
+    """Return the unique_id suffix of every entry in a sensor mapping."""
+    suffixes = []
+    for key, mapping in mappings.items():
+        if isinstance(mapping, dict):
+            suffixes.append(mapping.get("suffix") or key)
+        else:
+            suffixes.append(getattr(mapping, "suffix", key))
+    return suffixes
+
+
+class OrphanMatcher:
+    """Parse unique_ids of managed location entities into ``(owner, role)``."""
+
+    def __init__(self, roles_by_domain: Mapping[str, Iterable[str]]) -> None:
+        """
+        Compile one pattern per entity domain.
+
+        Roles are regular expression fragments matched at the end of the
+        unique_id; literal suffixes are escaped by the caller.
+        """
+        self._patterns = {
+            domain: re.compile(
+                rf"(?:{DOMAIN}_)?(?P<owner>.+?)_(?P<role>{'|'.join(roles)})"
+            )
+            for domain, roles in roles_by_domain.items()
+        }
+
+    @property
+    def domains(self) -> frozenset[str]:
+        """Return the entity domains with managed roles."""
+        return frozenset(self._patterns)
+
+    def parse(self, domain: str, unique_id: str) -> tuple[str, str] | None:
+        """Return ``(owner, role)`` or None if the role is not managed."""
+        pattern = self._patterns.get(domain)
+        if pattern is None:
+            return None
+        match = pattern.fullmatch(unique_id)
+        if match is None:
+            return None
+        return match["owner"], match["role"]
+
+
+def _literal_roles(*suffix_groups: Iterable[str]) -> list[str]:
+    """Return escaped roles, longest first, from groups of literal suffixes."""
+    roles = {suffix for group in suffix_groups for suffix in group}
+    return [re.escape(role) for role in sorted(roles, key=len, reverse=True)]
+
+
+ORPHAN_MATCHER = OrphanMatcher(
+    {
+        "sensor": [
+            *_literal_roles(
+                _mapping_suffixes(MONITORING_SENSOR_MAPPINGS),
+                _mapping_suffixes(AGGREGATED_SENSOR_MAPPINGS),
+                THRESHOLD_SENSOR_ROLES,
+                (HUMIDITY_LINKED_ROLE,),
+            ),
+            MONITOR_FALLBACK_ROLE,
+        ],
+        "datetime": _literal_roles(IGNORE_UNTIL_ROLES),
+    }
+)
+
+
+def _collect_expected_unique_ids(
+    hass: HomeAssistant, entry: ConfigEntry[Any]
+) -> set[str]:
+    """Return the unique_ids the current configuration creates."""
+    # Imported here as the platforms are only loaded once they are forwarded
+    from .datetime import _expected_datetime_entities_for_subentry  # noqa: PLC0415
+    from .sensor import _expected_entities_for_subentry  # noqa: PLC0415
+
+    expected: set[str] = set()
+    for subentry in (entry.subentries or {}).values():
+        for expected_set in _expected_entities_for_subentry(hass, subentry):
+            expected.update(expected_set)
+        expected.update(_expected_datetime_entities_for_subentry(hass, subentry))
+    return expected
+
+
+def find_orphaned_entities(
+    entities: Mapping[str, Any], config_entry_id: str, expected: AbstractSet[str]
+) -> list[str]:
+    """
+    Return the entity_ids of managed entities that are not expected.
+
+    ``entities`` maps entity_id to registry entry. Only entries of
+    ``config_entry_id`` are considered, and a unique_id is only parsed when it
+    is not expected.
+    """
+    domains = ORPHAN_MATCHER.domains
+    return [
+        entity_id
+        for entity_id, entity_entry in entities.items()
+        if entity_entry.config_entry_id == config_entry_id
+        and entity_entry.platform == DOMAIN
+        and entity_entry.unique_id
+        and entity_entry.unique_id not in expected
+        and entity_entry.domain in domains
+        and ORPHAN_MATCHER.parse(entity_entry.domain, entity_entry.unique_id)
+    ]
+
+
+@callback
+def async_cleanup_orphaned_entities(
+    hass: HomeAssistant, entry: ConfigEntry[Any]
+) -> int:
+    """
+    Remove the entities of an entry that its configuration no longer creates.
+
+    Returns:
+        The number of removed entities.
+
+    """
+    try:
+        entity_registry = er.async_get(hass)
+        entities_to_remove = find_orphaned_entities(
+            entity_registry.entities,
+            entry.entry_id,
+            _collect_expected_unique_ids(hass, entry),
+        )
+
+        for entity_id in entities_to_remove:
+            entity_registry.async_remove(entity_id)
+            _LOGGER.debug("Removed orphaned entity: %s", entity_id)
+
+    except Exception as exc:  # noqa: BLE001 - Defensive logging
+        _LOGGER.warning("Failed to cleanup orphaned entities: %s", exc)
+        return 0
+
+    if entities_to_remove:
+        _LOGGER.info(
+            "Cleaned up %d orphaned entities for entry %s",
+            len(entities_to_remove),
+            entry.entry_id,
+        )
+    return len(entities_to_remove)
@@ -0,0 +1,281 @@
+"""
+Shared per-location snapshot of plant threshold attributes.
+
+Every location has around ten ``AggregatedLocationSensor`` instances, one per
+min/max metric, and each of them needs the threshold attributes of the plants
+assigned to the location's slots. Instead of each sensor scanning the entity
+registry and rebuilding the plant dictionaries on every change, one snapshot
+per location is built from the assigned plant devices and kept current by a
+single state listener: a plant change updates one row and then notifies the
+location's aggregated sensors. Rows live in a columnar ``PlantThresholdStore``
+and all aggregated metrics of a location are computed together and cached
+until the next change.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_track_state_change_event,
+)
+
+from .const import (
+    AGGREGATED_SENSOR_MAPPINGS,
+    DOMAIN,
+    OPENPLANTBOOK_DOMAIN,
+    PLANT_SNAPSHOTS_KEY,
+)
+from .threshold_store import PlantThresholdStore, aggregate_locations
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+_LOGGER = logging.getLogger(__name__)
+
+# Threshold attributes read from each OpenPlantbook plant sensor
+PLANT_THRESHOLD_ATTRIBUTES = (
+    "minimum_light",
+    "maximum_light",
+    "minimum_temperature",
+    "maximum_temperature",
+    "minimum_humidity",
+    "maximum_humidity",
+    "minimum_moisture",
+    "maximum_moisture",
+    "minimum_soil_ec",
+    "maximum_soil_ec",
+)
+
+
+def assigned_plant_device_ids(plant_slots: Mapping[str, Any]) -> frozenset[str]:
+    """Return the plant device ids assigned to a location's slots."""
+    return frozenset(
+        plant_id
+        for slot in plant_slots.values()
+        if isinstance(slot, dict) and (plant_id := slot.get("plant_device_id"))
+    )
+
+
+class LocationPlantSnapshot:
+    """Threshold attributes of the plants assigned to one location."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        location_device_id: str,
+        plant_device_ids: frozenset[str],
+    ) -> None:
+        """Initialize an empty snapshot."""
+        self.hass = hass
+        self.location_device_id = location_device_id
+        self.plant_device_ids = plant_device_ids
+        self.store = PlantThresholdStore(PLANT_THRESHOLD_ATTRIBUTES)
+        # metric_key -> aggregated sensor configuration computed per pass
+        self._metric_configs: dict[str, Mapping[str, Any]] = dict(
+            AGGREGATED_SENSOR_MAPPINGS
+        )
+        self._aggregates: dict[str, float | None] | None = None
+        self._listeners: list[Callable[[], None]] = []
+        self._unsubscribe_state: Callable[[], None] | None = None
+        self.rebuilds = 0
+
+    @property
+    def entity_ids(self) -> list[str]:
+        """Return the tracked plant entity ids."""
+        return list(self.store)
+
+    @property
+    def plants(self) -> list[dict[str, Any]]:
+        """Return one attribute dictionary per plant with threshold values."""
+        return self.store.rows()
+
+    def aggregate(self, metric_key: str, metric_config: Mapping[str, Any]) -> Any:
+        """
+        Return an aggregated metric for the location.
+
+        All known metrics are computed in one pass over the store on the first
+        read after a change; later reads by the location's other sensors are
+        served from the cached results.
+        """
+        if self._metric_configs.get(metric_key) != metric_config:
+            self._metric_configs[metric_key] = metric_config
+            self._aggregates = None
+        if self._aggregates is None:
+            self._aggregates = self.store.aggregate_metrics(self._metric_configs)
+        return self._aggregates.get(metric_key)
+
+    def prime_aggregates(self, aggregates: dict[str, float | None]) -> None:
+        """Cache metrics computed for this location by a batch aggregation."""
+        if self._metric_configs.keys() <= aggregates.keys():
+            self._aggregates = aggregates
+
+    @callback
+    def async_setup(self) -> None:
+        """Discover the plant entities, read their states and start tracking."""
+        self.store.clear()
+        self._aggregates = None
+        self.rebuilds += 1
+        if not self.plant_device_ids:
+            return
+
+        try:
+            dev_reg = dr.async_get(self.hass)
+            ent_reg = er.async_get(self.hass)
+            if not dev_reg.async_get_device({(DOMAIN, self.location_device_id)}):
+                _LOGGER.debug("Location device %s not found", self.location_device_id)
+                return
+
+            for plant_device_id in sorted(self.plant_device_ids):
+                for entity in er.async_entries_for_device(ent_reg, plant_device_id):
+                    if (
+                        entity.domain == "sensor"
+                        and entity.platform == OPENPLANTBOOK_DOMAIN
+                        and entity.entity_id
+                    ):
+                        state = self.hass.states.get(entity.entity_id)
+                        self.store.set_row(
+                            entity.entity_id, state.attributes if state else None
+                        )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            _LOGGER.debug("Error building plant snapshot: %s", exc)
+
+        if len(self.store):
+            self._unsubscribe_state = async_track_state_change_event(
+                self.hass, self.entity_ids, self._handle_plant_state_changed
+            )
+        _LOGGER.debug(
+            "Built plant snapshot for location device %s with %d plant entities",
+            self.location_device_id,
+            len(self.store),
+        )
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> Callable[[], None]:
+        """
+        Call ``listener`` whenever a plant's threshold attributes change.
+
+        Returns:
+            A callable that removes the listener.
+
+        """
+        self._listeners.append(listener)
+
+        @callback
+        def _remove_listener() -> None:
+            if listener in self._listeners:
+                self._listeners.remove(listener)
+            if not self._listeners:
+                async_remove_location_plant_snapshot(self.hass, self)
+
+        return _remove_listener
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop tracking plant states."""
+        if self._unsubscribe_state is not None:
+            self._unsubscribe_state()
+            self._unsubscribe_state = None
+        self._listeners.clear()
+
+    @callback
+    def _handle_plant_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update the changed plant's row and notify the location's sensors."""
+        entity_id = event.data["entity_id"]
+        if entity_id not in self.store:
+            return
+        new_state = event.data.get("new_state")
+        if not self.store.set_row(
+            entity_id, new_state.attributes if new_state else None
+        ):
+            return
+
+        self._aggregates = None
+        for listener in list(self._listeners):
+            listener()
+
+
+@callback
+def async_get_location_plant_snapshot(
+    hass: HomeAssistant, location_device_id: str, plant_slots: Mapping[str, Any]
+) -> LocationPlantSnapshot:
+    """
+    Return the shared plant snapshot for a location, building it on first use.
+
+    A snapshot built for a different set of assigned plants is replaced.
+    """
+    snapshots: dict[str, LocationPlantSnapshot] = hass.data.setdefault(
+        DOMAIN, {}
+    ).setdefault(PLANT_SNAPSHOTS_KEY, {})
+    plant_device_ids = assigned_plant_device_ids(plant_slots)
+
+    snapshot = snapshots.get(location_device_id)
+    if snapshot is not None and snapshot.plant_device_ids == plant_device_ids:
+        return snapshot
+
+    if snapshot is not None:
+        snapshot.async_unload()
+    snapshot = LocationPlantSnapshot(hass, location_device_id, plant_device_ids)
+    snapshot.async_setup()
+    snapshots[location_device_id] = snapshot
+    return snapshot
+
+
+@callback
+def async_setup_plant_snapshots(
+    hass: HomeAssistant, locations: Mapping[str, Mapping[str, Any]]
+) -> None:
+    """
+    Build the snapshots of many locations and aggregate them in one batch.
+
+    ``locations`` maps location device ids to their plant slots. Called once
+    the sensor platform knows every location after a (re)load, so the
+    location sensors added afterwards read precomputed values.
+    """
+    snapshots = {
+        location_device_id: async_get_location_plant_snapshot(
+            hass, location_device_id, plant_slots
+        )
+        for location_device_id, plant_slots in locations.items()
+    }
+    results = aggregate_locations(
+        {key: snapshot.store for key, snapshot in snapshots.items()},
+        AGGREGATED_SENSOR_MAPPINGS,
+    )
+    for key, snapshot in snapshots.items():
+        snapshot.prime_aggregates(results[key])
+
+
+@callback
+def async_remove_location_plant_snapshot(
+    hass: HomeAssistant, snapshot: LocationPlantSnapshot
+) -> None:
+    """Stop and forget a snapshot once no sensor reads it."""
+    snapshot.async_unload()
+    snapshots = hass.data.get(DOMAIN, {}).get(PLANT_SNAPSHOTS_KEY, {})
+    if snapshots.get(snapshot.location_device_id) is snapshot:
+        del snapshots[snapshot.location_device_id]
+
+
+@callback
+def async_discard_location_plant_snapshot(
+    hass: HomeAssistant, location_device_id: str
+) -> None:
+    """Stop and forget the snapshot of a removed location, if any."""
+    snapshots = hass.data.get(DOMAIN, {}).get(PLANT_SNAPSHOTS_KEY, {})
+    if (snapshot := snapshots.pop(location_device_id, None)) is not None:
+        snapshot.async_unload()
+        snapshot.store.clear()
+
+
+@callback
+def async_unload_plant_snapshots(hass: HomeAssistant) -> None:
+    """Stop all plant snapshots and remove them from hass.data."""
+    snapshots = hass.data.get(DOMAIN, {}).pop(PLANT_SNAPSHOTS_KEY, {})
+    for snapshot in snapshots.values():
+        snapshot.async_unload()
@@ -0,0 +1,338 @@
+"""
+Diff-based reconfiguration of the main Plant Assistant entry.
+
+Every options or subentry update used to reload the whole entry, tearing
+down and recreating every zone and location entity and re-running their
+recorder queries. The reconfiguration manager keeps a snapshot of the
+configuration each entry was last set up with, diffs it against the updated
+entry and applies the changes it understands in place:
+
+- runtime options such as the state write debounce and the mirror write
+  filters are applied directly,
+- plant slot edits are pushed to the location's entities, as long as the
+  location keeps (or keeps lacking) plants so its entity set is unchanged,
+- removed locations are forgotten by the shared services (entity index,
+  plant snapshots and threshold evaluators). Home Assistant removes their
+  entities and devices itself when the subentry is removed.
+
+Only these changes are incremental. Everything else reloads the entry:
+changed entry data, any other option including ``irrigation_zones`` (zone
+edits), added locations, and location changes other than ``plant_slots``
+such as a new name, monitoring device or humidity sensor.
+"""
+
+from __future__ import annotations
+
+import copy
+import logging
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    CONF_MIRROR_WRITE_FILTERS,
+    CONF_STATE_WRITE_DEBOUNCE,
+    DEFAULT_STATE_WRITE_DEBOUNCE,
+    DOMAIN,
+    RECONFIGURE_KEY,
+)
+from .entity_index import async_unregister_location
+from .mirror_write_filter import async_get_mirror_write_filters
+from .plant_snapshot import (
+    assigned_plant_device_ids,
+    async_discard_location_plant_snapshot,
+    async_setup_plant_snapshots,
+)
+from .write_coalescer import async_get_write_coalescer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from homeassistant.config_entries import ConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+# Options that can be applied without recreating entities
+LIVE_OPTION_KEYS = frozenset({CONF_STATE_WRITE_DEBOUNCE, CONF_MIRROR_WRITE_FILTERS})
+# Subentry data keys whose changes are pushed to the location's entities
+LIVE_SUBENTRY_KEYS = frozenset({"plant_slots"})
+
+
+class ConfigSnapshot(NamedTuple):
+    """The configuration an entry's entities were created from."""
+
+    data: dict[str, Any]
+    options: dict[str, Any]
+    subentries: dict[str, dict[str, Any]]
+
+    @classmethod
+    def from_entry(cls, entry: ConfigEntry[Any]) -> ConfigSnapshot:
+        """Copy the data, options and subentry data of a config entry."""
+        subentries = getattr(entry, "subentries", None) or {}
+        return cls(
+            data=copy.deepcopy(dict(entry.data)),
+            options=copy.deepcopy(dict(entry.options)),
+            subentries={
+                subentry_id: copy.deepcopy(dict(subentry.data))
+                for subentry_id, subentry in subentries.items()
+            },
+        )
+
+
+class ConfigDiff(NamedTuple):
+    """Changes between two configuration snapshots."""
+
+    data: frozenset[str]
+    options: frozenset[str]
+    added_subentries: frozenset[str]
+    removed_subentries: frozenset[str]
+    # subentry_id -> changed data keys
+    changed_subentries: dict[str, frozenset[str]]
+
+    @property
+    def is_empty(self) -> bool:
+        """Return True if nothing changed."""
+        return not (
+            self.data
+            or self.options
+            or self.added_subentries
+            or self.removed_subentries
+            or self.changed_subentries
+        )
+
+
+def _changed_keys(old: Mapping[str, Any], new: Mapping[str, Any]) -> frozenset[str]:
+    """Return the keys added, removed or changed between two mappings."""
+    return frozenset(
+        key for key in old.keys() | new.keys() if old.get(key) != new.get(key)
+    )
+
+
+def diff_config(old: ConfigSnapshot, new: ConfigSnapshot) -> ConfigDiff:
+    """Diff two configuration snapshots of the same entry."""
+    old_ids = old.subentries.keys()
+    new_ids = new.subentries.keys()
+    changed = {}
+    for subentry_id in old_ids & new_ids:
+        keys = _changed_keys(old.subentries[subentry_id], new.subentries[subentry_id])
+        if keys:
+            changed[subentry_id] = keys
+    return ConfigDiff(
+        data=_changed_keys(old.data, new.data),
+        options=_changed_keys(old.options, new.options),
+        added_subentries=frozenset(new_ids - old_ids),
+        removed_subentries=frozenset(old_ids - new_ids),
+        changed_subentries=changed,
+    )
+
+
+def _has_plants(subentry_data: Mapping[str, Any]) -> bool:
+    """Return True if any slot of a location has a plant assigned."""
+    return bool(assigned_plant_device_ids(subentry_data.get("plant_slots") or {}))
+
+
+def reload_reason(diff: ConfigDiff, old: ConfigSnapshot, new: ConfigSnapshot) -> str:
+    """
+    Return why ``diff`` needs a full reload, or an empty string if it does not.
+
+    Live options, plant slot edits that keep the location's entity set and
+    removed locations are applied in place; any other change is a reason.
+    """
+    if diff.data:
+        return f"entry data changed: {sorted(diff.data)}"
+    if unsupported := diff.options - LIVE_OPTION_KEYS:
+        return f"options changed: {sorted(unsupported)}"
+    if diff.added_subentries:
+        return f"locations added: {sorted(diff.added_subentries)}"
+    for subentry_id, keys in diff.changed_subentries.items():
+        if unsupported := keys - LIVE_SUBENTRY_KEYS:
+            return f"location {subentry_id} changed: {sorted(unsupported)}"
+        # Gaining the first or losing the last plant changes the entity set
+        if _has_plants(old.subentries[subentry_id]) != _has_plants(
+            new.subentries[subentry_id]
+        ):
+            return f"location {subentry_id} plant assignment changed its entities"
+    return ""
+
+
+class ReconfigureManager:
+    """Apply configuration updates in place where the entity set allows it."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the manager."""
+        self.hass = hass
+        # entry_id -> configuration the entry's entities were created from
+        self._snapshots: dict[str, ConfigSnapshot] = {}
+        # subentry_id -> entity callbacks receiving the updated subentry data
+        self._listeners: dict[str, list[Callable[[Mapping[str, Any]], None]]] = {}
+        # subentry_id -> callbacks releasing a removed location's shared state
+        self._removal_listeners: dict[str, list[Callable[[], None]]] = {}
+        self.applied = 0
+        self.reloads = 0
+
+    @callback
+    def async_remember(self, entry: ConfigEntry[Any]) -> None:
+        """Record the configuration an entry is being set up with."""
+        self._snapshots[entry.entry_id] = ConfigSnapshot.from_entry(entry)
+
+    @callback
+    def async_add_subentry_listener(
+        self, subentry_id: str, listener: Callable[[Mapping[str, Any]], None]
+    ) -> Callable[[], None]:
+        """
+        Call ``listener`` with the new data when a location is updated in place.
+
+        Returns:
+            A callable that removes the listener.
+
+        """
+        listeners = self._listeners.setdefault(subentry_id, [])
+        listeners.append(listener)
+
+        @callback
+        def _remove_listener() -> None:
+            if listener in listeners:
+                listeners.remove(listener)
+            if not listeners and self._listeners.get(subentry_id) is listeners:
+                del self._listeners[subentry_id]
+
+        return _remove_listener
+
+    @callback
+    def async_add_subentry_removal_listener(
+        self, subentry_id: str, listener: Callable[[], None]
+    ) -> Callable[[], None]:
+        """
+        Call ``listener`` when a location is removed in place.
+
+        Returns:
+            A callable that removes the listener.
+
+        """
+        listeners = self._removal_listeners.setdefault(subentry_id, [])
+        listeners.append(listener)
+
+        @callback
+        def _remove_listener() -> None:
+            if listener in listeners:
+                listeners.remove(listener)
+            if not listeners and self._removal_listeners.get(subentry_id) is listeners:
+                del self._removal_listeners[subentry_id]
+
+        return _remove_listener
+
+    @callback
+    def async_apply(self, entry: ConfigEntry[Any]) -> bool:
+        """
+        Apply an updated entry in place.
+
+        Returns:
+            True if the update was applied (or changed nothing), False if the
+            entry has to be reloaded.
+
+        """
+        old = self._snapshots.get(entry.entry_id)
+        if old is None:
+            self.reloads += 1
+            return False
+
+        new = ConfigSnapshot.from_entry(entry)
+        diff = diff_config(old, new)
+        if diff.is_empty:
+            _LOGGER.debug("No entity changes for entry %s", entry.entry_id)
+            return True
+
+        if reason := reload_reason(diff, old, new):
+            _LOGGER.debug("Reloading entry %s: %s", entry.entry_id, reason)
+            self.reloads += 1
+            return False
+
+        self._snapshots[entry.entry_id] = new
+        self.applied += 1
+
+        if CONF_STATE_WRITE_DEBOUNCE in diff.options:
+            async_get_write_coalescer(self.hass).debounce = float(
+                new.options.get(CONF_STATE_WRITE_DEBOUNCE, DEFAULT_STATE_WRITE_DEBOUNCE)
+            )
+        if CONF_MIRROR_WRITE_FILTERS in diff.options:
+            async_get_mirror_write_filters(self.hass).async_configure(
+                new.options.get(CONF_MIRROR_WRITE_FILTERS)
+            )
+
+        for subentry_id in diff.removed_subentries:
+            self._async_forget_subentry(subentry_id)
+
+        for subentry_id, keys in diff.changed_subentries.items():
+            data = new.subentries[subentry_id]
+            if "plant_slots" in keys and _has_plants(data):
+                # Rebuild the location's plant snapshot once for all its sensors
+                async_setup_plant_snapshots(
+                    self.hass, {subentry_id: data.get("plant_slots") or {}}
+                )
+            for listener in list(self._listeners.get(subentry_id, ())):
+                listener(data)
+
+        _LOGGER.info(
+            "Applied configuration update to entry %s in place "
+            "(options: %s, removed locations: %d, updated locations: %d)",
+            entry.entry_id,
+            sorted(diff.options),
+            len(diff.removed_subentries),
+            len(diff.changed_subentries),
+        )
+        return True
+
+    @callback
+    def _async_forget_subentry(self, subentry_id: str) -> None:
+        """Drop a removed location from the shared services."""
+        self._listeners.pop(subentry_id, None)
+        for listener in self._removal_listeners.pop(subentry_id, ()):
+            listener()
+        async_unregister_location(self.hass, subentry_id)
+        # Location devices are keyed by their subentry id
+        async_discard_location_plant_snapshot(self.hass, subentry_id)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return counters for diagnostics."""
+        return {"applied": self.applied, "reloads": self.reloads}
+
+
+@callback
+def async_get_reconfigure_manager(hass: HomeAssistant) -> ReconfigureManager:
+    """Return the shared reconfiguration manager, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    manager: ReconfigureManager | None = domain_data.get(RECONFIGURE_KEY)
+    if not isinstance(manager, ReconfigureManager):
+        manager = ReconfigureManager(hass)
+        domain_data[RECONFIGURE_KEY] = manager
+    return manager
+
+
+@callback
+def async_listen_subentry_updates(
+    hass: HomeAssistant,
+    subentry_id: str,
+    listener: Callable[[Mapping[str, Any]], None],
+) -> Callable[[], None]:
+    """Call ``listener`` when a location's data is updated in place."""
+    return async_get_reconfigure_manager(hass).async_add_subentry_listener(
+        subentry_id, listener
+    )
+
+
+@callback
+def async_listen_subentry_removal(
+    hass: HomeAssistant, subentry_id: str, listener: Callable[[], None]
+) -> Callable[[], None]:
+    """Call ``listener`` when a location is removed without a reload."""
+    return async_get_reconfigure_manager(hass).async_add_subentry_removal_listener(
+        subentry_id, listener
+    )
+
+
+@callback
+def async_unload_reconfigure_manager(hass: HomeAssistant) -> None:
+    """Remove the shared reconfiguration manager from hass.data."""
+    domain_data = hass.data.get(DOMAIN)
+    if isinstance(domain_data, dict):
+        domain_data.pop(RECONFIGURE_KEY, None)
@@ -0,0 +1,349 @@
+"""
+Shared recorder statistics service for Plant Assistant.
+
+The threshold-duration and recent-change sensors all read hourly mean
+statistics of their source sensor. Querying the recorder once per sensor on
+every source state change means one week-long query per state update. This
+service keeps the statistic ids subscribed by those sensors and answers all
+of them from a single multi-id ``statistics_during_period`` call per cycle, per
+lookback window. Hourly statistics only change when the recorder compiles a
+new period, so results are shared until the next compile boundary.
+
+For the weekly threshold-duration sensors the service also keeps a rolling
+168-hour window of hourly means per source entity. It is seeded once from
+the recorder and then only topped up with the hours compiled since, so a
+threshold or state change is answered by re-counting in memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+from array import array
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, RECORDER_STATISTICS_KEY
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+_LOGGER = logging.getLogger(__name__)
+
+# The recorder compiles statistics every five minutes
+STATISTICS_CYCLE = timedelta(minutes=5)
+
+# Rolling window kept for the weekly threshold-duration sensors
+WINDOW_HOURS = 7 * 24
+WEEKLY_LOOKBACK = timedelta(hours=WINDOW_HOURS)
+# Short lookback used to top up a window; gaps longer than this re-seed it
+CATCH_UP_LOOKBACK = timedelta(hours=3)
+
+_SECONDS_PER_HOUR = 3600
+
+
+@dataclass(slots=True)
+class _Cycle:
+    """One batched query and the results shared by its subscribers."""
+
+    statistic_ids: frozenset[str]
+    expires: datetime
+    future: asyncio.Future[dict[str, list[Any]] | None] = field(repr=False)
+
+
+def _next_cycle_boundary(now: datetime) -> datetime:
+    """Return the start of the next statistics compile period after ``now``."""
+    period = int(STATISTICS_CYCLE.total_seconds())
+    timestamp = int(now.timestamp())
+    return dt_util.utc_from_timestamp(timestamp - timestamp % period + period)
+
+
+def _row_hour(row: Mapping[str, Any]) -> int | None:
+    """Return the hour number (hours since the epoch) a statistics row starts."""
+    start = row.get("start")
+    if isinstance(start, datetime):
+        start = start.timestamp()
+    if isinstance(start, int | float):
+        return int(start // _SECONDS_PER_HOUR)
+    return None
+
+
+class HourlyMeanWindow:
+    """
+    Fixed-size ring buffer of hourly means for one source entity.
+
+    Slots are indexed by hour number modulo the window size and hold NaN for
+    hours without a statistic, so comparisons against a threshold skip them.
+    """
+
+    __slots__ = ("_counts", "_head", "_latest_sample", "_means")
+
+    def __init__(self, hours: int = WINDOW_HOURS) -> None:
+        """Initialize an empty window."""
+        self._means = array("d", [math.nan]) * hours
+        # Newest hour covered by the window, and newest hour with a sample
+        self._head: int | None = None
+        self._latest_sample: int | None = None
+        # (comparison, threshold) -> count, valid until the window changes
+        self._counts: dict[tuple[str, float], int] = {}
+
+    def __len__(self) -> int:
+        """Return the number of hours that have a mean."""
+        return sum(1 for mean in self._means if not math.isnan(mean))
+
+    @property
+    def latest_sample_hour(self) -> int | None:
+        """Return the newest hour that has a mean, if any."""
+        return self._latest_sample
+
+    def advance_to(self, hour: int) -> None:
+        """Move the window head to ``hour``, dropping hours that fell out."""
+        if self._head is not None and hour <= self._head:
+            return
+
+        size = len(self._means)
+        if self._head is None or hour - self._head >= size:
+            for slot in range(size):
+                self._means[slot] = math.nan
+        else:
+            for expired in range(self._head + 1, hour + 1):
+                self._means[expired % size] = math.nan
+        self._head = hour
+        self._counts.clear()
+
+    def add(self, hour: int, mean: float) -> None:
+        """Store the mean for ``hour``, advancing the window if it is newer."""
+        self.advance_to(hour)
+        if self._head is None or hour <= self._head - len(self._means):
+            return
+
+        self._means[hour % len(self._means)] = mean
+        if self._latest_sample is None or hour > self._latest_sample:
+            self._latest_sample = hour
+        self._counts.clear()
+
+    def extend(self, rows: list[Any], last_hour: int) -> None:
+        """
+        Add statistics rows to the window.
+
+        Rows without a ``start`` are assumed to be consecutive hours ending
+        at ``last_hour``.
+        """
+        first_hour = last_hour - len(rows) + 1
+        for offset, row in enumerate(rows):
+            mean = row.get("mean")
+            if mean is None:
+                continue
+            try:
+                value = float(mean)
+            except (ValueError, TypeError):
+                continue
+            hour = _row_hour(row)
+            self.add(first_hour + offset if hour is None else hour, value)
+
+    def count_below(self, threshold: float) -> int:
+        """Return the number of hours whose mean was below ``threshold``."""
+        key = ("below", threshold)
+        if (count := self._counts.get(key)) is None:
+            count = sum(1 for mean in self._means if mean < threshold)
+            self._counts[key] = count
+        return count
+
+    def count_above(self, threshold: float) -> int:
+        """Return the number of hours whose mean was above ``threshold``."""
+        key = ("above", threshold)
+        if (count := self._counts.get(key)) is None:
+            count = sum(1 for mean in self._means if mean > threshold)
+            self._counts[key] = count
+        return count
+
+
+class RecorderStatisticsService:
+    """Batch hourly mean statistics requests across all sensors."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the statistics service."""
+        self.hass = hass
+        # lookback -> statistic_id -> number of subscribed sensors
+        self._subscriptions: dict[timedelta, dict[str, int]] = {}
+        self._cycles: dict[timedelta, _Cycle] = {}
+        # statistic_id -> rolling window of hourly means
+        self._windows: dict[str, HourlyMeanWindow] = {}
+        self.query_count = 0
+
+    @callback
+    def async_subscribe(
+        self, statistic_id: str, lookback: timedelta
+    ) -> Callable[[], None]:
+        """
+        Include a statistic id in every batched query for a lookback window.
+
+        Returns:
+            A callable that removes the subscription.
+
+        """
+        statistic_ids = self._subscriptions.setdefault(lookback, {})
+        statistic_ids[statistic_id] = statistic_ids.get(statistic_id, 0) + 1
+
+        @callback
+        def _unsubscribe() -> None:
+            count = statistic_ids.get(statistic_id, 0) - 1
+            if count > 0:
+                statistic_ids[statistic_id] = count
+                return
+            statistic_ids.pop(statistic_id, None)
+            if not any(statistic_id in ids for ids in self._subscriptions.values()):
+                self._windows.pop(statistic_id, None)
+
+        return _unsubscribe
+
+    @callback
+    def async_subscribe_window(self, statistic_id: str) -> Callable[[], None]:
+        """
+        Keep a rolling hourly window for a statistic id up to date in batches.
+
+        Returns:
+            A callable that removes the subscription.
+
+        """
+        unsubscribers = [
+            self.async_subscribe(statistic_id, WEEKLY_LOOKBACK),
+            self.async_subscribe(statistic_id, CATCH_UP_LOOKBACK),
+        ]
+
+        @callback
+        def _unsubscribe() -> None:
+            for unsubscribe in unsubscribers:
+                unsubscribe()
+
+        return _unsubscribe
+
+    async def async_get_hourly_window(
+        self, recorder_instance: Any, statistic_id: str
+    ) -> HourlyMeanWindow:
+        """
+        Return the rolling week of hourly means for ``statistic_id``.
+
+        The window is seeded from a week of statistics on first use. After
+        that only the last few hours are read, and only once a newer hourly
+        statistic should have been compiled.
+        """
+        # Hourly statistics for an hour are compiled once it has ended
+        last_complete_hour = int(dt_util.utcnow().timestamp() // _SECONDS_PER_HOUR) - 1
+
+        window = self._windows.get(statistic_id)
+        latest = window.latest_sample_hour if window is not None else None
+        if (
+            window is None
+            or latest is None
+            or (
+                last_complete_hour - latest
+                >= CATCH_UP_LOOKBACK.total_seconds() // _SECONDS_PER_HOUR
+            )
+        ):
+            rows = await self.async_get_hourly_means(
+                recorder_instance, statistic_id, WEEKLY_LOOKBACK
+            )
+            window = HourlyMeanWindow()
+            window.extend(rows or [], last_complete_hour)
+            self._windows[statistic_id] = window
+        elif latest < last_complete_hour:
+            rows = await self.async_get_hourly_means(
+                recorder_instance, statistic_id, CATCH_UP_LOOKBACK
+            )
+            window.extend(rows or [], last_complete_hour)
+
+        window.advance_to(last_complete_hour)
+        return window
+
+    async def async_get_hourly_means(
+        self, recorder_instance: Any, statistic_id: str, lookback: timedelta
+    ) -> list[Any] | None:
+        """
+        Return hourly mean statistics for ``statistic_id`` over ``lookback``.
+
+        Args:
+            recorder_instance: The recorder used to run the query.
+            statistic_id: The statistic id (source entity_id) to read.
+            lookback: How far back from now to read statistics.
+
+        Returns:
+            The statistics rows for the id, or None if there are none.
+
+        """
+        now = dt_util.utcnow()
+        cycle = self._cycles.get(lookback)
+        if (
+            cycle is None
+            or statistic_id not in cycle.statistic_ids
+            or (cycle.future.done() and cycle.expires <= now)
+        ):
+            return await self._async_run_cycle(
+                recorder_instance, statistic_id, lookback, now
+            )
+
+        results = await asyncio.shield(cycle.future)
+        return results.get(statistic_id) if results else None
+
+    async def _async_run_cycle(
+        self,
+        recorder_instance: Any,
+        statistic_id: str,
+        lookback: timedelta,
+        now: datetime,
+    ) -> list[Any] | None:
+        """Query all subscribed ids for a lookback window in one call."""
+        # Unsubscribed callers are still answered, just not batched ahead
+        statistic_ids = {statistic_id, *self._subscriptions.get(lookback, ())}
+        cycle = _Cycle(
+            statistic_ids=frozenset(statistic_ids),
+            expires=_next_cycle_boundary(now),
+            future=asyncio.get_running_loop().create_future(),
+        )
+        self._cycles[lookback] = cycle
+
+        end_time = dt_util.now()
+        start_time = end_time - lookback
+        self.query_count += 1
+        try:
+            results = await recorder_instance.async_add_executor_job(
+                statistics_during_period,
+                self.hass,
+                start_time,
+                end_time,
+                statistic_ids,
+                "hour",
+                None,
+                {"mean"},
+            )
+        except BaseException:
+            # Waiting subscribers see no data; the caller gets the error
+            cycle.future.set_result(None)
+            if self._cycles.get(lookback) is cycle:
+                del self._cycles[lookback]
+            raise
+
+        cycle.future.set_result(results)
+        _LOGGER.debug(
+            "Fetched %s statistics for %d ids in one query",
+            lookback,
+            len(cycle.statistic_ids),
+        )
+        return results.get(statistic_id) if results else None
+
+
+@callback
+def async_get_statistics_service(hass: HomeAssistant) -> RecorderStatisticsService:
+    """Return the shared statistics service, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    service: RecorderStatisticsService | None = domain_data.get(RECORDER_STATISTICS_KEY)
+    if not isinstance(service, RecorderStatisticsService):
+        service = RecorderStatisticsService(hass)
+        domain_data[RECORDER_STATISTICS_KEY] = service
+    return service
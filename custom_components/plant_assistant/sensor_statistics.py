@@ -0,0 +1,1381 @@
+"""
+Recorder statistics based sensors for the Plant Assistant integration.
+
+The weekly threshold duration sensors and the soil moisture recent change
+sensor, which read hourly means from the recorder. Imported by the sensor
+platform only when a location has a monitoring device.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor import SensorEntity
+from homeassistant.const import (
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+    EntityCategory,
+)
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import async_generate_entity_id
+from homeassistant.helpers.recorder import get_instance
+from homeassistant.helpers.restore_state import RestoreEntity
+
+from .callback_profiler import profiled_callback
+from .const import DOMAIN
+from .device import shared_device_info
+from .recorder_statistics import HourlyMeanWindow, async_get_statistics_service
+from .sensor import _resolve_entity_id
+from .state_multiplexer import async_subscribe_source
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from homeassistant.core import HomeAssistant
+
+    from .state_multiplexer import SourceReading
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class TemperatureBelowThresholdHoursSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that counts hours where temperature was below minimum threshold.
+
+    This sensor queries Home Assistant's statistics database to count the number
+    of hourly readings where the temperature was below the minimum temperature
+    threshold over the past 7 days.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        location_device_id: str,
+        location_name: str,
+        temperature_entity_id: str,
+        temperature_entity_unique_id: str | None = None,
+    ) -> None:
+        """
+        Initialize the temperature below threshold weekly duration sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The subentry ID.
+            location_device_id: The device ID of the location.
+            location_name: The name of the location.
+            temperature_entity_id: The entity ID of the temperature sensor.
+            temperature_entity_unique_id: The unique ID of the temperature sensor
+                                         (used for resilient lookups if entity renamed).
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.location_device_id = location_device_id
+        self._temperature_entity_id = temperature_entity_id
+        self._temperature_entity_unique_id = temperature_entity_unique_id
+
+        # Set entity attributes
+        self._attr_name = f"{location_name} Temperature Below Threshold Weekly Duration"
+        location_name_safe = location_name.lower().replace(" ", "_")
+        self._attr_unique_id = (
+            f"{DOMAIN}_{entry_id}_{location_name_safe}_"
+            "temperature_below_threshold_weekly_duration"
+        )
+
+        # Set device class, unit, and icon
+        self._attr_device_class = None  # No standard device class for this metric
+        self._attr_native_unit_of_measurement = "hours"
+        self._attr_icon = "mdi:thermometer-alert"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_suggested_display_precision = 0
+        self._attr_entity_registry_visible_default = True
+
+        # Set device info
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, location_device_id),
+            name=location_name,
+            manufacturer="Plant Assistant",
+            model="Plant Location Device",
+        )
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+        self._unsubscribe_statistics: Callable[[], None] | None = None
+
+        # Generate a concise entity_id
+        with contextlib.suppress(Exception):
+            safe_name = (
+                (f"{location_name} Temperature Below Threshold Weekly Duration")
+                .lower()
+                .replace(" ", "_")
+            )
+            self.entity_id = async_generate_entity_id(
+                "sensor.{}",
+                safe_name,
+                current_ids={},
+            )
+
+    async def _calculate_hours_below_threshold(self) -> int | None:
+        """
+        Calculate hours where temperature was below the minimum threshold.
+
+        This queries the statistics from Home Assistant's recorder database
+        to count hourly periods where temperature was below the threshold.
+
+        Returns:
+            The number of hours below threshold, or None if data unavailable.
+
+        """
+        try:
+            # Get threshold temperature
+            min_temp_threshold = await self._get_temperature_threshold()
+            if min_temp_threshold is None:
+                return None
+
+            # Get the rolling week of hourly temperature means
+            window = await self._fetch_temperature_statistics()
+            if not window:
+                return None
+
+            # Count hours below threshold
+            hours_below = window.count_below(min_temp_threshold)
+
+            _LOGGER.debug(
+                "Temperature below threshold: %d hours out of %d total hours "
+                "(threshold: %.1f°C)",
+                hours_below,
+                len(window),
+                min_temp_threshold,
+            )
+
+            return hours_below  # noqa: TRY300
+
+        except ImportError as exc:
+            _LOGGER.warning(
+                "Could not import recorder statistics: %s",
+                exc,
+            )
+            return None
+        except Exception as exc:  # noqa: BLE001 - Defensive
+            _LOGGER.warning(
+                "Error calculating temp below threshold weekly duration: %s (%s)",
+                exc,
+                type(exc).__name__,
+            )
+            return None
+
+    async def _get_temperature_threshold(self) -> float | None:
+        """Get the minimum temperature threshold from aggregated sensors."""
+        # Find the min_temperature aggregated sensor for this location
+        min_temp_entity_id = self._find_min_temperature_entity()
+        if not min_temp_entity_id:
+            _LOGGER.debug("No minimum temperature threshold entity found for location")
+            return None
+
+        # Get the threshold value
+        min_temp_state = self.hass.states.get(min_temp_entity_id)
+        if not min_temp_state or min_temp_state.state in (
+            STATE_UNAVAILABLE,
+            STATE_UNKNOWN,
+            None,
+        ):
+            _LOGGER.debug(
+                "Minimum temperature threshold not available: %s",
+                min_temp_state.state if min_temp_state else "None",
+            )
+            return None
+
+        try:
+            return float(min_temp_state.state)
+        except (ValueError, TypeError):
+            _LOGGER.debug(
+                "Could not convert minimum temperature to float: %s",
+                min_temp_state.state,
+            )
+            return None
+
+    def _find_min_temperature_entity(self) -> str | None:
+        """Find the min_temperature entity ID for this location."""
+        ent_reg = er.async_get(self.hass)
+        for entity in ent_reg.entities.values():
+            if (
+                entity.platform == DOMAIN
+                and entity.domain == "sensor"
+                and entity.unique_id
+                and f"{self.entry_id}" in entity.unique_id
+                and "min_temperature" in entity.unique_id
+            ):
+                return entity.entity_id
+        return None
+
+    async def _fetch_temperature_statistics(self) -> HourlyMeanWindow | None:
+        """Return the rolling week of hourly temperature means."""
+        # Get recorder instance
+        recorder_instance = get_instance(self.hass)
+        if recorder_instance is None:
+            _LOGGER.debug("Recorder not available")
+            return None
+
+        # Seeded once, then topped up as new hours are compiled
+        window = await async_get_statistics_service(self.hass).async_get_hourly_window(
+            recorder_instance, self._temperature_entity_id
+        )
+
+        if not window:
+            _LOGGER.debug(
+                "No statistics found for temperature entity: %s",
+                self._temperature_entity_id,
+            )
+            return None
+
+        return window
+
+    @profiled_callback
+    def _temperature_state_changed(self, _reading: SourceReading) -> None:
+        """Handle temperature sensor state changes."""
+        # Trigger recalculation when temperature changes
+        self.hass.async_create_task(self._async_update_state())
+
+    async def _async_update_state(self) -> None:
+        """Update the sensor state."""
+        self._state = await self._calculate_hours_below_threshold()
+
+        # Store metadata in attributes
+        self._attributes = {
+            "source_entity": self._temperature_entity_id,
+            "period_days": 7,
+        }
+
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+        return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        temp_state = self.hass.states.get(self._temperature_entity_id)
+        return temp_state is not None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to temperature sensor state changes and restore state."""
+        await super().async_added_to_hass()
+
+        # Restore previous state if available
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            try:
+                self._state = int(last_state.state)
+            except (ValueError, TypeError):
+                self._state = last_state.state
+
+            # Restore attributes
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored temperature below threshold sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        # Subscribe to temperature sensor state changes
+        # Update every hour or when temperature changes significantly
+        try:
+            self._unsubscribe = async_subscribe_source(
+                self.hass, self._temperature_entity_id, self._temperature_state_changed
+            )
+            _LOGGER.debug(
+                "Temperature below threshold sensor %s subscribed to %s",
+                self.entity_id,
+                self._temperature_entity_id,
+            )
+
+            # Keep this source's hourly window updated in shared batches
+            self._unsubscribe_statistics = async_get_statistics_service(
+                self.hass
+            ).async_subscribe_window(self._temperature_entity_id)
+
+            # Perform initial calculation
+            await self._async_update_state()
+
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up temperature below threshold sensor: %s",
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+        if self._unsubscribe_statistics:
+            self._unsubscribe_statistics()
+
+
+class TemperatureAboveThresholdHoursSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that counts hours where temperature was above maximum threshold.
+
+    This sensor queries Home Assistant's statistics database to count the number
+    of hourly readings where the temperature was above the maximum temperature
+    threshold over the past 7 days.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        location_device_id: str,
+        location_name: str,
+        temperature_entity_id: str,
+        temperature_entity_unique_id: str | None = None,
+    ) -> None:
+        """
+        Initialize the temperature above threshold weekly duration sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The subentry ID.
+            location_device_id: The device ID of the location.
+            location_name: The name of the location.
+            temperature_entity_id: The entity ID of the temperature sensor.
+            temperature_entity_unique_id: The unique ID of the temperature sensor
+                                         (used for resilient lookups if entity renamed).
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.location_device_id = location_device_id
+        self._temperature_entity_id = temperature_entity_id
+        self._temperature_entity_unique_id = temperature_entity_unique_id
+
+        # Set entity attributes
+        self._attr_name = f"{location_name} Temperature Above Threshold Weekly Duration"
+        location_name_safe = location_name.lower().replace(" ", "_")
+        self._attr_unique_id = (
+            f"{DOMAIN}_{entry_id}_{location_name_safe}_"
+            "temperature_above_threshold_weekly_duration"
+        )
+
+        # Set device class, unit, and icon
+        self._attr_device_class = None  # No standard device class for this metric
+        self._attr_native_unit_of_measurement = "hours"
+        self._attr_icon = "mdi:thermometer-alert"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_suggested_display_precision = 0
+        self._attr_entity_registry_visible_default = True
+
+        # Set device info
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, location_device_id),
+            name=location_name,
+            manufacturer="Plant Assistant",
+            model="Plant Location Device",
+        )
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+        self._unsubscribe_statistics: Callable[[], None] | None = None
+
+        # Generate a concise entity_id
+        with contextlib.suppress(Exception):
+            safe_name = (
+                (f"{location_name} Temperature Above Threshold Weekly Duration")
+                .lower()
+                .replace(" ", "_")
+            )
+            self.entity_id = async_generate_entity_id(
+                "sensor.{}",
+                safe_name,
+                current_ids={},
+            )
+
+    async def _calculate_hours_above_threshold(self) -> int | None:
+        """
+        Calculate hours where temperature was above the maximum threshold.
+
+        This queries the statistics from Home Assistant's recorder database
+        to count hourly periods where temperature was above the threshold.
+
+        Returns:
+            The number of hours above threshold, or None if data unavailable.
+
+        """
+        try:
+            # Get threshold temperature
+            max_temp_threshold = await self._get_temperature_threshold()
+            if max_temp_threshold is None:
+                return None
+
+            # Get the rolling week of hourly temperature means
+            window = await self._fetch_temperature_statistics()
+            if not window:
+                return None
+
+            # Count hours above threshold
+            hours_above = window.count_above(max_temp_threshold)
+
+            _LOGGER.debug(
+                "Temperature above threshold: %d hours out of %d total hours "
+                "(threshold: %.1f°C)",
+                hours_above,
+                len(window),
+                max_temp_threshold,
+            )
+
+            return hours_above  # noqa: TRY300
+
+        except ImportError as exc:
+            _LOGGER.warning(
+                "Could not import recorder statistics: %s",
+                exc,
+            )
+            return None
+        except Exception as exc:  # noqa: BLE001 - Defensive
+            _LOGGER.warning(
+                "Error calculating temp above threshold weekly duration: %s (%s)",
+                exc,
+                type(exc).__name__,
+            )
+            return None
+
+    async def _get_temperature_threshold(self) -> float | None:
+        """Get the maximum temperature threshold from aggregated sensors."""
+        # Find the max_temperature aggregated sensor for this location
+        max_temp_entity_id = self._find_max_temperature_entity()
+        if not max_temp_entity_id:
+            _LOGGER.debug("No maximum temperature threshold entity found for location")
+            return None
+
+        # Get the threshold value
+        max_temp_state = self.hass.states.get(max_temp_entity_id)
+        if not max_temp_state or max_temp_state.state in (
+            STATE_UNAVAILABLE,
+            STATE_UNKNOWN,
+            None,
+        ):
+            _LOGGER.debug(
+                "Maximum temperature threshold not available: %s",
+                max_temp_state.state if max_temp_state else "None",
+            )
+            return None
+
+        try:
+            return float(max_temp_state.state)
+        except (ValueError, TypeError):
+            _LOGGER.debug(
+                "Could not convert maximum temperature to float: %s",
+                max_temp_state.state,
+            )
+            return None
+
+    def _find_max_temperature_entity(self) -> str | None:
+        """Find the max_temperature entity ID for this location."""
+        ent_reg = er.async_get(self.hass)
+        for entity in ent_reg.entities.values():
+            if (
+                entity.platform == DOMAIN
+                and entity.domain == "sensor"
+                and entity.unique_id
+                and f"{self.entry_id}" in entity.unique_id
+                and "max_temperature" in entity.unique_id
+            ):
+                return entity.entity_id
+        return None
+
+    async def _fetch_temperature_statistics(self) -> HourlyMeanWindow | None:
+        """Return the rolling week of hourly temperature means."""
+        # Get recorder instance
+        recorder_instance = get_instance(self.hass)
+        if recorder_instance is None:
+            _LOGGER.debug("Recorder not available")
+            return None
+
+        # Seeded once, then topped up as new hours are compiled
+        window = await async_get_statistics_service(self.hass).async_get_hourly_window(
+            recorder_instance, self._temperature_entity_id
+        )
+
+        if not window:
+            _LOGGER.debug(
+                "No statistics found for temperature entity: %s",
+                self._temperature_entity_id,
+            )
+            return None
+
+        return window
+
+    @profiled_callback
+    def _temperature_state_changed(self, _reading: SourceReading) -> None:
+        """Handle temperature sensor state changes."""
+        # Trigger recalculation when temperature changes
+        self.hass.async_create_task(self._async_update_state())
+
+    async def _async_update_state(self) -> None:
+        """Update the sensor state."""
+        self._state = await self._calculate_hours_above_threshold()
+
+        # Store metadata in attributes
+        self._attributes = {
+            "source_entity": self._temperature_entity_id,
+            "period_days": 7,
+        }
+
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+        return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        temp_state = self.hass.states.get(self._temperature_entity_id)
+        return temp_state is not None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to temperature sensor state changes and restore state."""
+        await super().async_added_to_hass()
+
+        # Restore previous state if available
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            try:
+                self._state = int(last_state.state)
+            except (ValueError, TypeError):
+                self._state = last_state.state
+
+            # Restore attributes
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored temperature above threshold sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        # Subscribe to temperature sensor state changes
+        # Update every hour or when temperature changes significantly
+        try:
+            self._unsubscribe = async_subscribe_source(
+                self.hass, self._temperature_entity_id, self._temperature_state_changed
+            )
+            _LOGGER.debug(
+                "Temperature above threshold sensor %s subscribed to %s",
+                self.entity_id,
+                self._temperature_entity_id,
+            )
+
+            # Keep this source's hourly window updated in shared batches
+            self._unsubscribe_statistics = async_get_statistics_service(
+                self.hass
+            ).async_subscribe_window(self._temperature_entity_id)
+
+            # Perform initial calculation
+            await self._async_update_state()
+
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up temperature above threshold sensor: %s",
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+        if self._unsubscribe_statistics:
+            self._unsubscribe_statistics()
+
+
+class HumidityBelowThresholdHoursSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that counts hours where humidity was below minimum threshold.
+
+    This sensor queries Home Assistant's statistics database to count the number
+    of hourly readings where the humidity was below the minimum humidity
+    threshold over the past 7 days.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        location_device_id: str,
+        location_name: str,
+        humidity_entity_id: str,
+        humidity_entity_unique_id: str | None = None,
+    ) -> None:
+        """
+        Initialize the humidity below threshold weekly duration sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The subentry ID.
+            location_device_id: The device ID of the location.
+            location_name: The name of the location.
+            humidity_entity_id: The entity ID of the humidity sensor.
+            humidity_entity_unique_id: The unique ID for resilient lookup.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.location_device_id = location_device_id
+        self._humidity_entity_id = humidity_entity_id
+        self._humidity_entity_unique_id = humidity_entity_unique_id
+
+        # Set entity attributes
+        self._attr_name = f"{location_name} Humidity Below Threshold Weekly Duration"
+        location_name_safe = location_name.lower().replace(" ", "_")
+        self._attr_unique_id = (
+            f"{DOMAIN}_{entry_id}_{location_name_safe}_"
+            "humidity_below_threshold_weekly_duration"
+        )
+
+        # Set device class, unit, and icon
+        self._attr_device_class = None  # No standard device class for this metric
+        self._attr_native_unit_of_measurement = "hours"
+        self._attr_icon = "mdi:water-alert"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_suggested_display_precision = 0
+        self._attr_entity_registry_visible_default = True
+
+        # Set device info
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, location_device_id),
+            name=location_name,
+            manufacturer="Plant Assistant",
+            model="Plant Location Device",
+        )
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+        self._unsubscribe_statistics: Callable[[], None] | None = None
+
+        # Generate a concise entity_id
+        with contextlib.suppress(Exception):
+            safe_name = (
+                (f"{location_name} Humidity Below Threshold Weekly Duration")
+                .lower()
+                .replace(" ", "_")
+            )
+            self.entity_id = async_generate_entity_id(
+                "sensor.{}",
+                safe_name,
+                current_ids={},
+            )
+
+    async def _calculate_hours_below_threshold(self) -> int | None:
+        """
+        Calculate hours where humidity was below the minimum threshold.
+
+        This queries the statistics from Home Assistant's recorder database
+        to count hourly periods where humidity was below the threshold.
+
+        Returns:
+            The number of hours below threshold, or None if data unavailable.
+
+        """
+        try:
+            # Get threshold humidity
+            min_humidity_threshold = await self._get_humidity_threshold()
+            if min_humidity_threshold is None:
+                return None
+
+            # Get the rolling week of hourly humidity means
+            window = await self._fetch_humidity_statistics()
+            if not window:
+                return None
+
+            # Count hours below threshold
+            hours_below = window.count_below(min_humidity_threshold)
+
+            _LOGGER.debug(
+                "Humidity below threshold: %d hours out of %d total hours "
+                "(threshold: %.1f%%)",
+                hours_below,
+                len(window),
+                min_humidity_threshold,
+            )
+
+            return hours_below  # noqa: TRY300
+
+        except ImportError as exc:
+            _LOGGER.warning(
+                "Could not import recorder statistics: %s",
+                exc,
+            )
+            return None
+        except Exception as exc:  # noqa: BLE001 - Defensive
+            _LOGGER.warning(
+                "Error calculating humidity below threshold weekly duration: %s (%s)",
+                exc,
+                type(exc).__name__,
+            )
+            return None
+
+    async def _get_humidity_threshold(self) -> float | None:
+        """Get the minimum humidity threshold from aggregated sensors."""
+        # Find the min_humidity aggregated sensor for this location
+        min_humidity_entity_id = self._find_min_humidity_entity()
+        if not min_humidity_entity_id:
+            _LOGGER.debug("No minimum humidity threshold entity found for location")
+            return None
+
+        # Get the threshold value
+        min_humidity_state = self.hass.states.get(min_humidity_entity_id)
+        if not min_humidity_state or min_humidity_state.state in (
+            STATE_UNAVAILABLE,
+            STATE_UNKNOWN,
+            None,
+        ):
+            _LOGGER.debug(
+                "Minimum humidity threshold not available: %s",
+                min_humidity_state.state if min_humidity_state else "None",
+            )
+            return None
+
+        try:
+            return float(min_humidity_state.state)
+        except (ValueError, TypeError):
+            _LOGGER.debug(
+                "Could not convert minimum humidity to float: %s",
+                min_humidity_state.state,
+            )
+            return None
+
+    def _find_min_humidity_entity(self) -> str | None:
+        """Find the min_humidity entity ID for this location."""
+        ent_reg = er.async_get(self.hass)
+        for entity in ent_reg.entities.values():
+            if (
+                entity.platform == DOMAIN
+                and entity.domain == "sensor"
+                and entity.unique_id
+                and f"{self.entry_id}" in entity.unique_id
+                and "min_humidity" in entity.unique_id
+            ):
+                return entity.entity_id
+        return None
+
+    async def _fetch_humidity_statistics(self) -> HourlyMeanWindow | None:
+        """Return the rolling week of hourly humidity means."""
+        # Get recorder instance
+        recorder_instance = get_instance(self.hass)
+        if recorder_instance is None:
+            _LOGGER.debug("Recorder not available")
+            return None
+
+        # Seeded once, then topped up as new hours are compiled
+        window = await async_get_statistics_service(self.hass).async_get_hourly_window(
+            recorder_instance, self._humidity_entity_id
+        )
+
+        if not window:
+            _LOGGER.debug(
+                "No statistics found for humidity entity: %s",
+                self._humidity_entity_id,
+            )
+            return None
+
+        return window
+
+    @profiled_callback
+    def _humidity_state_changed(self, _reading: SourceReading) -> None:
+        """Handle humidity sensor state changes."""
+        # Trigger recalculation when humidity changes
+        self.hass.async_create_task(self._async_update_state())
+
+    async def _async_update_state(self) -> None:
+        """Update the sensor state."""
+        self._state = await self._calculate_hours_below_threshold()
+
+        # Store metadata in attributes
+        self._attributes = {
+            "source_entity": self._humidity_entity_id,
+            "period_days": 7,
+        }
+
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+        return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        humidity_state = self.hass.states.get(self._humidity_entity_id)
+        return humidity_state is not None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to humidity sensor state changes and restore state."""
+        await super().async_added_to_hass()
+
+        # Resolve humidity entity ID with fallback to unique ID for resilience
+        resolved_entity_id = _resolve_entity_id(
+            self.hass, self._humidity_entity_id, self._humidity_entity_unique_id
+        )
+        if resolved_entity_id and resolved_entity_id != self._humidity_entity_id:
+            _LOGGER.debug(
+                "Resolved humidity entity ID: %s -> %s",
+                self._humidity_entity_id,
+                resolved_entity_id,
+            )
+            self._humidity_entity_id = resolved_entity_id
+
+        # Restore previous state if available
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            try:
+                self._state = int(last_state.state)
+            except (ValueError, TypeError):
+                self._state = last_state.state
+
+            # Restore attributes
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored humidity below threshold sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        # Subscribe to humidity sensor state changes
+        # Update every hour or when humidity changes significantly
+        try:
+            self._unsubscribe = async_subscribe_source(
+                self.hass, self._humidity_entity_id, self._humidity_state_changed
+            )
+            _LOGGER.debug(
+                "Humidity below threshold sensor %s subscribed to %s",
+                self.entity_id,
+                self._humidity_entity_id,
+            )
+
+            # Keep this source's hourly window updated in shared batches
+            self._unsubscribe_statistics = async_get_statistics_service(
+                self.hass
+            ).async_subscribe_window(self._humidity_entity_id)
+
+            # Perform initial calculation
+            await self._async_update_state()
+
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up humidity below threshold sensor: %s",
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+        if self._unsubscribe_statistics:
+            self._unsubscribe_statistics()
+
+
+class HumidityAboveThresholdHoursSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that counts hours where humidity was above maximum threshold.
+
+    This sensor queries Home Assistant's statistics database to count the number
+    of hourly readings where the humidity was above the maximum humidity
+    threshold over the past 7 days.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        location_device_id: str,
+        location_name: str,
+        humidity_entity_id: str,
+        humidity_entity_unique_id: str | None = None,
+    ) -> None:
+        """
+        Initialize the humidity above threshold weekly duration sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The subentry ID.
+            location_device_id: The device ID of the location.
+            location_name: The name of the location.
+            humidity_entity_id: The entity ID of the humidity sensor.
+            humidity_entity_unique_id: The unique ID for resilient lookup.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.location_device_id = location_device_id
+        self._humidity_entity_id = humidity_entity_id
+        self._humidity_entity_unique_id = humidity_entity_unique_id
+
+        # Set entity attributes
+        self._attr_name = f"{location_name} Humidity Above Threshold Weekly Duration"
+        location_name_safe = location_name.lower().replace(" ", "_")
+        self._attr_unique_id = (
+            f"{DOMAIN}_{entry_id}_{location_name_safe}_"
+            "humidity_above_threshold_weekly_duration"
+        )
+
+        # Set device class, unit, and icon
+        self._attr_device_class = None  # No standard device class for this metric
+        self._attr_native_unit_of_measurement = "hours"
+        self._attr_icon = "mdi:water-alert"
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_suggested_display_precision = 0
+        self._attr_entity_registry_visible_default = True
+
+        # Set device info
+        self._attr_device_info = shared_device_info(
+            (DOMAIN, location_device_id),
+            name=location_name,
+            manufacturer="Plant Assistant",
+            model="Plant Location Device",
+        )
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+        self._unsubscribe_statistics: Callable[[], None] | None = None
+
+        # Generate a concise entity_id
+        with contextlib.suppress(Exception):
+            safe_name = (
+                (f"{location_name} Humidity Above Threshold Weekly Duration")
+                .lower()
+                .replace(" ", "_")
+            )
+            self.entity_id = async_generate_entity_id(
+                "sensor.{}",
+                safe_name,
+                current_ids={},
+            )
+
+    async def _calculate_hours_above_threshold(self) -> int | None:
+        """
+        Calculate hours where humidity was above the maximum threshold.
+
+        This queries the statistics from Home Assistant's recorder database
+        to count hourly periods where humidity was above the threshold.
+
+        Returns:
+            The number of hours above threshold, or None if data unavailable.
+
+        """
+        try:
+            # Get threshold humidity
+            max_humidity_threshold = await self._get_humidity_threshold()
+            if max_humidity_threshold is None:
+                return None
+
+            # Get the rolling week of hourly humidity means
+            window = await self._fetch_humidity_statistics()
+            if not window:
+                return None
+
+            # Count hours above threshold
+            hours_above = window.count_above(max_humidity_threshold)
+
+            _LOGGER.debug(
+                "Humidity above threshold: %d hours out of %d total hours "
+                "(threshold: %.1f%%)",
+                hours_above,
+                len(window),
+                max_humidity_threshold,
+            )
+
+            return hours_above  # noqa: TRY300
+
+        except ImportError as exc:
+            _LOGGER.warning(
+                "Could not import recorder statistics: %s",
+                exc,
+            )
+            return None
+        except Exception as exc:  # noqa: BLE001 - Defensive
+            _LOGGER.warning(
+                "Error calculating humidity above threshold weekly duration: %s (%s)",
+                exc,
+                type(exc).__name__,
+            )
+            return None
+
+    async def _get_humidity_threshold(self) -> float | None:
+        """Get the maximum humidity threshold from aggregated sensors."""
+        # Find the max_humidity aggregated sensor for this location
+        max_humidity_entity_id = self._find_max_humidity_entity()
+        if not max_humidity_entity_id:
+            _LOGGER.debug("No maximum humidity threshold entity found for location")
+            return None
+
+        # Get the threshold value
+        max_humidity_state = self.hass.states.get(max_humidity_entity_id)
+        if not max_humidity_state or max_humidity_state.state in (
+            STATE_UNAVAILABLE,
+            STATE_UNKNOWN,
+            None,
+        ):
+            _LOGGER.debug(
+                "Maximum humidity threshold not available: %s",
+                max_humidity_state.state if max_humidity_state else "None",
+            )
+            return None
+
+        try:
+            return float(max_humidity_state.state)
+        except (ValueError, TypeError):
+            _LOGGER.debug(
+                "Could not convert maximum humidity to float: %s",
+                max_humidity_state.state,
+            )
+            return None
+
+    def _find_max_humidity_entity(self) -> str | None:
+        """Find the max_humidity entity ID for this location."""
+        ent_reg = er.async_get(self.hass)
+        for entity in ent_reg.entities.values():
+            if (
+                entity.platform == DOMAIN
+                and entity.domain == "sensor"
+                and entity.unique_id
+                and f"{self.entry_id}" in entity.unique_id
+                and "max_humidity" in entity.unique_id
+            ):
+                return entity.entity_id
+        return None
+
+    async def _fetch_humidity_statistics(self) -> HourlyMeanWindow | None:
+        """Return the rolling week of hourly humidity means."""
+        # Get recorder instance
+        recorder_instance = get_instance(self.hass)
+        if recorder_instance is None:
+            _LOGGER.debug("Recorder not available")
+            return None
+
+        # Seeded once, then topped up as new hours are compiled
+        window = await async_get_statistics_service(self.hass).async_get_hourly_window(
+            recorder_instance, self._humidity_entity_id
+        )
+
+        if not window:
+            _LOGGER.debug(
+                "No statistics found for humidity entity: %s",
+                self._humidity_entity_id,
+            )
+            return None
+
+        return window
+
+    @profiled_callback
+    def _humidity_state_changed(self, _reading: SourceReading) -> None:
+        """Handle humidity sensor state changes."""
+        # Trigger recalculation when humidity changes
+        self.hass.async_create_task(self._async_update_state())
+
+    async def _async_update_state(self) -> None:
+        """Update the sensor state."""
+        self._state = await self._calculate_hours_above_threshold()
+
+        # Store metadata in attributes
+        self._attributes = {
+            "source_entity": self._humidity_entity_id,
+            "period_days": 7,
+        }
+
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+        return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        humidity_state = self.hass.states.get(self._humidity_entity_id)
+        return humidity_state is not None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to humidity sensor state changes and restore state."""
+        await super().async_added_to_hass()
+
+        # Resolve humidity entity ID with fallback to unique ID for resilience
+        resolved_entity_id = _resolve_entity_id(
+            self.hass, self._humidity_entity_id, self._humidity_entity_unique_id
+        )
+        if resolved_entity_id and resolved_entity_id != self._humidity_entity_id:
+            _LOGGER.debug(
+                "Resolved humidity entity ID: %s -> %s",
+                self._humidity_entity_id,
+                resolved_entity_id,
+            )
+            self._humidity_entity_id = resolved_entity_id
+
+        # Restore previous state if available
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            try:
+                self._state = int(last_state.state)
+            except (ValueError, TypeError):
+                self._state = last_state.state
+
+            # Restore attributes
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored humidity above threshold sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        # Subscribe to humidity sensor state changes
+        # Update every hour or when humidity changes significantly
+        try:
+            self._unsubscribe = async_subscribe_source(
+                self.hass, self._humidity_entity_id, self._humidity_state_changed
+            )
+            _LOGGER.debug(
+                "Humidity above threshold sensor %s subscribed to %s",
+                self.entity_id,
+                self._humidity_entity_id,
+            )
+
+            # Keep this source's hourly window updated in shared batches
+            self._unsubscribe_statistics = async_get_statistics_service(
+                self.hass
+            ).async_subscribe_window(self._humidity_entity_id)
+
+            # Perform initial calculation
+            await self._async_update_state()
+
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up humidity above threshold sensor: %s",
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+        if self._unsubscribe_statistics:
+            self._unsubscribe_statistics()
+
+
+class SoilMoistureRecentChangeSensor(SensorEntity):
+    """
+    Statistics sensor that tracks recent change in soil moisture percentage.
+
+    This sensor monitors the percentage change in soil moisture over a 3-hour window.
+    When the change is >= 10%, it indicates the plant was likely watered.
+
+    This sensor is only created for non-ESPHome zones where watering detection
+    must be inferred from moisture changes rather than direct irrigation events.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        location_device_id: str,
+        location_name: str,
+        soil_moisture_entity_id: str,
+        soil_moisture_entity_unique_id: str | None = None,
+    ) -> None:
+        """
+        Initialize the soil moisture recent change sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry ID.
+            location_device_id: The device identifier for the location.
+            location_name: The name of the plant location.
+            soil_moisture_entity_id: Entity ID of the soil moisture sensor to monitor.
+            soil_moisture_entity_unique_id: Unique ID of the soil moisture sensor.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.location_device_id = location_device_id
+        self.location_name = location_name
+        self.soil_moisture_entity_id = soil_moisture_entity_id
+        self.soil_moisture_entity_unique_id = soil_moisture_entity_unique_id
+
+        # Set entity attributes
+        self._attr_name = f"{location_name} Soil Moisture Recent Change"
+
+        # Generate unique_id
+        location_name_safe = location_name.lower().replace(" ", "_")
+        self._attr_unique_id = (
+            f"{DOMAIN}_{entry_id}_{location_name_safe}_soil_moisture_recent_change"
+        )
+
+        # Set sensor properties
+        self._attr_device_class = None  # No device class for change percentage
+        self._attr_native_unit_of_measurement = "%"
+        self._attr_icon = "mdi:water-percent"
+        self._attr_state_class = "measurement"
+
+        # Set device info to associate with the location device
+        self._attr_device_info = shared_device_info((DOMAIN, location_device_id))
+
+        self._state: float | None = None
+        self._unsubscribe = None
+        self._unsubscribe_statistics: Callable[[], None] | None = None
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the native value of the sensor."""
+        if self._state is None:
+            return None
+
+        # Return the change percentage
+        # Positive values indicate moisture increase (watering)
+        # Negative values indicate moisture decrease (drying)
+        return round(self._state, 1)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return {
+            "source_entity": self.soil_moisture_entity_id,
+            "window_duration": "3 hours",
+            "watering_threshold": 10.0,
+        }
+
+    @profiled_callback
+    def _soil_moisture_state_changed(self, _reading: SourceReading) -> None:
+        """Handle soil moisture sensor state changes."""
+        # Trigger recalculation when soil moisture changes
+        self.hass.async_create_task(self._async_update_state())
+
+    async def _async_update_state(self) -> None:
+        """Update the sensor state."""
+        await self.async_update()
+        self.async_write_ha_state()
+
+    async def async_update(self) -> None:
+        """Update sensor state by calculating recent moisture change."""
+        try:
+            # Get recorder instance
+            recorder_instance = get_instance(self.hass)
+
+            # Get statistics for the soil moisture sensor over last 3 hours
+            service = async_get_statistics_service(self.hass)
+            sensor_stats = await service.async_get_hourly_means(
+                recorder_instance, self.soil_moisture_entity_id, timedelta(hours=3)
+            )
+
+            if not sensor_stats or len(sensor_stats) < 2:  # noqa: PLR2004
+                # Need at least 2 data points to calculate change
+                self._state = None
+                return
+
+            # Get first and last mean values
+            first_stat = sensor_stats[0]
+            last_stat = sensor_stats[-1]
+
+            first_mean = first_stat.get("mean")
+            last_mean = last_stat.get("mean")
+
+            if first_mean is None or last_mean is None:
+                self._state = None
+                return
+
+            # Calculate change: positive = increase (watering), negative = decrease
+            change = last_mean - first_mean
+            self._state = change
+
+        except (ValueError, TypeError, KeyError, AttributeError) as exc:
+            _LOGGER.debug(
+                "Error calculating recent moisture change for %s: %s",
+                self.location_name,
+                exc,
+            )
+            self._state = None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to soil moisture sensor state changes."""
+        try:
+            # Subscribe to soil moisture sensor state changes
+            # Update when soil moisture changes to recalculate the recent change
+            self._unsubscribe = async_subscribe_source(
+                self.hass,
+                self.soil_moisture_entity_id,
+                self._soil_moisture_state_changed,
+            )
+            _LOGGER.debug(
+                "Soil moisture recent change sensor %s subscribed to %s",
+                self.entity_id,
+                self.soil_moisture_entity_id,
+            )
+
+            # Keep this source in the shared batched statistics query
+            self._unsubscribe_statistics = async_get_statistics_service(
+                self.hass
+            ).async_subscribe(self.soil_moisture_entity_id, timedelta(hours=3))
+
+            # Perform initial calculation
+            await self._async_update_state()
+
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up soil moisture recent change sensor: %s",
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+        if self._unsubscribe_statistics:
+            self._unsubscribe_statistics()
@@ -0,0 +1,2883 @@
+"""
+Irrigation zone sensors for the Plant Assistant integration.
+
+The last run, usage, error and fertiliser sensors of irrigation zones linked
+to an ESPHome irrigation controller. Imported by the sensor platform only
+when a zone has a linked controller.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, cast
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.const import (
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
+)
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.restore_state import RestoreEntity
+from homeassistant.util import dt as dt_util
+
+from .callback_profiler import profiled_callback
+from .const import DOMAIN
+from .device import shared_device_info
+from .entity_index import async_get_entity_index
+from .irrigation_events import async_subscribe_irrigation_zone
+from .sensor import find_device_entities_by_pattern
+
+if TYPE_CHECKING:
+    from homeassistant.core import Event, EventStateChangedData, HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class IrrigationZoneLastRunStartTimeSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that tracks the last run start time of an irrigation zone.
+
+    This sensor listens for the 'esphome.irrigation_gateway_update' event
+    and updates when the event fires with the zone's start time data.
+    The sensor uses the timestamp device_class for proper formatting.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        zone_device_id: tuple[str, str],
+        zone_name: str,
+        zone_id: str,
+    ) -> None:
+        """
+        Initialize the irrigation zone last run start time sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry ID.
+            zone_device_id: The device identifier tuple (domain, device_id).
+            zone_name: The name of the irrigation zone.
+            zone_id: The zone ID used to extract data from events.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.zone_device_id = zone_device_id
+        self.zone_name = zone_name
+        self.zone_id = zone_id
+
+        # Set entity attributes
+        self._attr_name = f"{zone_name} Last Run Start Time"
+        self._attr_device_class = SensorDeviceClass.TIMESTAMP
+        self._attr_icon = "mdi:clock-outline"
+
+        # Create unique ID from zone device identifier tuple
+        unique_id_parts = (
+            DOMAIN,
+            entry_id,
+            zone_device_id[0],
+            zone_device_id[1],
+            "last_run_start_time",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(zone_device_id)
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+
+    def _extract_zone_start_time(self, event_data: dict[str, Any]) -> str | None:
+        """
+        Extract the zone start time from event data.
+
+        The zone_name is converted to a key like 'lawn_start_time'.
+        The zone_name is normalized by replacing spaces with underscores and
+        converting to lowercase to match the event data key format.
+
+        Args:
+            event_data: The event data dictionary.
+
+        Returns:
+            The start time value if found, None otherwise.
+
+        """
+        # Convert zone_name to lowercase and replace spaces with underscores
+        normalized_zone_name = self.zone_name.lower().replace(" ", "_")
+        zone_key = f"{normalized_zone_name}_start_time"
+        start_time = event_data.get(zone_key)
+
+        if start_time:
+            _LOGGER.debug(
+                "Extracted zone start time for %s: normalized=%s, key=%s, value=%s",
+                self.zone_name,
+                normalized_zone_name,
+                zone_key,
+                start_time,
+            )
+
+        return cast("str | None", start_time)
+
+    @profiled_callback
+    def _handle_esphome_event(self, event: Any) -> None:
+        """Handle esphome.irrigation_gateway_update event."""
+        try:
+            event_data = event.data if hasattr(event, "data") else {}
+
+            # Log the event for debugging
+            _LOGGER.debug(
+                "Received esphome.irrigation_gateway_update event for zone %s. "
+                "Event data keys: %s",
+                self.zone_name,
+                list(event_data.keys()),
+            )
+
+            # Extract the start time for this specific zone
+            start_time = self._extract_zone_start_time(event_data)
+
+            if not start_time:
+                _LOGGER.debug(
+                    "No start time extracted for %s from event data",
+                    self.zone_name,
+                )
+                return
+
+            if start_time in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                _LOGGER.debug(
+                    "Start time for %s is unavailable/unknown: %s",
+                    self.zone_name,
+                    start_time,
+                )
+                return
+
+            # Update the state with the new start time
+            old_state = self._state
+            self._state = start_time
+
+            # Store event data in attributes
+            normalized_zone_name = self.zone_name.lower().replace(" ", "_")
+            self._attributes = {
+                "event_type": "esphome.irrigation_gateway_update",
+                "zone_name": self.zone_name,
+                "zone_key": f"{normalized_zone_name}_start_time",
+            }
+
+            # Log the update
+            if old_state != self._state:
+                _LOGGER.debug(
+                    "Updated %s start time from %s to %s",
+                    self.zone_name,
+                    old_state,
+                    self._state,
+                )
+
+            self.async_write_ha_state()
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Error processing esphome event for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+
+        # Parse ISO 8601 datetime string to datetime object for TIMESTAMP device class
+        try:
+            if isinstance(self._state, str):
+                # Use dt_util.parse_datetime to handle ISO 8601 format with timezone
+                parsed_dt = dt_util.parse_datetime(self._state)
+                if parsed_dt:
+                    return parsed_dt
+                _LOGGER.warning(
+                    "Failed to parse datetime for %s: %s",
+                    self.zone_name,
+                    self._state,
+                )
+                return None
+        except (ValueError, TypeError) as exc:
+            _LOGGER.warning(
+                "Error converting state to datetime for %s: %s",
+                self.zone_name,
+                exc,
+            )
+            return None
+        else:
+            # Already a datetime object
+            return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes if self._attributes else None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up event listener when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        # Restore previous state if available
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._state = last_state.state
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored last run start time sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        # Subscribe to esphome irrigation gateway update events
+        try:
+            self._unsubscribe = async_subscribe_irrigation_zone(
+                self.hass, self.zone_name, ("start_time",), self._handle_esphome_event
+            )
+            _LOGGER.debug(
+                "Set up event listener for %s",
+                self.zone_name,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up event listener for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+
+
+class IrrigationZoneLastRunEndTimeSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that tracks the last run end time of an irrigation zone.
+
+    This sensor listens for the 'esphome.irrigation_gateway_update' event
+    and updates when the event fires with the zone's end time data.
+    The sensor uses the timestamp device_class for proper formatting.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        zone_device_id: tuple[str, str],
+        zone_name: str,
+        zone_id: str,
+    ) -> None:
+        """
+        Initialize the irrigation zone last run end time sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry ID.
+            zone_device_id: The device identifier tuple (domain, device_id).
+            zone_name: The name of the irrigation zone.
+            zone_id: The zone ID used to extract data from events.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.zone_device_id = zone_device_id
+        self.zone_name = zone_name
+        self.zone_id = zone_id
+
+        # Set entity attributes
+        self._attr_name = f"{zone_name} Last Run End Time"
+        self._attr_device_class = SensorDeviceClass.TIMESTAMP
+        self._attr_icon = "mdi:clock-outline"
+
+        # Create unique ID from zone device identifier tuple
+        unique_id_parts = (
+            DOMAIN,
+            entry_id,
+            zone_device_id[0],
+            zone_device_id[1],
+            "last_run_end_time",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(zone_device_id)
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+
+    def _extract_zone_end_time(self, event_data: dict[str, Any]) -> str | None:
+        """
+        Extract the zone end time from event data.
+
+        The zone_name is converted to a key like 'lawn_end_time'.
+        The zone_name is normalized by replacing spaces with underscores and
+        converting to lowercase to match the event data key format.
+
+        Args:
+            event_data: The event data dictionary.
+
+        Returns:
+            The end time value if found, None otherwise.
+
+        """
+        # Convert zone_name to lowercase and replace spaces with underscores
+        normalized_zone_name = self.zone_name.lower().replace(" ", "_")
+        zone_key = f"{normalized_zone_name}_end_time"
+        end_time = event_data.get(zone_key)
+
+        if end_time:
+            _LOGGER.debug(
+                "Extracted zone end time for %s: normalized=%s, key=%s, value=%s",
+                self.zone_name,
+                normalized_zone_name,
+                zone_key,
+                end_time,
+            )
+
+        return cast("str | None", end_time)
+
+    @profiled_callback
+    def _handle_esphome_event(self, event: Any) -> None:
+        """Handle esphome.irrigation_gateway_update event."""
+        try:
+            event_data = event.data if hasattr(event, "data") else {}
+
+            # Log the event for debugging
+            _LOGGER.debug(
+                "Received esphome.irrigation_gateway_update event for zone %s. "
+                "Event data keys: %s",
+                self.zone_name,
+                list(event_data.keys()),
+            )
+
+            # Extract the end time for this specific zone
+            end_time = self._extract_zone_end_time(event_data)
+
+            if not end_time:
+                _LOGGER.debug(
+                    "No end time extracted for %s from event data",
+                    self.zone_name,
+                )
+                return
+
+            if end_time in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                _LOGGER.debug(
+                    "End time for %s is unavailable/unknown: %s",
+                    self.zone_name,
+                    end_time,
+                )
+                return
+
+            # Update the state with the new end time
+            old_state = self._state
+            self._state = end_time
+
+            # Store event data in attributes
+            self._attributes = {
+                "event_type": "esphome.irrigation_gateway_update",
+                "zone_id": self.zone_id,
+                "zone_key": f"{self.zone_id.replace('-', '_')}_end_time",
+            }
+
+            # Log the update
+            if old_state != self._state:
+                _LOGGER.debug(
+                    "Updated %s end time from %s to %s",
+                    self.zone_name,
+                    old_state,
+                    self._state,
+                )
+
+            self.async_write_ha_state()
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Error processing esphome event for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+
+        # Parse ISO 8601 datetime string to datetime object for TIMESTAMP device class
+        try:
+            if isinstance(self._state, str):
+                # Use dt_util.parse_datetime to handle ISO 8601 format with timezone
+                parsed_dt = dt_util.parse_datetime(self._state)
+                if parsed_dt:
+                    return parsed_dt
+                _LOGGER.warning(
+                    "Failed to parse datetime for %s: %s",
+                    self.zone_name,
+                    self._state,
+                )
+                return None
+        except (ValueError, TypeError) as exc:
+            _LOGGER.warning(
+                "Error converting state to datetime for %s: %s",
+                self.zone_name,
+                exc,
+            )
+            return None
+        else:
+            # Already a datetime object
+            return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes if self._attributes else None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up event listener when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        # Restore previous state if available
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._state = last_state.state
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored last run end time sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        # Subscribe to esphome irrigation gateway update events
+        try:
+            self._unsubscribe = async_subscribe_irrigation_zone(
+                self.hass, self.zone_name, ("end_time",), self._handle_esphome_event
+            )
+            _LOGGER.debug(
+                "Set up event listener for %s",
+                self.zone_name,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up event listener for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+
+
+class IrrigationZoneLastFertiliserInjectionSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that tracks the last fertiliser injection time of an irrigation zone.
+
+    This sensor listens for the 'esphome.irrigation_gateway_update' event
+    and updates when the event fires with the zone's fertiliser injection time.
+    The sensor uses the timestamp device_class for proper formatting.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        zone_device_id: tuple[str, str],
+        zone_name: str,
+        zone_id: str,
+    ) -> None:
+        """
+        Initialize the irrigation zone last fertiliser injection sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry ID.
+            zone_device_id: The device identifier tuple (domain, device_id).
+            zone_name: The name of the irrigation zone.
+            zone_id: The zone ID used to extract data from events.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.zone_device_id = zone_device_id
+        self.zone_name = zone_name
+        self.zone_id = zone_id
+
+        # Set entity attributes
+        self._attr_name = f"{zone_name} Last Fertiliser Injection"
+        self._attr_device_class = SensorDeviceClass.TIMESTAMP
+        self._attr_icon = "mdi:water-opacity"
+
+        # Create unique ID from zone device identifier tuple
+        unique_id_parts = (
+            DOMAIN,
+            entry_id,
+            zone_device_id[0],
+            zone_device_id[1],
+            "last_fertiliser_injection",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(zone_device_id)
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+
+    def _extract_zone_fertiliser_injection_time(
+        self, event_data: dict[str, Any]
+    ) -> str | None:
+        """
+        Extract the zone fertiliser injection time from event data.
+
+        The zone_name is converted to a key like 'lawn_fertiliser_injection_time'.
+        The zone_name is normalized by replacing spaces with underscores and
+        converting to lowercase to match the event data key format.
+
+        Args:
+            event_data: The event data dictionary.
+
+        Returns:
+            The fertiliser injection time value if found, None otherwise.
+
+        """
+        normalized_zone_name = self.zone_name.lower().replace(" ", "_")
+        zone_key = f"{normalized_zone_name}_fertiliser_injection_time"
+        injection_time = event_data.get(zone_key)
+
+        if injection_time:
+            _LOGGER.debug(
+                "Extracted zone fertiliser injection time for %s: "
+                "normalized=%s, key=%s, value=%s",
+                self.zone_name,
+                normalized_zone_name,
+                zone_key,
+                injection_time,
+            )
+
+        return cast("str | None", injection_time)
+
+    @profiled_callback
+    def _handle_esphome_event(self, event: Any) -> None:
+        """Handle esphome.irrigation_gateway_update event."""
+        try:
+            event_data = event.data if hasattr(event, "data") else {}
+
+            _LOGGER.debug(
+                "Received esphome.irrigation_gateway_update event for zone %s",
+                self.zone_name,
+            )
+
+            injection_time = self._extract_zone_fertiliser_injection_time(event_data)
+
+            if not injection_time:
+                _LOGGER.debug(
+                    "No fertiliser injection time extracted for %s",
+                    self.zone_name,
+                )
+                return
+
+            if injection_time in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                _LOGGER.debug(
+                    "Fertiliser injection time for %s is unavailable/unknown",
+                    self.zone_name,
+                )
+                return
+
+            old_state = self._state
+            self._state = injection_time
+
+            self._attributes = {
+                "event_type": "esphome.irrigation_gateway_update",
+                "zone_id": self.zone_id,
+            }
+
+            if old_state != self._state:
+                _LOGGER.debug(
+                    "Updated %s fertiliser injection time from %s to %s",
+                    self.zone_name,
+                    old_state,
+                    self._state,
+                )
+
+            self.async_write_ha_state()
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Error processing esphome event for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+
+        try:
+            if isinstance(self._state, str):
+                parsed_dt = dt_util.parse_datetime(self._state)
+                if parsed_dt:
+                    return parsed_dt
+                _LOGGER.warning(
+                    "Failed to parse datetime for %s: %s",
+                    self.zone_name,
+                    self._state,
+                )
+                return None
+        except (ValueError, TypeError) as exc:
+            _LOGGER.warning(
+                "Error converting state to datetime for %s: %s",
+                self.zone_name,
+                exc,
+            )
+            return None
+        else:
+            return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes if self._attributes else None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up event listener when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._state = last_state.state
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored last fertiliser injection sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        try:
+            self._unsubscribe = async_subscribe_irrigation_zone(
+                self.hass,
+                self.zone_name,
+                ("fertiliser_injection_time",),
+                self._handle_esphome_event,
+            )
+            _LOGGER.debug(
+                "Set up event listener for %s",
+                self.zone_name,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up event listener for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+
+
+class IrrigationZoneLastRunExpectedDurationSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that tracks the expected duration of the last irrigation run.
+
+    This sensor listens for the 'esphome.irrigation_gateway_update' event
+    and updates when the event fires with the zone's expected duration.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        zone_device_id: tuple[str, str],
+        zone_name: str,
+        zone_id: str,
+    ) -> None:
+        """
+        Initialize the irrigation zone last run expected duration sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry ID.
+            zone_device_id: The device identifier tuple (domain, device_id).
+            zone_name: The name of the irrigation zone.
+            zone_id: The zone ID used to extract data from events.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.zone_device_id = zone_device_id
+        self.zone_name = zone_name
+        self.zone_id = zone_id
+
+        # Set entity attributes
+        self._attr_name = f"{zone_name} Last Run Expected Duration"
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_native_unit_of_measurement = "min"
+        self._attr_state_class = "measurement"
+        self._attr_icon = "mdi:timer-star"
+
+        # Create unique ID from zone device identifier tuple
+        unique_id_parts = (
+            DOMAIN,
+            entry_id,
+            zone_device_id[0],
+            zone_device_id[1],
+            "last_run_expected_duration",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(zone_device_id)
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+
+    def _extract_zone_duration(self, event_data: dict[str, Any]) -> str | None:
+        """
+        Extract the zone expected duration from event data.
+
+        The zone_name is converted to a key like 'lawn_duration'.
+        The zone_name is normalized by replacing spaces with underscores and
+        converting to lowercase to match the event data key format.
+
+        Args:
+            event_data: The event data dictionary.
+
+        Returns:
+            The duration value if found, None otherwise.
+
+        """
+        normalized_zone_name = self.zone_name.lower().replace(" ", "_")
+        zone_key = f"{normalized_zone_name}_duration"
+        duration = event_data.get(zone_key)
+
+        if duration:
+            _LOGGER.debug(
+                "Extracted zone expected duration for %s: zone_name=%s, "
+                "key=%s, value=%s",
+                self.zone_name,
+                normalized_zone_name,
+                zone_key,
+                duration,
+            )
+
+        return cast("str | None", duration)
+
+    @profiled_callback
+    def _handle_esphome_event(self, event: Any) -> None:
+        """Handle esphome.irrigation_gateway_update event."""
+        try:
+            event_data = event.data if hasattr(event, "data") else {}
+
+            duration = self._extract_zone_duration(event_data)
+
+            if not duration:
+                _LOGGER.debug(
+                    "No duration extracted for %s from event data",
+                    self.zone_name,
+                )
+                return
+
+            if duration in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                _LOGGER.debug(
+                    "Duration for %s is unavailable/unknown: %s",
+                    self.zone_name,
+                    duration,
+                )
+                return
+
+            old_state = self._state
+            self._state = duration
+
+            self._attributes = {
+                "event_type": "esphome.irrigation_gateway_update",
+                "zone_id": self.zone_id,
+            }
+
+            if old_state != self._state:
+                _LOGGER.debug(
+                    "Updated %s expected duration from %s to %s",
+                    self.zone_name,
+                    old_state,
+                    self._state,
+                )
+
+            self.async_write_ha_state()
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Error processing esphome event for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+
+        try:
+            return float(self._state)
+        except (ValueError, TypeError):
+            return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes if self._attributes else None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up event listener when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._state = last_state.state
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored last run expected duration sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        try:
+            self._unsubscribe = async_subscribe_irrigation_zone(
+                self.hass, self.zone_name, ("duration",), self._handle_esphome_event
+            )
+            _LOGGER.debug(
+                "Set up event listener for %s",
+                self.zone_name,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up event listener for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+
+
+class IrrigationZoneLastRunActualDurationSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that tracks the actual duration of the last irrigation run.
+
+    This sensor listens for the 'esphome.irrigation_gateway_update' event
+    and calculates the actual duration from start and end times.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        zone_device_id: tuple[str, str],
+        zone_name: str,
+        zone_id: str,
+    ) -> None:
+        """
+        Initialize the irrigation zone last run actual duration sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry ID.
+            zone_device_id: The device identifier tuple (domain, device_id).
+            zone_name: The name of the irrigation zone.
+            zone_id: The zone ID used to extract data from events.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.zone_device_id = zone_device_id
+        self.zone_name = zone_name
+        self.zone_id = zone_id
+
+        # Set entity attributes
+        self._attr_name = f"{zone_name} Last Run Actual Duration"
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_native_unit_of_measurement = "min"
+        self._attr_state_class = "measurement"
+        self._attr_icon = "mdi:timer"
+
+        # Create unique ID from zone device identifier tuple
+        unique_id_parts = (
+            DOMAIN,
+            entry_id,
+            zone_device_id[0],
+            zone_device_id[1],
+            "last_run_actual_duration",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(zone_device_id)
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+
+    def _calculate_duration_from_times(
+        self, event_data: dict[str, Any]
+    ) -> float | None:
+        """
+        Calculate duration from start and end times in event data.
+
+        Args:
+            event_data: The event data dictionary.
+
+        Returns:
+            The duration in minutes, or None if calculation fails.
+
+        """
+        normalized_zone_name = self.zone_name.lower().replace(" ", "_")
+        start_key = f"{normalized_zone_name}_start_time"
+        end_key = f"{normalized_zone_name}_end_time"
+
+        start_time = event_data.get(start_key)
+        end_time = event_data.get(end_key)
+
+        if not start_time or not end_time:
+            return None
+
+        if start_time in (STATE_UNAVAILABLE, STATE_UNKNOWN) or end_time in (
+            STATE_UNAVAILABLE,
+            STATE_UNKNOWN,
+        ):
+            return None
+
+        try:
+            start_ts = dt_util.parse_datetime(start_time)
+            end_ts = dt_util.parse_datetime(end_time)
+
+            if start_ts and end_ts and end_ts > start_ts:
+                duration_minutes = int((end_ts - start_ts).total_seconds() / 60)
+                return float(duration_minutes)
+        except (ValueError, TypeError) as exc:
+            _LOGGER.debug(
+                "Error calculating duration for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+        return None
+
+    @profiled_callback
+    def _handle_esphome_event(self, event: Any) -> None:
+        """Handle esphome.irrigation_gateway_update event."""
+        try:
+            event_data = event.data if hasattr(event, "data") else {}
+
+            duration = self._calculate_duration_from_times(event_data)
+
+            if duration is None:
+                _LOGGER.debug(
+                    "No actual duration calculated for %s from event data",
+                    self.zone_name,
+                )
+                return
+
+            old_state = self._state
+            self._state = duration
+
+            normalized_zone_name = self.zone_name.lower().replace(" ", "_")
+            self._attributes = {
+                "event_type": "esphome.irrigation_gateway_update",
+                "zone_name": self.zone_name,
+                "zone_key": f"{normalized_zone_name}_start_time",
+            }
+
+            if old_state != self._state:
+                _LOGGER.debug(
+                    "Updated %s actual duration from %s to %s minutes",
+                    self.zone_name,
+                    old_state,
+                    self._state,
+                )
+
+            self.async_write_ha_state()
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Error processing esphome event for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+        return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes if self._attributes else None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up event listener when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            try:
+                self._state = float(last_state.state)
+            except (ValueError, TypeError):
+                self._state = last_state.state
+
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored last run actual duration sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        try:
+            self._unsubscribe = async_subscribe_irrigation_zone(
+                self.hass,
+                self.zone_name,
+                ("start_time", "end_time"),
+                self._handle_esphome_event,
+            )
+            _LOGGER.debug(
+                "Set up event listener for %s",
+                self.zone_name,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up event listener for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+
+
+class IrrigationZoneLastRunWaterMainUsageSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that tracks water main usage from the last irrigation run.
+
+    This sensor listens for the 'esphome.irrigation_gateway_update' event
+    and updates with the water main usage value.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        zone_device_id: tuple[str, str],
+        zone_name: str,
+        zone_id: str,
+    ) -> None:
+        """
+        Initialize the irrigation zone last run water main usage sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry ID.
+            zone_device_id: The device identifier tuple (domain, device_id).
+            zone_name: The name of the irrigation zone.
+            zone_id: The zone ID used to extract data from events.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.zone_device_id = zone_device_id
+        self.zone_name = zone_name
+        self.zone_id = zone_id
+
+        # Set entity attributes
+        self._attr_name = f"{zone_name} Last Run Water Main Usage"
+        self._attr_device_class = SensorDeviceClass.WATER
+        self._attr_native_unit_of_measurement = "L"
+        self._attr_state_class = "total_increasing"
+        self._attr_icon = "mdi:water-pump"
+
+        # Create unique ID from zone device identifier tuple
+        unique_id_parts = (
+            DOMAIN,
+            entry_id,
+            zone_device_id[0],
+            zone_device_id[1],
+            "last_run_water_main_usage",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(zone_device_id)
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+
+    def _extract_water_main_usage(self, event_data: dict[str, Any]) -> str | None:
+        """
+        Extract the water main usage from event data.
+
+        Args:
+            event_data: The event data dictionary.
+
+        Returns:
+            The water main usage value if found, None otherwise.
+
+        """
+        normalized_zone_name = self.zone_name.lower().replace(" ", "_")
+        zone_key = f"{normalized_zone_name}_water_main_usage"
+        usage = event_data.get(zone_key)
+
+        if usage:
+            _LOGGER.debug(
+                "Extracted zone water main usage for %s: key=%s, value=%s",
+                self.zone_name,
+                zone_key,
+                usage,
+            )
+
+        return cast("str | None", usage)
+
+    @profiled_callback
+    def _handle_esphome_event(self, event: Any) -> None:
+        """Handle esphome.irrigation_gateway_update event."""
+        try:
+            event_data = event.data if hasattr(event, "data") else {}
+
+            usage = self._extract_water_main_usage(event_data)
+
+            if not usage:
+                _LOGGER.debug(
+                    "No water main usage extracted for %s",
+                    self.zone_name,
+                )
+                return
+
+            if usage in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                _LOGGER.debug(
+                    "Water main usage for %s is unavailable/unknown",
+                    self.zone_name,
+                )
+                return
+
+            old_state = self._state
+            self._state = usage
+
+            self._attributes = {
+                "event_type": "esphome.irrigation_gateway_update",
+                "zone_id": self.zone_id,
+            }
+
+            if old_state != self._state:
+                _LOGGER.debug(
+                    "Updated %s water main usage from %s to %s l",
+                    self.zone_name,
+                    old_state,
+                    self._state,
+                )
+
+            self.async_write_ha_state()
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Error processing esphome event for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+
+        try:
+            return float(self._state)
+        except (ValueError, TypeError):
+            return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes if self._attributes else None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up event listener when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            try:
+                self._state = float(last_state.state)
+            except (ValueError, TypeError):
+                self._state = last_state.state
+
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored water main usage sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        try:
+            self._unsubscribe = async_subscribe_irrigation_zone(
+                self.hass,
+                self.zone_name,
+                ("water_main_usage",),
+                self._handle_esphome_event,
+            )
+            _LOGGER.debug(
+                "Set up event listener for %s",
+                self.zone_name,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up event listener for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+
+
+class IrrigationZoneLastRunRainWaterUsageSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that tracks rain water tank usage from the last irrigation run.
+
+    This sensor listens for the 'esphome.irrigation_gateway_update' event
+    and updates with the rain water tank usage value.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        zone_device_id: tuple[str, str],
+        zone_name: str,
+        zone_id: str,
+    ) -> None:
+        """
+        Initialize the irrigation zone last run rain water usage sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry ID.
+            zone_device_id: The device identifier tuple (domain, device_id).
+            zone_name: The name of the irrigation zone.
+            zone_id: The zone ID used to extract data from events.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.zone_device_id = zone_device_id
+        self.zone_name = zone_name
+        self.zone_id = zone_id
+
+        # Set entity attributes
+        self._attr_name = f"{zone_name} Last Run Rain Water Usage"
+        self._attr_device_class = SensorDeviceClass.WATER
+        self._attr_native_unit_of_measurement = "L"
+        self._attr_state_class = "total_increasing"
+        self._attr_icon = "mdi:weather-pouring"
+
+        # Create unique ID from zone device identifier tuple
+        unique_id_parts = (
+            DOMAIN,
+            entry_id,
+            zone_device_id[0],
+            zone_device_id[1],
+            "last_run_rain_water_usage",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(zone_device_id)
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+
+    def _extract_rain_water_usage(self, event_data: dict[str, Any]) -> str | None:
+        """
+        Extract the rain water tank usage from event data.
+
+        Args:
+            event_data: The event data dictionary.
+
+        Returns:
+            The rain water tank usage value if found, None otherwise.
+
+        """
+        normalized_zone_name = self.zone_name.lower().replace(" ", "_")
+        zone_key = f"{normalized_zone_name}_rain_water_tank_usage"
+        usage = event_data.get(zone_key)
+
+        if usage:
+            _LOGGER.debug(
+                "Extracted zone rain water usage for %s: key=%s, value=%s",
+                self.zone_name,
+                zone_key,
+                usage,
+            )
+
+        return cast("str | None", usage)
+
+    @profiled_callback
+    def _handle_esphome_event(self, event: Any) -> None:
+        """Handle esphome.irrigation_gateway_update event."""
+        try:
+            event_data = event.data if hasattr(event, "data") else {}
+
+            usage = self._extract_rain_water_usage(event_data)
+
+            if not usage:
+                _LOGGER.debug(
+                    "No rain water usage extracted for %s",
+                    self.zone_name,
+                )
+                return
+
+            if usage in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                _LOGGER.debug(
+                    "Rain water usage for %s is unavailable/unknown",
+                    self.zone_name,
+                )
+                return
+
+            old_state = self._state
+            self._state = usage
+
+            self._attributes = {
+                "event_type": "esphome.irrigation_gateway_update",
+                "zone_id": self.zone_id,
+            }
+
+            if old_state != self._state:
+                _LOGGER.debug(
+                    "Updated %s rain water usage from %s to %s l",
+                    self.zone_name,
+                    old_state,
+                    self._state,
+                )
+
+            self.async_write_ha_state()
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Error processing esphome event for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+
+        try:
+            return float(self._state)
+        except (ValueError, TypeError):
+            return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes if self._attributes else None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up event listener when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            try:
+                self._state = float(last_state.state)
+            except (ValueError, TypeError):
+                self._state = last_state.state
+
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored rain water usage sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        try:
+            self._unsubscribe = async_subscribe_irrigation_zone(
+                self.hass,
+                self.zone_name,
+                ("rain_water_tank_usage",),
+                self._handle_esphome_event,
+            )
+            _LOGGER.debug(
+                "Set up event listener for %s",
+                self.zone_name,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up event listener for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+
+
+class IrrigationZoneLastRunFertiliserUsageSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that tracks fertiliser usage from the last irrigation run.
+
+    This sensor listens for the 'esphome.irrigation_gateway_update' event
+    and updates with the fertiliser usage value.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        zone_device_id: tuple[str, str],
+        zone_name: str,
+        zone_id: str,
+    ) -> None:
+        """
+        Initialize the irrigation zone last run fertiliser usage sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry ID.
+            zone_device_id: The device identifier tuple (domain, device_id).
+            zone_name: The name of the irrigation zone.
+            zone_id: The zone ID used to extract data from events.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.zone_device_id = zone_device_id
+        self.zone_name = zone_name
+        self.zone_id = zone_id
+
+        # Set entity attributes
+        self._attr_name = f"{zone_name} Last Run Fertiliser Usage"
+        self._attr_device_class = SensorDeviceClass.WATER
+        self._attr_native_unit_of_measurement = "L"
+        self._attr_state_class = "total_increasing"
+        self._attr_icon = "mdi:water-pump"
+
+        # Create unique ID from zone device identifier tuple
+        unique_id_parts = (
+            DOMAIN,
+            entry_id,
+            zone_device_id[0],
+            zone_device_id[1],
+            "last_run_fertiliser_usage",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(zone_device_id)
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+
+    def _extract_fertiliser_usage(self, event_data: dict[str, Any]) -> str | None:
+        """
+        Extract the fertiliser usage from event data.
+
+        Args:
+            event_data: The event data dictionary.
+
+        Returns:
+            The fertiliser usage value if found, None otherwise.
+
+        """
+        normalized_zone_name = self.zone_name.lower().replace(" ", "_")
+        zone_key = f"{normalized_zone_name}_fertiliser_usage"
+        usage = event_data.get(zone_key)
+
+        if usage:
+            _LOGGER.debug(
+                "Extracted zone fertiliser usage for %s: key=%s, value=%s",
+                self.zone_name,
+                zone_key,
+                usage,
+            )
+
+        return cast("str | None", usage)
+
+    @profiled_callback
+    def _handle_esphome_event(self, event: Any) -> None:
+        """Handle esphome.irrigation_gateway_update event."""
+        try:
+            event_data = event.data if hasattr(event, "data") else {}
+
+            usage = self._extract_fertiliser_usage(event_data)
+
+            if not usage:
+                _LOGGER.debug(
+                    "No fertiliser usage extracted for %s",
+                    self.zone_name,
+                )
+                return
+
+            if usage in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                _LOGGER.debug(
+                    "Fertiliser usage for %s is unavailable/unknown",
+                    self.zone_name,
+                )
+                return
+
+            old_state = self._state
+            self._state = usage
+
+            normalized_zone_name = self.zone_name.lower().replace(" ", "_")
+            self._attributes = {
+                "event_type": "esphome.irrigation_gateway_update",
+                "zone_name": self.zone_name,
+                "zone_key": f"{normalized_zone_name}_fertiliser_usage",
+            }
+
+            if old_state != self._state:
+                _LOGGER.debug(
+                    "Updated %s fertiliser usage from %s to %s l",
+                    self.zone_name,
+                    old_state,
+                    self._state,
+                )
+
+            self.async_write_ha_state()
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Error processing esphome event for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+
+        try:
+            return float(self._state)
+        except (ValueError, TypeError):
+            return None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes if self._attributes else None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up event listener when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            try:
+                self._state = float(last_state.state)
+            except (ValueError, TypeError):
+                self._state = last_state.state
+
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored fertiliser usage sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        try:
+            self._unsubscribe = async_subscribe_irrigation_zone(
+                self.hass,
+                self.zone_name,
+                ("fertiliser_usage",),
+                self._handle_esphome_event,
+            )
+            _LOGGER.debug(
+                "Set up event listener for %s",
+                self.zone_name,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up event listener for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+
+
+class IrrigationZoneLastErrorSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that tracks the last error time of an irrigation zone.
+
+    This sensor listens for the 'esphome.irrigation_gateway_update' event
+    and updates with the last error time using the timestamp device_class.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        zone_device_id: tuple[str, str],
+        zone_name: str,
+        zone_id: str,
+    ) -> None:
+        """
+        Initialize the irrigation zone last error sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry ID.
+            zone_device_id: The device identifier tuple (domain, device_id).
+            zone_name: The name of the irrigation zone.
+            zone_id: The zone ID used to extract data from events.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.zone_device_id = zone_device_id
+        self.zone_name = zone_name
+        self.zone_id = zone_id
+
+        # Set entity attributes
+        self._attr_name = f"{zone_name} Last Error"
+        self._attr_device_class = SensorDeviceClass.TIMESTAMP
+        self._attr_icon = "mdi:alert-circle"
+
+        # Create unique ID from zone device identifier tuple
+        unique_id_parts = (
+            DOMAIN,
+            entry_id,
+            zone_device_id[0],
+            zone_device_id[1],
+            "last_error",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(zone_device_id)
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+
+    def _extract_zone_error_time(self, event_data: dict[str, Any]) -> str | None:
+        """
+        Extract the zone error time from event data.
+
+        The zone_name is converted to a key like 'lawn_error_time'.
+        The zone_name is normalized by replacing spaces with underscores and
+        converting to lowercase to match the event data key format.
+
+        Args:
+            event_data: The event data dictionary.
+
+        Returns:
+            The error time value if found, None otherwise.
+
+        """
+        normalized_zone_name = self.zone_name.lower().replace(" ", "_")
+        zone_key = f"{normalized_zone_name}_error_time"
+        error_time = event_data.get(zone_key)
+
+        if error_time:
+            _LOGGER.debug(
+                "Extracted zone error time for %s: key=%s, value=%s",
+                self.zone_name,
+                zone_key,
+                error_time,
+            )
+
+        return cast("str | None", error_time)
+
+    @profiled_callback
+    def _handle_esphome_event(self, event: Any) -> None:
+        """Handle esphome.irrigation_gateway_update event."""
+        try:
+            event_data = event.data if hasattr(event, "data") else {}
+
+            error_time = self._extract_zone_error_time(event_data)
+
+            if not error_time:
+                _LOGGER.debug(
+                    "No error time extracted for %s",
+                    self.zone_name,
+                )
+                return
+
+            if error_time in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                _LOGGER.debug(
+                    "Error time for %s is unavailable/unknown",
+                    self.zone_name,
+                )
+                return
+
+            old_state = self._state
+            self._state = error_time
+
+            self._attributes = {
+                "event_type": "esphome.irrigation_gateway_update",
+                "zone_id": self.zone_id,
+            }
+
+            if old_state != self._state:
+                _LOGGER.debug(
+                    "Updated %s error time from %s to %s",
+                    self.zone_name,
+                    old_state,
+                    self._state,
+                )
+
+            self.async_write_ha_state()
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Error processing esphome event for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+
+        try:
+            if isinstance(self._state, str):
+                parsed_dt = dt_util.parse_datetime(self._state)
+                if parsed_dt:
+                    return parsed_dt
+                _LOGGER.warning(
+                    "Failed to parse datetime for %s: %s",
+                    self.zone_name,
+                    self._state,
+                )
+                return None
+        except (ValueError, TypeError) as exc:
+            _LOGGER.warning(
+                "Error converting state to datetime for %s: %s",
+                self.zone_name,
+                exc,
+            )
+            return None
+        else:
+            return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes if self._attributes else None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up event listener when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._state = last_state.state
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored last error sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        try:
+            self._unsubscribe = async_subscribe_irrigation_zone(
+                self.hass, self.zone_name, ("error_time",), self._handle_esphome_event
+            )
+            _LOGGER.debug(
+                "Set up event listener for %s",
+                self.zone_name,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up event listener for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+
+
+class IrrigationZoneLastErrorTypeSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that tracks the last error type of an irrigation zone.
+
+    This sensor listens for the 'esphome.irrigation_gateway_update' event
+    and updates with the error type value.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        zone_device_id: tuple[str, str],
+        zone_name: str,
+        zone_id: str,
+    ) -> None:
+        """
+        Initialize the irrigation zone last error type sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry ID.
+            zone_device_id: The device identifier tuple (domain, device_id).
+            zone_name: The name of the irrigation zone.
+            zone_id: The zone ID used to extract data from events.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.zone_device_id = zone_device_id
+        self.zone_name = zone_name
+        self.zone_id = zone_id
+
+        # Set entity attributes
+        self._attr_name = f"{zone_name} Last Error Type"
+        self._attr_icon = "mdi:alert-octagon"
+
+        # Create unique ID from zone device identifier tuple
+        unique_id_parts = (
+            DOMAIN,
+            entry_id,
+            zone_device_id[0],
+            zone_device_id[1],
+            "last_error_type",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(zone_device_id)
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+
+    def _extract_zone_error_type(self, event_data: dict[str, Any]) -> str | None:
+        """
+        Extract the zone error type from event data.
+
+        The zone_name is converted to a key like 'lawn_error_type'.
+        The zone_name is normalized by replacing spaces with underscores and
+        converting to lowercase to match the event data key format.
+
+        Args:
+            event_data: The event data dictionary.
+
+        Returns:
+            The error type value if found, None otherwise.
+
+        """
+        normalized_zone_name = self.zone_name.lower().replace(" ", "_")
+        zone_key = f"{normalized_zone_name}_error_type"
+        error_type = event_data.get(zone_key)
+
+        if error_type:
+            _LOGGER.debug(
+                "Extracted zone error type for %s: key=%s, value=%s",
+                self.zone_name,
+                zone_key,
+                error_type,
+            )
+
+        return cast("str | None", error_type)
+
+    @profiled_callback
+    def _handle_esphome_event(self, event: Any) -> None:
+        """Handle esphome.irrigation_gateway_update event."""
+        try:
+            event_data = event.data if hasattr(event, "data") else {}
+
+            error_type = self._extract_zone_error_type(event_data)
+
+            if not error_type:
+                _LOGGER.debug(
+                    "No error type extracted for %s",
+                    self.zone_name,
+                )
+                return
+
+            if error_type in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                _LOGGER.debug(
+                    "Error type for %s is unavailable/unknown",
+                    self.zone_name,
+                )
+                return
+
+            old_state = self._state
+            self._state = error_type
+
+            self._attributes = {
+                "event_type": "esphome.irrigation_gateway_update",
+                "zone_id": self.zone_id,
+            }
+
+            if old_state != self._state:
+                _LOGGER.debug(
+                    "Updated %s error type from %s to %s",
+                    self.zone_name,
+                    old_state,
+                    self._state,
+                )
+
+            self.async_write_ha_state()
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Error processing esphome event for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+        return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes if self._attributes else None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up event listener when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._state = last_state.state
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored last error type sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        try:
+            self._unsubscribe = async_subscribe_irrigation_zone(
+                self.hass, self.zone_name, ("error_type",), self._handle_esphome_event
+            )
+            _LOGGER.debug(
+                "Set up event listener for %s",
+                self.zone_name,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up event listener for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+
+
+class IrrigationZoneLastErrorMessageSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that tracks the last error message of an irrigation zone.
+
+    This sensor listens for the 'esphome.irrigation_gateway_update' event
+    and updates with the error message/detail value.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        zone_device_id: tuple[str, str],
+        zone_name: str,
+        zone_id: str,
+    ) -> None:
+        """
+        Initialize the irrigation zone last error message sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry ID.
+            zone_device_id: The device identifier tuple (domain, device_id).
+            zone_name: The name of the irrigation zone.
+            zone_id: The zone ID used to extract data from events.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.zone_device_id = zone_device_id
+        self.zone_name = zone_name
+        self.zone_id = zone_id
+
+        # Set entity attributes
+        self._attr_name = f"{zone_name} Last Error Message"
+        self._attr_icon = "mdi:message-alert"
+
+        # Create unique ID from zone device identifier tuple
+        unique_id_parts = (
+            DOMAIN,
+            entry_id,
+            zone_device_id[0],
+            zone_device_id[1],
+            "last_error_message",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(zone_device_id)
+
+        self._state: Any = None
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+
+    def _extract_zone_error_detail(self, event_data: dict[str, Any]) -> str | None:
+        """
+        Extract the zone error detail/message from event data.
+
+        The zone_name is converted to a key like 'lawn_error_detail'.
+        The zone_name is normalized by replacing spaces with underscores and
+        converting to lowercase to match the event data key format.
+
+        Args:
+            event_data: The event data dictionary.
+
+        Returns:
+            The error detail value if found, None otherwise.
+
+        """
+        normalized_zone_name = self.zone_name.lower().replace(" ", "_")
+        zone_key = f"{normalized_zone_name}_error_detail"
+        error_detail = event_data.get(zone_key)
+
+        if error_detail:
+            _LOGGER.debug(
+                "Extracted zone error detail for %s: key=%s, value=%s",
+                self.zone_name,
+                zone_key,
+                error_detail,
+            )
+
+        return cast("str | None", error_detail)
+
+    @profiled_callback
+    def _handle_esphome_event(self, event: Any) -> None:
+        """Handle esphome.irrigation_gateway_update event."""
+        try:
+            event_data = event.data if hasattr(event, "data") else {}
+
+            error_detail = self._extract_zone_error_detail(event_data)
+
+            if not error_detail:
+                _LOGGER.debug(
+                    "No error detail extracted for %s",
+                    self.zone_name,
+                )
+                return
+
+            if error_detail in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                _LOGGER.debug(
+                    "Error detail for %s is unavailable/unknown",
+                    self.zone_name,
+                )
+                return
+
+            old_state = self._state
+            self._state = error_detail
+
+            self._attributes = {
+                "event_type": "esphome.irrigation_gateway_update",
+                "zone_id": self.zone_id,
+            }
+
+            if old_state != self._state:
+                _LOGGER.debug(
+                    "Updated %s error message from %s to %s",
+                    self.zone_name,
+                    old_state,
+                    self._state,
+                )
+
+            self.async_write_ha_state()
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Error processing esphome event for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    @property
+    def native_value(self) -> Any:
+        """Return the native value of the sensor."""
+        if self._state in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+            return None
+        return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes if self._attributes else None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up event listener when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._state = last_state.state
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored last error message sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+
+        try:
+            self._unsubscribe = async_subscribe_irrigation_zone(
+                self.hass, self.zone_name, ("error_detail",), self._handle_esphome_event
+            )
+            _LOGGER.debug(
+                "Set up event listener for %s",
+                self.zone_name,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up event listener for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
+
+
+class IrrigationZoneErrorCountSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that counts the number of errors for an irrigation zone.
+
+    This sensor listens for updates to the last error entity and increments
+    the count when a new error timestamp is detected.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        zone_device_id: tuple[str, str],
+        zone_name: str,
+        zone_id: str,
+    ) -> None:
+        """
+        Initialize the irrigation zone error count sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry ID.
+            zone_device_id: The device identifier tuple (domain, device_id).
+            zone_name: The name of the irrigation zone.
+            zone_id: The zone ID used to extract data from events.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.zone_device_id = zone_device_id
+        self.zone_name = zone_name
+        self.zone_id = zone_id
+
+        # Set entity attributes
+        self._attr_name = f"{zone_name} Error Count"
+        self._attr_native_unit_of_measurement = "errors"
+        self._attr_state_class = "total_increasing"
+        self._attr_icon = "mdi:counter"
+
+        # Create unique ID from zone device identifier tuple
+        unique_id_parts = (
+            DOMAIN,
+            entry_id,
+            zone_device_id[0],
+            zone_device_id[1],
+            "error_count",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(zone_device_id)
+
+        self._state: int = 0
+        self._attributes: dict[str, Any] = {}
+        self._last_error_state: str | None = None
+        self._unsubscribe_last_error = None
+        self._last_error_entity_id: str | None = None
+
+    def reset_error_count(self) -> None:
+        """Reset the error count to 0 and clear tracking state."""
+        self._state = 0
+        self._last_error_state = None
+        self._attributes = {}
+        self.async_write_ha_state()
+        _LOGGER.debug(
+            "Reset error count for %s",
+            self.zone_name,
+        )
+
+    @profiled_callback
+    def _handle_last_error_state_change(
+        self, event: Event[EventStateChangedData]
+    ) -> None:
+        """Handle Last Error entity state changes."""
+        new_state = event.data.get("new_state")
+        try:
+            if not new_state:
+                return
+
+            new_error_time = new_state.state
+            if new_error_time in (STATE_UNAVAILABLE, STATE_UNKNOWN, None):
+                _LOGGER.debug(
+                    "Last Error state for %s is unavailable/unknown/None",
+                    self.zone_name,
+                )
+                return
+
+            # Check if this is a new error (different from internal tracking)
+            if new_error_time != self._last_error_state:
+                old_count = self._state
+                self._state += 1
+                self._last_error_state = new_error_time
+
+                self._attributes = {
+                    "event_type": "last_error_state_change",
+                    "zone_id": self.zone_id,
+                    "last_error_time": new_error_time,
+                }
+
+                _LOGGER.debug(
+                    "Incremented %s error count from %d to %d"
+                    " (Last Error state change to %s)",
+                    self.zone_name,
+                    old_count,
+                    self._state,
+                    new_error_time,
+                )
+
+                self.async_write_ha_state()
+            else:
+                _LOGGER.debug(
+                    "Last Error state change for %s: new time %s"
+                    " matches internal tracking %s",
+                    self.zone_name,
+                    new_error_time,
+                    self._last_error_state,
+                )
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Error processing Last Error state change for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    @property
+    def native_value(self) -> int:
+        """Return the native value of the sensor."""
+        return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes if self._attributes else None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up event listener when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        # Restore previous state if available
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            try:
+                self._state = int(last_state.state)
+            except (ValueError, TypeError):
+                self._state = 0
+
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+                # Restore the last error time to prevent re-counting
+                self._last_error_state = self._attributes.get("last_error_time")
+
+            _LOGGER.debug(
+                "Restored error count sensor %s with state: %d",
+                self.entity_id,
+                self._state,
+            )  # Find the Last Error entity ID by its unique ID
+        last_error_unique_id_parts = (
+            DOMAIN,
+            self.entry_id,
+            self.zone_device_id[0],
+            self.zone_device_id[1],
+            "last_error",
+        )
+        last_error_unique_id = "_".join(last_error_unique_id_parts)
+
+        try:
+            registry = er.async_get(self.hass)
+            index = async_get_entity_index(self.hass, registry)
+            if index is not None and (
+                last_error_entity_id := index.async_get_entity_id(last_error_unique_id)
+            ):
+                self._last_error_entity_id = last_error_entity_id
+                _LOGGER.debug(
+                    "Found Last Error entity for %s: %s",
+                    self.zone_name,
+                    self._last_error_entity_id,
+                )
+        except (AttributeError, KeyError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to find Last Error entity for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+        # Subscribe to Last Error entity state changes
+        if self._last_error_entity_id:
+            try:
+                self._unsubscribe_last_error = async_track_state_change_event(
+                    self.hass,
+                    self._last_error_entity_id,
+                    self._handle_last_error_state_change,
+                )
+                _LOGGER.debug(
+                    "Set up Last Error state change listener for %s",
+                    self.zone_name,
+                )
+            except (AttributeError, KeyError, ValueError) as exc:
+                _LOGGER.warning(
+                    "Failed to set up Last Error state change listener for %s: %s",
+                    self.zone_name,
+                    exc,
+                )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe_last_error:
+            self._unsubscribe_last_error()
+
+
+class IrrigationZoneFertiliserDueSensor(SensorEntity, RestoreEntity):
+    """
+    Sensor that assesses if fertiliser is due for an irrigation zone.
+
+    This sensor evaluates whether fertiliser injection is due based on multiple
+    conditions including:
+    - System-wide fertiliser enabled state
+    - Zone-specific fertiliser enabled state
+    - Fertiliser injection schedule (in days)
+    - Current month (only active April-September)
+    - Last fertiliser injection timestamp
+    - Current date/time
+
+    The sensor state is 'on' when fertiliser is due, 'off' otherwise.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        zone_device_id: tuple[str, str],
+        zone_name: str,
+        zone_id: str,
+    ) -> None:
+        """
+        Initialize the irrigation zone fertiliser due sensor.
+
+        Args:
+            hass: The Home Assistant instance.
+            entry_id: The config entry ID.
+            zone_device_id: The device identifier tuple (domain, device_id).
+            zone_name: The name of the irrigation zone.
+            zone_id: The zone ID used to extract data from events and entities.
+
+        """
+        self.hass = hass
+        self.entry_id = entry_id
+        self.zone_device_id = zone_device_id
+        self.zone_name = zone_name
+        self.zone_id = zone_id
+
+        # Set entity attributes
+        self._attr_name = f"{zone_name} Fertiliser Due"
+        self._attr_device_class = SensorDeviceClass.ENUM
+        self._attr_icon = "mdi:water-opacity"
+        self._attr_options = ["off", "on"]
+
+        # Create unique ID from zone device identifier tuple
+        unique_id_parts = (
+            DOMAIN,
+            entry_id,
+            zone_device_id[0],
+            zone_device_id[1],
+            "fertiliser_due",
+        )
+        self._attr_unique_id = "_".join(unique_id_parts)
+
+        # Set device info to associate with the irrigation zone device
+        self._attr_device_info = shared_device_info(zone_device_id)
+
+        self._state: str = "off"
+        self._attributes: dict[str, Any] = {}
+        self._unsubscribe = None
+
+        # Store discovered entity IDs from the device
+        # We discover these from the device instead of constructing them,
+        # making the sensor resilient to entity renames
+        self._last_injection_entity_id: str | None = None
+        self._fertiliser_switch_entity_id: str | None = None
+        self._fertiliser_schedule_entity_id: str | None = None
+        self._discover_device_entities()
+
+    def _discover_device_entities(self) -> None:
+        """
+        Discover all required entities for this zone's fertiliser monitoring.
+
+        This queries the device registry and entity registry to find the entities
+        associated with this zone's device, rather than constructing entity IDs.
+        This makes the sensor resilient to entity renames.
+
+        Entities discovered:
+        - last_fertiliser_injection (sensor)
+        - allow_fertiliser_injection (switch)
+        - fertiliser_injection_days (number)
+        """
+        try:
+            # Get the device ID (not the identifier tuple)
+            dev_reg = dr.async_get(self.hass)
+
+            # Find the device by identifier
+            device = dev_reg.async_get_device(identifiers={self.zone_device_id})
+
+            if not device:
+                _LOGGER.debug(
+                    "Could not find device for zone %s (identifier: %s)",
+                    self.zone_name,
+                    self.zone_device_id,
+                )
+                return
+
+            # Find sensor entities on this device
+            sensor_entities = find_device_entities_by_pattern(
+                self.hass,
+                device.id,
+                "sensor",
+                ["last_fertiliser_injection"],
+            )
+
+            if "last_fertiliser_injection" in sensor_entities:
+                entity_id, unique_id = sensor_entities["last_fertiliser_injection"]
+                self._last_injection_entity_id = entity_id
+                _LOGGER.debug(
+                    "Discovered last fertiliser injection sensor for %s: %s "
+                    "(unique_id: %s)",
+                    self.zone_name,
+                    entity_id,
+                    unique_id,
+                )
+            else:
+                _LOGGER.debug(
+                    "Could not find last fertiliser injection sensor for %s "
+                    "on device %s",
+                    self.zone_name,
+                    device.id,
+                )
+
+            # Find switch entities on this device
+            switch_entities = find_device_entities_by_pattern(
+                self.hass,
+                device.id,
+                "switch",
+                ["allow_fertiliser_injection"],
+            )
+
+            if "allow_fertiliser_injection" in switch_entities:
+                entity_id, unique_id = switch_entities["allow_fertiliser_injection"]
+                self._fertiliser_switch_entity_id = entity_id
+                _LOGGER.debug(
+                    "Discovered fertiliser injection switch for %s: %s (unique_id: %s)",
+                    self.zone_name,
+                    entity_id,
+                    unique_id,
+                )
+            else:
+                _LOGGER.debug(
+                    "Could not find fertiliser injection switch for %s on device %s",
+                    self.zone_name,
+                    device.id,
+                )
+
+            # Find number entities on this device
+            number_entities = find_device_entities_by_pattern(
+                self.hass,
+                device.id,
+                "number",
+                ["fertiliser_injection_days"],
+            )
+
+            if "fertiliser_injection_days" in number_entities:
+                entity_id, unique_id = number_entities["fertiliser_injection_days"]
+                self._fertiliser_schedule_entity_id = entity_id
+                _LOGGER.debug(
+                    "Discovered fertiliser injection schedule for %s: %s "
+                    "(unique_id: %s)",
+                    self.zone_name,
+                    entity_id,
+                    unique_id,
+                )
+            else:
+                _LOGGER.debug(
+                    "Could not find fertiliser injection schedule for %s on device %s",
+                    self.zone_name,
+                    device.id,
+                )
+
+        except (AttributeError, KeyError, ValueError, TypeError) as exc:
+            _LOGGER.debug(
+                "Error discovering fertiliser entities for %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    def _get_entity_state(self, entity_id: str) -> str | None:
+        """
+        Safely get the state of an entity.
+
+        Args:
+            entity_id: The entity ID to retrieve state for.
+
+        Returns:
+            The state value as a string, or None if unavailable/unknown.
+
+        """
+        try:
+            state = self.hass.states.get(entity_id)
+            if state is not None and state.state not in (
+                STATE_UNAVAILABLE,
+                STATE_UNKNOWN,
+            ):
+                return state.state
+            return None  # noqa: TRY300
+        except (AttributeError, KeyError, ValueError):
+            return None
+
+    def _parse_datetime_state(self, datetime_str: str | None) -> Any:
+        """
+        Parse a datetime string to a datetime object.
+
+        Args:
+            datetime_str: The datetime string to parse (ISO 8601 format).
+
+        Returns:
+            A datetime object if parsing succeeds, None otherwise.
+
+        """
+        if not datetime_str or datetime_str in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            return None
+
+        try:
+            return dt_util.parse_datetime(datetime_str)
+        except (ValueError, TypeError):
+            return None
+
+    def _evaluate_fertiliser_due(self) -> bool:  # noqa: PLR0911
+        """
+        Evaluate if fertiliser is due based on configuration.
+
+        Implements the logic checking:
+        - Zone-specific fertiliser enabled state (from device switch)
+        - Fertiliser injection schedule (from device number entity)
+        - Current month (only active April-September, months 4-9)
+        - Last fertiliser injection timestamp
+        - Current date/time
+
+        Returns:
+            True if fertiliser is due, False otherwise.
+
+        """
+        # 1. Check if zone fertiliser injection is enabled
+        # Use the discovered entity ID instead of constructing it
+        if not self._fertiliser_switch_entity_id:
+            _LOGGER.debug(
+                "Fertiliser due %s: Fertiliser injection switch not discovered",
+                self.zone_name,
+            )
+            return False
+
+        zone_fertiliser_enabled = self._get_entity_state(
+            self._fertiliser_switch_entity_id
+        )
+        if zone_fertiliser_enabled != "on":
+            _LOGGER.debug(
+                "Fertiliser due %s: Zone fertiliser enabled is %s (from %s)",
+                self.zone_name,
+                zone_fertiliser_enabled,
+                self._fertiliser_switch_entity_id,
+            )
+            return False
+
+        # 2. Check if fertiliser schedule is configured (> 0 days)
+        # Use the discovered entity ID instead of constructing it
+        if not self._fertiliser_schedule_entity_id:
+            _LOGGER.debug(
+                "Fertiliser due %s: Fertiliser schedule entity not discovered",
+                self.zone_name,
+            )
+            return False
+
+        schedule_str = self._get_entity_state(self._fertiliser_schedule_entity_id)
+        if not schedule_str:
+            _LOGGER.debug(
+                "Fertiliser due %s: Schedule not available from %s",
+                self.zone_name,
+                self._fertiliser_schedule_entity_id,
+            )
+            return False
+
+        try:
+            schedule_days = int(float(schedule_str))
+        except (ValueError, TypeError):
+            _LOGGER.debug(
+                "Fertiliser due %s: Could not parse schedule: %s",
+                self.zone_name,
+                schedule_str,
+            )
+            return False
+
+        if schedule_days <= 0:
+            _LOGGER.debug(
+                "Fertiliser due %s: Schedule is 0 or negative: %d days",
+                self.zone_name,
+                schedule_days,
+            )
+            return False
+
+        # 3. Check if current month is in season (April-September)
+        current_month = dt_util.now().month
+        if current_month < 4 or current_month > 9:  # noqa: PLR2004
+            _LOGGER.debug(
+                "Fertiliser due %s: Outside fertiliser season (month=%d)",
+                self.zone_name,
+                current_month,
+            )
+            return False
+
+        # 4. Get last fertiliser injection date
+        # Use the discovered entity ID instead of constructing it
+        if not self._last_injection_entity_id:
+            _LOGGER.debug(
+                "Fertiliser due %s: Last fertiliser injection sensor not discovered",
+                self.zone_name,
+            )
+            return True  # If we can't find the sensor, assume fertiliser is due
+
+        last_injection_str = self._get_entity_state(self._last_injection_entity_id)
+
+        # If never injected before, fertiliser is due
+        if not last_injection_str:
+            _LOGGER.debug(
+                "Fertiliser due %s: No previous injection recorded",
+                self.zone_name,
+            )
+            return True
+
+        # 5. Parse last injection timestamp
+        last_injection_dt = self._parse_datetime_state(last_injection_str)
+        if not last_injection_dt:
+            _LOGGER.debug(
+                "Fertiliser due %s: Could not parse last injection date: %s",
+                self.zone_name,
+                last_injection_str,
+            )
+            return False
+
+        # 6. Calculate next due date
+        try:
+            next_due_dt = last_injection_dt + timedelta(days=schedule_days)
+        except (TypeError, ValueError):
+            _LOGGER.debug(
+                "Fertiliser due %s: Could not calculate next due date",
+                self.zone_name,
+            )
+            return False
+
+        # 7. Get current datetime and compare if current time >= next due time
+        current_dt = dt_util.now()
+        is_due: bool = current_dt >= next_due_dt
+
+        _LOGGER.debug(
+            "Fertiliser due %s: Evaluated - last_injection=%s, schedule=%d days, "
+            "next_due=%s, current=%s, is_due=%s",
+            self.zone_name,
+            last_injection_dt,
+            schedule_days,
+            next_due_dt,
+            current_dt,
+            is_due,
+        )
+
+        return is_due
+
+    @profiled_callback
+    def _handle_esphome_event(self, _event: Any) -> None:
+        """
+        Handle esphome.irrigation_gateway_update event.
+
+        This event triggers re-evaluation of the fertiliser due state
+        in case any relevant data has changed.
+        """
+        try:
+            _LOGGER.debug(
+                "Fertiliser due sensor %s received esphome event",
+                self.zone_name,
+            )
+
+            # Re-evaluate fertiliser due status
+            is_due = self._evaluate_fertiliser_due()
+            new_state = "on" if is_due else "off"
+
+            if self._state != new_state:
+                old_state = self._state
+                self._state = new_state
+
+                self._attributes = {
+                    "last_evaluation": dt_util.now().isoformat(),
+                    "event_type": "esphome.irrigation_gateway_update",
+                    "zone_id": self.zone_id,
+                }
+
+                _LOGGER.info(
+                    "Fertiliser due %s changed from %s to %s",
+                    self.zone_name,
+                    old_state,
+                    new_state,
+                )
+
+                self.async_write_ha_state()
+        except (AttributeError, KeyError, ValueError, TypeError) as exc:
+            _LOGGER.warning(
+                "Error processing esphome event for fertiliser due %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    @property
+    def native_value(self) -> str:
+        """Return the native value of the sensor."""
+        return self._state
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return entity specific state attributes."""
+        return self._attributes if self._attributes else None
+
+    async def async_added_to_hass(self) -> None:
+        """Set up event listener when entity is added to hass."""
+        await super().async_added_to_hass()
+
+        # Restore previous state if available
+        if (
+            last_state := await self.async_get_last_state()
+        ) and last_state.state not in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+            self._state = last_state.state
+            if last_state.attributes:
+                self._attributes = dict(last_state.attributes)
+
+            _LOGGER.debug(
+                "Restored fertiliser due sensor %s with state: %s",
+                self.entity_id,
+                self._state,
+            )
+        else:
+            # Perform initial evaluation
+            is_due = self._evaluate_fertiliser_due()
+            self._state = "on" if is_due else "off"
+            self._attributes = {
+                "last_evaluation": dt_util.now().isoformat(),
+                "zone_id": self.zone_id,
+            }
+
+        # Subscribe to esphome irrigation gateway update events
+        try:
+            # Re-evaluated on every gateway event, regardless of zone
+            self._unsubscribe = async_subscribe_irrigation_zone(
+                self.hass, None, None, self._handle_esphome_event
+            )
+            _LOGGER.debug(
+                "Set up event listener for fertiliser due sensor %s",
+                self.zone_name,
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as exc:
+            _LOGGER.warning(
+                "Failed to set up event listener for fertiliser due %s: %s",
+                self.zone_name,
+                exc,
+            )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Clean up when entity is removed."""
+        if self._unsubscribe:
+            self._unsubscribe()
@@ -0,0 +1,281 @@
+"""
+Shared state change subscriptions of the location's source entities.
+
+A location's mirror sensors are read by several entities at once: the soil
+moisture mirror by the threshold monitors and the recent change sensor, the
+temperature and humidity mirrors by the weekly threshold duration sensors,
+and so on. Rather than each consumer subscribing with its own
+``async_track_state_change_event`` and parsing the state again, the
+multiplexer holds a single subscription per source entity, parses every
+change once into a ``SourceReading`` and fans it out to the registered
+consumers. Subscriptions are reference counted: the entity is tracked while
+at least one consumer is registered.
+
+The mirror and DLI sensors, and the status, link and ignore-until monitors
+read their sources through the multiplexer as well, so every source entity
+has exactly one Home Assistant subscription however many entities read it.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import (
+    EventStateChangedData,
+    async_track_state_change_event,
+)
+
+from .callback_profiler import profiled_callback
+from .const import DOMAIN, STATE_MULTIPLEXER_KEY
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+    from datetime import datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+# Sources with the most consumers listed in diagnostics
+MOST_SHARED_REPORTED = 10
+
+
+def parse_float(value: Any) -> float | None:
+    """Parse a state value to float, handling unavailable/unknown states."""
+    if value is None or value in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+class SourceReading(NamedTuple):
+    """A source entity's state, parsed once for all of its consumers."""
+
+    entity_id: str
+    # Raw state, None while the entity does not exist
+    state: str | None
+    # The state as a number, None if unavailable, unknown or not numeric
+    value: float | None
+    last_updated: datetime | None
+    # The state's attributes, shared with the state machine; None while the
+    # entity does not exist
+    attributes: Mapping[str, Any] | None = None
+
+    @classmethod
+    def from_state(cls, entity_id: str, state: State | None) -> SourceReading:
+        """Parse an entity's state object."""
+        if state is None:
+            return cls(entity_id, None, None, None)
+        return cls(
+            entity_id,
+            state.state,
+            parse_float(state.state),
+            state.last_updated,
+            state.attributes,
+        )
+
+    @property
+    def available(self) -> bool:
+        """Return True if the source has a known state."""
+        return self.state is not None and self.state not in (
+            STATE_UNAVAILABLE,
+            STATE_UNKNOWN,
+        )
+
+
+class _Source:
+    """One tracked entity, its consumers and its latest reading."""
+
+    __slots__ = ("consumers", "reading", "unsubscribe")
+
+    def __init__(self, reading: SourceReading) -> None:
+        """Initialize a source without consumers."""
+        self.reading = reading
+        # Rebuilt on (un)subscribe so delivery iterates a stable snapshot
+        self.consumers: tuple[Callable[[SourceReading], None], ...] = ()
+        self.unsubscribe: Callable[[], None] | None = None
+
+
+class StateChangeMultiplexer:
+    """Fan out state changes of source entities to in-process consumers."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the multiplexer."""
+        self.hass = hass
+        self._sources: dict[str, _Source] = {}
+        self._events = 0
+        self._deliveries = 0
+
+    @property
+    def subscription_count(self) -> int:
+        """Return the number of entities tracked in Home Assistant."""
+        return len(self._sources)
+
+    @property
+    def consumer_count(self) -> int:
+        """Return the number of registered consumers over all sources."""
+        return sum(len(source.consumers) for source in self._sources.values())
+
+    @callback
+    def async_subscribe(
+        self, entity_id: str, consumer: Callable[[SourceReading], None]
+    ) -> Callable[[], None]:
+        """
+        Deliver every change of ``entity_id`` to ``consumer``.
+
+        The entity is tracked on its first consumer. The returned callable
+        removes the consumer and stops tracking the entity after the last one;
+        calling it more than once has no further effect.
+        """
+        source = self._sources.get(entity_id)
+        if source is None:
+            source = _Source(
+                SourceReading.from_state(entity_id, self.hass.states.get(entity_id))
+            )
+            source.unsubscribe = async_track_state_change_event(
+                self.hass, entity_id, self._async_state_changed
+            )
+            self._sources[entity_id] = source
+        source.consumers = (*source.consumers, consumer)
+
+        removed = False
+
+        @callback
+        def _unsubscribe() -> None:
+            nonlocal removed
+            if not removed:
+                removed = True
+                self._async_remove(entity_id, consumer)
+
+        return _unsubscribe
+
+    def consumers(self, entity_id: str) -> tuple[Callable[[SourceReading], None], ...]:
+        """Return the consumers registered for an entity."""
+        if (source := self._sources.get(entity_id)) is not None:
+            return source.consumers
+        return ()
+
+    def reading(self, entity_id: str) -> SourceReading:
+        """Return the latest reading of an entity, tracked or not."""
+        if (source := self._sources.get(entity_id)) is not None:
+            return source.reading
+        return SourceReading.from_state(entity_id, self.hass.states.get(entity_id))
+
+    @callback
+    def async_unload(self) -> None:
+        """Stop tracking every entity and drop all consumers."""
+        for source in self._sources.values():
+            if source.unsubscribe is not None:
+                source.unsubscribe()
+        self._sources.clear()
+
+    @callback
+    def _async_remove(
+        self, entity_id: str, consumer: Callable[[SourceReading], None]
+    ) -> None:
+        """Remove a consumer and stop tracking its entity once none are left."""
+        source = self._sources.get(entity_id)
+        if source is None:
+            return
+        consumers = list(source.consumers)
+        try:
+            consumers.remove(consumer)
+        except ValueError:
+            return
+        source.consumers = tuple(consumers)
+        if consumers:
+            return
+
+        del self._sources[entity_id]
+        if source.unsubscribe is not None:
+            source.unsubscribe()
+
+    @profiled_callback
+    def _async_state_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Parse a state change once and deliver it to the entity's consumers."""
+        entity_id = event.data["entity_id"]
+        source = self._sources.get(entity_id)
+        if source is None:
+            return
+
+        reading = SourceReading.from_state(entity_id, event.data["new_state"])
+        source.reading = reading
+        self._events += 1
+        self._deliveries += len(source.consumers)
+        for consumer in source.consumers:
+            try:
+                consumer(reading)
+            except Exception:
+                _LOGGER.exception("Error delivering state change of %s", entity_id)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return subscription and delivery counts for diagnostics."""
+        consumers = {
+            entity_id: len(source.consumers)
+            for entity_id, source in self._sources.items()
+        }
+        return {
+            "subscriptions": len(consumers),
+            "consumers": sum(consumers.values()),
+            "shared_subscriptions": sum(1 for count in consumers.values() if count > 1),
+            "events": self._events,
+            "deliveries": self._deliveries,
+            "most_shared": dict(
+                sorted(consumers.items(), key=lambda item: -item[1])[
+                    :MOST_SHARED_REPORTED
+                ]
+            ),
+        }
+
+
+@callback
+def async_get_state_multiplexer(hass: HomeAssistant) -> StateChangeMultiplexer:
+    """Return the shared state change multiplexer, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    multiplexer: StateChangeMultiplexer | None = domain_data.get(STATE_MULTIPLEXER_KEY)
+    if not isinstance(multiplexer, StateChangeMultiplexer):
+        multiplexer = StateChangeMultiplexer(hass)
+        domain_data[STATE_MULTIPLEXER_KEY] = multiplexer
+    return multiplexer
+
+
+@callback
+def async_subscribe_source(
+    hass: HomeAssistant,
+    entity_ids: str | Iterable[str],
+    consumer: Callable[[SourceReading], None],
+) -> Callable[[], None]:
+    """
+    Subscribe a consumer to source entities through the shared multiplexer.
+
+    Like ``async_track_state_change_event``, accepts one entity_id or several
+    and returns a single callable that removes every subscription.
+    """
+    multiplexer = async_get_state_multiplexer(hass)
+    if isinstance(entity_ids, str):
+        return multiplexer.async_subscribe(entity_ids, consumer)
+
+    unsubscribes = [
+        multiplexer.async_subscribe(entity_id, consumer) for entity_id in entity_ids
+    ]
+
+    @callback
+    def _unsubscribe_all() -> None:
+        for unsubscribe in unsubscribes:
+            unsubscribe()
+
+    return _unsubscribe_all
+
+
+@callback
+def async_unload_state_multiplexer(hass: HomeAssistant) -> None:
+    """Stop tracking and remove the multiplexer from hass.data."""
+    domain_data = hass.data.get(DOMAIN)
+    if not isinstance(domain_data, dict):
+        return
+    multiplexer = domain_data.pop(STATE_MULTIPLEXER_KEY, None)
+    if isinstance(multiplexer, StateChangeMultiplexer):
+        multiplexer.async_unload()
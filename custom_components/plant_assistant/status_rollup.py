@@ -0,0 +1,101 @@
+"""
+Incremental roll-up of child statuses for Plant Assistant location sensors.
+
+The location Status and Ignored Statuses sensors summarise a handful of child
+entities as "N Issues" / "N Ignored". Rather than recounting every child on
+each change, a roll-up keeps the last known value per child together with a
+running set of active children, so each child transition is O(1).
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping
+
+
+class StatusRollup:
+    """Running count of active children for a location roll-up sensor."""
+
+    __slots__ = ("_active", "_children", "_version")
+
+    def __init__(self, children: Mapping[str, bool | None] | None = None) -> None:
+        """Initialize the roll-up, optionally with known child values."""
+        # child key -> last known value; None while the child is unavailable
+        self._children: dict[str, bool | None] = {}
+        self._active: set[str] = set()
+        self._version = 0
+        for key, active in (children or {}).items():
+            self.set(key, active=active)
+
+    def __len__(self) -> int:
+        """Return the number of tracked children."""
+        return len(self._children)
+
+    def __contains__(self, key: object) -> bool:
+        """Return True if ``key`` is a tracked child."""
+        return key in self._children
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the tracked children in the order they were added."""
+        return iter(self._children)
+
+    @property
+    def active_count(self) -> int:
+        """Return the number of children that are currently active."""
+        return len(self._active)
+
+    @property
+    def version(self) -> int:
+        """Return a counter that increases whenever a child changes."""
+        return self._version
+
+    def active(self) -> list[str]:
+        """Return the active children in the order they were added."""
+        return [key for key in self._children if key in self._active]
+
+    def get(self, key: str) -> bool | None:
+        """Return the last known value of a child."""
+        return self._children.get(key)
+
+    def set(self, key: str, *, active: bool | None) -> bool:
+        """
+        Record the value of a child.
+
+        Returns:
+            True if the child is new or its value changed.
+
+        """
+        if key in self._children and self._children[key] is active:
+            return False
+
+        self._children[key] = active
+        self._version += 1
+        if active is True:
+            self._active.add(key)
+        else:
+            self._active.discard(key)
+        return True
+
+    def discard(self, key: str) -> bool:
+        """
+        Stop tracking a child.
+
+        Returns:
+            True if the child was tracked.
+
+        """
+        if key not in self._children:
+            return False
+
+        del self._children[key]
+        self._active.discard(key)
+        self._version += 1
+        return True
+
+    def clear(self) -> None:
+        """Stop tracking all children."""
+        self._children.clear()
+        self._active.clear()
+        self._version += 1
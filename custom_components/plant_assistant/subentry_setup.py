@@ -0,0 +1,86 @@
+"""
+Concurrent per-location entity setup for the entity platforms.
+
+The sensor and binary_sensor platforms create a set of entities for every
+location subentry. The builders of different locations are independent, so
+they run concurrently with a bound on how many are in flight, rather than
+each location awaiting the previous one. The created entities are collected
+and added once every location is built; ``async_add_entities`` associates
+entities with a single subentry per call, so there is one call per location.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, cast
+
+from homeassistant.core import callback
+
+from .const import SUBENTRY_SETUP_CONCURRENCY
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping, Sequence
+
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_build_subentry_entities[EntityT: Entity](
+    subentries: Mapping[str, Any],
+    builder: Callable[[str, Any], Awaitable[list[EntityT]]],
+    limit: int = SUBENTRY_SETUP_CONCURRENCY,
+) -> dict[str, list[EntityT]]:
+    """
+    Run ``builder(subentry_id, subentry)`` for every subentry concurrently.
+
+    At most ``limit`` builders run at a time. Returns the entities of each
+    subentry in subentry order; a builder that raises is logged and its
+    location gets no entities, so it cannot fail the other locations.
+    """
+    semaphore = asyncio.Semaphore(max(limit, 1))
+
+    async def _build(subentry_id: str, subentry: Any) -> list[EntityT]:
+        async with semaphore:
+            return await builder(subentry_id, subentry)
+
+    results = await asyncio.gather(
+        *(
+            _build(subentry_id, subentry)
+            for subentry_id, subentry in subentries.items()
+        ),
+        return_exceptions=True,
+    )
+
+    entities: dict[str, list[EntityT]] = {}
+    for subentry_id, result in zip(subentries, results, strict=True):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            _LOGGER.error(
+                "Failed to create entities for subentry %s",
+                subentry_id,
+                exc_info=result,
+            )
+            continue
+        entities[subentry_id] = result
+    return entities
+
+
+@callback
+def async_add_subentry_entities(
+    async_add_entities: AddEntitiesCallback,
+    entities: Mapping[str, Sequence[Entity]],
+) -> None:
+    """Add the entities of each subentry, associated with their subentry."""
+    # Note: config_subentry_id exists in HA 2025.8.3+ but not in type hint
+    _add_entities = cast("Callable[..., Any]", async_add_entities)
+    for subentry_id, subentry_entities in entities.items():
+        if not subentry_entities:
+            continue
+        _LOGGER.debug(
+            "Adding %d entities for subentry %s", len(subentry_entities), subentry_id
+        )
+        _add_entities(list(subentry_entities), config_subentry_id=subentry_id)
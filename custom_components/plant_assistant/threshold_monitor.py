@@ -0,0 +1,705 @@
+"""
+Table-driven threshold monitors for Plant Assistant locations.
+
+Every location has a set of status monitors comparing a reading with its
+limits: soil moisture and conductivity against the plants' thresholds, the
+weekly hours spent above/below the temperature and humidity limits, the
+monitor's battery level and the weekly average daily light integral. Each
+monitor is declared as a ``ThresholdRule``, an ordered list of conditions
+that compare a source with a threshold or constant, with optional
+ignore-until windows and suppression after watering.
+
+Inputs are referred to by role, the unique_id suffix of one of the location's
+own entities as indexed by ``entity_index`` (e.g. ``min_soil_moisture``). A
+single ``LocationThresholdEvaluator`` per location resolves the roles of all
+its rules, consumes their entities' readings from the shared state
+multiplexer and on each change re-evaluates only the rules reading that
+input.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .callback_profiler import profiled_callback
+from .entity_index import async_find_location_entity
+from .ignore_until import async_get_ignore_until_scheduler, parse_ignore_until
+from .reconfigure import async_listen_subentry_removal
+from .state_multiplexer import async_get_state_multiplexer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Mapping
+
+    from .binary_sensor import ThresholdMonitorBinarySensor
+    from .state_multiplexer import SourceReading
+
+_LOGGER = logging.getLogger(__name__)
+
+NORMAL = "normal"
+
+# Battery level threshold (percentage) for low battery alert
+BATTERY_LEVEL_THRESHOLD = 10
+# Temperature and humidity alert once this many weekly hours are out of range
+THRESHOLD_HOURS = 2.0
+# Soil moisture "water soon" band above the low threshold, in percentage points
+WATER_SOON_MARGIN = 5
+
+# Timestamp of the location's last detected watering; high readings shortly
+# after watering are expected in zones without direct watering data
+WATERED_ROLE = "watered"
+WATERING_SUPPRESSION = timedelta(hours=24)
+
+
+@dataclass(frozen=True, slots=True)
+class IgnoreWindow:
+    """An ignore-until datetime entity and the attributes reporting it."""
+
+    role: str
+    attribute: str = "ignore_until"
+    ignoring_attribute: str = "currently_ignoring"
+
+
+@dataclass(frozen=True, slots=True)
+class ThresholdCondition:
+    """
+    One problem status of a rule.
+
+    The condition holds while the ``source`` reading is above (or below) the
+    ``threshold`` reading plus ``offset``, or ``offset`` alone without a
+    threshold role.
+    """
+
+    status: str
+    source: str
+    above: bool
+    threshold: str | None = None
+    offset: float = 0.0
+    inclusive: bool = False
+    ignore: IgnoreWindow | None = None
+    suppress_after_watering: bool = False
+    icon: str | None = None
+    alert_type: str = "Critical"
+    message: str | None = None
+    # Attribute reporting the effective limit, while the threshold is known
+    limit_attribute: str | None = None
+
+    @property
+    def inputs(self) -> tuple[str, ...]:
+        """Return the roles compared by the condition."""
+        if self.threshold is None:
+            return (self.source,)
+        return (self.source, self.threshold)
+
+    def limit(self, values: Mapping[str, Any]) -> float | None:
+        """Return the limit the source is compared with."""
+        if self.threshold is None:
+            return self.offset
+        threshold = values.get(self.threshold)
+        return None if threshold is None else threshold + self.offset
+
+    def holds(self, values: Mapping[str, Any]) -> bool:
+        """Return True if the condition holds for ``values``."""
+        value = float(values[self.source])
+        limit = self.limit(values)
+        if limit is None:
+            return False
+        if self.above:
+            return value >= limit if self.inclusive else value > limit
+        return value <= limit if self.inclusive else value < limit
+
+
+@dataclass(frozen=True, slots=True)
+class ThresholdRule:
+    """
+    A location status monitor, evaluated condition by condition.
+
+    The first condition that holds decides the status; an ignore-until window
+    or watering suppression on that condition reports normal instead. The
+    rule is unknown while any compared input is unavailable.
+    """
+
+    # unique_id suffix of the monitor, after the location name
+    key: str
+    name: str
+    message: str
+    icon: str
+    conditions: tuple[ThresholdCondition, ...]
+    # Role of the reading the monitor watches; the monitor is only created
+    # and available while it exists. None for monitors of derived sensors.
+    source: str | None = None
+    report_source: bool = False
+    # (attribute, role) pairs reporting the inputs
+    values: tuple[tuple[str, str], ...] = ()
+    constants: tuple[tuple[str, Any], ...] = ()
+    status_attribute: str | None = None
+    # Window suppressing every condition of the rule
+    ignore: IgnoreWindow | None = None
+    normal_alert_type: str = "Critical"
+    normal_message: str | None = None
+    task_when_normal: bool = True
+    required: tuple[str, ...] = field(init=False)
+    ignore_windows: tuple[IgnoreWindow, ...] = field(init=False)
+    # Roles whose values appear in the monitor's attributes
+    attribute_roles: tuple[str, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        """Derive the required inputs, ignore windows and attribute roles."""
+        required = dict.fromkeys(
+            role for condition in self.conditions for role in condition.inputs
+        )
+        windows = [self.ignore] + [condition.ignore for condition in self.conditions]
+        object.__setattr__(self, "required", tuple(required))
+        object.__setattr__(
+            self,
+            "ignore_windows",
+            tuple(window for window in windows if window is not None),
+        )
+        attribute_roles = dict.fromkeys(role for _attribute, role in self.values)
+        for condition in self.conditions:
+            if condition.limit_attribute is not None and condition.threshold:
+                attribute_roles[condition.threshold] = None
+        for window in self.ignore_windows:
+            attribute_roles[window.role] = None
+        object.__setattr__(self, "attribute_roles", tuple(attribute_roles))
+
+    @property
+    def suppressed_after_watering(self) -> bool:
+        """Return True if any condition is suppressed after watering."""
+        return any(condition.suppress_after_watering for condition in self.conditions)
+
+    def condition(self, status: str) -> ThresholdCondition | None:
+        """Return the condition reporting ``status``."""
+        for condition in self.conditions:
+            if condition.status == status:
+                return condition
+        return None
+
+    def evaluate(
+        self,
+        values: Mapping[str, Any],
+        now: datetime | None = None,
+    ) -> tuple[bool | None, str]:
+        """Return the problem state and status for ``values``."""
+        for role in self.required:
+            if values.get(role) is None:
+                return None, NORMAL
+
+        if self.ignore is not None:
+            now = now or dt_util.now()
+            if _ignoring(values, self.ignore, now):
+                return False, NORMAL
+
+        for condition in self.conditions:
+            if not condition.holds(values):
+                continue
+            if condition.ignore is None and not condition.suppress_after_watering:
+                return True, condition.status
+            now = now or dt_util.now()
+            if _ignoring(values, condition.ignore, now) or (
+                condition.suppress_after_watering
+                and _watered_recently(values.get(WATERED_ROLE), now)
+            ):
+                return False, NORMAL
+            return True, condition.status
+        return False, NORMAL
+
+    def icon_for(self, status: str) -> str:
+        """Return the icon for a status."""
+        if (condition := self.condition(status)) is not None:
+            return condition.icon or self.icon
+        return self.icon
+
+    def alert_attributes(self, status: str) -> dict[str, Any]:
+        """Return the alert type, message and task flag of a status."""
+        if (condition := self.condition(status)) is not None:
+            return {
+                "type": condition.alert_type,
+                "message": condition.message or f"{self.message} {status.capitalize()}",
+                "task": True,
+            }
+        return {
+            "type": self.normal_alert_type,
+            "message": self.normal_message or f"{self.message} {status.capitalize()}",
+            "task": self.task_when_normal,
+        }
+
+
+def _ignoring(
+    values: Mapping[str, Any], window: IgnoreWindow | None, now: datetime
+) -> bool:
+    """Return True while an ignore-until window is in the future."""
+    if window is None:
+        return False
+    deadline = values.get(window.role)
+    return isinstance(deadline, datetime) and now < deadline
+
+
+def _watered_recently(watered: Any, now: datetime) -> bool:
+    """Return True if the last watering is within the suppression period."""
+    return isinstance(watered, datetime) and now - watered < WATERING_SUPPRESSION
+
+
+_TEMPERATURE_HIGH_IGNORE = IgnoreWindow(
+    "temperature_high_threshold_ignore_until",
+    "high_threshold_ignore_until",
+    "currently_ignoring_high",
+)
+_TEMPERATURE_LOW_IGNORE = IgnoreWindow(
+    "temperature_low_threshold_ignore_until",
+    "low_threshold_ignore_until",
+    "currently_ignoring_low",
+)
+_HUMIDITY_HIGH_IGNORE = IgnoreWindow(
+    "humidity_high_threshold_ignore_until",
+    "high_threshold_ignore_until",
+    "currently_ignoring_high",
+)
+_HUMIDITY_LOW_IGNORE = IgnoreWindow(
+    "humidity_ignore_until",
+    "low_threshold_ignore_until",
+    "currently_ignoring_low",
+)
+_DLI_HIGH_IGNORE = IgnoreWindow(
+    "daily_light_integral_high_threshold_ignore_until",
+    "high_threshold_ignore_until",
+    "currently_ignoring_high",
+)
+_DLI_LOW_IGNORE = IgnoreWindow(
+    "daily_light_integral_low_threshold_ignore_until",
+    "low_threshold_ignore_until",
+    "currently_ignoring_low",
+)
+
+SOIL_MOISTURE_STATUS = ThresholdRule(
+    key="soil_moisture_status",
+    name="Soil Moisture Status",
+    message="Soil Moisture",
+    icon="mdi:water-check",
+    source="soil_moisture_mirror",
+    report_source=True,
+    conditions=(
+        ThresholdCondition(
+            "low",
+            "soil_moisture_mirror",
+            above=False,
+            threshold="min_soil_moisture",
+            icon="mdi:water-minus",
+        ),
+        ThresholdCondition(
+            "high",
+            "soil_moisture_mirror",
+            above=True,
+            threshold="max_soil_moisture",
+            suppress_after_watering=True,
+            icon="mdi:water-plus",
+        ),
+        ThresholdCondition(
+            "water_soon",
+            "soil_moisture_mirror",
+            above=False,
+            threshold="min_soil_moisture",
+            offset=WATER_SOON_MARGIN,
+            inclusive=True,
+            icon="mdi:watering-can",
+            alert_type="Warning",
+            limit_attribute="water_soon_threshold",
+        ),
+    ),
+    values=(
+        ("current_soil_moisture", "soil_moisture_mirror"),
+        ("minimum_soil_moisture_threshold", "min_soil_moisture"),
+        ("maximum_soil_moisture_threshold", "max_soil_moisture"),
+    ),
+    status_attribute="moisture_status",
+    ignore=IgnoreWindow("soil_moisture_ignore_until"),
+)
+
+SOIL_CONDUCTIVITY_STATUS = ThresholdRule(
+    key="soil_conductivity_status",
+    name="Soil Conductivity Status",
+    message="Soil Conductivity",
+    icon="mdi:flash-check",
+    source="soil_conductivity_mirror",
+    report_source=True,
+    conditions=(
+        ThresholdCondition(
+            "low",
+            "soil_conductivity_mirror",
+            above=False,
+            threshold="min_soil_conductivity",
+            icon="mdi:flash-off",
+        ),
+        ThresholdCondition(
+            "high",
+            "soil_conductivity_mirror",
+            above=True,
+            threshold="max_soil_conductivity",
+            suppress_after_watering=True,
+            icon="mdi:flash-alert",
+        ),
+    ),
+    values=(
+        ("current_soil_conductivity", "soil_conductivity_mirror"),
+        ("minimum_soil_conductivity_threshold", "min_soil_conductivity"),
+        ("maximum_soil_conductivity_threshold", "max_soil_conductivity"),
+    ),
+    status_attribute="conductivity_status",
+)
+
+TEMPERATURE_STATUS = ThresholdRule(
+    key="temperature_status",
+    name="Temperature Status",
+    message="Temperature",
+    icon="mdi:thermometer",
+    source="temperature_mirror",
+    conditions=(
+        ThresholdCondition(
+            "above",
+            "temperature_above_threshold_weekly_duration",
+            above=True,
+            offset=THRESHOLD_HOURS,
+            ignore=_TEMPERATURE_HIGH_IGNORE,
+            icon="mdi:thermometer-high",
+        ),
+        ThresholdCondition(
+            "below",
+            "temperature_below_threshold_weekly_duration",
+            above=True,
+            offset=THRESHOLD_HOURS,
+            ignore=_TEMPERATURE_LOW_IGNORE,
+            icon="mdi:thermometer-low",
+        ),
+    ),
+    values=(
+        ("above_threshold_hours", "temperature_above_threshold_weekly_duration"),
+        ("below_threshold_hours", "temperature_below_threshold_weekly_duration"),
+    ),
+    constants=(("threshold_hours", THRESHOLD_HOURS),),
+    status_attribute="temperature_status",
+)
+
+HUMIDITY_STATUS = ThresholdRule(
+    key="humidity_status",
+    name="Humidity Status",
+    message="Humidity",
+    icon="mdi:water-percent",
+    source="humidity_linked",
+    conditions=(
+        ThresholdCondition(
+            "above",
+            "humidity_above_threshold_weekly_duration",
+            above=True,
+            offset=THRESHOLD_HOURS,
+            ignore=_HUMIDITY_HIGH_IGNORE,
+            icon="mdi:water-percent",
+        ),
+        ThresholdCondition(
+            "below",
+            "humidity_below_threshold_weekly_duration",
+            above=True,
+            offset=THRESHOLD_HOURS,
+            ignore=_HUMIDITY_LOW_IGNORE,
+            icon="mdi:water-percent-alert",
+        ),
+    ),
+    values=(
+        ("above_threshold_hours", "humidity_above_threshold_weekly_duration"),
+        ("below_threshold_hours", "humidity_below_threshold_weekly_duration"),
+    ),
+    constants=(("threshold_hours", THRESHOLD_HOURS),),
+    status_attribute="humidity_status",
+)
+
+BATTERY_LEVEL_STATUS = ThresholdRule(
+    key="monitor_battery_level_status",
+    name="Monitor Battery Level Status",
+    message="Battery level",
+    icon="mdi:battery",
+    source="monitor_battery_level",
+    report_source=True,
+    conditions=(
+        ThresholdCondition(
+            "low",
+            "monitor_battery_level",
+            above=False,
+            offset=BATTERY_LEVEL_THRESHOLD,
+            icon="mdi:battery-alert",
+            message=f"Battery level low (< {BATTERY_LEVEL_THRESHOLD}%)",
+        ),
+    ),
+    values=(("current_battery_level", "monitor_battery_level"),),
+    ignore=IgnoreWindow("monitor_battery_low_threshold_ignore_until"),
+    normal_alert_type="Normal",
+    normal_message="Battery level normal",
+    task_when_normal=False,
+)
+
+DLI_STATUS = ThresholdRule(
+    key="dli_status",
+    name="Daily Light Integral Status",
+    message="Daily Light Integral",
+    icon="mdi:counter",
+    conditions=(
+        ThresholdCondition(
+            "above",
+            "daily_light_integral_weekly_average",
+            above=True,
+            threshold="max_dli",
+            ignore=_DLI_HIGH_IGNORE,
+            icon="mdi:white-balance-sunny",
+        ),
+        ThresholdCondition(
+            "below",
+            "daily_light_integral_weekly_average",
+            above=False,
+            threshold="min_dli",
+            ignore=_DLI_LOW_IGNORE,
+            icon="mdi:sun-compass",
+        ),
+    ),
+    values=(
+        ("weekly_average_dli", "daily_light_integral_weekly_average"),
+        ("minimum_dli_threshold", "min_dli"),
+        ("maximum_dli_threshold", "max_dli"),
+    ),
+    status_attribute="dli_status",
+)
+
+# Location status monitors in the order they are created
+THRESHOLD_RULES: tuple[ThresholdRule, ...] = (
+    SOIL_MOISTURE_STATUS,
+    SOIL_CONDUCTIVITY_STATUS,
+    TEMPERATURE_STATUS,
+    HUMIDITY_STATUS,
+    BATTERY_LEVEL_STATUS,
+    DLI_STATUS,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _TrackedInput:
+    """An input entity, the roles it fills and the rules reading them."""
+
+    roles: tuple[str, ...]
+    rule_keys: tuple[str, ...]
+    # Timestamps are parsed from the raw state, other inputs are numeric
+    timestamp: bool
+    ignore_until: bool
+
+
+class LocationThresholdEvaluator:
+    """Shared inputs and subscription of one location's threshold monitors."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        subentry_id: str,
+        location_name: str,
+        *,
+        has_esphome_device: bool = False,
+    ) -> None:
+        """
+        Initialize the evaluator.
+
+        Args:
+            hass: The Home Assistant instance.
+            subentry_id: The location's config subentry id.
+            location_name: The location name, used to resolve roles.
+            has_esphome_device: True if the zone reports waterings directly,
+                in which case readings are not suppressed after watering.
+
+        """
+        self.hass = hass
+        self.subentry_id = subentry_id
+        self.location_name = location_name
+        self.has_esphome_device = has_esphome_device
+        # rule key -> monitor, and the monitors currently added to hass
+        self._monitors: dict[str, ThresholdMonitorBinarySensor] = {}
+        self._attached: dict[str, ThresholdMonitorBinarySensor] = {}
+        # role -> parsed value of its entity's state
+        self._values: dict[str, Any] = {}
+        self._entity_ids: dict[str, str] = {}
+        self._inputs: dict[str, _TrackedInput] = {}
+        self._ignore_roles: tuple[str, ...] = ()
+        self._unsubscribes: list[Callable[[], None]] | None = None
+        self._ignore_until_registered = False
+
+    @property
+    def values(self) -> Mapping[str, Any]:
+        """Return the current input values by role."""
+        return self._values
+
+    @property
+    def subscribed(self) -> bool:
+        """Return True while the inputs are tracked."""
+        return self._unsubscribes is not None
+
+    def entity_id(self, role: str) -> str | None:
+        """Return the entity an input role resolved to."""
+        return self._entity_ids.get(role)
+
+    @callback
+    def async_add_monitor(self, monitor: ThresholdMonitorBinarySensor) -> None:
+        """Register a monitor; its rule's inputs are resolved on first attach."""
+        self._monitors[monitor.rule.key] = monitor
+
+    @callback
+    def async_attach(self, monitor: ThresholdMonitorBinarySensor) -> None:
+        """Start feeding a monitor added to hass, subscribing on the first."""
+        self._monitors[monitor.rule.key] = monitor
+        if not self.subscribed:
+            self._async_subscribe()
+        self._attached[monitor.rule.key] = monitor
+
+    @callback
+    def async_detach(self, monitor: ThresholdMonitorBinarySensor) -> None:
+        """Stop feeding a monitor, unsubscribing once none is left."""
+        self._attached.pop(monitor.rule.key, None)
+        if not self._attached:
+            self._async_unsubscribe()
+
+    @callback
+    def async_unload(self) -> None:
+        """Release everything held for a removed location."""
+        self._attached.clear()
+        self._async_unsubscribe()
+        self._inputs.clear()
+        self._entity_ids.clear()
+        self._values.clear()
+
+    @callback
+    def _async_unsubscribe(self) -> None:
+        """Stop tracking the inputs and ignore-until expiries."""
+        if self._unsubscribes is None:
+            return
+        for unsubscribe in self._unsubscribes:
+            unsubscribe()
+        self._unsubscribes = None
+        if self._ignore_until_registered:
+            async_get_ignore_until_scheduler(self.hass).async_cancel(self)
+            self._ignore_until_registered = False
+
+    def evaluate(self, rule: ThresholdRule) -> tuple[bool | None, str]:
+        """Return the state and status of ``rule`` for the current inputs."""
+        return rule.evaluate(self._values)
+
+    def _rule_roles(self, rule: ThresholdRule) -> Iterable[str]:
+        """Return every role a rule reads."""
+        yield from rule.required
+        for window in rule.ignore_windows:
+            yield window.role
+        if rule.suppressed_after_watering and not self.has_esphome_device:
+            yield WATERED_ROLE
+
+    @callback
+    def _async_subscribe(self) -> None:
+        """Resolve the inputs of every registered rule and track them."""
+        rules_by_role: dict[str, dict[str, None]] = {}
+        for rule in (monitor.rule for monitor in self._monitors.values()):
+            for role in self._rule_roles(rule):
+                rules_by_role.setdefault(role, {})[rule.key] = None
+        ignore_roles = {
+            window.role
+            for monitor in self._monitors.values()
+            for window in monitor.rule.ignore_windows
+        }
+        self._ignore_roles = tuple(ignore_roles)
+
+        roles_by_entity_id: dict[str, dict[str, None]] = {}
+        for role in rules_by_role:
+            domain = "datetime" if role in ignore_roles else "sensor"
+            result = async_find_location_entity(
+                self.hass, self.subentry_id, self.location_name, role, domain
+            )
+            if result is None:
+                _LOGGER.debug(
+                    "No %s entity found for location %s", role, self.location_name
+                )
+                self._values[role] = None
+                continue
+            self._entity_ids[role] = result[0]
+            roles_by_entity_id.setdefault(result[0], {})[role] = None
+
+        multiplexer = async_get_state_multiplexer(self.hass)
+        self._unsubscribes = [
+            async_listen_subentry_removal(
+                self.hass, self.subentry_id, self.async_unload
+            )
+        ]
+        for entity_id, roles in roles_by_entity_id.items():
+            tracked = _TrackedInput(
+                roles=tuple(roles),
+                rule_keys=tuple(
+                    dict.fromkeys(key for role in roles for key in rules_by_role[role])
+                ),
+                timestamp=not ignore_roles.isdisjoint(roles) or WATERED_ROLE in roles,
+                ignore_until=not ignore_roles.isdisjoint(roles),
+            )
+            self._inputs[entity_id] = tracked
+            self._unsubscribes.append(
+                multiplexer.async_subscribe(entity_id, self._async_input_changed)
+            )
+            self._store(tracked, multiplexer.reading(entity_id))
+
+        _LOGGER.debug(
+            "Tracking %d threshold inputs for location %s",
+            len(self._inputs),
+            self.location_name,
+        )
+        self._async_schedule_ignore_until_expiry()
+
+    def _store(self, tracked: _TrackedInput, reading: SourceReading) -> None:
+        """Set the roles of an input to its parsed reading."""
+        if tracked.timestamp:
+            value: Any = parse_ignore_until(reading.state)
+        else:
+            value = reading.value
+        for role in tracked.roles:
+            self._values[role] = value
+
+    @profiled_callback
+    def _async_input_changed(self, reading: SourceReading) -> None:
+        """Update the changed input and re-evaluate the rules reading it."""
+        tracked = self._inputs.get(reading.entity_id)
+        if tracked is None:
+            return
+        self._store(tracked, reading)
+        if tracked.ignore_until:
+            self._async_schedule_ignore_until_expiry()
+
+        attached = self._attached
+        for key in tracked.rule_keys:
+            if (monitor := attached.get(key)) is not None:
+                monitor.async_evaluate()
+
+    @callback
+    def _async_schedule_ignore_until_expiry(self) -> None:
+        """Register the earliest upcoming ignore-until deadline."""
+        now = dt_util.now()
+        upcoming = [
+            deadline
+            for role in self._ignore_roles
+            if isinstance(deadline := self._values.get(role), datetime)
+            and deadline > now
+        ]
+        if not upcoming and not self._ignore_until_registered:
+            return
+
+        async_get_ignore_until_scheduler(self.hass).async_schedule(
+            self, min(upcoming, default=None), self._async_ignore_until_expired
+        )
+        self._ignore_until_registered = True
+
+    @profiled_callback
+    def _async_ignore_until_expired(self) -> None:
+        """Re-evaluate the rules with an ignore-until window that ended."""
+        for monitor in list(self._attached.values()):
+            if monitor.rule.ignore_windows:
+                monitor.async_evaluate()
+        self._async_schedule_ignore_until_expiry()
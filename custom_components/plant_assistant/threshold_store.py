@@ -0,0 +1,260 @@
+"""
+Columnar store of plant threshold attributes.
+
+The list-of-dicts helpers in ``aggregation`` and ``dli`` coerce and validate
+every value each time a location sensor recomputes. The store instead keeps
+one ``array('d')`` column per threshold attribute with one row per plant.
+Values are coerced once when a plant's attributes change, and anything
+missing, non-numeric or non-finite is stored as NaN. Aggregating a location
+is then a reduction over a few float columns, and every aggregated metric of
+a location is computed in a single pass.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .dli import lux_to_dli
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+_NAN = math.nan
+
+# aggregation_type -> (reduction, metric_config key naming the column)
+_AGGREGATION_COLUMNS: dict[str, tuple[str, str]] = {
+    "max_of_mins": ("max", "plant_attr_min"),
+    "min_of_maximums": ("min", "plant_attr_max"),
+}
+
+
+class MetricSpec(NamedTuple):
+    """A compiled aggregated metric: which column to reduce, and how."""
+
+    metric_key: str
+    reduction: str
+    column: str
+    convert_to_dli: bool
+
+
+def threshold_float(value: Any) -> float:
+    """Coerce a threshold attribute to a float, or NaN if it is not usable."""
+    if value is None:
+        return _NAN
+    try:
+        fv = float(value)
+    except (TypeError, ValueError):
+        return _NAN
+    return fv if math.isfinite(fv) else _NAN
+
+
+def compile_metric_specs(
+    metric_configs: Mapping[str, Mapping[str, Any]],
+) -> list[MetricSpec]:
+    """
+    Compile aggregated sensor configurations into metric specs.
+
+    Configurations with an unknown aggregation type or without the matching
+    attribute key are skipped, so their metrics aggregate to None.
+    """
+    specs = []
+    for metric_key, config in metric_configs.items():
+        reduction, column_config_key = _AGGREGATION_COLUMNS.get(
+            config.get("aggregation_type", ""), ("", "")
+        )
+        column = config.get(column_config_key) if reduction else None
+        if column:
+            specs.append(
+                MetricSpec(
+                    metric_key,
+                    reduction,
+                    column,
+                    bool(config.get("convert_illuminance_to_dli")),
+                )
+            )
+    return specs
+
+
+def _reduce(
+    column: array[float], reduction: str, *, convert_to_dli: bool
+) -> float | None:
+    """Reduce one column, skipping NaN (and negative values for DLI)."""
+    if convert_to_dli:
+        # NaN >= 0 is False, so this also skips missing values
+        values: Iterable[float] = (v for v in column if v >= 0)
+    else:
+        values = filter(math.isfinite, column)
+
+    if reduction == "avg":
+        collected = list(values)
+        return sum(collected) / len(collected) if collected else None
+
+    if reduction == "max":
+        result = max(values, default=None)
+    elif reduction == "min":
+        result = min(values, default=None)
+    else:
+        return None
+    if result is not None and convert_to_dli:
+        # lux -> DLI is monotonic, so converting the extreme is equivalent to
+        # converting every value first
+        return lux_to_dli(result)
+    return result
+
+
+class PlantThresholdStore:
+    """Threshold attributes of a set of plants, stored column-wise."""
+
+    __slots__ = ("_columns", "_index", "_row_ids", "keys")
+
+    def __init__(self, keys: Iterable[str]) -> None:
+        """Initialize an empty store with one column per attribute key."""
+        self.keys = tuple(keys)
+        self._columns: dict[str, array[float]] = {key: array("d") for key in self.keys}
+        # row id (plant entity_id) -> row position in every column
+        self._index: dict[str, int] = {}
+        self._row_ids: list[str] = []
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self._row_ids)
+
+    def __contains__(self, row_id: object) -> bool:
+        """Return True if the store has a row for ``row_id``."""
+        return row_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over row ids in insertion order (until rows are removed)."""
+        return iter(self._row_ids)
+
+    def column(self, key: str) -> array[float]:
+        """Return the column for an attribute key."""
+        return self._columns[key]
+
+    def set_row(self, row_id: str, attributes: Mapping[str, Any] | None) -> bool:
+        """
+        Store the threshold attributes of a plant.
+
+        ``attributes`` of None (e.g. the plant is unavailable) stores a row
+        of NaN so the plant stays tracked but contributes no values.
+
+        Returns:
+            True if the row is new or any stored value changed.
+
+        """
+        attrs = attributes or {}
+        position = self._index.get(row_id)
+        if position is None:
+            self._index[row_id] = len(self._row_ids)
+            self._row_ids.append(row_id)
+            for key, column in self._columns.items():
+                column.append(threshold_float(attrs.get(key)))
+            return True
+
+        changed = False
+        for key, column in self._columns.items():
+            value = threshold_float(attrs.get(key))
+            current = column[position]
+            # NaN never equals itself, so compare missing values explicitly
+            if value != current and not (math.isnan(value) and math.isnan(current)):
+                column[position] = value
+                changed = True
+        return changed
+
+    def discard_row(self, row_id: str) -> bool:
+        """
+        Remove a plant's row, moving the last row into its place.
+
+        Returns:
+            True if the row existed.
+
+        """
+        position = self._index.pop(row_id, None)
+        if position is None:
+            return False
+
+        last_id = self._row_ids.pop()
+        for column in self._columns.values():
+            last_value = column.pop()
+            if last_id != row_id:
+                column[position] = last_value
+        if last_id != row_id:
+            self._row_ids[position] = last_id
+            self._index[last_id] = position
+        return True
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self._index.clear()
+        self._row_ids.clear()
+        for key in self.keys:
+            self._columns[key] = array("d")
+
+    def rows(self) -> list[dict[str, float]]:
+        """Return one dictionary per row with at least one stored value."""
+        out = []
+        for position in range(len(self._row_ids)):
+            row = {
+                key: value
+                for key, column in self._columns.items()
+                if not math.isnan(value := column[position])
+            }
+            if row:
+                out.append(row)
+        return out
+
+    def aggregate(
+        self, reduction: str, key: str, *, convert_to_dli: bool = False
+    ) -> float | None:
+        """
+        Reduce one column with ``min``, ``max`` or ``avg``.
+
+        Returns:
+            The aggregated value, or None if the column has no usable values.
+
+        """
+        column = self._columns.get(key)
+        if column is None:
+            return None
+        return _reduce(column, reduction, convert_to_dli=convert_to_dli)
+
+    def aggregate_specs(self, specs: Iterable[MetricSpec]) -> dict[str, float | None]:
+        """Compute several compiled metrics, reducing each column only once."""
+        reduced: dict[tuple[str, str, bool], float | None] = {}
+        results: dict[str, float | None] = {}
+        for spec in specs:
+            cache_key = (spec.reduction, spec.column, spec.convert_to_dli)
+            if cache_key not in reduced:
+                reduced[cache_key] = self.aggregate(
+                    spec.reduction, spec.column, convert_to_dli=spec.convert_to_dli
+                )
+            results[spec.metric_key] = reduced[cache_key]
+        return results
+
+    def aggregate_metrics(
+        self, metric_configs: Mapping[str, Mapping[str, Any]]
+    ) -> dict[str, float | None]:
+        """Compute every configured aggregated metric in one pass."""
+        results = dict.fromkeys(metric_configs)
+        results.update(self.aggregate_specs(compile_metric_specs(metric_configs)))
+        return results
+
+
+def aggregate_locations(
+    stores: Mapping[str, PlantThresholdStore],
+    metric_configs: Mapping[str, Mapping[str, Any]],
+) -> dict[str, dict[str, float | None]]:
+    """
+    Compute every configured metric for many locations at once.
+
+    Used after a (re)load to recompute the whole install: the metric
+    configurations are compiled once and applied to every location's store.
+    """
+    specs = compile_metric_specs(metric_configs)
+    empty = dict.fromkeys(metric_configs)
+    return {
+        location: {**empty, **store.aggregate_specs(specs)}
+        for location, store in stores.items()
+    }
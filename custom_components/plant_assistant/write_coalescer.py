@@ -0,0 +1,168 @@
+"""
+Coalesced state writes for Plant Assistant entities.
+
+A single gateway event or threshold change can make the same entity write
+its state several times within one loop iteration, for example when every
+aggregated location sensor recomputes and the low/high/status monitors
+cascade behind them. Each write costs a state machine update, a recorder
+row and a websocket message. Entities using ``CoalescedWriteMixin`` instead
+mark themselves dirty in a shared set that is flushed once per event loop
+tick (or after a configurable debounce), so every entity writes at most once
+per flush.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .callback_profiler import profiled_callback
+from .const import DEFAULT_STATE_WRITE_DEBOUNCE, DOMAIN, WRITE_COALESCER_KEY
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from datetime import datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class StateWriteCoalescer:
+    """Integration-wide set of entities waiting to write their state."""
+
+    def __init__(
+        self, hass: HomeAssistant, debounce: float = DEFAULT_STATE_WRITE_DEBOUNCE
+    ) -> None:
+        """
+        Initialize the coalescer.
+
+        Args:
+            hass: The Home Assistant instance.
+            debounce: Seconds to wait before flushing. Zero flushes on the
+                next event loop tick.
+
+        """
+        self.hass = hass
+        self.debounce = debounce
+        # entity -> its real write; insertion order is the flush order
+        self._dirty: dict[Any, Callable[[], None]] = {}
+        self._cancel_flush: Callable[[], None] | None = None
+        self.writes = 0
+        self.suppressed_writes = 0
+        self.flushes = 0
+
+    def __len__(self) -> int:
+        """Return the number of entities waiting to write."""
+        return len(self._dirty)
+
+    @callback
+    def async_mark_dirty(self, entity: Any, write: Callable[[], None]) -> None:
+        """Queue a state write for ``entity``, merging repeated requests."""
+        if entity in self._dirty:
+            self.suppressed_writes += 1
+            return
+
+        self._dirty[entity] = write
+        if self._cancel_flush is None:
+            self._async_schedule_flush()
+
+    @callback
+    def _async_schedule_flush(self) -> None:
+        """Arm the flush for the next tick or after the debounce."""
+        if self.debounce > 0:
+            self._cancel_flush = async_call_later(
+                self.hass, self.debounce, self._async_flush_later
+            )
+            return
+
+        handle = self.hass.loop.call_soon(self.async_flush)
+        self._cancel_flush = handle.cancel
+
+    @profiled_callback
+    def _async_flush_later(self, _now: datetime) -> None:
+        """Flush once the debounce has elapsed."""
+        self.async_flush()
+
+    @callback
+    def async_flush(self) -> None:
+        """Write the state of every dirty entity once."""
+        self._cancel_flush = None
+        dirty, self._dirty = self._dirty, {}
+        if not dirty:
+            return
+
+        self.flushes += 1
+        for write in dirty.values():
+            self.writes += 1
+            try:
+                write()
+            except Exception:
+                _LOGGER.exception("Error writing coalesced entity state")
+
+    @callback
+    def async_discard(self, entity: Any) -> None:
+        """Drop a pending write, e.g. when the entity is removed."""
+        self._dirty.pop(entity, None)
+
+    @callback
+    def async_unload(self) -> None:
+        """Cancel the pending flush and drop queued writes."""
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        self._dirty.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return counters for diagnostics."""
+        return {
+            "debounce": self.debounce,
+            "pending": len(self._dirty),
+            "flushes": self.flushes,
+            "writes": self.writes,
+            "suppressed_writes": self.suppressed_writes,
+        }
+
+
+class CoalescedWriteMixin:
+    """Route ``async_write_ha_state`` through the shared write coalescer."""
+
+    hass: HomeAssistant
+    _write_coalescer_registered: bool = False
+
+    @profiled_callback
+    def async_write_ha_state(self) -> None:
+        """Queue a state write, merged with others in the same flush."""
+        coalescer = async_get_write_coalescer(self.hass)
+        if not self._write_coalescer_registered:
+            self._write_coalescer_registered = True
+            self.async_on_remove(  # type: ignore[attr-defined]
+                lambda: coalescer.async_discard(self)
+            )
+        coalescer.async_mark_dirty(
+            self,
+            super().async_write_ha_state,  # type: ignore[misc]
+        )
+
+
+@callback
+def async_get_write_coalescer(hass: HomeAssistant) -> StateWriteCoalescer:
+    """Return the shared write coalescer, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    coalescer: StateWriteCoalescer | None = domain_data.get(WRITE_COALESCER_KEY)
+    if not isinstance(coalescer, StateWriteCoalescer):
+        coalescer = StateWriteCoalescer(hass)
+        domain_data[WRITE_COALESCER_KEY] = coalescer
+    return coalescer
+
+
+@callback
+def async_unload_write_coalescer(hass: HomeAssistant) -> None:
+    """Cancel the shared coalescer's flush and remove it from hass.data."""
+    domain_data = hass.data.get(DOMAIN)
+    if not isinstance(domain_data, dict):
+        return
+    coalescer = domain_data.pop(WRITE_COALESCER_KEY, None)
+    if isinstance(coalescer, StateWriteCoalescer):
+        coalescer.async_unload()
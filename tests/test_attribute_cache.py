@@ -0,0 +1,42 @@
+"""Tests for the cached, read-only state attributes."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.plant_assistant.attribute_cache import AttributeCache
+
+
+def test_builds_once_per_key():
+    """Test that the builder only runs when the key changes."""
+    cache = AttributeCache()
+    build = MagicMock(side_effect=lambda: {"count": build.call_count})
+
+    first = cache.get(1, build)
+    assert cache.get(1, build) is first
+    assert build.call_count == 1
+    assert first == {"count": 1}
+
+    assert cache.get(2, build) == {"count": 2}
+    assert cache.builds == 2
+
+
+def test_attributes_are_read_only():
+    """Test that the cached mapping cannot be modified."""
+    cache = AttributeCache()
+    attrs = cache.get("key", lambda: {"message": "1 Ignored"})
+
+    with pytest.raises(TypeError):
+        attrs["message"] = "2 Ignored"  # type: ignore[index]
+
+
+def test_clear_rebuilds():
+    """Test that clearing drops the cached mapping."""
+    cache = AttributeCache()
+    build = MagicMock(return_value={})
+
+    cache.get(None, build)
+    cache.clear()
+    cache.get(None, build)
+
+    assert build.call_count == 2
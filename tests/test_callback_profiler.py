@@ -0,0 +1,178 @@
+"""Tests for the opt-in entity callback profiler."""
+
+import sys
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+from homeassistant.core import callback, is_callback
+from homeassistant.helpers.entity import Entity
+
+from custom_components.plant_assistant.binary_sensor import (
+    ThresholdMonitorBinarySensor,
+)
+from custom_components.plant_assistant.callback_profiler import (
+    PROFILED_MODULES,
+    CallbackProfiler,
+    CallbackStats,
+    async_enable_callback_profiler,
+    async_get_callback_profiler,
+    async_unload_callback_profiler,
+    profiled_callback,
+)
+from custom_components.plant_assistant.const import CALLBACK_PROFILER_KEY, DOMAIN
+from custom_components.plant_assistant.sensor import AggregatedLocationSensor
+from custom_components.plant_assistant.state_multiplexer import (
+    StateChangeMultiplexer,
+)
+from custom_components.plant_assistant.threshold_monitor import (
+    LocationThresholdEvaluator,
+)
+from custom_components.plant_assistant.write_coalescer import CoalescedWriteMixin
+
+MODULE = "custom_components.plant_assistant.callback_profiler"
+
+
+class WriteMixin:
+    """Mixin with a profiled handler."""
+
+    @profiled_callback
+    def _async_flush(self):
+        """Handle a timer."""
+
+
+class ProfiledSensor(WriteMixin, Entity):
+    """Entity with a profiled, a plain callback and an ordinary method."""
+
+    def __init__(self, entity_id):
+        """Initialize the entity."""
+        self.entity_id = entity_id
+        self.changes = []
+
+    @profiled_callback
+    def _source_state_changed(self, event):
+        """Handle a source state change."""
+        self.changes.append(event)
+
+    @callback
+    def _subscribe(self):
+        """Set up, not an event handler."""
+
+    def _helper(self):
+        """Not a callback."""
+
+
+ORIGINAL = ProfiledSensor.__dict__["_source_state_changed"]
+SUBSCRIBE = ProfiledSensor.__dict__["_subscribe"]
+HELPER = ProfiledSensor.__dict__["_helper"]
+MODULES = (sys.modules[__name__],)
+
+
+@pytest.fixture
+def profiler():
+    """Return a profiler that is disabled again after the test."""
+    profiler = CallbackProfiler()
+    yield profiler
+    profiler.async_disable()
+
+
+def test_disabled_profiler_leaves_callbacks_untouched(profiler):
+    """Test that nothing is wrapped until profiling is enabled."""
+    assert ProfiledSensor.__dict__["_source_state_changed"] is ORIGINAL
+    assert profiler.as_dict() == {"enabled": False, "classes": {}}
+
+
+def test_enabled_profiler_records_calls(profiler):
+    """Test call counts, percentiles and slowest calls per entity class."""
+    profiler.async_enable(MODULES)
+    sensor = ProfiledSensor("sensor.bed")
+
+    handler = sensor._source_state_changed
+    for event in range(3):
+        handler(event)
+
+    assert sensor.changes == [0, 1, 2]
+    assert is_callback(ProfiledSensor._source_state_changed)
+    assert ProfiledSensor.__dict__["_subscribe"] is SUBSCRIBE
+    assert ProfiledSensor.__dict__["_helper"] is HELPER
+    sensor._async_flush()
+
+    stats = profiler.as_dict()["classes"]["ProfiledSensor"]
+    assert stats["callbacks"]["_source_state_changed"]["calls"] == 3
+    assert stats["callbacks"]["WriteMixin._async_flush"]["calls"] == 1
+    assert set(stats["callbacks"]) == {
+        "_source_state_changed",
+        "WriteMixin._async_flush",
+    }
+    slowest = stats["slowest_recent"]
+    assert len(slowest) == 4
+    assert slowest[0]["entity_id"] == "sensor.bed"
+    assert slowest[0]["duration_ms"] >= slowest[-1]["duration_ms"]
+
+    profiler.async_disable()
+    assert ProfiledSensor.__dict__["_source_state_changed"] is ORIGINAL
+
+
+def test_callback_stats_percentiles():
+    """Test the nearest-rank percentiles in milliseconds."""
+    stats = CallbackStats()
+    for duration in range(1, 101):
+        stats.record(duration / 1000)
+
+    result = stats.as_dict()
+
+    assert result["calls"] == 100
+    assert result["p50_ms"] == 50
+    assert result["p95_ms"] == 95
+    assert result["p99_ms"] == 99
+    assert result["max_ms"] == 100
+
+
+def test_unload_restores_callbacks():
+    """Test that unloading the shared profiler restores the callbacks."""
+    hass = MagicMock()
+    hass.data = {}
+    async_get_callback_profiler(hass).async_enable(MODULES)
+    assert ProfiledSensor.__dict__["_source_state_changed"] is not ORIGINAL
+
+    async_unload_callback_profiler(hass)
+
+    assert ProfiledSensor.__dict__["_source_state_changed"] is ORIGINAL
+    assert CALLBACK_PROFILER_KEY not in hass.data[DOMAIN]
+
+
+def test_enable_wraps_loaded_handlers(profiler):
+    """Test that the default modules cover the services and skip setup helpers."""
+    handlers = [
+        (LocationThresholdEvaluator, "_async_input_changed"),
+        (ThresholdMonitorBinarySensor, "async_evaluate"),
+        (StateChangeMultiplexer, "_async_state_changed"),
+        (CoalescedWriteMixin, "async_write_ha_state"),
+    ]
+    originals = [vars(cls)[name] for cls, name in handlers]
+    subscribe = vars(AggregatedLocationSensor)["_subscribe_plant_snapshot"]
+
+    profiler.async_enable()
+
+    for (cls, name), original in zip(handlers, originals, strict=True):
+        assert vars(cls)[name] is not original
+        assert is_callback(vars(cls)[name])
+    assert vars(AggregatedLocationSensor)["_subscribe_plant_snapshot"] is subscribe
+
+    profiler.async_disable()
+    for (cls, name), original in zip(handlers, originals, strict=True):
+        assert vars(cls)[name] is original
+
+
+async def test_enable_imports_platforms_in_executor():
+    """Test that the platform modules are imported before profiling starts."""
+    hass = MagicMock()
+    hass.data = {}
+    with patch(f"{MODULE}.async_import_module") as import_module:
+        await async_enable_callback_profiler(hass)
+
+    assert import_module.await_args_list == [
+        call(hass, f"custom_components.plant_assistant.{name}")
+        for name in PROFILED_MODULES
+    ]
+    assert async_get_callback_profiler(hass).enabled
+    async_unload_callback_profiler(hass)
@@ -3,13 +3,25 @@
 from unittest.mock import AsyncMock, Mock
 
 import pytest
+from homeassistant.data_entry_flow import section
 from homeassistant.helpers import device_registry as dr
 
-from custom_components.plant_assistant.config_flow import ConfigFlow
+from custom_components.plant_assistant.config_flow import (
+    ConfigFlow,
+    OptionsFlowHandler,
+)
 from custom_components.plant_assistant.const import (
+    CONF_CALLBACK_PROFILING,
     CONF_LINKED_DEVICE_ID,
+    CONF_MIRROR_DEADBAND,
+    CONF_MIRROR_MIN_INTERVAL,
+    CONF_MIRROR_RELATIVE_DEADBAND,
+    CONF_MIRROR_WRITE_FILTERS,
     CONF_NAME,
+    CONF_STATE_WRITE_DEBOUNCE,
+    DEFAULT_STATE_WRITE_DEBOUNCE,
     DOMAIN,
+    MIRROR_WRITE_FILTER_SENSOR_TYPES,
     STEP_DEVICE_SELECTION,
     STEP_MANUAL_NAME,
     STORAGE_VERSION,
@@ -184,3 +196,116 @@ async def test_unique_id_generation():
     # Should create unique ID by sanitizing the name
     expected_unique_id = f"{DOMAIN}_my_plant_assistant_zone"
     flow.async_set_unique_id.assert_called_once_with(expected_unique_id)
+
+
+def _options_flow(options):
+    """Create an options flow for a main entry with ``options``."""
+    entry = Mock(entry_id="entry", data={}, options=options)
+    flow = OptionsFlowHandler()
+    flow.hass = Mock()
+    flow.hass.config_entries.async_get_known_entry = Mock(return_value=entry)
+    flow.handler = entry.entry_id
+    return flow
+
+
+def _schema_defaults(result):
+    """Return the default of every field of a form's schema, sections nested."""
+    defaults = {}
+    for key, value in result["data_schema"].schema.items():
+        if isinstance(value, section):
+            defaults[str(key)] = _schema_defaults({"data_schema": value.schema})
+        else:
+            defaults[str(key)] = key.default()
+    return defaults
+
+
+@pytest.mark.asyncio
+async def test_options_flow_shows_current_options():
+    """Test the options form defaults to the entry's current options."""
+    flow = _options_flow({"irrigation_zones": {}})
+
+    result = await flow.async_step_init()
+
+    assert result.get("type") == "form"
+    assert result.get("step_id") == "init"
+    defaults = _schema_defaults(result)
+    assert defaults[CONF_STATE_WRITE_DEBOUNCE] == DEFAULT_STATE_WRITE_DEBOUNCE
+    assert defaults[CONF_CALLBACK_PROFILING] is False
+
+    flow = _options_flow(
+        {CONF_STATE_WRITE_DEBOUNCE: 2.5, CONF_CALLBACK_PROFILING: True}
+    )
+    defaults = _schema_defaults(await flow.async_step_init())
+    assert defaults[CONF_STATE_WRITE_DEBOUNCE] == 2.5
+    assert defaults[CONF_CALLBACK_PROFILING] is True
+
+
+@pytest.mark.asyncio
+async def test_options_flow_keeps_zones():
+    """Test saving the options keeps the zones and locations."""
+    zones = {"zone-1": {"id": "zone-1", "locations": {}}}
+    flow = _options_flow({"version": STORAGE_VERSION, "irrigation_zones": zones})
+
+    result = await flow.async_step_init(
+        {CONF_STATE_WRITE_DEBOUNCE: 1.0, CONF_CALLBACK_PROFILING: True}
+    )
+
+    assert result.get("type") == "create_entry"
+    assert result.get("data") == {
+        "version": STORAGE_VERSION,
+        "irrigation_zones": zones,
+        CONF_STATE_WRITE_DEBOUNCE: 1.0,
+        CONF_CALLBACK_PROFILING: True,
+        CONF_MIRROR_WRITE_FILTERS: {},
+    }
+
+
+@pytest.mark.asyncio
+async def test_options_flow_mirror_write_filters():
+    """Test the write filters are edited in one section per sensor type."""
+    moisture = {
+        CONF_MIRROR_DEADBAND: 0.5,
+        CONF_MIRROR_RELATIVE_DEADBAND: 0,
+        CONF_MIRROR_MIN_INTERVAL: 60,
+    }
+    flow = _options_flow({CONF_MIRROR_WRITE_FILTERS: {"soil_moisture": moisture}})
+
+    defaults = _schema_defaults(await flow.async_step_init())
+
+    assert [key for key in defaults if key in MIRROR_WRITE_FILTER_SENSOR_TYPES] == [
+        "temperature",
+        "illuminance",
+        "soil_moisture",
+        "soil_conductivity",
+        "battery",
+        "signal_strength",
+        "humidity",
+    ]
+    assert defaults["soil_moisture"] == moisture
+    assert defaults["humidity"] == {
+        CONF_MIRROR_DEADBAND: 0,
+        CONF_MIRROR_RELATIVE_DEADBAND: 0,
+        CONF_MIRROR_MIN_INTERVAL: 0,
+    }
+
+    disabled = defaults["humidity"]
+    humidity = {**disabled, CONF_MIRROR_RELATIVE_DEADBAND: 0.01}
+    result = await flow.async_step_init(
+        {
+            CONF_STATE_WRITE_DEBOUNCE: 0.0,
+            CONF_CALLBACK_PROFILING: False,
+            "soil_moisture": disabled,
+            "humidity": humidity,
+        }
+    )
+
+    # Sensor types left at 0 are not stored
+    assert result.get("data", {})[CONF_MIRROR_WRITE_FILTERS] == {"humidity": humidity}
+
+
+def test_options_flow_only_for_main_entries():
+    """Test legacy location entries do not offer options."""
+    assert ConfigFlow.async_supports_options_flow(Mock(data={}))
+    assert not ConfigFlow.async_supports_options_flow(
+        Mock(data={"parent_entry_id": "main"})
+    )
@@ -0,0 +1,32 @@
+"""Tests for the shared device info of Plant Assistant entities."""
+
+from custom_components.plant_assistant.const import DOMAIN
+from custom_components.plant_assistant.device import shared_device_info
+
+
+def test_same_description_shares_one_device_info():
+    """Test that entities of one device get the same DeviceInfo object."""
+    first = shared_device_info((DOMAIN, "location_1"))
+
+    assert shared_device_info((DOMAIN, "location_1")) is first
+    assert first == {"identifiers": {(DOMAIN, "location_1")}}
+
+
+def test_descriptions_are_kept_apart():
+    """Test that differing identifiers or details build separate DeviceInfos."""
+    plain = shared_device_info((DOMAIN, "location_1"))
+    named = shared_device_info(
+        (DOMAIN, "location_1"),
+        name="Balcony",
+        manufacturer="Plant Assistant",
+        model="Plant Location Device",
+    )
+
+    assert named is not plain
+    assert named == {
+        "identifiers": {(DOMAIN, "location_1")},
+        "name": "Balcony",
+        "manufacturer": "Plant Assistant",
+        "model": "Plant Location Device",
+    }
+    assert shared_device_info((DOMAIN, "location_2")) != plain
@@ -0,0 +1,193 @@
+"""Tests for event-driven monitoring device availability."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event
+
+from custom_components.plant_assistant.binary_sensor import (
+    LinkMonitorBinarySensor,
+    LinkMonitorConfig,
+)
+from custom_components.plant_assistant.const import DEVICE_AVAILABILITY_KEY, DOMAIN
+from custom_components.plant_assistant.device_availability import (
+    async_get_device_availability_tracker,
+    async_unload_device_availability_trackers,
+)
+
+MODULE = "custom_components.plant_assistant.device_availability"
+
+
+def _entry(entity_id):
+    entry = MagicMock()
+    entry.entity_id = entity_id
+    return entry
+
+
+def _state(state):
+    return MagicMock(state=state)
+
+
+def _changed(entity_id, state):
+    return Event(
+        "state_changed",
+        {
+            "entity_id": entity_id,
+            "old_state": None,
+            "new_state": _state(state) if state is not None else None,
+        },
+    )
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance with a two-entity device."""
+    hass = MagicMock()
+    hass.data = {}
+    states = {
+        "sensor.probe_moisture": _state("41"),
+        "sensor.probe_battery": _state(STATE_UNAVAILABLE),
+    }
+    hass.states.get = MagicMock(side_effect=states.get)
+    return hass
+
+
+@pytest.fixture
+def device_entries():
+    """Patch the device index lookups and state tracking."""
+    entries = [_entry("sensor.probe_moisture"), _entry("sensor.probe_battery")]
+    with (
+        patch(
+            f"{MODULE}.async_get_device_entries",
+            side_effect=lambda _hass, _device_id: list(entries),
+        ),
+        patch(f"{MODULE}.async_track_state_change_event") as track,
+    ):
+        yield entries, track
+
+
+@pytest.mark.usefixtures("device_entries")
+def test_initial_counts(mock_hass):
+    """Test that the tracker counts the device's entities once."""
+    tracker = async_get_device_availability_tracker(mock_hass, "probe")
+
+    assert tracker.available_count == 1
+    assert tracker.unavailable_count == 1
+    assert tracker.available is True
+    assert mock_hass.data[DOMAIN][DEVICE_AVAILABILITY_KEY]["probe"] is tracker
+
+
+def test_transitions_are_counted_without_reading_states(mock_hass, device_entries):
+    """Test that transitions update counters and notify only on a flip."""
+    _entries, track = device_entries
+    tracker = async_get_device_availability_tracker(mock_hass, "probe")
+    listener = MagicMock()
+    tracker.async_add_listener(listener)
+    track.assert_called_once()
+    mock_hass.states.get.reset_mock()
+
+    tracker._handle_state_changed(_changed("sensor.probe_moisture", "40"))
+    listener.assert_not_called()
+
+    tracker._handle_state_changed(_changed("sensor.probe_moisture", STATE_UNKNOWN))
+    assert tracker.available is False
+    listener.assert_called_once()
+
+    tracker._handle_state_changed(_changed("sensor.probe_battery", "88"))
+    assert tracker.available is True
+    assert listener.call_count == 2
+
+    tracker._handle_state_changed(_changed("sensor.probe_battery", None))
+    tracker._handle_state_changed(_changed("sensor.other", "1"))
+    assert (tracker.available_count, tracker.unavailable_count) == (0, 1)
+    assert tracker.available is False
+    assert listener.call_count == 3
+    mock_hass.states.get.assert_not_called()
+
+
+def test_registry_change_recounts(mock_hass, device_entries):
+    """Test that an entity joining the device triggers a recount."""
+    entries, track = device_entries
+    tracker = async_get_device_availability_tracker(mock_hass, "probe")
+    tracker.async_add_listener(MagicMock())
+
+    tracker._handle_entity_registry_updated(
+        Event("entity_registry_updated", {"action": "create", "entity_id": "x.y"})
+    )
+    assert track.call_count == 1
+
+    entries.append(_entry("sensor.probe_temperature"))
+    tracker._handle_entity_registry_updated(
+        Event(
+            "entity_registry_updated",
+            {"action": "create", "entity_id": "sensor.probe_temperature"},
+        )
+    )
+
+    assert "sensor.probe_temperature" in tracker.entity_ids
+    assert track.call_count == 2
+    track.return_value.assert_called_once()
+
+
+def test_last_listener_drops_tracker(mock_hass, device_entries):
+    """Test that the tracker is dropped when no link sensor uses it."""
+    _entries, track = device_entries
+    tracker = async_get_device_availability_tracker(mock_hass, "probe")
+    remove_first = tracker.async_add_listener(MagicMock())
+    remove_second = tracker.async_add_listener(MagicMock())
+
+    remove_first()
+    assert "probe" in mock_hass.data[DOMAIN][DEVICE_AVAILABILITY_KEY]
+    remove_second()
+
+    track.return_value.assert_called_once()
+    mock_hass.bus.async_listen.return_value.assert_called_once()
+    assert "probe" not in mock_hass.data[DOMAIN][DEVICE_AVAILABILITY_KEY]
+
+
+@pytest.mark.usefixtures("device_entries")
+def test_unload_stops_trackers(mock_hass):
+    """Test that unloading removes every tracker."""
+    async_get_device_availability_tracker(mock_hass, "probe").async_add_listener(
+        MagicMock()
+    )
+
+    async_unload_device_availability_trackers(mock_hass)
+
+    assert DEVICE_AVAILABILITY_KEY not in mock_hass.data[DOMAIN]
+
+
+@pytest.mark.usefixtures("device_entries")
+async def test_link_sensor_flips_when_last_entity_goes_unavailable(mock_hass):
+    """Test that the link sensor follows the tracker without recounting."""
+    sensor = LinkMonitorBinarySensor(
+        LinkMonitorConfig(
+            hass=mock_hass,
+            entry_id="entry",
+            location_name="Bed",
+            irrigation_zone_name="Zone",
+            monitoring_device_id="probe",
+            location_device_id="location",
+        )
+    )
+    sensor.async_write_ha_state = MagicMock()
+    sensor.async_get_last_state = AsyncMock(return_value=None)
+    device = MagicMock(disabled_by=None)
+
+    with patch(
+        "custom_components.plant_assistant.binary_sensor.dr.async_get"
+    ) as dev_reg:
+        dev_reg.return_value.async_get.return_value = device
+        await sensor.async_added_to_hass()
+        assert sensor.is_on is True
+
+        tracker = mock_hass.data[DOMAIN][DEVICE_AVAILABILITY_KEY]["probe"]
+        tracker._handle_state_changed(
+            _changed("sensor.probe_moisture", STATE_UNAVAILABLE)
+        )
+
+    assert sensor.is_on is False
+    assert tracker.has_listeners
+    await sensor.async_will_remove_from_hass()
+    assert "probe" not in mock_hass.data[DOMAIN][DEVICE_AVAILABILITY_KEY]
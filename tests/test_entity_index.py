@@ -0,0 +1,422 @@
+"""Tests for the shared entity registry index."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.core import Event
+
+from custom_components.plant_assistant import async_unload_entry
+from custom_components.plant_assistant.const import DOMAIN, ENTITY_INDEX_KEY
+from custom_components.plant_assistant.entity_index import (
+    EntityRegistryIndex,
+    async_find_location_entity,
+    async_get_device_entries,
+    async_get_entity_index,
+    async_unload_entity_index,
+)
+from custom_components.plant_assistant.sensor import _resolve_entity_id
+
+
+def _entry(entity_id, unique_id, platform="test"):
+    entry = MagicMock()
+    entry.entity_id = entity_id
+    entry.unique_id = unique_id
+    entry.platform = platform
+    return entry
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    hass.states = MagicMock()
+    hass.states.get = MagicMock(return_value=None)
+    hass.bus = MagicMock()
+    return hass
+
+
+@pytest.fixture
+def registry():
+    """Create a mock entity registry with a few entries."""
+    registry = MagicMock()
+    registry.entities = {
+        "sensor.one": _entry("sensor.one", "uid_1"),
+        "sensor.two": _entry("sensor.two", "uid_2", platform=DOMAIN),
+        "sensor.shared_other": _entry("sensor.shared_other", "shared", "other"),
+        "sensor.shared_ours": _entry("sensor.shared_ours", "shared", DOMAIN),
+    }
+    registry.async_get = MagicMock(side_effect=registry.entities.get)
+    return registry
+
+
+class TestEntityRegistryIndex:
+    """Test building and querying the index."""
+
+    def test_lookup_by_unique_id(self, mock_hass, registry):
+        """Test unique_ids resolve to their entity_ids."""
+        index = EntityRegistryIndex(mock_hass, registry)
+        index.async_setup()
+
+        assert len(index) == 4
+        assert index.async_get_entity_id("uid_1") == "sensor.one"
+        assert index.async_get_entity_id("uid_2", DOMAIN) == "sensor.two"
+        assert index.async_get_entity_id("uid_2", "other") is None
+        assert index.async_get_entity_id("missing") is None
+        assert index.async_get_entity_id(None) is None
+
+    def test_platform_disambiguates_shared_unique_id(self, mock_hass, registry):
+        """Test that a reused unique_id resolves per platform."""
+        index = EntityRegistryIndex(mock_hass, registry)
+        index.async_setup()
+
+        assert index.async_get_entity_id("shared") == "sensor.shared_other"
+        assert index.async_get_entity_id("shared", DOMAIN) == "sensor.shared_ours"
+
+    def test_subscribes_once(self, mock_hass, registry):
+        """Test that rebuilding does not add a second listener."""
+        index = EntityRegistryIndex(mock_hass, registry)
+        index.async_setup()
+        index.async_setup()
+
+        mock_hass.bus.async_listen.assert_called_once_with(
+            "entity_registry_updated", index._handle_entity_registry_updated
+        )
+
+    def test_create_event_adds_entry(self, mock_hass, registry):
+        """Test that created entities become resolvable."""
+        index = EntityRegistryIndex(mock_hass, registry)
+        index.async_setup()
+
+        registry.entities["sensor.three"] = _entry("sensor.three", "uid_3")
+        index._handle_entity_registry_updated(
+            Event(
+                "entity_registry_updated",
+                {"action": "create", "entity_id": "sensor.three"},
+            )
+        )
+
+        assert index.async_get_entity_id("uid_3") == "sensor.three"
+
+    def test_remove_event_drops_entry(self, mock_hass, registry):
+        """Test that removed entities are no longer resolvable."""
+        index = EntityRegistryIndex(mock_hass, registry)
+        index.async_setup()
+
+        del registry.entities["sensor.shared_other"]
+        index._handle_entity_registry_updated(
+            Event(
+                "entity_registry_updated",
+                {"action": "remove", "entity_id": "sensor.shared_other"},
+            )
+        )
+
+        assert index.async_get_entity_id("shared") == "sensor.shared_ours"
+        assert len(index) == 3
+
+    def test_rename_event_updates_entity_id(self, mock_hass, registry):
+        """Test that renamed entities resolve to their new entity_id."""
+        index = EntityRegistryIndex(mock_hass, registry)
+        index.async_setup()
+
+        entry = registry.entities.pop("sensor.one")
+        entry.entity_id = "sensor.renamed"
+        registry.entities["sensor.renamed"] = entry
+        index._handle_entity_registry_updated(
+            Event(
+                "entity_registry_updated",
+                {
+                    "action": "update",
+                    "entity_id": "sensor.renamed",
+                    "old_entity_id": "sensor.one",
+                    "changes": {"entity_id": "sensor.one"},
+                },
+            )
+        )
+
+        assert index.async_get_entity_id("uid_1") == "sensor.renamed"
+        assert len(index) == 4
+
+
+class TestLocationRoleIndex:
+    """Test looking up a location's entities by role."""
+
+    @pytest.fixture
+    def location_registry(self):
+        """Create a registry with two locations whose names share a prefix."""
+        registry = MagicMock()
+        registry.entities = {
+            "sensor.bed_moisture": _entry(
+                "sensor.bed_moisture",
+                f"{DOMAIN}_sub_1_bed_soil_moisture_mirror",
+                DOMAIN,
+            ),
+            "sensor.bed_2_moisture": _entry(
+                "sensor.bed_2_moisture",
+                f"{DOMAIN}_sub_2_bed_2_soil_moisture_mirror",
+                DOMAIN,
+            ),
+            "binary_sensor.bed_watered": _entry(
+                "binary_sensor.bed_watered",
+                f"{DOMAIN}_sub_1_bed_recently_watered",
+                DOMAIN,
+            ),
+            "datetime.bed_ignore": _entry(
+                "datetime.bed_ignore",
+                f"{DOMAIN}_sub_1_humidity_ignore_until",
+                DOMAIN,
+            ),
+        }
+        registry.async_get = MagicMock(side_effect=registry.entities.get)
+        return registry
+
+    def test_lookup_by_role(self, mock_hass, location_registry):
+        """Test that roles resolve per subentry without prefix collisions."""
+        index = EntityRegistryIndex(mock_hass, location_registry)
+        index.async_setup()
+        index.async_register_location("sub_1", "Bed")
+        index.async_register_location("sub_2", "Bed 2")
+
+        assert index.async_get_location_entity("sub_1", "soil_moisture_mirror") == (
+            "sensor.bed_moisture",
+            f"{DOMAIN}_sub_1_bed_soil_moisture_mirror",
+        )
+        assert index.async_get_location_entity(
+            "sub_2", "soil_moisture_mirror", "sensor"
+        ) == (
+            "sensor.bed_2_moisture",
+            f"{DOMAIN}_sub_2_bed_2_soil_moisture_mirror",
+        )
+        assert (
+            index.async_get_location_entity("sub_1", "humidity_ignore_until")[0]
+            == "datetime.bed_ignore"
+        )
+
+    def test_lookup_filters_domain(self, mock_hass, location_registry):
+        """Test that the domain filter excludes other entity domains."""
+        index = EntityRegistryIndex(mock_hass, location_registry)
+        index.async_setup()
+        index.async_register_location("sub_1", "Bed")
+
+        assert (
+            index.async_get_location_entity("sub_1", "recently_watered", "sensor")
+            is None
+        )
+        assert (
+            index.async_get_location_entity(
+                "sub_1", "recently_watered", "binary_sensor"
+            )[0]
+            == "binary_sensor.bed_watered"
+        )
+
+    def test_unregistered_location_not_indexed(self, mock_hass, location_registry):
+        """Test that only registered locations are indexed by role."""
+        index = EntityRegistryIndex(mock_hass, location_registry)
+        index.async_setup()
+
+        assert index.async_get_location_entity("sub_1", "soil_moisture_mirror") is None
+
+    def test_unregister_location(self, mock_hass, location_registry):
+        """Test that a removed location is no longer indexed by role."""
+        index = EntityRegistryIndex(mock_hass, location_registry)
+        index.async_setup()
+        index.async_register_location("sub_1", "Bed")
+        index.async_register_location("sub_2", "Bed 2")
+
+        index.async_unregister_location("sub_1")
+
+        assert index.async_get_location_entity("sub_1", "soil_moisture_mirror") is None
+        assert not any(key[0] == "sub_1" for key in index._by_location_role)
+        assert index.async_get_location_entity("sub_2", "soil_moisture_mirror")
+
+    def test_events_update_roles(self, mock_hass, location_registry):
+        """Test that created and removed entities update the role index."""
+        index = EntityRegistryIndex(mock_hass, location_registry)
+        index.async_setup()
+        index.async_register_location("sub_1", "Bed")
+
+        location_registry.entities["sensor.bed_temperature"] = _entry(
+            "sensor.bed_temperature",
+            f"{DOMAIN}_sub_1_bed_temperature_mirror",
+            DOMAIN,
+        )
+        index._handle_entity_registry_updated(
+            Event(
+                "entity_registry_updated",
+                {"action": "create", "entity_id": "sensor.bed_temperature"},
+            )
+        )
+        assert (
+            index.async_get_location_entity("sub_1", "temperature_mirror")[0]
+            == "sensor.bed_temperature"
+        )
+
+        del location_registry.entities["sensor.bed_moisture"]
+        index._handle_entity_registry_updated(
+            Event(
+                "entity_registry_updated",
+                {"action": "remove", "entity_id": "sensor.bed_moisture"},
+            )
+        )
+        assert index.async_get_location_entity("sub_1", "soil_moisture_mirror") is None
+
+    def test_find_location_entity_registers_location(
+        self, mock_hass, location_registry
+    ):
+        """Test the module helper registers the location on first use."""
+        with patch(
+            "custom_components.plant_assistant.entity_index.er.async_get",
+            return_value=location_registry,
+        ):
+            result = async_find_location_entity(
+                mock_hass, "sub_2", "Bed 2", "soil_moisture_mirror", "sensor"
+            )
+
+        assert result == (
+            "sensor.bed_2_moisture",
+            f"{DOMAIN}_sub_2_bed_2_soil_moisture_mirror",
+        )
+
+
+class TestDeviceIndex:
+    """Test looking up the entities of a device."""
+
+    @pytest.fixture
+    def device_registry(self):
+        """Create a mock entity registry with entities on two devices."""
+        registry = MagicMock()
+        registry.entities = {}
+        for entity_id, device_id in (
+            ("sensor.probe_temperature", "probe"),
+            ("sensor.probe_battery", "probe"),
+            ("binary_sensor.probe_status", "probe"),
+            ("sensor.valve_flow", "valve"),
+        ):
+            entry = _entry(entity_id, f"uid_{entity_id}")
+            entry.device_id = device_id
+            registry.entities[entity_id] = entry
+        registry.async_get = MagicMock(side_effect=registry.entities.get)
+        return registry
+
+    def test_lookup_by_device_and_domain(self, mock_hass, device_registry):
+        """Test that a device's entries are grouped by domain."""
+        index = EntityRegistryIndex(mock_hass, device_registry)
+        index.async_setup()
+
+        assert [e.entity_id for e in index.async_get_device_entries("probe")] == [
+            "sensor.probe_temperature",
+            "sensor.probe_battery",
+            "binary_sensor.probe_status",
+        ]
+        assert [
+            e.entity_id for e in index.async_get_device_entries("probe", "sensor")
+        ] == ["sensor.probe_temperature", "sensor.probe_battery"]
+        assert index.async_get_device_entries("probe", "switch") == []
+        assert index.async_get_device_entries("missing") == []
+        assert index.async_get_device_entries(None) == []
+
+    def test_events_update_device_entries(self, mock_hass, device_registry):
+        """Test that moved and removed entities leave their old device."""
+        index = EntityRegistryIndex(mock_hass, device_registry)
+        index.async_setup()
+
+        device_registry.entities["sensor.probe_battery"].device_id = "valve"
+        index._handle_entity_registry_updated(
+            Event(
+                "entity_registry_updated",
+                {"action": "update", "entity_id": "sensor.probe_battery"},
+            )
+        )
+        del device_registry.entities["sensor.valve_flow"]
+        index._handle_entity_registry_updated(
+            Event(
+                "entity_registry_updated",
+                {"action": "remove", "entity_id": "sensor.valve_flow"},
+            )
+        )
+
+        assert [
+            e.entity_id for e in index.async_get_device_entries("probe", "sensor")
+        ] == ["sensor.probe_temperature"]
+        assert [e.entity_id for e in index.async_get_device_entries("valve")] == [
+            "sensor.probe_battery"
+        ]
+
+    def test_get_device_entries_uses_shared_index(self, mock_hass, device_registry):
+        """Test the module helper builds and reuses the shared index."""
+        entries = async_get_device_entries(
+            mock_hass, "valve", "sensor", device_registry
+        )
+
+        assert [e.entity_id for e in entries] == ["sensor.valve_flow"]
+        assert isinstance(mock_hass.data[DOMAIN][ENTITY_INDEX_KEY], EntityRegistryIndex)
+
+
+class TestSharedIndex:
+    """Test the hass.data backed accessor."""
+
+    def test_index_is_shared(self, mock_hass, registry):
+        """Test that the same index is returned for the same registry."""
+        first = async_get_entity_index(mock_hass, registry)
+        second = async_get_entity_index(mock_hass, registry)
+
+        assert first is second
+        assert mock_hass.data[DOMAIN][ENTITY_INDEX_KEY] is first
+
+    def test_index_rebuilt_for_new_registry(self, mock_hass, registry):
+        """Test that a different registry produces a fresh index."""
+        first = async_get_entity_index(mock_hass, registry)
+        other_registry = MagicMock()
+        other_registry.entities = {}
+
+        second = async_get_entity_index(mock_hass, other_registry)
+
+        assert second is not first
+        assert second.async_get_entity_id("uid_1") is None
+
+    def test_unload_removes_index(self, mock_hass, registry):
+        """Test that unloading unsubscribes and drops the index."""
+        unsubscribe = MagicMock()
+        mock_hass.bus.async_listen.return_value = unsubscribe
+        async_get_entity_index(mock_hass, registry)
+
+        async_unload_entity_index(mock_hass)
+
+        unsubscribe.assert_called_once()
+        assert ENTITY_INDEX_KEY not in mock_hass.data[DOMAIN]
+
+    @pytest.mark.parametrize("unloaded", [True, False])
+    async def test_unload_entry_keeps_index_until_platforms_unload(
+        self, mock_hass, registry, unloaded
+    ):
+        """Test that the index outlives the platforms' entities."""
+        index = async_get_entity_index(mock_hass, registry)
+        entry = MagicMock(entry_id="entry")
+        mock_hass.data[DOMAIN]["entries"] = {"entry": {}}
+
+        async def unload_platforms(*_args):
+            # Entities being removed still see the shared index
+            assert mock_hass.data[DOMAIN][ENTITY_INDEX_KEY] is index
+            return unloaded
+
+        mock_hass.config_entries.async_unload_platforms = AsyncMock(
+            side_effect=unload_platforms
+        )
+
+        assert await async_unload_entry(mock_hass, entry) is unloaded
+        if unloaded:
+            assert DOMAIN not in mock_hass.data
+        else:
+            assert mock_hass.data[DOMAIN][ENTITY_INDEX_KEY] is index
+            assert "entry" in mock_hass.data[DOMAIN]["entries"]
+
+    def test_resolve_entity_id_uses_index(self, mock_hass, registry):
+        """Test that _resolve_entity_id falls back to the unique_id index."""
+        registry.async_get = MagicMock(return_value=None)
+        with patch(
+            "custom_components.plant_assistant.sensor.er.async_get",
+            return_value=registry,
+        ):
+            resolved = _resolve_entity_id(mock_hass, "sensor.old_name", "uid_2")
+
+        assert resolved == "sensor.two"
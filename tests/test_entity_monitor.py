@@ -1,15 +1,23 @@
 """Tests for entity monitoring functionality."""
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
 import pytest
 
+from custom_components.plant_assistant import async_update_options
 from custom_components.plant_assistant.const import DOMAIN
 from custom_components.plant_assistant.entity_monitor import (
     EntityMonitor,
     async_setup_entity_monitor,
     async_unload_entity_monitor,
 )
+from custom_components.plant_assistant.mirror_registry import (
+    async_get_mirror_registry,
+)
+from custom_components.plant_assistant.reconfigure import (
+    async_get_reconfigure_manager,
+)
 
 
 class TestEntityMonitor:
@@ -98,31 +106,20 @@ class TestEntityMonitor:
     async def test_find_mirror_entities_with_registry(
         self, mock_hass, mock_entity_registry
     ):
-        """Test finding mirror entities when registry is available."""
-        # Mock source entity entry to provide unique_id
+        """Test that mirrors are found by the renamed source's unique_id."""
+        # The registry already maps the new entity id when the event fires
         mock_source_entry = MagicMock()
         mock_source_entry.unique_id = "original_humidity_unique_id"
+        mock_entity_registry.async_get.side_effect = {
+            "sensor.renamed_humidity": mock_source_entry
+        }.get
 
-        # Mock mirror entity registry entry
-        mock_entity_entry = MagicMock()
-        mock_entity_entry.domain = "sensor"
-        mock_entity_entry.unique_id = f"{DOMAIN}_test_humidity_mirror"
-        mock_entity_entry.entity_id = "sensor.test_humidity_mirror"
-
-        mock_entity_registry.entities = {
-            "sensor.test_humidity_mirror": mock_entity_entry
-        }
-
-        # Mock async_get to return source entity entry
-        mock_entity_registry.async_get.return_value = mock_source_entry
-
-        # Mock state with source entity reference and source_unique_id
-        mock_state = MagicMock()
-        mock_state.attributes = {
-            "source_entity": "sensor.original_humidity",
-            "source_unique_id": "original_humidity_unique_id",
-        }
-        mock_hass.states.get.return_value = mock_state
+        mirror = MagicMock()
+        mirror.entity_id = "sensor.test_humidity_mirror"
+        other_mirror = MagicMock()
+        registry = async_get_mirror_registry(mock_hass)
+        registry.async_register("original_humidity_unique_id", mirror)
+        registry.async_register("other_unique_id", other_mirror)
 
         with patch(
             "homeassistant.helpers.entity_registry.async_get",
@@ -130,19 +127,26 @@ class TestEntityMonitor:
         ):
             monitor = EntityMonitor(mock_hass)
             entities = await monitor._find_mirror_entities_for_source(
-                "sensor.original_humidity"
+                "sensor.original_humidity", "sensor.renamed_humidity"
             )
-            assert "sensor.test_humidity_mirror" in entities
+            assert entities == [mirror]
+            # No registry or state machine scan is needed
+            mock_hass.states.get.assert_not_called()
 
     async def test_update_mirror_entity_without_registry(self, mock_hass):
         """Test updating mirror entity when registry is not available."""
+        mirror = MagicMock()
+        mirror.async_update_source_entity = AsyncMock()
         with patch(
             "homeassistant.helpers.entity_registry.async_get", side_effect=TypeError()
         ):
             monitor = EntityMonitor(mock_hass)
             # Should complete without error
             await monitor._update_mirror_entity_source(
-                "sensor.test_mirror", "sensor.old_source", "sensor.new_source"
+                mirror, "sensor.old_source", "sensor.new_source"
+            )
+            mirror.async_update_source_entity.assert_awaited_once_with(
+                "sensor.new_source"
             )
 
     async def test_handle_entity_rename_event(self, mock_hass, mock_entity_registry):
@@ -184,6 +188,157 @@ class TestEntityMonitor:
             # Should not create any tasks for non-rename events
             mock_hass.async_create_task.assert_not_called()
 
+    async def test_renames_are_batched(self, mock_hass, mock_entity_registry):
+        """Test that a burst of renames is applied to config entries once."""
+        with (
+            patch(
+                "homeassistant.helpers.entity_registry.async_get",
+                return_value=mock_entity_registry,
+            ),
+            patch(
+                "custom_components.plant_assistant.entity_monitor.async_call_later"
+            ) as mock_call_later,
+        ):
+            monitor = EntityMonitor(mock_hass)
+            monitor._update_all_config_entries_for_renames = MagicMock()
+
+            monitor._async_queue_rename("sensor.a", "sensor.b")
+            monitor._async_queue_rename("sensor.b", "sensor.c")
+            monitor._async_queue_rename("sensor.humidity", "sensor.bed_humidity")
+
+            # Each rename restarts the batch window
+            assert mock_call_later.call_count == 3
+            assert mock_call_later.return_value.call_count == 2
+            mock_hass.async_create_task.assert_not_called()
+
+            flush = mock_call_later.call_args.args[2]
+            flush(None)
+
+            mock_hass.async_create_task.assert_called_once()
+            monitor._update_all_config_entries_for_renames.assert_called_once_with(
+                {
+                    "sensor.a": "sensor.c",
+                    "sensor.b": "sensor.c",
+                    "sensor.humidity": "sensor.bed_humidity",
+                }
+            )
+
+    async def test_batched_renames_reload_entry_once(
+        self, mock_hass, mock_entity_registry
+    ):
+        """Test that several renames touching one entry reload it once."""
+        renamed_entry = MagicMock()
+        renamed_entry.unique_id = "humidity_unique"
+        renamed_entry.device_id = "probe"
+        mock_entity_registry.async_get.side_effect = {
+            "sensor.bed_humidity": renamed_entry,
+            "sensor.bed_moisture": renamed_entry,
+        }.get
+
+        config_entry = MagicMock()
+        config_entry.entry_id = "subentry"
+        config_entry.update_listeners = []
+        config_entry.options = {}
+        config_entry.data = {
+            "humidity_entity_id": "sensor.humidity",
+            "monitoring_device_id": "probe",
+        }
+        mock_hass.config_entries.async_entries.return_value = [config_entry]
+        mock_hass.config_entries.async_reload = AsyncMock()
+
+        with patch(
+            "homeassistant.helpers.entity_registry.async_get",
+            return_value=mock_entity_registry,
+        ):
+            monitor = EntityMonitor(mock_hass)
+            await monitor._update_all_config_entries_for_renames(
+                {
+                    "sensor.humidity": "sensor.bed_humidity",
+                    "sensor.moisture": "sensor.bed_moisture",
+                }
+            )
+
+        mock_hass.config_entries.async_update_entry.assert_called_once_with(
+            config_entry,
+            data={
+                "humidity_entity_id": "sensor.bed_humidity",
+                "humidity_entity_unique_id": "humidity_unique",
+                "monitoring_device_id": "probe",
+            },
+        )
+        mock_hass.config_entries.async_reload.assert_awaited_once_with("subentry")
+
+    async def test_renames_reload_through_update_listener_once(
+        self, mock_hass, mock_entity_registry
+    ):
+        """Test a burst of renames reloads each entry once, listener included."""
+        mock_entity_registry.async_get.return_value = None
+        tasks = []
+        mock_hass.async_create_task = lambda coro: tasks.append(
+            asyncio.get_running_loop().create_task(coro)
+        )
+        mock_hass.config_entries.async_reload = AsyncMock()
+
+        def _update_entry(entry, *, options=None, data=None):
+            """Update an entry and run its update listeners like HA does."""
+            changed = False
+            if options is not None and options != entry.options:
+                entry.options, changed = options, True
+            if data is not None and data != entry.data:
+                entry.data, changed = data, True
+            if changed:
+                for listener in entry.update_listeners:
+                    mock_hass.async_create_task(listener(mock_hass, entry))
+            return changed
+
+        mock_hass.config_entries.async_update_entry = _update_entry
+
+        # Main entry, reloaded by async_update_options on a zone change
+        main_entry = MagicMock(entry_id="main", data={}, subentries={})
+        main_entry.options = {
+            "irrigation_zones": {
+                "zone-1": {
+                    "locations": {
+                        "bed": {"humidity_entity_id": "sensor.humidity"},
+                        "pots": {"humidity_entity_id": "sensor.porch_humidity"},
+                    }
+                }
+            }
+        }
+        main_entry.update_listeners = [async_update_options]
+        async_get_reconfigure_manager(mock_hass).async_remember(main_entry)
+
+        # Legacy location entry without an update listener
+        legacy_entry = MagicMock(entry_id="legacy", options={}, update_listeners=[])
+        legacy_entry.data = {"humidity_entity_id": "sensor.porch_humidity"}
+
+        mock_hass.config_entries.async_entries.return_value = [
+            main_entry,
+            legacy_entry,
+        ]
+
+        with patch(
+            "homeassistant.helpers.entity_registry.async_get",
+            return_value=mock_entity_registry,
+        ):
+            monitor = EntityMonitor(mock_hass)
+            await monitor._update_all_config_entries_for_renames(
+                {
+                    "sensor.humidity": "sensor.bed_humidity",
+                    "sensor.porch_humidity": "sensor.pots_humidity",
+                }
+            )
+            await asyncio.gather(*tasks)
+
+        locations = main_entry.options["irrigation_zones"]["zone-1"]["locations"]
+        assert locations["bed"]["humidity_entity_id"] == "sensor.bed_humidity"
+        assert locations["pots"]["humidity_entity_id"] == "sensor.pots_humidity"
+        assert legacy_entry.data["humidity_entity_id"] == "sensor.pots_humidity"
+        assert sorted(mock_hass.config_entries.async_reload.await_args_list) == [
+            call("legacy"),
+            call("main"),
+        ]
+
     async def test_async_setup_entity_monitor(self, mock_hass):
         """Test global entity monitor setup function."""
         with patch(
@@ -5,7 +5,7 @@ from unittest.mock import Mock, patch
 
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 
-from custom_components.plant_assistant.sensor import IrrigationZoneErrorCountSensor
+from custom_components.plant_assistant.sensor_zone import IrrigationZoneErrorCountSensor
 
 from .conftest import create_state_changed_event
 
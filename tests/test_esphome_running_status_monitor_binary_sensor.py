@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 from homeassistant.core import HomeAssistant
 
-from custom_components.plant_assistant.binary_sensor import (
+from custom_components.plant_assistant.binary_sensor_zone import (
     ESPHomeRunningStatusMonitorBinarySensor,
     ESPHomeRunningStatusMonitorConfig,
 )
@@ -157,7 +157,7 @@ class TestESPHomeRunningStatusMonitorBinarySensorFindRunning:
         mock_state.attributes = {"device_class": "running"}
 
         with patch(
-            "custom_components.plant_assistant.binary_sensor.er.async_get",
+            "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
             return_value=mock_entity_registry,
         ):
             sensor_config.hass.states.get.return_value = mock_state
@@ -185,7 +185,7 @@ class TestESPHomeRunningStatusMonitorBinarySensorFindRunning:
         mock_state.attributes = {"device_class": "connectivity"}
 
         with patch(
-            "custom_components.plant_assistant.binary_sensor.er.async_get",
+            "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
             return_value=mock_entity_registry,
         ):
             sensor_config.hass.states.get.return_value = mock_state
@@ -224,7 +224,7 @@ class TestESPHomeRunningStatusMonitorBinarySensorFindRunning:
             return mock_state
 
         with patch(
-            "custom_components.plant_assistant.binary_sensor.er.async_get",
+            "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
             return_value=mock_entity_registry,
         ):
             sensor_config.hass.states.get.side_effect = mock_states_get
@@ -248,7 +248,7 @@ class TestESPHomeRunningStatusMonitorBinarySensorFindRunning:
         }
 
         with patch(
-            "custom_components.plant_assistant.binary_sensor.er.async_get",
+            "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
             return_value=mock_entity_registry,
         ):
             result = sensor._find_running_binary_sensor()
@@ -444,11 +444,11 @@ class TestESPHomeRunningStatusMonitorBinarySensorAsyncMethods:
 
         with (
             patch(
-                "custom_components.plant_assistant.binary_sensor.er.async_get",
+                "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
                 return_value=mock_entity_registry,
             ),
             patch(
-                "custom_components.plant_assistant.binary_sensor.async_track_state_change_event",
+                "custom_components.plant_assistant.binary_sensor_zone.async_track_state_change_event",
                 return_value=MagicMock(),
             ),
         ):
@@ -472,11 +472,11 @@ class TestESPHomeRunningStatusMonitorBinarySensorAsyncMethods:
 
         with (
             patch(
-                "custom_components.plant_assistant.binary_sensor.er.async_get",
+                "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
                 return_value=mock_entity_registry,
             ),
             patch(
-                "custom_components.plant_assistant.binary_sensor.async_track_state_change_event",
+                "custom_components.plant_assistant.binary_sensor_zone.async_track_state_change_event",
                 return_value=MagicMock(),
             ),
         ):
@@ -580,7 +580,7 @@ class TestESPHomeRunningStatusMonitorBinarySensorEdgeCases:
         mock_state.attributes = {}
 
         with patch(
-            "custom_components.plant_assistant.binary_sensor.er.async_get",
+            "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
             return_value=mock_entity_registry,
         ):
             sensor_config.hass.states.get.return_value = mock_state
@@ -593,7 +593,7 @@ class TestESPHomeRunningStatusMonitorBinarySensorEdgeCases:
         sensor = ESPHomeRunningStatusMonitorBinarySensor(sensor_config)
 
         with patch(
-            "custom_components.plant_assistant.binary_sensor.er.async_get",
+            "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
             side_effect=AttributeError("Test error"),
         ):
             result = sensor._find_running_binary_sensor()
@@ -618,7 +618,7 @@ class TestESPHomeRunningStatusMonitorBinarySensorEdgeCases:
         sensor_config.hass.states.get.side_effect = ValueError("Test error")
 
         with patch(
-            "custom_components.plant_assistant.binary_sensor.er.async_get",
+            "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
             return_value=mock_entity_registry,
         ):
             result = sensor._find_running_binary_sensor()
@@ -652,7 +652,7 @@ class TestESPHomeRunningStatusMonitorBinarySensorEdgeCases:
             return mock_state
 
         with patch(
-            "custom_components.plant_assistant.binary_sensor.er.async_get",
+            "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
             return_value=mock_entity_registry,
         ):
             sensor_config.hass.states.get.side_effect = mock_states_get
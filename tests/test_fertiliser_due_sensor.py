@@ -10,7 +10,7 @@ import pytest
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.util import dt as dt_util
 
-from custom_components.plant_assistant.sensor import (
+from custom_components.plant_assistant.sensor_zone import (
     IrrigationZoneFertiliserDueSensor,
 )
 
@@ -48,6 +48,17 @@ def create_device_registry_mock() -> Mock:
     mock_devices.values = Mock(return_value=devices.values())
     registry.devices = mock_devices
     registry.async_get = Mock(side_effect=lambda device_id: devices.get(device_id))
+    registry.async_get_device = Mock(
+        side_effect=lambda identifiers: next(
+            (
+                device
+                for device in devices.values()
+                if isinstance(device.identifiers, set)
+                and identifiers & device.identifiers
+            ),
+            None,
+        )
+    )
 
     return registry
 
@@ -90,9 +101,9 @@ def sensor(hass_mock: Mock) -> IrrigationZoneFertiliserDueSensor:
     """Create a fertiliser due sensor instance."""
     # Mock the registries for device discovery
     with (
-        patch("custom_components.plant_assistant.sensor.dr.async_get") as mock_dr,
+        patch("custom_components.plant_assistant.sensor_zone.dr.async_get") as mock_dr,
         patch(
-            "custom_components.plant_assistant.sensor.find_device_entities_by_pattern"
+            "custom_components.plant_assistant.sensor_zone.find_device_entities_by_pattern"
         ) as mock_find,
     ):
         mock_dr.return_value = create_device_registry_mock()
@@ -294,7 +305,7 @@ class TestIrrigationZoneFertiliserDueSensor:
         result = sensor._evaluate_fertiliser_due()
         assert result is False
 
-    @patch("custom_components.plant_assistant.sensor.dt_util.now")
+    @patch("custom_components.plant_assistant.sensor_zone.dt_util.now")
     def test_evaluate_fertiliser_due_outside_season_january(
         self,
         mock_now: Mock,
@@ -318,7 +329,7 @@ class TestIrrigationZoneFertiliserDueSensor:
         result = sensor._evaluate_fertiliser_due()
         assert result is False
 
-    @patch("custom_components.plant_assistant.sensor.dt_util.now")
+    @patch("custom_components.plant_assistant.sensor_zone.dt_util.now")
     def test_evaluate_fertiliser_due_outside_season_october(
         self,
         mock_now: Mock,
@@ -342,7 +353,7 @@ class TestIrrigationZoneFertiliserDueSensor:
         result = sensor._evaluate_fertiliser_due()
         assert result is False
 
-    @patch("custom_components.plant_assistant.sensor.dt_util.now")
+    @patch("custom_components.plant_assistant.sensor_zone.dt_util.now")
     def test_evaluate_fertiliser_due_no_previous_injection(
         self,
         mock_now: Mock,
@@ -368,7 +379,7 @@ class TestIrrigationZoneFertiliserDueSensor:
         result = sensor._evaluate_fertiliser_due()
         assert result is True
 
-    @patch("custom_components.plant_assistant.sensor.dt_util.now")
+    @patch("custom_components.plant_assistant.sensor_zone.dt_util.now")
     def test_evaluate_fertiliser_due_not_yet_due(
         self,
         mock_now: Mock,
@@ -396,7 +407,7 @@ class TestIrrigationZoneFertiliserDueSensor:
         result = sensor._evaluate_fertiliser_due()
         assert result is False
 
-    @patch("custom_components.plant_assistant.sensor.dt_util.now")
+    @patch("custom_components.plant_assistant.sensor_zone.dt_util.now")
     def test_evaluate_fertiliser_due_is_due(
         self,
         mock_now: Mock,
@@ -424,7 +435,7 @@ class TestIrrigationZoneFertiliserDueSensor:
         result = sensor._evaluate_fertiliser_due()
         assert result is True
 
-    @patch("custom_components.plant_assistant.sensor.dt_util.now")
+    @patch("custom_components.plant_assistant.sensor_zone.dt_util.now")
     def test_evaluate_fertiliser_due_is_overdue(
         self,
         mock_now: Mock,
@@ -452,7 +463,7 @@ class TestIrrigationZoneFertiliserDueSensor:
         result = sensor._evaluate_fertiliser_due()
         assert result is True
 
-    @patch("custom_components.plant_assistant.sensor.dt_util.now")
+    @patch("custom_components.plant_assistant.sensor_zone.dt_util.now")
     def test_evaluate_fertiliser_due_in_season_april(
         self,
         mock_now: Mock,
@@ -477,7 +488,7 @@ class TestIrrigationZoneFertiliserDueSensor:
         result = sensor._evaluate_fertiliser_due()
         assert result is True
 
-    @patch("custom_components.plant_assistant.sensor.dt_util.now")
+    @patch("custom_components.plant_assistant.sensor_zone.dt_util.now")
     def test_evaluate_fertiliser_due_in_season_september(
         self,
         mock_now: Mock,
@@ -502,7 +513,7 @@ class TestIrrigationZoneFertiliserDueSensor:
         result = sensor._evaluate_fertiliser_due()
         assert result is True
 
-    @patch("custom_components.plant_assistant.sensor.dt_util.now")
+    @patch("custom_components.plant_assistant.sensor_zone.dt_util.now")
     def test_evaluate_fertiliser_due_invalid_last_injection_date(
         self,
         mock_now: Mock,
@@ -548,7 +559,7 @@ class TestIrrigationZoneFertiliserDueSensor:
         sensor._get_entity_state("input_boolean.front_garden_fertiliser_injection")
         hass_mock.states.get.assert_called()
 
-    @patch("custom_components.plant_assistant.sensor.dt_util.now")
+    @patch("custom_components.plant_assistant.sensor_zone.dt_util.now")
     def test_handle_esphome_event_triggers_update(
         self,
         mock_now: Mock,
@@ -581,7 +592,7 @@ class TestIrrigationZoneFertiliserDueSensor:
         # State should now be "on"
         assert sensor._state == "on"
 
-    @patch("custom_components.plant_assistant.sensor.dt_util.now")
+    @patch("custom_components.plant_assistant.sensor_zone.dt_util.now")
     def test_handle_esphome_event_no_state_change(
         self,
         mock_now: Mock,
@@ -640,9 +651,9 @@ class TestIrrigationZoneFertiliserDueSensor:
         assert attrs == {} or attrs is None
 
     @patch(
-        "custom_components.plant_assistant.sensor.IrrigationZoneFertiliserDueSensor.async_get_last_state"
+        "custom_components.plant_assistant.sensor_zone.IrrigationZoneFertiliserDueSensor.async_get_last_state"
     )
-    @patch("custom_components.plant_assistant.sensor.dt_util.now")
+    @patch("custom_components.plant_assistant.sensor_zone.dt_util.now")
     async def test_async_added_to_hass_restores_state(
         self,
         mock_now: Mock,
@@ -671,9 +682,9 @@ class TestIrrigationZoneFertiliserDueSensor:
         assert "zone_name" in sensor._attributes
 
     @patch(
-        "custom_components.plant_assistant.sensor.IrrigationZoneFertiliserDueSensor.async_get_last_state"
+        "custom_components.plant_assistant.sensor_zone.IrrigationZoneFertiliserDueSensor.async_get_last_state"
     )
-    @patch("custom_components.plant_assistant.sensor.dt_util.now")
+    @patch("custom_components.plant_assistant.sensor_zone.dt_util.now")
     async def test_async_added_to_hass_evaluates_if_no_state(
         self,
         mock_now: Mock,
@@ -7,7 +7,7 @@ from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant
 
 from custom_components.plant_assistant.const import DOMAIN
-from custom_components.plant_assistant.sensor import (
+from custom_components.plant_assistant.sensor_statistics import (
     HumidityBelowThresholdHoursSensor,
 )
 
@@ -32,7 +32,7 @@ def mock_entity_registry():
     registry.entities.values = MagicMock(return_value=[])
 
     with patch(
-        "custom_components.plant_assistant.sensor.er.async_get",
+        "custom_components.plant_assistant.sensor_statistics.er.async_get",
         return_value=registry,
     ):
         yield registry
@@ -152,11 +152,11 @@ async def test_humidity_below_threshold_no_statistics(mock_hass, mock_entity_reg
 
     with (
         patch(
-            "custom_components.plant_assistant.sensor.get_instance",
+            "custom_components.plant_assistant.sensor_statistics.get_instance",
             return_value=mock_recorder,
         ),
         patch(
-            "custom_components.plant_assistant.sensor.statistics_during_period"
+            "custom_components.plant_assistant.recorder_statistics.statistics_during_period"
         ) as mock_stats_fn,
     ):
         mock_stats_fn.return_value = {}
@@ -205,11 +205,11 @@ async def test_humidity_below_threshold_calculation(mock_hass, mock_entity_regis
     # Patch both get_instance and statistics_during_period
     with (
         patch(
-            "custom_components.plant_assistant.sensor.get_instance",
+            "custom_components.plant_assistant.sensor_statistics.get_instance",
             return_value=mock_recorder,
         ),
         patch(
-            "custom_components.plant_assistant.sensor.statistics_during_period"
+            "custom_components.plant_assistant.recorder_statistics.statistics_during_period"
         ) as mock_stats_fn,
     ):
         mock_stats_fn.return_value = mock_stats
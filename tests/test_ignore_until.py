@@ -0,0 +1,238 @@
+"""Tests for scheduled expiry of ignore-until windows."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.core import State
+from homeassistant.util import dt as dt_util
+
+from custom_components.plant_assistant.binary_sensor import (
+    ThresholdMonitorBinarySensor,
+    ThresholdMonitorConfig,
+)
+from custom_components.plant_assistant.const import (
+    DOMAIN,
+    IGNORE_UNTIL_SCHEDULER_KEY,
+)
+from custom_components.plant_assistant.ignore_until import (
+    IgnoreUntilScheduler,
+    async_get_ignore_until_scheduler,
+    async_unload_ignore_until_scheduler,
+    parse_ignore_until,
+)
+from custom_components.plant_assistant.threshold_monitor import (
+    SOIL_MOISTURE_STATUS,
+    LocationThresholdEvaluator,
+)
+from custom_components.plant_assistant.write_coalescer import (
+    async_get_write_coalescer,
+)
+
+TRACK_POINT_IN_TIME = (
+    "custom_components.plant_assistant.ignore_until.async_track_point_in_time"
+)
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+@pytest.fixture
+def mock_track():
+    """Patch the point-in-time tracker and return the mock."""
+    with patch(TRACK_POINT_IN_TIME) as track:
+        yield track
+
+
+class TestIgnoreUntilScheduler:
+    """Test the min-heap scheduler."""
+
+    def test_single_timer_for_earliest_deadline(self, mock_hass, mock_track):
+        """Test that one timer is armed for the earliest deadline."""
+        scheduler = IgnoreUntilScheduler(mock_hass)
+        now = dt_util.utcnow()
+
+        scheduler.async_schedule("late", now + timedelta(hours=2), MagicMock())
+        scheduler.async_schedule("early", now + timedelta(hours=1), MagicMock())
+        scheduler.async_schedule("later", now + timedelta(hours=3), MagicMock())
+
+        assert mock_track.call_count == 2
+        assert len(scheduler) == 3
+        assert scheduler.next_deadline.timestamp() == pytest.approx(
+            (now + timedelta(hours=1)).timestamp()
+        )
+        # The first timer was replaced by the earlier one
+        mock_track.return_value.assert_called_once()
+
+    @pytest.mark.usefixtures("mock_track")
+    def test_fire_runs_only_expired_actions(self, mock_hass):
+        """Test that firing re-evaluates exactly the expired keys."""
+        scheduler = IgnoreUntilScheduler(mock_hass)
+        now = dt_util.utcnow()
+        first = MagicMock()
+        second = MagicMock()
+        pending = MagicMock()
+        scheduler.async_schedule("first", now + timedelta(minutes=1), first)
+        scheduler.async_schedule("second", now + timedelta(minutes=1), second)
+        scheduler.async_schedule("pending", now + timedelta(hours=1), pending)
+
+        scheduler._handle_timer(now + timedelta(minutes=1))
+
+        first.assert_called_once()
+        second.assert_called_once()
+        pending.assert_not_called()
+        assert len(scheduler) == 1
+        assert scheduler.next_deadline.timestamp() == pytest.approx(
+            (now + timedelta(hours=1)).timestamp()
+        )
+
+    @pytest.mark.usefixtures("mock_track")
+    def test_rescheduled_key_uses_new_deadline(self, mock_hass):
+        """Test that a superseded deadline does not fire."""
+        scheduler = IgnoreUntilScheduler(mock_hass)
+        now = dt_util.utcnow()
+        action = MagicMock()
+        scheduler.async_schedule("monitor", now + timedelta(minutes=1), action)
+        scheduler.async_schedule("monitor", now + timedelta(minutes=30), action)
+
+        scheduler._handle_timer(now + timedelta(minutes=1))
+        action.assert_not_called()
+
+        scheduler._handle_timer(now + timedelta(minutes=30))
+        action.assert_called_once()
+        assert scheduler.next_deadline is None
+
+    def test_cancel_and_past_deadline(self, mock_hass, mock_track):
+        """Test that cancelling or a past deadline disarms the timer."""
+        scheduler = IgnoreUntilScheduler(mock_hass)
+        now = dt_util.utcnow()
+        action = MagicMock()
+        scheduler.async_schedule("monitor", now + timedelta(minutes=1), action)
+
+        scheduler.async_schedule("monitor", now - timedelta(minutes=1), action)
+
+        assert len(scheduler) == 0
+        assert scheduler.next_deadline is None
+        mock_track.return_value.assert_called_once()
+
+    @pytest.mark.usefixtures("mock_track")
+    def test_failing_action_does_not_block_others(self, mock_hass):
+        """Test that one failing re-evaluation does not stop the rest."""
+        scheduler = IgnoreUntilScheduler(mock_hass)
+        now = dt_util.utcnow()
+        action = MagicMock()
+        scheduler.async_schedule(
+            "failing", now + timedelta(minutes=1), MagicMock(side_effect=ValueError)
+        )
+        scheduler.async_schedule("other", now + timedelta(minutes=1), action)
+
+        scheduler._handle_timer(now + timedelta(minutes=1))
+
+        action.assert_called_once()
+
+
+class TestSharedScheduler:
+    """Test the hass.data backed helpers."""
+
+    def test_scheduler_is_shared(self, mock_hass):
+        """Test that the scheduler is stored in hass.data and reused."""
+        scheduler = async_get_ignore_until_scheduler(mock_hass)
+
+        assert async_get_ignore_until_scheduler(mock_hass) is scheduler
+        assert mock_hass.data[DOMAIN][IGNORE_UNTIL_SCHEDULER_KEY] is scheduler
+
+    def test_unload_cancels_timer(self, mock_hass, mock_track):
+        """Test that unloading cancels the timer and drops the scheduler."""
+        scheduler = async_get_ignore_until_scheduler(mock_hass)
+        scheduler.async_schedule(
+            "monitor", dt_util.utcnow() + timedelta(hours=1), MagicMock()
+        )
+
+        async_unload_ignore_until_scheduler(mock_hass)
+
+        mock_track.return_value.assert_called_once()
+        assert IGNORE_UNTIL_SCHEDULER_KEY not in mock_hass.data[DOMAIN]
+
+
+def test_parse_ignore_until():
+    """Test parsing ignore-until state values."""
+    assert parse_ignore_until("unknown") is None
+    assert parse_ignore_until("not a date") is None
+    parsed = parse_ignore_until("2025-01-01T12:00:00")
+    assert parsed is not None
+    assert parsed.tzinfo is not None
+
+
+@pytest.mark.usefixtures("mock_track")
+def test_monitor_raises_problem_when_window_expires(mock_hass):
+    """Test that a quiet monitor re-evaluates once its ignore window ends."""
+    ignore_until = dt_util.now() + timedelta(hours=1)
+    states = {
+        "sensor.test_garden_soil_moisture_mirror": "25",
+        "sensor.test_garden_min_soil_moisture": "30",
+        "sensor.test_garden_max_soil_moisture": "70",
+        "datetime.test_garden_soil_moisture_ignore_until": ignore_until.isoformat(),
+    }
+    mock_hass.states.get.side_effect = lambda entity_id: (
+        State(entity_id, states[entity_id]) if entity_id in states else None
+    )
+
+    def find(_hass, _subentry_id, _location_name, role, domain=None):
+        entity_id = f"{domain}.test_garden_{role}"
+        return (
+            (entity_id, f"{DOMAIN}_test_entry_{role}") if entity_id in states else None
+        )
+
+    evaluator = LocationThresholdEvaluator(mock_hass, "test_entry", "Test Garden")
+    sensor = ThresholdMonitorBinarySensor(
+        ThresholdMonitorConfig(
+            evaluator=evaluator,
+            rule=SOIL_MOISTURE_STATUS,
+            entry_id="test_entry",
+            location_name="Test Garden",
+            irrigation_zone_name="Zone A",
+            source_entity_id="sensor.test_garden_soil_moisture_mirror",
+            location_device_id="test_location",
+        )
+    )
+
+    with (
+        patch(
+            "custom_components.plant_assistant.threshold_monitor."
+            "async_find_location_entity",
+            side_effect=find,
+        ),
+        patch(
+            "custom_components.plant_assistant.state_multiplexer."
+            "async_track_state_change_event"
+        ),
+        patch(
+            "homeassistant.helpers.entity.Entity.async_write_ha_state"
+        ) as write_state,
+    ):
+        evaluator.async_attach(sensor)
+        sensor.async_evaluate()
+        async_get_write_coalescer(mock_hass).async_flush()
+        assert sensor.is_on is False
+
+        scheduler = mock_hass.data[DOMAIN][IGNORE_UNTIL_SCHEDULER_KEY]
+        assert scheduler.next_deadline.timestamp() == pytest.approx(
+            ignore_until.timestamp()
+        )
+
+        with patch(
+            "custom_components.plant_assistant.threshold_monitor.dt_util.now",
+            return_value=ignore_until + timedelta(seconds=1),
+        ):
+            scheduler._handle_timer(ignore_until)
+        async_get_write_coalescer(mock_hass).async_flush()
+
+    assert sensor.is_on is True
+    assert sensor.status == "low"
+    assert write_state.call_count == 2
+    assert len(scheduler) == 0
@@ -11,6 +11,7 @@ from custom_components.plant_assistant.binary_sensor import (
     IgnoredStatusesMonitorConfig,
 )
 from custom_components.plant_assistant.const import DOMAIN
+from custom_components.plant_assistant.state_multiplexer import SourceReading
 
 
 @pytest.fixture
@@ -346,3 +347,121 @@ class TestIgnoredStatusesMonitorBinarySensorAvailability:
         sensor = IgnoredStatusesMonitorBinarySensor(sensor_config)
 
         assert sensor.available is True
+
+
+def _registry_entry(domain, unique_id, entity_id):
+    """Create a mock entity registry entry of this integration."""
+    entry = MagicMock()
+    entry.platform = DOMAIN
+    entry.domain = domain
+    entry.unique_id = unique_id
+    entry.entity_id = entity_id
+    entry.device_id = None
+    return entry
+
+
+class TestIgnoredStatusesMonitorBinarySensorDiscovery:
+    """Test finding the location's ignore_until entities."""
+
+    @pytest.mark.asyncio
+    async def test_find_ignore_until_entities_by_role(
+        self, sensor_config, mock_entity_registry
+    ):
+        """Test only the location's known ignore_until datetimes are found."""
+        mock_entity_registry.entities.values.return_value = [
+            _registry_entry(
+                "datetime",
+                "plant_assistant_test_entry_123_soil_moisture_ignore_until",
+                "datetime.test_garden_soil_moisture_ignore_until",
+            ),
+            _registry_entry(
+                "datetime",
+                "plant_assistant_test_entry_123_monitor_link_ignore_until",
+                "datetime.test_garden_monitor_link_ignore_until",
+            ),
+            # Another location's datetime with this entry id as a substring
+            _registry_entry(
+                "datetime",
+                "plant_assistant_test_entry_1234_soil_moisture_ignore_until",
+                "datetime.other_soil_moisture_ignore_until",
+            ),
+            # Not an ignore_until role
+            _registry_entry(
+                "datetime",
+                "plant_assistant_test_entry_123_custom_ignore_until_note",
+                "datetime.test_garden_custom_ignore_until_note",
+            ),
+        ]
+        sensor = IgnoredStatusesMonitorBinarySensor(sensor_config)
+
+        result = await sensor._find_ignore_until_entities()
+
+        assert result == [
+            "datetime.test_garden_soil_moisture_ignore_until",
+            "datetime.test_garden_monitor_link_ignore_until",
+        ]
+        assert sensor._ignore_until_entity_unique_ids == {
+            "datetime.test_garden_soil_moisture_ignore_until": (
+                "plant_assistant_test_entry_123_soil_moisture_ignore_until"
+            ),
+            "datetime.test_garden_monitor_link_ignore_until": (
+                "plant_assistant_test_entry_123_monitor_link_ignore_until"
+            ),
+        }
+
+
+class TestIgnoredStatusesMonitorBinarySensorIncremental:
+    """Test incremental updates of the ignored count."""
+
+    def _changed(self, entity_id, state):
+        return SourceReading(entity_id, state, None, None)
+
+    def test_change_only_reads_changed_entity(self, mock_hass, sensor_config):
+        """Test that one ignore_until change does not re-read the others."""
+        sensor = IgnoredStatusesMonitorBinarySensor(sensor_config)
+        sensor._ignore_until_entity_ids = [
+            "datetime.test_garden_soil_moisture_ignore_until",
+            "datetime.test_garden_temperature_ignore_until",
+        ]
+        sensor.async_write_ha_state = MagicMock()
+        mock_hass.states.get = MagicMock(return_value=None)
+        sensor._update_state()
+        mock_hass.states.get.reset_mock()
+
+        future_time = (datetime.now(UTC) + timedelta(hours=1)).isoformat()
+        sensor._ignore_until_state_changed(
+            self._changed("datetime.test_garden_temperature_ignore_until", future_time)
+        )
+
+        mock_hass.states.get.assert_not_called()
+        assert sensor._ignored_count == 1
+        assert sensor.extra_state_attributes["message"] == "1 Ignored"
+        sensor.async_write_ha_state.assert_called_once()
+
+        # Clearing the ignore_until drops the count again
+        sensor._ignore_until_state_changed(
+            self._changed("datetime.test_garden_temperature_ignore_until", "unknown")
+        )
+        assert sensor._ignored_count == 0
+        assert sensor.is_on is False
+
+    def test_expiry_drops_expired_statuses(self, sensor_config):
+        """Test that an expired ignore_until period stops being counted."""
+        sensor = IgnoredStatusesMonitorBinarySensor(sensor_config)
+        sensor.async_write_ha_state = MagicMock()
+        now = datetime.now(UTC)
+        sensor._set_ignore_until(
+            "datetime.soon", (now + timedelta(minutes=1)).isoformat(), now
+        )
+        sensor._set_ignore_until(
+            "datetime.later", (now + timedelta(hours=1)).isoformat(), now
+        )
+
+        with patch(
+            "custom_components.plant_assistant.binary_sensor.dt_util.now",
+            return_value=now + timedelta(minutes=2),
+        ):
+            sensor._async_ignore_until_expired()
+
+        assert sensor._ignored_count == 1
+        assert list(sensor._ignore_until_by_entity_id) == ["datetime.later"]
@@ -0,0 +1,199 @@
+"""Tests for the shared irrigation gateway event dispatcher."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import Event
+
+from custom_components.plant_assistant.const import (
+    DOMAIN,
+    IRRIGATION_EVENT_DISPATCHER_KEY,
+)
+from custom_components.plant_assistant.irrigation_events import (
+    IrrigationEventDispatcher,
+    async_subscribe_irrigation_zone,
+    async_unload_irrigation_event_dispatcher,
+)
+from custom_components.plant_assistant.sensor_zone import (
+    IrrigationZoneLastRunStartTimeSensor,
+)
+
+EVENT_TYPE = "esphome.irrigation_gateway_update"
+
+
+def _event(data):
+    return Event(EVENT_TYPE, data)
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+class TestIrrigationEventDispatcher:
+    """Test routing of gateway events."""
+
+    def test_single_bus_listener(self, mock_hass):
+        """Test that many subscribers share one bus listener."""
+        dispatcher = IrrigationEventDispatcher(mock_hass)
+        for zone in ("Lawn", "Flower Bed", "Veg Patch"):
+            dispatcher.async_subscribe(zone, ("start_time",), MagicMock())
+            dispatcher.async_subscribe(zone, ("end_time",), MagicMock())
+
+        mock_hass.bus.async_listen.assert_called_once_with(
+            EVENT_TYPE, dispatcher._handle_event
+        )
+        assert dispatcher.subscriber_count == 6
+
+    def test_routes_only_zone_fields(self, mock_hass):
+        """Test that subscribers only receive their own zone's fields."""
+        dispatcher = IrrigationEventDispatcher(mock_hass)
+        lawn = MagicMock()
+        flower_bed = MagicMock()
+        dispatcher.async_subscribe("Lawn", ("start_time",), lawn)
+        dispatcher.async_subscribe("Flower Bed", ("start_time",), flower_bed)
+
+        dispatcher._handle_event(
+            _event(
+                {
+                    "trigger": "Zone Deactivated",
+                    "flower_bed_start_time": "2025-11-06T20:24:17+00:00",
+                    "flower_bed_duration": "5",
+                }
+            )
+        )
+
+        lawn.assert_not_called()
+        flower_bed.assert_called_once()
+        update = flower_bed.call_args.args[0]
+        assert update.data == {"flower_bed_start_time": "2025-11-06T20:24:17+00:00"}
+        assert update.event_type == EVENT_TYPE
+
+    def test_unchanged_fields_not_delivered(self, mock_hass):
+        """Test that repeated values are not delivered again."""
+        dispatcher = IrrigationEventDispatcher(mock_hass)
+        handler = MagicMock()
+        dispatcher.async_subscribe("Lawn", ("start_time", "end_time"), handler)
+
+        data = {
+            "lawn_start_time": "2025-11-06T20:00:00+00:00",
+            "lawn_end_time": "2025-11-06T20:10:00+00:00",
+        }
+        dispatcher._handle_event(_event(data))
+        dispatcher._handle_event(_event(data))
+        assert handler.call_count == 1
+
+        # A change to either field delivers all present subscribed fields
+        dispatcher._handle_event(
+            _event({**data, "lawn_end_time": "2025-11-06T20:15:00+00:00"})
+        )
+        assert handler.call_count == 2
+        assert handler.call_args.args[0].data == {
+            "lawn_start_time": "2025-11-06T20:00:00+00:00",
+            "lawn_end_time": "2025-11-06T20:15:00+00:00",
+        }
+
+    def test_broadcast_subscribers_get_every_event(self, mock_hass):
+        """Test that zone-less subscribers receive every event in full."""
+        dispatcher = IrrigationEventDispatcher(mock_hass)
+        handler = MagicMock()
+        dispatcher.async_subscribe(None, None, handler)
+
+        dispatcher._handle_event(_event({"trigger": "Heartbeat"}))
+        dispatcher._handle_event(_event({"trigger": "Heartbeat"}))
+
+        assert handler.call_count == 2
+        assert handler.call_args.args[0].data == {"trigger": "Heartbeat"}
+
+    def test_failing_subscriber_does_not_block_others(self, mock_hass):
+        """Test that one failing handler does not stop delivery."""
+        dispatcher = IrrigationEventDispatcher(mock_hass)
+        failing = MagicMock(side_effect=RuntimeError("boom"))
+        handler = MagicMock()
+        dispatcher.async_subscribe("Lawn", ("duration",), failing)
+        dispatcher.async_subscribe("Lawn", ("duration",), handler)
+
+        dispatcher._handle_event(_event({"lawn_duration": "5"}))
+
+        handler.assert_called_once()
+
+    def test_unsubscribe_stops_listening(self, mock_hass):
+        """Test that the bus listener is removed with the last subscriber."""
+        unsubscribe_bus = MagicMock()
+        mock_hass.bus.async_listen.return_value = unsubscribe_bus
+        dispatcher = IrrigationEventDispatcher(mock_hass)
+        handler = MagicMock()
+        first = dispatcher.async_subscribe("Lawn", ("duration",), handler)
+        second = dispatcher.async_subscribe(None, None, handler)
+
+        first()
+        unsubscribe_bus.assert_not_called()
+        second()
+        unsubscribe_bus.assert_called_once()
+        assert dispatcher.subscriber_count == 0
+
+        # Unsubscribing twice is harmless
+        first()
+
+    def test_resubscribe_receives_current_value(self, mock_hass):
+        """Test that a new subscriber gets the next value even if unchanged."""
+        dispatcher = IrrigationEventDispatcher(mock_hass)
+        data = {"lawn_duration": "5"}
+        first = MagicMock()
+        dispatcher.async_subscribe("Lawn", ("duration",), first)
+        dispatcher._handle_event(_event(data))
+
+        second = MagicMock()
+        dispatcher.async_subscribe("Lawn", ("duration",), second)
+        dispatcher._handle_event(_event(data))
+
+        second.assert_called_once()
+
+
+class TestSharedDispatcher:
+    """Test the hass.data backed helpers."""
+
+    def test_dispatcher_is_shared(self, mock_hass):
+        """Test that subscriptions share one dispatcher."""
+        async_subscribe_irrigation_zone(mock_hass, "Lawn", ("duration",), MagicMock())
+        async_subscribe_irrigation_zone(mock_hass, "Veg", ("duration",), MagicMock())
+
+        dispatcher = mock_hass.data[DOMAIN][IRRIGATION_EVENT_DISPATCHER_KEY]
+        assert dispatcher.subscriber_count == 2
+        mock_hass.bus.async_listen.assert_called_once()
+
+    def test_unload_removes_dispatcher(self, mock_hass):
+        """Test that unloading stops listening and drops the dispatcher."""
+        unsubscribe_bus = MagicMock()
+        mock_hass.bus.async_listen.return_value = unsubscribe_bus
+        async_subscribe_irrigation_zone(mock_hass, "Lawn", ("duration",), MagicMock())
+
+        async_unload_irrigation_event_dispatcher(mock_hass)
+
+        unsubscribe_bus.assert_called_once()
+        assert IRRIGATION_EVENT_DISPATCHER_KEY not in mock_hass.data[DOMAIN]
+
+    def test_zone_sensor_updates_through_dispatcher(self, mock_hass):
+        """Test that a zone sensor handles a routed update."""
+        sensor = IrrigationZoneLastRunStartTimeSensor(
+            hass=mock_hass,
+            entry_id="test_entry",
+            zone_device_id=("esphome", "device_123"),
+            zone_name="Flower Bed",
+            zone_id="zone-2",
+        )
+        sensor.async_write_ha_state = MagicMock()
+        async_subscribe_irrigation_zone(
+            mock_hass, "Flower Bed", ("start_time",), sensor._handle_esphome_event
+        )
+        dispatcher = mock_hass.data[DOMAIN][IRRIGATION_EVENT_DISPATCHER_KEY]
+
+        dispatcher._handle_event(
+            _event({"flower_bed_start_time": "2025-11-06T20:24:17+00:00"})
+        )
+
+        assert sensor._state == "2025-11-06T20:24:17+00:00"
+        sensor.async_write_ha_state.assert_called_once()
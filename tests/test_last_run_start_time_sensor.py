@@ -5,7 +5,11 @@ from unittest.mock import AsyncMock, Mock
 import pytest
 from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 
-from custom_components.plant_assistant.sensor import (
+from custom_components.plant_assistant.const import (
+    DOMAIN,
+    IRRIGATION_EVENT_DISPATCHER_KEY,
+)
+from custom_components.plant_assistant.sensor_zone import (
     IrrigationZoneLastRunStartTimeSensor,
 )
 
@@ -263,6 +267,7 @@ class TestIrrigationZoneLastRunStartTimeSensor:
     async def test_event_listener_setup(self):
         """Test that event listener is set up correctly."""
         hass = Mock()
+        hass.data = {}
         hass.bus.async_listen = Mock(return_value=Mock())
 
         sensor = IrrigationZoneLastRunStartTimeSensor(
@@ -280,8 +285,10 @@ class TestIrrigationZoneLastRunStartTimeSensor:
         # Call async_added_to_hass
         await sensor.async_added_to_hass()
 
-        # Verify event listener was registered
+        # Verify the shared dispatcher registered a single bus listener
+        dispatcher = hass.data[DOMAIN][IRRIGATION_EVENT_DISPATCHER_KEY]
         hass.bus.async_listen.assert_called_once_with(
             "esphome.irrigation_gateway_update",
-            sensor._handle_esphome_event,
+            dispatcher._handle_event,
         )
+        assert dispatcher.subscriber_count == 1
@@ -12,8 +12,7 @@ from custom_components.plant_assistant.binary_sensor import (
     LinkStatusBinarySensor,
 )
 from custom_components.plant_assistant.const import DOMAIN
-
-from .conftest import create_state_changed_event
+from custom_components.plant_assistant.state_multiplexer import SourceReading
 
 
 @pytest.fixture
@@ -581,13 +580,14 @@ class TestLinkStatusBinarySensorIgnoreUntil:
         sensor._device_available = False
         sensor.async_write_ha_state = MagicMock()
 
-        # Mock new state
-        new_state = MagicMock()
-        new_state.state = (dt_util.now() + timedelta(hours=1)).isoformat()
-
         # Call the state changed callback
-        event = create_state_changed_event(new_state)
-        sensor._monitor_link_ignore_until_state_changed(event)
+        reading = SourceReading(
+            "datetime.test_monitor_link_ignore_until",
+            (dt_util.now() + timedelta(hours=1)).isoformat(),
+            None,
+            None,
+        )
+        sensor._monitor_link_ignore_until_state_changed(reading)
 
         # Should parse datetime and update state
         assert sensor._ignore_until_datetime is not None
@@ -599,13 +599,11 @@ class TestLinkStatusBinarySensorIgnoreUntil:
         sensor._device_available = False
         sensor.async_write_ha_state = MagicMock()
 
-        # Mock unavailable state
-        new_state = MagicMock()
-        new_state.state = "unavailable"
-
         # Call the state changed callback
-        event = create_state_changed_event(new_state)
-        sensor._monitor_link_ignore_until_state_changed(event)
+        reading = SourceReading(
+            "datetime.test_monitor_link_ignore_until", STATE_UNAVAILABLE, None, None
+        )
+        sensor._monitor_link_ignore_until_state_changed(reading)
 
         # Should clear ignore until
         assert sensor._ignore_until_datetime is None
@@ -7,7 +7,7 @@ import pytest
 from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
 
-from custom_components.plant_assistant.binary_sensor import (
+from custom_components.plant_assistant.binary_sensor_zone import (
     MasterScheduleStatusMonitorBinarySensor,
     MasterScheduleStatusMonitorConfig,
 )
@@ -34,7 +34,7 @@ def mock_entity_registry():
     registry.entities.values = MagicMock(return_value=[])
 
     with patch(
-        "custom_components.plant_assistant.binary_sensor.er.async_get",
+        "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
         return_value=registry,
     ):
         yield registry
@@ -414,7 +414,7 @@ class TestMasterScheduleStatusMonitorBinarySensorAsyncOperations:
         mock_registry.entities.values.return_value = [mock_entity]
 
         with patch(
-            "custom_components.plant_assistant.binary_sensor.er.async_get",
+            "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
             return_value=mock_registry,
         ):
             result = await sensor._find_schedule_ignore_until_entity()
@@ -439,7 +439,7 @@ class TestMasterScheduleStatusMonitorBinarySensorAsyncOperations:
         mock_registry.entities.values.return_value = []
 
         with patch(
-            "custom_components.plant_assistant.binary_sensor.er.async_get",
+            "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
             return_value=mock_registry,
         ):
             result = await sensor._find_schedule_ignore_until_entity()
@@ -461,11 +461,11 @@ class TestMasterScheduleStatusMonitorBinarySensorAsyncOperations:
 
         with (
             patch(
-                "custom_components.plant_assistant.binary_sensor.er.async_get",
+                "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
                 return_value=mock_registry,
             ),
             patch(
-                "custom_components.plant_assistant.binary_sensor.async_track_state_change_event"
+                "custom_components.plant_assistant.binary_sensor_zone.async_track_state_change_event"
             ) as mock_track,
         ):
             mock_track.return_value = lambda: None
@@ -484,11 +484,14 @@ class TestMasterScheduleStatusMonitorBinarySensorAsyncOperations:
         mock_unsubscribe_switch = MagicMock()
         mock_unsubscribe_ignore = MagicMock()
 
-        sensor._unsubscribe_switch = mock_unsubscribe_switch
-        sensor._unsubscribe_ignore_until = mock_unsubscribe_ignore
+        sensor._unsubscribe_handlers = [
+            mock_unsubscribe_switch,
+            mock_unsubscribe_ignore,
+        ]
 
         await sensor.async_will_remove_from_hass()
 
         # Verify cleanup was called
         mock_unsubscribe_switch.assert_called_once()
         mock_unsubscribe_ignore.assert_called_once()
+        assert sensor._unsubscribe_handlers == []
@@ -0,0 +1,112 @@
+"""Tests for the registry of live mirror sensors."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from custom_components.plant_assistant.const import DOMAIN, MIRROR_REGISTRY_KEY
+from custom_components.plant_assistant.mirror_registry import (
+    MirrorEntityRegistry,
+    async_get_mirror_registry,
+    async_unload_mirror_registry,
+)
+from custom_components.plant_assistant.sensor import (
+    HumidityLinkedSensor,
+    MonitoringSensor,
+)
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance with two source states."""
+    hass = Mock()
+    hass.data = {}
+    states = {
+        "sensor.old_temp": Mock(state="21", attributes={}),
+        "sensor.new_temp": Mock(state="22", attributes={}),
+        "sensor.humidity": Mock(state="55", attributes={}),
+    }
+    hass.states.get = MagicMock(side_effect=states.get)
+    return hass
+
+
+def test_register_and_unregister():
+    """Test that registrations are grouped by source unique_id."""
+    registry = MirrorEntityRegistry()
+    first, second = object(), object()
+
+    remove_first = registry.async_register("source", first)
+    registry.async_register("source", second)
+    registry.async_register("source", second)
+
+    assert registry.async_get_mirrors("source") == [first, second]
+    assert registry.async_get_mirrors("other") == []
+    assert registry.async_get_mirrors(None) == []
+    assert len(registry) == 2
+
+    remove_first()
+    remove_first()
+    registry.async_unregister("source", second)
+    assert registry.async_get_mirrors("source") == []
+    assert len(registry) == 0
+
+
+def test_unload_removes_registry(mock_hass):
+    """Test that unloading drops the shared registry."""
+    registry = async_get_mirror_registry(mock_hass)
+    assert async_get_mirror_registry(mock_hass) is registry
+
+    async_unload_mirror_registry(mock_hass)
+
+    assert MIRROR_REGISTRY_KEY not in mock_hass.data[DOMAIN]
+
+
+async def test_mirror_sensors_register_while_added(mock_hass):
+    """Test that mirror sensors register on add and unregister on removal."""
+    with (
+        patch(
+            "custom_components.plant_assistant.sensor.er.async_get",
+            return_value=None,
+        ),
+        patch(
+            "custom_components.plant_assistant.sensor.async_subscribe_source",
+            return_value=MagicMock(),
+        ),
+    ):
+        monitoring = MonitoringSensor(
+            mock_hass,
+            {
+                "entry_id": "entry",
+                "source_entity_id": "sensor.old_temp",
+                "source_entity_unique_id": "temp_unique",
+                "device_name": "Bed",
+                "entity_name": "Temperature",
+                "sensor_type": "temperature",
+            },
+            location_device_id="location",
+        )
+        humidity = HumidityLinkedSensor(
+            mock_hass,
+            "entry",
+            "location",
+            "Bed",
+            "sensor.humidity",
+            "humidity_unique",
+        )
+        registry = async_get_mirror_registry(mock_hass)
+        assert len(registry) == 0
+
+        await monitoring.async_added_to_hass()
+        await humidity.async_added_to_hass()
+        assert registry.async_get_mirrors("temp_unique") == [monitoring]
+        assert registry.async_get_mirrors("humidity_unique") == [humidity]
+
+        # A rename keeps the mirror registered under the source unique_id
+        monitoring.async_write_ha_state = Mock()
+        await monitoring.async_update_source_entity("sensor.new_temp")
+        assert registry.async_get_mirrors("temp_unique") == [monitoring]
+
+        await monitoring.async_will_remove_from_hass()
+        await humidity.async_will_remove_from_hass()
+
+    assert len(registry) == 0
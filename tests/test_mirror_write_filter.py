@@ -0,0 +1,193 @@
+"""Tests for deadband and rate limiting of mirror sensor state writes."""
+
+import math
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.plant_assistant.const import DOMAIN, MIRROR_WRITE_FILTERS_KEY
+from custom_components.plant_assistant.mirror_write_filter import (
+    MirrorWriteFilter,
+    MirrorWriteFilterMixin,
+    async_get_mirror_write_filters,
+    async_unload_mirror_write_filters,
+)
+
+MODULE = "custom_components.plant_assistant.mirror_write_filter"
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+@pytest.fixture
+def clock():
+    """Patch the monotonic clock and the trailing flush timer."""
+    with (
+        patch(f"{MODULE}.time.monotonic", return_value=0.0) as monotonic,
+        patch(f"{MODULE}.async_call_later") as call_later,
+    ):
+        yield monotonic, call_later
+
+
+class _Base:
+    """Stand-in for Entity that records written states."""
+
+    def __init__(self, hass):
+        self.hass = hass
+        self.written = []
+
+    def async_write_ha_state(self):
+        self.written.append(self._state)
+
+    async def async_will_remove_from_hass(self):
+        """Stand-in for the entity removal hook."""
+
+
+class _Mirror(MirrorWriteFilterMixin, _Base):
+    """Mirror sensor using the write filter."""
+
+    _mirror_write_type = "soil_moisture"
+
+    def update(self, state):
+        self._state = state
+        self.async_write_mirror_state()
+
+
+def _configure(hass, **settings):
+    async_get_mirror_write_filters(hass).async_configure({"soil_moisture": settings})
+
+
+def test_without_filter_every_update_is_written(mock_hass):
+    """Test that mirrors write every update unless a filter is configured."""
+    mirror = _Mirror(mock_hass)
+
+    for state in ("40", "40", "40.1"):
+        mirror.update(state)
+
+    assert mirror.written == ["40", "40", "40.1"]
+
+
+@pytest.mark.usefixtures("clock")
+def test_deadband_holds_small_changes(mock_hass):
+    """Test that changes within the deadband wait for the trailing flush."""
+    _configure(mock_hass, deadband=0.5, relative_deadband=0.1)
+    mirror = _Mirror(mock_hass)
+
+    mirror.update("40")
+    mirror.update("43.9")
+    assert mirror.written == ["40"]
+
+    mirror.update("45")
+    assert mirror.written == ["40", "45"]
+    assert async_get_mirror_write_filters(mock_hass).held_writes == 1
+
+
+def test_rate_limit_flushes_latest_value(mock_hass, clock):
+    """Test that updates within the interval are flushed once, with the latest."""
+    monotonic, call_later = clock
+    _configure(mock_hass, min_interval=60)
+    mirror = _Mirror(mock_hass)
+
+    mirror.update("40")
+    monotonic.return_value = 10.0
+    mirror.update("42")
+    mirror.update("44")
+
+    assert mirror.written == ["40"]
+    call_later.assert_called_once_with(
+        mock_hass, 50.0, mirror._async_flush_mirror_state
+    )
+
+    mirror._async_flush_mirror_state(None)
+
+    assert mirror.written == ["40", "44"]
+    assert async_get_mirror_write_filters(mock_hass).as_dict() == {
+        "filters": {
+            "soil_moisture": {
+                "deadband": 0.0,
+                "relative_deadband": 0.0,
+                "min_interval": 60.0,
+            }
+        },
+        "writes": 1,
+        "held_writes": 2,
+        "flushes": 1,
+    }
+
+
+def test_sooner_flush_replaces_pending_one(mock_hass, clock):
+    """Test that a held update due sooner reschedules the trailing flush."""
+    monotonic, call_later = clock
+    _configure(mock_hass, deadband=1, min_interval=60)
+    mirror = _Mirror(mock_hass)
+
+    mirror.update("40")
+    monotonic.return_value = 30.0
+    # Within the deadband: flushed after a full interval
+    mirror.update("40.5")
+    first_flush = call_later.return_value
+    call_later.return_value = MagicMock()
+    # Outside the deadband: due when the interval since the last write ends
+    mirror.update("45")
+
+    first_flush.assert_called_once()
+    assert [call.args[1] for call in call_later.call_args_list] == [60.0, 30.0]
+
+    # A later deadline leaves the sooner flush in place
+    monotonic.return_value = 40.0
+    mirror.update("45.5")
+    assert call_later.call_count == 2
+
+    mirror._async_flush_mirror_state(None)
+    assert mirror.written == ["40", "45.5"]
+    assert mirror._mirror_flush_at == math.inf
+
+
+def test_unavailable_transitions_pass_through(mock_hass, clock):
+    """Test that updates to and from unavailable are never held."""
+    _, call_later = clock
+    _configure(mock_hass, deadband=5, min_interval=60)
+    mirror = _Mirror(mock_hass)
+
+    mirror.update("40")
+    mirror.update("41")
+    mirror.update("unavailable")
+    mirror.update("41")
+
+    assert mirror.written == ["40", "unavailable", "41"]
+    # The held update's flush is cancelled by the next write
+    call_later.return_value.assert_called_once()
+
+
+@pytest.mark.usefixtures("clock")
+async def test_removal_cancels_pending_flush(mock_hass):
+    """Test that a held update is dropped when the mirror is removed."""
+    _configure(mock_hass, min_interval=60)
+    mirror = _Mirror(mock_hass)
+    mirror.update("40")
+    mirror.update("41")
+    cancel = mirror._mirror_cancel_flush
+
+    await mirror.async_will_remove_from_hass()
+
+    cancel.assert_called_once()
+    assert mirror._mirror_cancel_flush is None
+
+
+def test_invalid_filter_is_ignored(mock_hass):
+    """Test that a filter with invalid settings is skipped."""
+    filters = async_get_mirror_write_filters(mock_hass)
+    filters.async_configure(
+        {"temperature": {"deadband": -1}, "battery": {"min_interval": 300}}
+    )
+
+    assert filters.get("temperature") is None
+    assert filters.get("battery") == MirrorWriteFilter(min_interval=300.0)
+
+    async_unload_mirror_write_filters(mock_hass)
+    assert MIRROR_WRITE_FILTERS_KEY not in mock_hass.data[DOMAIN]
@@ -5,8 +5,9 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from custom_components.plant_assistant.const import DOMAIN
-from custom_components.plant_assistant.sensor import (
-    _cleanup_orphaned_monitoring_sensors,
+from custom_components.plant_assistant.orphan_cleanup import (
+    ORPHAN_MATCHER,
+    async_cleanup_orphaned_entities,
 )
 
 
@@ -70,7 +71,7 @@ async def test_cleanup_orphaned_monitoring_sensors_removes_disassociated_sensors
         mock_entry.subentries = {}
 
         # Run cleanup
-        await _cleanup_orphaned_monitoring_sensors(mock_hass, mock_entry)
+        async_cleanup_orphaned_entities(mock_hass, mock_entry)
 
         # Verify orphaned sensors were removed
         assert mock_entity_registry.async_remove.call_count == 2
@@ -164,7 +165,7 @@ async def test_cleanup_orphaned_monitoring_sensors_preserves_current_sensors():
         mock_entry.subentries = {"subentry_123": mock_subentry}
 
         # Run cleanup
-        await _cleanup_orphaned_monitoring_sensors(mock_hass, mock_entry)
+        async_cleanup_orphaned_entities(mock_hass, mock_entry)
 
         # Verify only orphaned sensor was removed, not the expected one
         mock_entity_registry.async_remove.assert_called_once_with(
@@ -193,7 +194,7 @@ async def test_cleanup_orphaned_monitoring_sensors_with_no_subentries():
         mock_entry.subentries = {}
 
         # Run cleanup - should not raise any errors
-        await _cleanup_orphaned_monitoring_sensors(mock_hass, mock_entry)
+        async_cleanup_orphaned_entities(mock_hass, mock_entry)
 
         # Verify no entities were removed
         mock_entity_registry.async_remove.assert_not_called()
@@ -239,7 +240,7 @@ async def test_cleanup_orphaned_monitoring_sensors_ignores_other_domains():
         mock_entry.subentries = {}
 
         # Run cleanup
-        await _cleanup_orphaned_monitoring_sensors(mock_hass, mock_entry)
+        async_cleanup_orphaned_entities(mock_hass, mock_entry)
 
         # Verify no entities from other domains/platforms were removed
         mock_entity_registry.async_remove.assert_not_called()
@@ -265,7 +266,7 @@ async def test_cleanup_orphaned_monitoring_sensors_handles_exceptions():
         mock_entry.subentries = {}
 
         # Run cleanup - should not raise any errors
-        await _cleanup_orphaned_monitoring_sensors(mock_hass, mock_entry)
+        async_cleanup_orphaned_entities(mock_hass, mock_entry)
 
         # No exceptions should have been raised
 
@@ -305,7 +306,7 @@ async def test_cleanup_orphaned_monitoring_sensors_removes_battery_sensors():
         mock_entry.subentries = {}
 
         # Run cleanup
-        await _cleanup_orphaned_monitoring_sensors(mock_hass, mock_entry)
+        async_cleanup_orphaned_entities(mock_hass, mock_entry)
 
         # Verify orphaned battery sensor was removed
         mock_entity_registry.async_remove.assert_called_once_with(
@@ -348,9 +349,89 @@ async def test_cleanup_orphaned_monitoring_sensors_removes_signal_strength_senso
         mock_entry.subentries = {}
 
         # Run cleanup
-        await _cleanup_orphaned_monitoring_sensors(mock_hass, mock_entry)
+        async_cleanup_orphaned_entities(mock_hass, mock_entry)
 
         # Verify orphaned signal strength sensor was removed
         mock_entity_registry.async_remove.assert_called_once_with(
             "sensor.orphaned_signal"
         )
+
+
+@pytest.mark.parametrize(
+    ("domain", "unique_id", "expected"),
+    [
+        (
+            "sensor",
+            f"{DOMAIN}_sub_bed_soil_conductivity_mirror",
+            ("sub_bed", "soil_conductivity_mirror"),
+        ),
+        ("sensor", f"{DOMAIN}_sub_bed_min_temperature", ("sub_bed", "min_temperature")),
+        (
+            "sensor",
+            f"{DOMAIN}_sub_bed_monitor_sensor_probe_ph",
+            ("sub_bed", "monitor_sensor_probe_ph"),
+        ),
+        (
+            "datetime",
+            f"{DOMAIN}_sub_humidity_high_threshold_ignore_until",
+            ("sub", "humidity_high_threshold_ignore_until"),
+        ),
+        ("sensor", f"{DOMAIN}_sub_bed_plant_count", None),
+        ("datetime", f"{DOMAIN}_sub_bed_illuminance_mirror", None),
+        ("switch", f"{DOMAIN}_sub_bed_illuminance_mirror", None),
+    ],
+)
+def test_orphan_matcher_parses_roles(domain, unique_id, expected):
+    """Test that unique_ids are parsed into owner and role per domain."""
+    assert ORPHAN_MATCHER.parse(domain, unique_id) == expected
+
+
+def test_cleanup_covers_sensor_and_datetime_entities_in_one_pass():
+    """Test that one pass removes orphans of every platform and keeps the rest."""
+    mock_hass = MagicMock()
+    mock_entity_registry = MagicMock()
+
+    def _entry(domain, unique_id):
+        entity_entry = MagicMock()
+        entity_entry.platform = DOMAIN
+        entity_entry.domain = domain
+        entity_entry.unique_id = f"{DOMAIN}_{unique_id}"
+        entity_entry.config_entry_id = "main_entry_123"
+        return entity_entry
+
+    mock_entity_registry.entities = {
+        "sensor.bed_humidity": _entry("sensor", "bed_bed_humidity_linked"),
+        "sensor.old_humidity": _entry("sensor", "old_old_humidity_linked"),
+        "datetime.bed_battery": _entry(
+            "datetime", "bed_battery_low_threshold_ignore_until"
+        ),
+        "datetime.bed_humidity": _entry("datetime", "bed_humidity_ignore_until"),
+        "datetime.old_battery": _entry(
+            "datetime", "old_battery_low_threshold_ignore_until"
+        ),
+        "switch.bed": _entry("switch", "bed_irrigation"),
+    }
+    mock_entity_registry.async_remove = MagicMock()
+
+    mock_subentry = MagicMock()
+    mock_subentry.subentry_id = "bed"
+    mock_subentry.data = {
+        "device_id": "location_device_123",
+        "humidity_entity_id": "sensor.room_humidity",
+        "name": "Bed",
+    }
+    mock_entry = MagicMock()
+    mock_entry.entry_id = "main_entry_123"
+    mock_entry.subentries = {"bed": mock_subentry}
+
+    with patch(
+        "custom_components.plant_assistant.orphan_cleanup.er.async_get",
+        return_value=mock_entity_registry,
+    ):
+        removed = async_cleanup_orphaned_entities(mock_hass, mock_entry)
+
+    # Without plants the humidity ignore until entity is no longer created
+    assert removed == 3
+    assert sorted(
+        call.args[0] for call in mock_entity_registry.async_remove.call_args_list
+    ) == ["datetime.bed_humidity", "datetime.old_battery", "sensor.old_humidity"]
@@ -0,0 +1,249 @@
+"""Tests for the shared per-location plant attribute snapshot."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.core import Event
+
+from custom_components.plant_assistant.const import (
+    AGGREGATED_SENSOR_MAPPINGS,
+    DOMAIN,
+    PLANT_SNAPSHOTS_KEY,
+)
+from custom_components.plant_assistant.plant_snapshot import (
+    assigned_plant_device_ids,
+    async_discard_location_plant_snapshot,
+    async_get_location_plant_snapshot,
+    async_setup_plant_snapshots,
+    async_unload_plant_snapshots,
+)
+from custom_components.plant_assistant.sensor import AggregatedLocationSensor
+from custom_components.plant_assistant.threshold_store import PlantThresholdStore
+
+MODULE = "custom_components.plant_assistant.plant_snapshot"
+
+PLANT_SLOTS = {
+    "slot_1": {"plant_device_id": "plant_device_1"},
+    "slot_2": {"plant_device_id": "plant_device_2"},
+    "slot_3": {},
+}
+
+
+def _entity(entity_id, device_id, platform="openplantbook_ref", domain="sensor"):
+    entity = MagicMock()
+    entity.entity_id = entity_id
+    entity.device_id = device_id
+    entity.platform = platform
+    entity.domain = domain
+    return entity
+
+
+def _state(**attributes):
+    return MagicMock(attributes=attributes)
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance with two plants."""
+    hass = MagicMock()
+    hass.data = {}
+    states = {
+        "sensor.plant_1": _state(minimum_temperature=10, maximum_temperature=30),
+        "sensor.plant_2": _state(minimum_temperature=12, maximum_temperature=28),
+    }
+    hass.states.get = MagicMock(side_effect=states.get)
+    return hass
+
+
+@pytest.fixture
+def registries():
+    """Patch the registries and state tracking used by the snapshot."""
+    entities_by_device = {
+        "plant_device_1": [_entity("sensor.plant_1", "plant_device_1")],
+        "plant_device_2": [
+            _entity("sensor.plant_2", "plant_device_2"),
+            _entity("sensor.other", "plant_device_2", platform="other"),
+        ],
+    }
+    with (
+        patch(f"{MODULE}.dr.async_get"),
+        patch(f"{MODULE}.er.async_get"),
+        patch(
+            f"{MODULE}.er.async_entries_for_device",
+            side_effect=lambda _reg, device_id: entities_by_device.get(device_id, []),
+        ) as entries_for_device,
+        patch(f"{MODULE}.async_track_state_change_event") as track,
+    ):
+        yield entries_for_device, track
+
+
+def _changed(entity_id, new_state):
+    return Event(
+        "state_changed",
+        {"entity_id": entity_id, "old_state": None, "new_state": new_state},
+    )
+
+
+def test_assigned_plant_device_ids():
+    """Test that only slots with a plant device are collected."""
+    assert assigned_plant_device_ids(PLANT_SLOTS) == {
+        "plant_device_1",
+        "plant_device_2",
+    }
+
+
+def test_snapshot_is_shared_per_location(mock_hass, registries):
+    """Test that one snapshot and one listener serve the whole location."""
+    entries_for_device, track = registries
+
+    first = async_get_location_plant_snapshot(mock_hass, "location_1", PLANT_SLOTS)
+    second = async_get_location_plant_snapshot(mock_hass, "location_1", PLANT_SLOTS)
+
+    assert first is second
+    assert first.entity_ids == ["sensor.plant_1", "sensor.plant_2"]
+    assert len(first.plants) == 2
+    assert entries_for_device.call_count == 2
+    track.assert_called_once()
+    assert mock_hass.data[DOMAIN][PLANT_SNAPSHOTS_KEY]["location_1"] is first
+
+
+@pytest.mark.usefixtures("registries")
+def test_changed_plant_updates_one_row(mock_hass):
+    """Test that a plant change updates its row and notifies listeners once."""
+    snapshot = async_get_location_plant_snapshot(mock_hass, "location_1", PLANT_SLOTS)
+    listener = MagicMock()
+    snapshot.async_add_listener(listener)
+
+    snapshot._handle_plant_state_changed(
+        _changed(
+            "sensor.plant_2",
+            _state(minimum_temperature=15, maximum_temperature=28),
+        )
+    )
+
+    listener.assert_called_once()
+    assert {plant["minimum_temperature"] for plant in snapshot.plants} == {10, 15}
+
+    # Unrelated attribute changes do not notify
+    snapshot._handle_plant_state_changed(
+        _changed(
+            "sensor.plant_2",
+            _state(minimum_temperature=15, maximum_temperature=28, friendly="x"),
+        )
+    )
+    listener.assert_called_once()
+    assert snapshot.rebuilds == 1
+
+
+@pytest.mark.usefixtures("registries")
+def test_changed_slots_rebuild_snapshot(mock_hass):
+    """Test that a different slot assignment replaces the snapshot."""
+    first = async_get_location_plant_snapshot(mock_hass, "location_1", PLANT_SLOTS)
+
+    second = async_get_location_plant_snapshot(
+        mock_hass, "location_1", {"slot_1": {"plant_device_id": "plant_device_1"}}
+    )
+
+    assert second is not first
+    assert second.entity_ids == ["sensor.plant_1"]
+
+
+def test_last_listener_removes_snapshot(mock_hass, registries):
+    """Test that the snapshot stops tracking once no sensor reads it."""
+    _entries_for_device, track = registries
+    snapshot = async_get_location_plant_snapshot(mock_hass, "location_1", PLANT_SLOTS)
+    remove_first = snapshot.async_add_listener(MagicMock())
+    remove_second = snapshot.async_add_listener(MagicMock())
+
+    remove_first()
+    track.return_value.assert_not_called()
+    remove_second()
+
+    track.return_value.assert_called_once()
+    assert "location_1" not in mock_hass.data[DOMAIN][PLANT_SNAPSHOTS_KEY]
+
+
+def test_discard_removed_location_snapshot(mock_hass, registries):
+    """Test that a removed location's snapshot stops tracking and is dropped."""
+    _entries_for_device, track = registries
+    snapshot = async_get_location_plant_snapshot(mock_hass, "location_1", PLANT_SLOTS)
+    snapshot.async_add_listener(MagicMock())
+
+    async_discard_location_plant_snapshot(mock_hass, "location_1")
+    async_discard_location_plant_snapshot(mock_hass, "location_1")
+
+    track.return_value.assert_called_once()
+    assert "location_1" not in mock_hass.data[DOMAIN][PLANT_SNAPSHOTS_KEY]
+
+
+def test_unload_stops_all_snapshots(mock_hass, registries):
+    """Test that unloading stops tracking and drops the snapshots."""
+    _entries_for_device, track = registries
+    async_get_location_plant_snapshot(mock_hass, "location_1", PLANT_SLOTS)
+
+    async_unload_plant_snapshots(mock_hass)
+
+    track.return_value.assert_called_once()
+    assert PLANT_SNAPSHOTS_KEY not in mock_hass.data[DOMAIN]
+
+
+@pytest.mark.usefixtures("registries")
+async def test_aggregated_sensors_share_snapshot(mock_hass):
+    """Test that a location's aggregated sensors read one snapshot."""
+    sensors = [
+        AggregatedLocationSensor(
+            hass=mock_hass,
+            entry_id="entry_1",
+            location_device_id="location_1",
+            location_name="Bed",
+            metric_key=metric_key,
+            metric_config={
+                "aggregation_type": aggregation_type,
+                "plant_attr_min": "minimum_temperature",
+                "plant_attr_max": "maximum_temperature",
+            },
+            plant_slots=PLANT_SLOTS,
+        )
+        for metric_key, aggregation_type in (
+            ("min_temperature", "max_of_mins"),
+            ("max_temperature", "min_of_maximums"),
+        )
+    ]
+    for sensor in sensors:
+        sensor.async_write_ha_state = MagicMock()
+        await sensor.async_added_to_hass()
+
+    assert [sensor.native_value for sensor in sensors] == [12, 28]
+    snapshot = mock_hass.data[DOMAIN][PLANT_SNAPSHOTS_KEY]["location_1"]
+    snapshot._handle_plant_state_changed(
+        _changed(
+            "sensor.plant_1",
+            _state(minimum_temperature=14, maximum_temperature=25),
+        )
+    )
+
+    assert [sensor.native_value for sensor in sensors] == [14, 25]
+    assert snapshot.rebuilds == 1
+
+
+@pytest.mark.usefixtures("registries")
+def test_setup_aggregates_locations_in_one_batch(mock_hass):
+    """Test that the batch setup primes every location's aggregates."""
+    async_setup_plant_snapshots(mock_hass, {"location_1": PLANT_SLOTS})
+    snapshot = mock_hass.data[DOMAIN][PLANT_SNAPSHOTS_KEY]["location_1"]
+
+    with patch.object(PlantThresholdStore, "aggregate_metrics") as aggregate_metrics:
+        assert (
+            snapshot.aggregate(
+                "min_temperature", AGGREGATED_SENSOR_MAPPINGS["min_temperature"]
+            )
+            == 12
+        )
+        assert (
+            snapshot.aggregate(
+                "max_temperature", AGGREGATED_SENSOR_MAPPINGS["max_temperature"]
+            )
+            == 28
+        )
+
+    aggregate_metrics.assert_not_called()
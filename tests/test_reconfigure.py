@@ -0,0 +1,211 @@
+"""Tests for diff-based reconfiguration of option and subentry updates."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.plant_assistant.const import (
+    CONF_MIRROR_WRITE_FILTERS,
+    CONF_STATE_WRITE_DEBOUNCE,
+    DOMAIN,
+    RECONFIGURE_KEY,
+)
+from custom_components.plant_assistant.mirror_write_filter import (
+    async_get_mirror_write_filters,
+)
+from custom_components.plant_assistant.reconfigure import (
+    ConfigSnapshot,
+    async_get_reconfigure_manager,
+    async_listen_subentry_removal,
+    async_listen_subentry_updates,
+    async_unload_reconfigure_manager,
+    diff_config,
+    reload_reason,
+)
+from custom_components.plant_assistant.write_coalescer import (
+    async_get_write_coalescer,
+)
+
+MODULE = "custom_components.plant_assistant.reconfigure"
+
+
+def _slots(*plant_ids):
+    return {
+        f"slot_{i}": {"plant_device_id": plant_id}
+        for i, plant_id in enumerate(plant_ids, start=1)
+    }
+
+
+def _entry(options=None, subentries=None):
+    entry = MagicMock()
+    entry.entry_id = "main"
+    entry.data = {"name": "Plant Assistant"}
+    entry.options = options or {}
+    entry.subentries = {
+        subentry_id: MagicMock(data=data)
+        for subentry_id, data in (subentries or {}).items()
+    }
+    return entry
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+@pytest.fixture
+def mock_plant_snapshots():
+    """Patch the plant snapshot rebuild."""
+    with patch(f"{MODULE}.async_setup_plant_snapshots") as setup:
+        yield setup
+
+
+def test_diff_config():
+    """Test that the diff reports options and subentry changes by key."""
+    old = ConfigSnapshot.from_entry(
+        _entry(
+            {"irrigation_zones": {}, CONF_STATE_WRITE_DEBOUNCE: 0},
+            {
+                "bed": {"name": "Bed", "plant_slots": _slots("a")},
+                "pot": {"name": "Pot"},
+            },
+        )
+    )
+    new = ConfigSnapshot.from_entry(
+        _entry(
+            {"irrigation_zones": {}, CONF_STATE_WRITE_DEBOUNCE: 2},
+            {
+                "bed": {"name": "Bed", "plant_slots": _slots("a", "b")},
+                "tub": {"name": "Tub"},
+            },
+        )
+    )
+
+    diff = diff_config(old, new)
+
+    assert diff.data == frozenset()
+    assert diff.options == {CONF_STATE_WRITE_DEBOUNCE}
+    assert diff.added_subentries == {"tub"}
+    assert diff.removed_subentries == {"pot"}
+    assert diff.changed_subentries == {"bed": {"plant_slots"}}
+    assert not diff.is_empty
+    assert "locations added" in reload_reason(diff, old, new)
+    assert diff_config(old, old).is_empty
+
+
+@pytest.mark.parametrize(
+    ("options", "subentries", "reason"),
+    [
+        ({"irrigation_zones": {"z": {"name": "Front"}}}, None, "options changed"),
+        (None, {"bed": {"name": "Renamed", "plant_slots": _slots("a")}}, "changed"),
+        (None, {"bed": {"name": "Bed", "plant_slots": {}}}, "plant assignment"),
+    ],
+)
+def test_unsupported_changes_need_reload(options, subentries, reason):
+    """Test that changes altering the entity set fall back to a reload."""
+    old = ConfigSnapshot.from_entry(
+        _entry({}, {"bed": {"name": "Bed", "plant_slots": _slots("a")}})
+    )
+    new = ConfigSnapshot.from_entry(
+        _entry(
+            options or {},
+            subentries or {"bed": {"name": "Bed", "plant_slots": _slots("a")}},
+        )
+    )
+
+    assert reason in reload_reason(diff_config(old, new), old, new)
+
+
+def test_slot_edit_is_applied_in_place(mock_hass, mock_plant_snapshots):
+    """Test that a slot edit reaches the location's entities without a reload."""
+    entry = _entry({}, {"bed": {"name": "Bed", "plant_slots": _slots("a")}})
+    manager = async_get_reconfigure_manager(mock_hass)
+    manager.async_remember(entry)
+    bed_listener = MagicMock()
+    other_listener = MagicMock()
+    async_listen_subentry_updates(mock_hass, "bed", bed_listener)
+    async_listen_subentry_updates(mock_hass, "pot", other_listener)
+
+    entry.subentries["bed"].data = {"name": "Bed", "plant_slots": _slots("a", "b")}
+
+    assert manager.async_apply(entry) is True
+    bed_listener.assert_called_once_with(entry.subentries["bed"].data)
+    other_listener.assert_not_called()
+    mock_plant_snapshots.assert_called_once_with(mock_hass, {"bed": _slots("a", "b")})
+    assert manager.as_dict() == {"applied": 1, "reloads": 0}
+
+    # The applied configuration becomes the new baseline
+    assert manager.async_apply(entry) is True
+    bed_listener.assert_called_once()
+
+
+@pytest.mark.usefixtures("mock_plant_snapshots")
+def test_runtime_option_and_removed_location(mock_hass):
+    """Test that the debounce option and removed locations apply in place."""
+    entry = _entry({CONF_STATE_WRITE_DEBOUNCE: 0}, {"bed": {"name": "Bed"}})
+    manager = async_get_reconfigure_manager(mock_hass)
+    manager.async_remember(entry)
+    async_listen_subentry_updates(mock_hass, "bed", MagicMock())
+    on_removed = MagicMock()
+    async_listen_subentry_removal(mock_hass, "bed", on_removed)
+
+    entry.options = {CONF_STATE_WRITE_DEBOUNCE: 1.5}
+    entry.subentries = {}
+
+    with (
+        patch(f"{MODULE}.async_unregister_location") as unregister,
+        patch(f"{MODULE}.async_discard_location_plant_snapshot") as discard,
+    ):
+        assert manager.async_apply(entry) is True
+
+    # Home Assistant itself removes the entities of a removed subentry
+    on_removed.assert_called_once_with()
+    unregister.assert_called_once_with(mock_hass, "bed")
+    discard.assert_called_once_with(mock_hass, "bed")
+    assert async_get_write_coalescer(mock_hass).debounce == 1.5
+    assert not manager._listeners
+    assert not manager._removal_listeners
+
+
+def test_removal_listener_can_be_removed(mock_hass):
+    """Test that a removed removal listener is not called."""
+    entry = _entry({}, {"bed": {"name": "Bed"}})
+    manager = async_get_reconfigure_manager(mock_hass)
+    manager.async_remember(entry)
+    on_removed = MagicMock()
+    async_listen_subentry_removal(mock_hass, "bed", on_removed)()
+
+    entry.subentries = {}
+    with (
+        patch(f"{MODULE}.async_unregister_location"),
+        patch(f"{MODULE}.async_discard_location_plant_snapshot"),
+    ):
+        assert manager.async_apply(entry) is True
+
+    on_removed.assert_not_called()
+
+
+def test_mirror_write_filters_apply_in_place(mock_hass):
+    """Test that changed mirror write filters apply without a reload."""
+    entry = _entry({})
+    manager = async_get_reconfigure_manager(mock_hass)
+    manager.async_remember(entry)
+
+    entry.options = {CONF_MIRROR_WRITE_FILTERS: {"temperature": {"deadband": 0.2}}}
+
+    assert manager.async_apply(entry) is True
+    assert async_get_mirror_write_filters(mock_hass).get("temperature").deadband == 0.2
+
+
+def test_unknown_entry_reloads(mock_hass):
+    """Test that an entry without a recorded configuration is reloaded."""
+    manager = async_get_reconfigure_manager(mock_hass)
+
+    assert manager.async_apply(_entry()) is False
+    assert manager.reloads == 1
+
+    async_unload_reconfigure_manager(mock_hass)
+    assert RECONFIGURE_KEY not in mock_hass.data[DOMAIN]
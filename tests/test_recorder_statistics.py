@@ -0,0 +1,246 @@
+"""Tests for the shared recorder statistics service."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.util import dt as dt_util
+
+from custom_components.plant_assistant.const import DOMAIN, RECORDER_STATISTICS_KEY
+from custom_components.plant_assistant.recorder_statistics import (
+    HourlyMeanWindow,
+    RecorderStatisticsService,
+    async_get_statistics_service,
+)
+
+WEEK = timedelta(days=7)
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+def _recorder(stats):
+    recorder = MagicMock()
+    recorder.async_add_executor_job = AsyncMock(return_value=stats)
+    return recorder
+
+
+async def test_subscribed_ids_share_one_query(mock_hass):
+    """Test that all subscribed ids are fetched in a single query."""
+    service = RecorderStatisticsService(mock_hass)
+    service.async_subscribe("sensor.a", WEEK)
+    service.async_subscribe("sensor.b", WEEK)
+    recorder = _recorder({"sensor.a": [{"mean": 1.0}], "sensor.b": [{"mean": 2.0}]})
+
+    first = await service.async_get_hourly_means(recorder, "sensor.a", WEEK)
+    second = await service.async_get_hourly_means(recorder, "sensor.b", WEEK)
+
+    assert first == [{"mean": 1.0}]
+    assert second == [{"mean": 2.0}]
+    recorder.async_add_executor_job.assert_awaited_once()
+    assert recorder.async_add_executor_job.call_args.args[4] == {
+        "sensor.a",
+        "sensor.b",
+    }
+    assert service.query_count == 1
+
+
+async def test_concurrent_requests_wait_for_in_flight_query(mock_hass):
+    """Test that requests during an in-flight query share its result."""
+    service = RecorderStatisticsService(mock_hass)
+    service.async_subscribe("sensor.a", WEEK)
+    service.async_subscribe("sensor.b", WEEK)
+    release = asyncio.Event()
+
+    async def _slow_query(*_args):
+        await release.wait()
+        return {"sensor.a": [{"mean": 1.0}], "sensor.b": [{"mean": 2.0}]}
+
+    recorder = MagicMock()
+    recorder.async_add_executor_job = AsyncMock(side_effect=_slow_query)
+
+    first = asyncio.create_task(
+        service.async_get_hourly_means(recorder, "sensor.a", WEEK)
+    )
+    second = asyncio.create_task(
+        service.async_get_hourly_means(recorder, "sensor.b", WEEK)
+    )
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await first == [{"mean": 1.0}]
+    assert await second == [{"mean": 2.0}]
+    assert service.query_count == 1
+
+
+async def test_results_expire_after_cycle(mock_hass):
+    """Test that a new cycle queries the recorder again."""
+    service = RecorderStatisticsService(mock_hass)
+    service.async_subscribe("sensor.a", WEEK)
+    recorder = _recorder({"sensor.a": [{"mean": 1.0}]})
+    now = dt_util.utcnow()
+
+    with patch(
+        "custom_components.plant_assistant.recorder_statistics.dt_util.utcnow",
+        return_value=now,
+    ) as mock_utcnow:
+        await service.async_get_hourly_means(recorder, "sensor.a", WEEK)
+        await service.async_get_hourly_means(recorder, "sensor.a", WEEK)
+        assert service.query_count == 1
+
+        mock_utcnow.return_value = now + timedelta(minutes=5)
+        await service.async_get_hourly_means(recorder, "sensor.a", WEEK)
+
+    assert service.query_count == 2
+
+
+async def test_unknown_id_triggers_new_query(mock_hass):
+    """Test that an id missing from the current cycle is fetched."""
+    service = RecorderStatisticsService(mock_hass)
+    recorder = _recorder({"sensor.a": [{"mean": 1.0}]})
+
+    await service.async_get_hourly_means(recorder, "sensor.a", WEEK)
+    result = await service.async_get_hourly_means(recorder, "sensor.b", WEEK)
+
+    assert result is None
+    assert service.query_count == 2
+
+
+async def test_lookbacks_are_batched_separately(mock_hass):
+    """Test that different lookback windows use separate queries."""
+    service = RecorderStatisticsService(mock_hass)
+    service.async_subscribe("sensor.a", WEEK)
+    service.async_subscribe("sensor.a", timedelta(hours=3))
+    recorder = _recorder({"sensor.a": [{"mean": 1.0}]})
+
+    await service.async_get_hourly_means(recorder, "sensor.a", WEEK)
+    await service.async_get_hourly_means(recorder, "sensor.a", timedelta(hours=3))
+
+    assert service.query_count == 2
+
+
+async def test_unsubscribe_removes_id_from_batch(mock_hass):
+    """Test that unsubscribed ids are no longer queried."""
+    service = RecorderStatisticsService(mock_hass)
+    service.async_subscribe("sensor.a", WEEK)
+    unsubscribe = service.async_subscribe("sensor.b", WEEK)
+    unsubscribe()
+    recorder = _recorder({})
+
+    await service.async_get_hourly_means(recorder, "sensor.a", WEEK)
+
+    assert recorder.async_add_executor_job.call_args.args[4] == {"sensor.a"}
+
+
+async def test_query_error_propagates_and_is_not_cached(mock_hass):
+    """Test that a failed query raises and the next request retries."""
+    service = RecorderStatisticsService(mock_hass)
+    recorder = MagicMock()
+    recorder.async_add_executor_job = AsyncMock(side_effect=ValueError("db"))
+
+    with pytest.raises(ValueError, match="db"):
+        await service.async_get_hourly_means(recorder, "sensor.a", WEEK)
+
+    recorder.async_add_executor_job = AsyncMock(return_value={"sensor.a": []})
+    assert await service.async_get_hourly_means(recorder, "sensor.a", WEEK) == []
+
+
+def test_service_is_shared(mock_hass):
+    """Test that the service is stored in hass.data and reused."""
+    service = async_get_statistics_service(mock_hass)
+
+    assert async_get_statistics_service(mock_hass) is service
+    assert mock_hass.data[DOMAIN][RECORDER_STATISTICS_KEY] is service
+
+
+class TestHourlyMeanWindow:
+    """Test the rolling hourly mean ring buffer."""
+
+    def test_counts_against_threshold(self):
+        """Test counting hours below and above a threshold."""
+        window = HourlyMeanWindow()
+        window.extend([{"mean": 3.0}, {"mean": 6.0}, {"mean": None}], 100)
+
+        assert len(window) == 2
+        assert window.count_below(5.0) == 1
+        assert window.count_above(5.0) == 1
+        assert window.latest_sample_hour == 99
+
+    def test_rows_with_start_are_placed_by_hour(self):
+        """Test that rows with a start timestamp land in their own hour."""
+        window = HourlyMeanWindow()
+        window.extend([{"start": 10 * 3600.0, "mean": 1.0}], 20)
+
+        assert window.latest_sample_hour == 10
+
+    def test_old_hours_drop_out(self):
+        """Test that advancing the window expires hours older than a week."""
+        window = HourlyMeanWindow(hours=4)
+        for hour in range(4):
+            window.add(hour, 1.0)
+        assert window.count_below(2.0) == 4
+
+        window.add(5, 3.0)
+
+        # Hours 0 and 1 expired, hours 2, 3 and 5 remain
+        assert len(window) == 3
+        assert window.count_below(2.0) == 2
+
+        window.advance_to(100)
+        assert len(window) == 0
+
+    def test_too_old_hours_ignored(self):
+        """Test that hours older than the window are not stored."""
+        window = HourlyMeanWindow(hours=4)
+        window.add(10, 1.0)
+        window.add(6, 1.0)
+
+        assert len(window) == 1
+
+
+async def test_window_seeded_once_then_topped_up(mock_hass):
+    """Test that the window only reads recent hours after seeding."""
+    service = RecorderStatisticsService(mock_hass)
+    service.async_subscribe_window("sensor.a")
+    now = dt_util.utcnow()
+    hour = int(now.timestamp() // 3600)
+    recorder = _recorder({"sensor.a": [{"start": (hour - 2) * 3600.0, "mean": 1.0}]})
+
+    with patch(
+        "custom_components.plant_assistant.recorder_statistics.dt_util.utcnow",
+        return_value=now,
+    ) as mock_utcnow:
+        window = await service.async_get_hourly_window(recorder, "sensor.a")
+        assert window.count_below(2.0) == 1
+        assert recorder.async_add_executor_job.call_args.args[2] < now - WEEK + (
+            timedelta(minutes=1)
+        )
+
+        # A newer hour is due, so only the short catch-up window is read
+        recorder.async_add_executor_job = AsyncMock(
+            return_value={"sensor.a": [{"start": (hour - 1) * 3600.0, "mean": 1.5}]}
+        )
+        mock_utcnow.return_value = now + timedelta(minutes=5)
+        window = await service.async_get_hourly_window(recorder, "sensor.a")
+
+    assert window.count_below(2.0) == 2
+    assert recorder.async_add_executor_job.call_args.args[2] > now - timedelta(hours=4)
+
+
+async def test_window_answers_from_memory_when_current(mock_hass):
+    """Test that an up to date window does not query the recorder."""
+    service = RecorderStatisticsService(mock_hass)
+    hour = int(dt_util.utcnow().timestamp() // 3600)
+    recorder = _recorder({"sensor.a": [{"start": (hour - 1) * 3600.0, "mean": 1.0}]})
+
+    await service.async_get_hourly_window(recorder, "sensor.a")
+    window = await service.async_get_hourly_window(recorder, "sensor.a")
+
+    assert window.count_above(0.5) == 1
+    assert service.query_count == 1
@@ -7,7 +7,7 @@ import pytest
 from homeassistant.const import STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant
 
-from custom_components.plant_assistant.binary_sensor import (
+from custom_components.plant_assistant.binary_sensor_zone import (
     ScheduleMisconfigurationStatusMonitorBinarySensor,
     ScheduleMisconfigurationStatusMonitorConfig,
 )
@@ -34,7 +34,7 @@ def mock_entity_registry():
     registry.entities.values = MagicMock(return_value=[])
 
     with patch(
-        "custom_components.plant_assistant.binary_sensor.er.async_get",
+        "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
         return_value=registry,
     ):
         yield registry
@@ -480,11 +480,11 @@ class TestScheduleMisconfigurationStatusMonitorBinarySensorAsyncOperations:
 
         with (
             patch(
-                "custom_components.plant_assistant.binary_sensor.er.async_get",
+                "custom_components.plant_assistant.binary_sensor_zone.er.async_get",
                 return_value=mock_registry,
             ),
             patch(
-                "custom_components.plant_assistant.binary_sensor.async_track_state_change_event"
+                "custom_components.plant_assistant.binary_sensor_zone.async_track_state_change_event"
             ) as mock_track,
         ):
             mock_track.return_value = lambda: None
@@ -506,11 +506,13 @@ class TestScheduleMisconfigurationStatusMonitorBinarySensorAsyncOperations:
         mock_unsubscribe_sunset = MagicMock()
         mock_unsubscribe_ignore = MagicMock()
 
-        sensor._unsubscribe_master = mock_unsubscribe_master
-        sensor._unsubscribe_sunrise = mock_unsubscribe_sunrise
-        sensor._unsubscribe_afternoon = mock_unsubscribe_afternoon
-        sensor._unsubscribe_sunset = mock_unsubscribe_sunset
-        sensor._unsubscribe_ignore_until = mock_unsubscribe_ignore
+        sensor._unsubscribe_handlers = [
+            mock_unsubscribe_master,
+            mock_unsubscribe_sunrise,
+            mock_unsubscribe_afternoon,
+            mock_unsubscribe_sunset,
+            mock_unsubscribe_ignore,
+        ]
 
         await sensor.async_will_remove_from_hass()
 
@@ -520,3 +522,4 @@ class TestScheduleMisconfigurationStatusMonitorBinarySensorAsyncOperations:
         mock_unsubscribe_afternoon.assert_called_once()
         mock_unsubscribe_sunset.assert_called_once()
         mock_unsubscribe_ignore.assert_called_once()
+        assert sensor._unsubscribe_handlers == []
@@ -67,9 +67,9 @@ class TestMonitoringSensorUpdate:
         # Mock async_write_ha_state to avoid Home Assistant internals
         sensor.async_write_ha_state = Mock()
 
-        # Mock async_track_state_change_event
+        # Mock the source subscription
         with patch(
-            "custom_components.plant_assistant.sensor.async_track_state_change_event",
+            "custom_components.plant_assistant.sensor.async_subscribe_source",
             return_value=MagicMock(),
         ) as mock_track:
             # Update to new entity ID
@@ -139,9 +139,9 @@ class TestHumidityLinkedSensorUpdate:
         # Mock async_write_ha_state to avoid Home Assistant internals
         sensor.async_write_ha_state = Mock()
 
-        # Mock async_track_state_change_event
+        # Mock the source subscription
         with patch(
-            "custom_components.plant_assistant.sensor.async_track_state_change_event",
+            "custom_components.plant_assistant.sensor.async_subscribe_source",
             return_value=MagicMock(),
         ) as mock_track:
             # Update to new entity ID
@@ -198,9 +198,9 @@ class TestHumidityLinkedSensorUpdate:
         # Mock async_write_ha_state to avoid Home Assistant internals
         sensor.async_write_ha_state = Mock()
 
-        # Mock async_track_state_change_event
+        # Mock the source subscription
         with patch(
-            "custom_components.plant_assistant.sensor.async_track_state_change_event",
+            "custom_components.plant_assistant.sensor.async_subscribe_source",
             return_value=MagicMock(),
         ) as mock_track:
             # Update to non-existent entity ID
@@ -0,0 +1,250 @@
+"""Tests for the shared state change multiplexer."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event, EventStateChangedData, State
+
+from custom_components.plant_assistant.const import DOMAIN, STATE_MULTIPLEXER_KEY
+from custom_components.plant_assistant.state_multiplexer import (
+    SourceReading,
+    StateChangeMultiplexer,
+    async_subscribe_source,
+    async_unload_state_multiplexer,
+    parse_float,
+)
+
+MODULE = "custom_components.plant_assistant.state_multiplexer"
+MOISTURE = "sensor.test_garden_soil_moisture_mirror"
+TEMPERATURE = "sensor.test_garden_temperature_mirror"
+UPDATED = datetime(2024, 6, 1, 12, tzinfo=UTC)
+
+
+def _state_changed(entity_id, value):
+    """Create a state_changed event, removing the entity if value is None."""
+    new_state = None
+    if value is not None:
+        new_state = State(entity_id, value, last_updated=UPDATED)
+    return Event(
+        "state_changed",
+        EventStateChangedData(entity_id=entity_id, old_state=None, new_state=new_state),
+    )
+
+
+@pytest.fixture
+def track():
+    """Patch the state change tracking with one unsubscribe mock per entity."""
+    unsubscribes = {}
+
+    def _track(_hass, entity_id, _action):
+        return unsubscribes.setdefault(entity_id, MagicMock())
+
+    with patch(
+        f"{MODULE}.async_track_state_change_event", side_effect=_track
+    ) as mock_track:
+        mock_track.unsubscribes = unsubscribes
+        yield mock_track
+
+
+@pytest.fixture
+def multiplexer(mock_hass, track):  # noqa: ARG001
+    """Return a multiplexer on a hass without states."""
+    mock_hass.states.get.return_value = None
+    return StateChangeMultiplexer(mock_hass)
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("42.5", 42.5),
+        ("invalid", None),
+        (STATE_UNAVAILABLE, None),
+        (STATE_UNKNOWN, None),
+        (None, None),
+    ],
+)
+def test_parse_float(value, expected):
+    """Test parsing source states."""
+    assert parse_float(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("42.5", ("42.5", 42.5, True)),
+        ("dry", ("dry", None, True)),
+        (STATE_UNAVAILABLE, (STATE_UNAVAILABLE, None, False)),
+        (STATE_UNKNOWN, (STATE_UNKNOWN, None, False)),
+        (None, (None, None, False)),
+    ],
+)
+def test_reading_from_state(value, expected):
+    """Test parsing a state object into a reading."""
+    state = State(MOISTURE, value, last_updated=UPDATED) if value else None
+
+    reading = SourceReading.from_state(MOISTURE, state)
+
+    assert (reading.state, reading.value, reading.available) == expected
+    assert reading.last_updated == (UPDATED if value else None)
+
+
+def test_one_subscription_per_entity(multiplexer, track):
+    """Test that consumers of an entity share one state change subscription."""
+    for _ in range(5):
+        multiplexer.async_subscribe(MOISTURE, MagicMock())
+    multiplexer.async_subscribe(TEMPERATURE, MagicMock())
+
+    assert track.call_count == 2
+    assert [call.args[1] for call in track.call_args_list] == [MOISTURE, TEMPERATURE]
+    assert multiplexer.subscription_count == 2
+    assert multiplexer.consumer_count == 6
+
+
+def test_change_parsed_once_and_fanned_out(multiplexer):
+    """Test that every consumer gets the same parsed reading."""
+    consumers = [MagicMock(), MagicMock(), MagicMock()]
+    for consumer in consumers:
+        multiplexer.async_subscribe(MOISTURE, consumer)
+    other = MagicMock()
+    multiplexer.async_subscribe(TEMPERATURE, other)
+
+    with patch(f"{MODULE}.parse_float", wraps=parse_float) as mock_parse:
+        multiplexer._async_state_changed(_state_changed(MOISTURE, "31.5"))
+    mock_parse.assert_called_once_with("31.5")
+
+    readings = [consumer.call_args.args[0] for consumer in consumers]
+    assert all(reading is readings[0] for reading in readings)
+    assert readings[0] == SourceReading(MOISTURE, "31.5", 31.5, UPDATED, {})
+    assert multiplexer.reading(MOISTURE) is readings[0]
+    other.assert_not_called()
+
+
+def test_unsubscribe_is_reference_counted(multiplexer, track):
+    """Test that the entity is tracked until its last consumer leaves."""
+    first = multiplexer.async_subscribe(MOISTURE, MagicMock())
+    second = multiplexer.async_subscribe(MOISTURE, MagicMock())
+    unsubscribe = track.unsubscribes[MOISTURE]
+
+    first()
+    first()
+    unsubscribe.assert_not_called()
+    assert multiplexer.consumer_count == 1
+
+    second()
+    unsubscribe.assert_called_once()
+    assert multiplexer.subscription_count == 0
+
+    multiplexer.async_subscribe(MOISTURE, MagicMock())
+    assert track.call_count == 2
+
+
+def test_repeated_unsubscribe_keeps_other_registration(multiplexer):
+    """Test that calling an unsubscribe twice removes one registration only."""
+    consumer = MagicMock()
+    first = multiplexer.async_subscribe(MOISTURE, consumer)
+    multiplexer.async_subscribe(MOISTURE, consumer)
+
+    first()
+    first()
+    multiplexer._async_state_changed(_state_changed(MOISTURE, "10"))
+
+    consumer.assert_called_once()
+
+
+def test_consumer_error_does_not_stop_delivery(multiplexer):
+    """Test that a failing consumer does not affect the others."""
+    failing = MagicMock(side_effect=ValueError("boom"))
+    consumer = MagicMock()
+    multiplexer.async_subscribe(MOISTURE, failing)
+    multiplexer.async_subscribe(MOISTURE, consumer)
+
+    multiplexer._async_state_changed(_state_changed(MOISTURE, "10"))
+
+    consumer.assert_called_once()
+
+
+def test_consumer_may_unsubscribe_during_delivery(multiplexer):
+    """Test that removing a consumer while delivering is safe."""
+    consumer = MagicMock()
+    unsubscribe = multiplexer.async_subscribe(MOISTURE, lambda _reading: unsubscribe())
+    multiplexer.async_subscribe(MOISTURE, consumer)
+
+    multiplexer._async_state_changed(_state_changed(MOISTURE, "10"))
+
+    consumer.assert_called_once()
+    assert multiplexer.consumer_count == 1
+
+
+def test_reading_of_untracked_entity(multiplexer, mock_hass):
+    """Test that untracked entities are read from the state machine."""
+    mock_hass.states.get.return_value = State(TEMPERATURE, "21", last_updated=UPDATED)
+
+    assert multiplexer.reading(TEMPERATURE).value == 21.0
+
+
+def test_initial_reading_and_removal(multiplexer, mock_hass):
+    """Test the reading on subscription and after the entity is removed."""
+    mock_hass.states.get.return_value = State(MOISTURE, "40", last_updated=UPDATED)
+    consumer = MagicMock()
+    multiplexer.async_subscribe(MOISTURE, consumer)
+    assert multiplexer.reading(MOISTURE).value == 40.0
+
+    multiplexer._async_state_changed(_state_changed(MOISTURE, None))
+
+    reading = consumer.call_args.args[0]
+    assert reading.state is None
+    assert not reading.available
+
+
+def test_as_dict(multiplexer):
+    """Test the subscription counts reported in diagnostics."""
+    for _ in range(3):
+        multiplexer.async_subscribe(MOISTURE, MagicMock())
+    multiplexer.async_subscribe(TEMPERATURE, MagicMock())
+    multiplexer._async_state_changed(_state_changed(MOISTURE, "10"))
+    multiplexer._async_state_changed(_state_changed(TEMPERATURE, "20"))
+
+    assert multiplexer.as_dict() == {
+        "subscriptions": 2,
+        "consumers": 4,
+        "shared_subscriptions": 1,
+        "events": 2,
+        "deliveries": 4,
+        "most_shared": {MOISTURE: 3, TEMPERATURE: 1},
+    }
+
+
+def test_module_helpers(mock_hass, track):
+    """Test the shared multiplexer's lifecycle in hass.data."""
+    mock_hass.states.get.return_value = None
+    async_subscribe_source(mock_hass, MOISTURE, MagicMock())
+    async_subscribe_source(mock_hass, MOISTURE, MagicMock())
+
+    multiplexer = mock_hass.data[DOMAIN][STATE_MULTIPLEXER_KEY]
+    assert multiplexer.subscription_count == 1
+    track.assert_called_once()
+
+    async_unload_state_multiplexer(mock_hass)
+
+    track.unsubscribes[MOISTURE].assert_called_once()
+    assert STATE_MULTIPLEXER_KEY not in mock_hass.data[DOMAIN]
+    async_unload_state_multiplexer(mock_hass)
+
+
+def test_subscribe_source_to_several_entities(mock_hass, track):
+    """Test that one callable removes the subscriptions of every entity."""
+    mock_hass.states.get.return_value = None
+    consumer = MagicMock()
+    unsubscribe = async_subscribe_source(mock_hass, [MOISTURE, TEMPERATURE], consumer)
+
+    multiplexer = mock_hass.data[DOMAIN][STATE_MULTIPLEXER_KEY]
+    assert multiplexer.consumers(MOISTURE) == (consumer,)
+    assert multiplexer.consumers(TEMPERATURE) == (consumer,)
+
+    unsubscribe()
+
+    assert multiplexer.subscription_count == 0
+    track.unsubscribes[MOISTURE].assert_called_once()
+    track.unsubscribes[TEMPERATURE].assert_called_once()
@@ -10,6 +10,8 @@ from custom_components.plant_assistant.binary_sensor import (
     StatusMonitorConfig,
 )
 from custom_components.plant_assistant.const import DOMAIN
+from custom_components.plant_assistant.state_multiplexer import SourceReading
+from custom_components.plant_assistant.status_rollup import StatusRollup
 
 
 @pytest.fixture
@@ -92,11 +94,13 @@ class TestStatusMonitorStateAttributes:
 
     def test_attributes_no_problems(self, sensor):
         """Test attributes when no problems detected."""
-        sensor._status_sensors = {
-            "Plant Count Status": False,
-            "Soil Moisture Status": False,
-            "Temperature Status": False,
-        }
+        sensor._status_sensors = StatusRollup(
+            {
+                "Plant Count Status": False,
+                "Soil Moisture Status": False,
+                "Temperature Status": False,
+            }
+        )
         sensor._state = False
 
         attrs = sensor.extra_state_attributes
@@ -107,11 +111,13 @@ class TestStatusMonitorStateAttributes:
 
     def test_attributes_with_problems(self, sensor):
         """Test attributes when problems detected."""
-        sensor._status_sensors = {
-            "Plant Count Status": False,
-            "Soil Moisture Status": True,
-            "Temperature Status": True,
-        }
+        sensor._status_sensors = StatusRollup(
+            {
+                "Plant Count Status": False,
+                "Soil Moisture Status": True,
+                "Temperature Status": True,
+            }
+        )
         sensor._state = True
 
         attrs = sensor.extra_state_attributes
@@ -124,11 +130,13 @@ class TestStatusMonitorStateAttributes:
 
     def test_attributes_mixed_states(self, sensor):
         """Test attributes with mixed sensor states."""
-        sensor._status_sensors = {
-            "Plant Count Status": False,
-            "Soil Moisture Status": None,
-            "Temperature Status": True,
-        }
+        sensor._status_sensors = StatusRollup(
+            {
+                "Plant Count Status": False,
+                "Soil Moisture Status": None,
+                "Temperature Status": True,
+            }
+        )
         sensor._state = True
 
         attrs = sensor.extra_state_attributes
@@ -138,9 +146,11 @@ class TestStatusMonitorStateAttributes:
 
     def test_master_tag_attribute(self, sensor):
         """Test that master_tag attribute contains irrigation zone name."""
-        sensor._status_sensors = {
-            "Plant Count Status": False,
-        }
+        sensor._status_sensors = StatusRollup(
+            {
+                "Plant Count Status": False,
+            }
+        )
         attrs = sensor.extra_state_attributes
         assert "master_tag" in attrs
         assert attrs["master_tag"] == "Zone A"
@@ -156,7 +166,7 @@ class TestStatusMonitorStateAttributes:
             location_device_id="test_location_456",
         )
         sensor = StatusMonitorBinarySensor(config)
-        sensor._status_sensors = {"Plant Count Status": False}
+        sensor._status_sensors = StatusRollup({"Plant Count Status": False})
 
         attrs = sensor.extra_state_attributes
         assert attrs["master_tag"] == "Zone B"
@@ -167,12 +177,12 @@ class TestStatusMonitorAvailability:
 
     def test_available_with_sensors(self, sensor):
         """Test sensor is available when status sensors found."""
-        sensor._status_sensors = {"Plant Count Status": False}
+        sensor._status_sensors = StatusRollup({"Plant Count Status": False})
         assert sensor.available is True
 
     def test_unavailable_without_sensors(self, sensor):
         """Test sensor is unavailable when no status sensors found."""
-        sensor._status_sensors = {}
+        sensor._status_sensors = StatusRollup()
         assert sensor.available is False
 
 
@@ -203,61 +213,73 @@ class TestStatusMonitorStateLogic:
 
     def test_update_state_no_problems(self, sensor):
         """Test state update when no problems detected."""
-        sensor._status_sensors = {
-            "Plant Count Status": False,
-            "Soil Moisture Status": False,
-            "Temperature Status": False,
-        }
+        sensor._status_sensors = StatusRollup(
+            {
+                "Plant Count Status": False,
+                "Soil Moisture Status": False,
+                "Temperature Status": False,
+            }
+        )
         sensor._update_state()
         assert sensor.is_on is False
 
     def test_update_state_one_problem(self, sensor):
         """Test state update when one sensor has problem."""
-        sensor._status_sensors = {
-            "Plant Count Status": False,
-            "Soil Moisture Status": True,
-            "Temperature Status": False,
-        }
+        sensor._status_sensors = StatusRollup(
+            {
+                "Plant Count Status": False,
+                "Soil Moisture Status": True,
+                "Temperature Status": False,
+            }
+        )
         sensor._update_state()
         assert sensor.is_on is True
 
     def test_update_state_multiple_problems(self, sensor):
         """Test state update when multiple sensors have problems."""
-        sensor._status_sensors = {
-            "Plant Count Status": True,
-            "Soil Moisture Status": True,
-            "Temperature Status": False,
-        }
+        sensor._status_sensors = StatusRollup(
+            {
+                "Plant Count Status": True,
+                "Soil Moisture Status": True,
+                "Temperature Status": False,
+            }
+        )
         sensor._update_state()
         assert sensor.is_on is True
 
     def test_update_state_all_problems(self, sensor):
         """Test state update when all sensors have problems."""
-        sensor._status_sensors = {
-            "Plant Count Status": True,
-            "Soil Moisture Status": True,
-            "Temperature Status": True,
-        }
+        sensor._status_sensors = StatusRollup(
+            {
+                "Plant Count Status": True,
+                "Soil Moisture Status": True,
+                "Temperature Status": True,
+            }
+        )
         sensor._update_state()
         assert sensor.is_on is True
 
     def test_update_state_with_none_values(self, sensor):
         """Test state update with None values (unavailable sensors)."""
-        sensor._status_sensors = {
-            "Plant Count Status": None,
-            "Soil Moisture Status": True,
-            "Temperature Status": None,
-        }
+        sensor._status_sensors = StatusRollup(
+            {
+                "Plant Count Status": None,
+                "Soil Moisture Status": True,
+                "Temperature Status": None,
+            }
+        )
         sensor._update_state()
         assert sensor.is_on is True
 
     def test_update_state_all_none_values(self, sensor):
         """Test state update when all sensors are None."""
-        sensor._status_sensors = {
-            "Plant Count Status": None,
-            "Soil Moisture Status": None,
-            "Temperature Status": None,
-        }
+        sensor._status_sensors = StatusRollup(
+            {
+                "Plant Count Status": None,
+                "Soil Moisture Status": None,
+                "Temperature Status": None,
+            }
+        )
         sensor._update_state()
         assert sensor.is_on is False
 
@@ -281,7 +303,7 @@ class TestStatusMonitorFindStatusSensors:
         mock_entity.platform = DOMAIN
         mock_entity.domain = "binary_sensor"
         mock_entity.unique_id = (
-            "plant_assistant_test_entry_123_test_garden_plant_count_status"
+            "plant_assistant_test_entry_123_test_garden_plant_count_status_monitor"
         )
         mock_entity.entity_id = "binary_sensor.test_garden_plant_count_status"
 
@@ -339,7 +361,7 @@ class TestStatusMonitorFindStatusSensors:
         entity1.platform = DOMAIN
         entity1.domain = "binary_sensor"
         entity1.unique_id = (
-            "plant_assistant_test_entry_123_test_garden_plant_count_status"
+            "plant_assistant_test_entry_123_test_garden_plant_count_status_monitor"
         )
         entity1.entity_id = "binary_sensor.test_garden_plant_count_status"
         mock_entities.append(entity1)
@@ -383,3 +405,53 @@ class TestStatusMonitorFindStatusSensors:
         assert "Temperature Status" in result
         # Ignored Statuses should not be in result
         assert not any("Ignored" in key for key in result)
+
+
+class TestStatusMonitorIncrementalUpdates:
+    """Tests for Status Monitor child transitions."""
+
+    def _changed(self, entity_id, state):
+        return SourceReading(entity_id, state, None, None)
+
+    def test_child_transition_updates_issue_count(self, sensor):
+        """Test that one child transition updates the running issue count."""
+        sensor._status_entity_ids = {
+            "Soil Moisture Status": "binary_sensor.moisture_status",
+            "Temperature Status": "binary_sensor.temperature_status",
+        }
+        sensor._status_names_by_entity_id = {
+            "binary_sensor.moisture_status": "Soil Moisture Status",
+            "binary_sensor.temperature_status": "Temperature Status",
+        }
+        sensor._status_sensors = StatusRollup(
+            {"Soil Moisture Status": False, "Temperature Status": False}
+        )
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor._status_sensor_state_changed(
+            self._changed("binary_sensor.temperature_status", "on")
+        )
+
+        assert sensor.is_on is True
+        assert sensor.extra_state_attributes["message"] == "1 Issue"
+        assert sensor.extra_state_attributes["problem_sensors"] == [
+            "Temperature Status"
+        ]
+        sensor.async_write_ha_state.assert_called_once()
+
+    def test_unchanged_child_does_not_write(self, sensor):
+        """Test that a child reporting the same problem state is not rewritten."""
+        sensor._status_names_by_entity_id = {
+            "binary_sensor.temperature_status": "Temperature Status",
+        }
+        sensor._status_sensors = StatusRollup({"Temperature Status": True})
+        sensor.async_write_ha_state = MagicMock()
+
+        sensor._status_sensor_state_changed(
+            self._changed("binary_sensor.temperature_status", "on")
+        )
+        sensor._status_sensor_state_changed(
+            self._changed("binary_sensor.unrelated", "on")
+        )
+
+        sensor.async_write_ha_state.assert_not_called()
@@ -0,0 +1,54 @@
+"""Tests for the incremental status roll-up."""
+
+from custom_components.plant_assistant.status_rollup import StatusRollup
+
+
+def test_running_count_follows_transitions():
+    """Test that the active count tracks each child transition."""
+    rollup = StatusRollup({"a": False, "b": None})
+
+    assert rollup.active_count == 0
+    assert rollup.set("a", active=True)
+    assert rollup.set("b", active=True)
+    assert rollup.active_count == 2
+
+    assert not rollup.set("a", active=True)
+    assert rollup.set("a", active=None)
+    assert rollup.active_count == 1
+    assert rollup.active() == ["b"]
+
+
+def test_active_keeps_child_order():
+    """Test that active children are reported in the order they were added."""
+    rollup = StatusRollup({"first": False, "second": False, "third": False})
+    rollup.set("third", active=True)
+    rollup.set("first", active=True)
+
+    assert rollup.active() == ["first", "third"]
+    assert len(rollup) == 3
+    assert "second" in rollup
+
+
+def test_discard_and_clear():
+    """Test removing children updates the running count."""
+    rollup = StatusRollup({"a": True, "b": True})
+
+    assert rollup.discard("a")
+    assert not rollup.discard("a")
+    assert rollup.active_count == 1
+
+    rollup.clear()
+    assert len(rollup) == 0
+    assert rollup.active_count == 0
+
+
+def test_version_counts_changes():
+    """Test that the version only moves when a child changes."""
+    rollup = StatusRollup({"a": False})
+    version = rollup.version
+
+    rollup.set("a", active=False)
+    assert rollup.version == version
+
+    rollup.set("a", active=True)
+    assert rollup.version > version
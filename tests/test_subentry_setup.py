@@ -0,0 +1,85 @@
+"""Tests for concurrent per-location entity setup."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from custom_components.plant_assistant import binary_sensor
+from custom_components.plant_assistant.subentry_setup import (
+    async_add_subentry_entities,
+    async_build_subentry_entities,
+)
+
+
+async def test_builders_run_concurrently_up_to_limit():
+    """Test that builders overlap but never exceed the concurrency limit."""
+    running = 0
+    peak = 0
+
+    async def builder(subentry_id, _subentry):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        # Later subentries finish first to check results keep subentry order
+        await asyncio.sleep(0.001 * (10 - int(subentry_id)))
+        running -= 1
+        return [f"entity_{subentry_id}"]
+
+    subentries = {str(i): MagicMock() for i in range(6)}
+
+    entities = await async_build_subentry_entities(subentries, builder, limit=3)
+
+    assert peak == 3
+    assert list(entities) == list(subentries)
+    assert entities["4"] == ["entity_4"]
+
+
+async def test_failing_builder_does_not_fail_other_locations():
+    """Test that a location whose builder raises is skipped."""
+
+    async def builder(subentry_id, _subentry):
+        if subentry_id == "broken":
+            msg = "boom"
+            raise ValueError(msg)
+        return [subentry_id]
+
+    entities = await async_build_subentry_entities(
+        {"bed": MagicMock(), "broken": MagicMock(), "pot": MagicMock()}, builder
+    )
+
+    assert entities == {"bed": ["bed"], "pot": ["pot"]}
+
+
+def test_add_subentry_entities_associates_subentries():
+    """Test one add call per location with entities, tagged with its subentry."""
+    async_add_entities = MagicMock()
+
+    async_add_subentry_entities(
+        async_add_entities, {"bed": ["a", "b"], "empty": [], "pot": ["c"]}
+    )
+
+    assert async_add_entities.call_count == 2
+    async_add_entities.assert_any_call(["a", "b"], config_subentry_id="bed")
+    async_add_entities.assert_any_call(["c"], config_subentry_id="pot")
+
+
+async def test_binary_sensor_subentries_added_after_all_are_built():
+    """Test that binary sensors are added only once every location is built."""
+    entry = MagicMock()
+    entry.subentries = {"bed": MagicMock(), "pot": MagicMock()}
+    async_add_entities = MagicMock()
+    built = []
+
+    async def create(_hass, _entry, subentry_id, _subentry):
+        await asyncio.sleep(0)
+        async_add_entities.assert_not_called()
+        built.append(subentry_id)
+        return [f"{subentry_id}_status"]
+
+    with patch.object(binary_sensor, "_create_subentry_sensors", create):
+        await binary_sensor._setup_subentry_sensors(
+            MagicMock(), entry, async_add_entities
+        )
+
+    assert sorted(built) == ["bed", "pot"]
+    async_add_entities.assert_any_call(["bed_status"], config_subentry_id="bed")
+    async_add_entities.assert_any_call(["pot_status"], config_subentry_id="pot")
@@ -7,7 +7,7 @@ from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
 from homeassistant.core import HomeAssistant
 
 from custom_components.plant_assistant.const import DOMAIN
-from custom_components.plant_assistant.sensor import (
+from custom_components.plant_assistant.sensor_statistics import (
     TemperatureAboveThresholdHoursSensor,
 )
 
@@ -32,7 +32,7 @@ def mock_entity_registry():
     registry.entities.values = MagicMock(return_value=[])
 
     with patch(
-        "custom_components.plant_assistant.sensor.er.async_get",
+        "custom_components.plant_assistant.sensor_statistics.er.async_get",
         return_value=registry,
     ):
         yield registry
@@ -157,11 +157,11 @@ async def test_temperature_above_threshold_no_statistics(
 
     with (
         patch(
-            "custom_components.plant_assistant.sensor.get_instance",
+            "custom_components.plant_assistant.sensor_statistics.get_instance",
             return_value=mock_recorder,
         ),
         patch(
-            "custom_components.plant_assistant.sensor.statistics_during_period"
+            "custom_components.plant_assistant.recorder_statistics.statistics_during_period"
         ) as mock_stats_fn,
     ):
         mock_stats_fn.return_value = {}
@@ -210,11 +210,11 @@ async def test_temperature_above_threshold_calculation(mock_hass, mock_entity_re
     # Patch both get_instance and statistics_during_period
     with (
         patch(
-            "custom_components.plant_assistant.sensor.get_instance",
+            "custom_components.plant_assistant.sensor_statistics.get_instance",
             return_value=mock_recorder,
         ),
         patch(
-            "custom_components.plant_assistant.sensor.statistics_during_period"
+            "custom_components.plant_assistant.recorder_statistics.statistics_during_period"
         ) as mock_stats_fn,
     ):
         mock_stats_fn.return_value = mock_stats
@@ -264,11 +264,11 @@ async def test_temperature_state_changed_callback(mock_hass, mock_entity_registr
 
     with (
         patch(
-            "custom_components.plant_assistant.sensor.get_instance",
+            "custom_components.plant_assistant.sensor_statistics.get_instance",
             return_value=mock_recorder,
         ),
         patch(
-            "custom_components.plant_assistant.sensor.statistics_during_period"
+            "custom_components.plant_assistant.recorder_statistics.statistics_during_period"
         ) as mock_stats_fn,
     ):
         mock_stats_fn.return_value = mock_stats
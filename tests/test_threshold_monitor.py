@@ -0,0 +1,1031 @@
+"""Tests for the table-driven location threshold monitors."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.const import STATE_UNAVAILABLE, STATE_UNKNOWN
+from homeassistant.core import Event, EventStateChangedData
+from homeassistant.util import dt as dt_util
+
+from custom_components.plant_assistant.binary_sensor import (
+    ThresholdMonitorBinarySensor,
+    ThresholdMonitorConfig,
+    _create_threshold_monitors,
+)
+from custom_components.plant_assistant.const import DOMAIN
+from custom_components.plant_assistant.reconfigure import (
+    async_get_reconfigure_manager,
+)
+from custom_components.plant_assistant.threshold_monitor import (
+    BATTERY_LEVEL_STATUS,
+    DLI_STATUS,
+    HUMIDITY_STATUS,
+    NORMAL,
+    SOIL_CONDUCTIVITY_STATUS,
+    SOIL_MOISTURE_STATUS,
+    TEMPERATURE_STATUS,
+    THRESHOLD_RULES,
+    WATERED_ROLE,
+    LocationThresholdEvaluator,
+)
+
+MODULE = "custom_components.plant_assistant.threshold_monitor"
+MULTIPLEXER_MODULE = "custom_components.plant_assistant.state_multiplexer"
+
+NOW = dt_util.now()
+FUTURE = NOW + timedelta(hours=1)
+PAST = NOW - timedelta(hours=1)
+
+MOISTURE = {
+    "soil_moisture_mirror": 50.0,
+    "min_soil_moisture": 30.0,
+    "max_soil_moisture": 70.0,
+}
+CONDUCTIVITY = {
+    "soil_conductivity_mirror": 1000.0,
+    "min_soil_conductivity": 500.0,
+    "max_soil_conductivity": 2000.0,
+}
+TEMPERATURE = {
+    "temperature_above_threshold_weekly_duration": 0.5,
+    "temperature_below_threshold_weekly_duration": 0.5,
+}
+HUMIDITY = {
+    "humidity_above_threshold_weekly_duration": 0.5,
+    "humidity_below_threshold_weekly_duration": 0.5,
+}
+BATTERY = {"monitor_battery_level": 80.0}
+DLI = {
+    "daily_light_integral_weekly_average": 15.0,
+    "min_dli": 10.0,
+    "max_dli": 25.0,
+}
+
+
+def _entity_id(role):
+    """Return the entity_id used for a role in these tests."""
+    domain = "datetime" if role.endswith("ignore_until") else "sensor"
+    return f"{domain}.test_garden_{role}"
+
+
+def _state_changed(entity_id, value):
+    """Create a state_changed event for an input entity."""
+    new_state = None
+    if value is not None:
+        new_state = MagicMock()
+        new_state.state = value.isoformat() if hasattr(value, "isoformat") else value
+    return Event(
+        "state_changed",
+        EventStateChangedData(entity_id=entity_id, old_state=None, new_state=new_state),
+    )
+
+
+class FakeLocation:
+    """A location's input entities, served to the evaluator under test."""
+
+    def __init__(self, hass, *, has_esphome_device=False):
+        """Initialize the location with no entities."""
+        self.hass = hass
+        self.states = {}
+        # entity_id -> state change listener and its unsubscribe
+        self.listeners = {}
+        self.unsubscribes = {}
+        self.track = MagicMock(side_effect=self._track)
+        self.scheduler = MagicMock()
+        hass.states.get.side_effect = self._get_state
+        self.evaluator = LocationThresholdEvaluator(
+            hass, "test_entry", "Test Garden", has_esphome_device=has_esphome_device
+        )
+
+    def _track(self, _hass, entity_id, action):
+        """Record the multiplexer's subscription of an input entity."""
+        self.listeners[entity_id] = action
+        return self.unsubscribes.setdefault(entity_id, MagicMock())
+
+    def _get_state(self, entity_id):
+        """Return a mock state for an entity that has a value."""
+        if entity_id not in self.states:
+            return None
+        state = MagicMock()
+        value = self.states[entity_id]
+        state.state = value.isoformat() if hasattr(value, "isoformat") else value
+        return state
+
+    def find(self, _hass, _subentry_id, _location_name, role, _domain=None):
+        """Resolve a role to its entity if the location has a value for it."""
+        entity_id = _entity_id(role)
+        if entity_id not in self.states:
+            return None
+        return entity_id, f"{DOMAIN}_test_entry_test_garden_{role}"
+
+    def set(self, **values):
+        """Set the states of input entities by role."""
+        for role, value in values.items():
+            self.states[_entity_id(role)] = value
+
+    def monitor(self, rule, source_entity_id="sensor.source"):
+        """Create a monitor of ``rule`` with a mocked state write."""
+        monitor = ThresholdMonitorBinarySensor(
+            ThresholdMonitorConfig(
+                evaluator=self.evaluator,
+                rule=rule,
+                entry_id="test_entry",
+                location_name="Test Garden",
+                irrigation_zone_name="Zone A",
+                source_entity_id=source_entity_id if rule.source else None,
+                location_device_id="test_location",
+            )
+        )
+        monitor.async_write_ha_state = MagicMock()
+        return monitor
+
+    def attach(self, *monitors):
+        """Attach monitors to the evaluator and evaluate them once."""
+        for monitor in monitors:
+            self.evaluator.async_attach(monitor)
+            monitor.async_evaluate()
+
+    def fire(self, role, value):
+        """Change an input and deliver the state_changed event."""
+        self.set(**{role: value})
+        entity_id = _entity_id(role)
+        self.listeners[entity_id](_state_changed(entity_id, value))
+
+
+@pytest.fixture
+def location(mock_hass):
+    """Return a fake location with the evaluator's helpers patched."""
+    fake = FakeLocation(mock_hass)
+    with (
+        patch(f"{MODULE}.async_find_location_entity", side_effect=fake.find),
+        patch(f"{MULTIPLEXER_MODULE}.async_track_state_change_event", fake.track),
+        patch(
+            f"{MODULE}.async_get_ignore_until_scheduler",
+            return_value=fake.scheduler,
+        ),
+    ):
+        yield fake
+
+
+@pytest.mark.parametrize(
+    ("rule", "name", "key", "icon"),
+    [
+        (
+            SOIL_MOISTURE_STATUS,
+            "Soil Moisture Status",
+            "soil_moisture_status",
+            "mdi:water-check",
+        ),
+        (
+            SOIL_CONDUCTIVITY_STATUS,
+            "Soil Conductivity Status",
+            "soil_conductivity_status",
+            "mdi:flash-check",
+        ),
+        (
+            TEMPERATURE_STATUS,
+            "Temperature Status",
+            "temperature_status",
+            "mdi:thermometer",
+        ),
+        (HUMIDITY_STATUS, "Humidity Status", "humidity_status", "mdi:water-percent"),
+        (
+            BATTERY_LEVEL_STATUS,
+            "Monitor Battery Level Status",
+            "monitor_battery_level_status",
+            "mdi:battery",
+        ),
+        (DLI_STATUS, "Daily Light Integral Status", "dli_status", "mdi:counter"),
+    ],
+)
+def test_monitor_init(location, rule, name, key, icon):
+    """Test names, unique ids, device class and device of each monitor."""
+    monitor = location.monitor(rule)
+
+    assert monitor._attr_name == f"Test Garden {name}"
+    assert monitor._attr_unique_id == f"{DOMAIN}_test_entry_test_garden_{key}"
+    # BinarySensorDeviceClass.PROBLEM has a value of 'problem'
+    assert monitor.device_class == "problem"
+    assert monitor.device_info == {"identifiers": {(DOMAIN, "test_location")}}
+    assert monitor.is_on is None
+    assert monitor.icon == icon
+
+
+def test_rules_keep_status_sensor_order():
+    """Test that the monitors are created in the rolled-up status order."""
+    assert [rule.key for rule in THRESHOLD_RULES] == [
+        "soil_moisture_status",
+        "soil_conductivity_status",
+        "temperature_status",
+        "humidity_status",
+        "monitor_battery_level_status",
+        "dli_status",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("rule", "values", "expected"),
+    [
+        # Soil moisture: low, high, water soon (min..min+5) and normal
+        (SOIL_MOISTURE_STATUS, {"soil_moisture_mirror": 25.0}, (True, "low")),
+        (SOIL_MOISTURE_STATUS, {"soil_moisture_mirror": 75.0}, (True, "high")),
+        (SOIL_MOISTURE_STATUS, {"soil_moisture_mirror": 32.0}, (True, "water_soon")),
+        (SOIL_MOISTURE_STATUS, {"soil_moisture_mirror": 30.0}, (True, "water_soon")),
+        (SOIL_MOISTURE_STATUS, {"soil_moisture_mirror": 35.0}, (True, "water_soon")),
+        (SOIL_MOISTURE_STATUS, {"soil_moisture_mirror": 35.1}, (False, NORMAL)),
+        (SOIL_MOISTURE_STATUS, {"soil_moisture_mirror": 70.0}, (False, NORMAL)),
+        (SOIL_MOISTURE_STATUS, {"soil_moisture_mirror": 50.0}, (False, NORMAL)),
+        (SOIL_MOISTURE_STATUS, {"soil_moisture_mirror": None}, (None, NORMAL)),
+        (SOIL_MOISTURE_STATUS, {"min_soil_moisture": None}, (None, NORMAL)),
+        (SOIL_MOISTURE_STATUS, {"max_soil_moisture": None}, (None, NORMAL)),
+        # Soil conductivity
+        (SOIL_CONDUCTIVITY_STATUS, {"soil_conductivity_mirror": 400.0}, (True, "low")),
+        (
+            SOIL_CONDUCTIVITY_STATUS,
+            {"soil_conductivity_mirror": 2500.0},
+            (True, "high"),
+        ),
+        (
+            SOIL_CONDUCTIVITY_STATUS,
+            {"soil_conductivity_mirror": 500.0},
+            (False, NORMAL),
+        ),
+        (
+            SOIL_CONDUCTIVITY_STATUS,
+            {"soil_conductivity_mirror": 2000.0},
+            (False, NORMAL),
+        ),
+        (SOIL_CONDUCTIVITY_STATUS, {"min_soil_conductivity": None}, (None, NORMAL)),
+        (SOIL_CONDUCTIVITY_STATUS, {"max_soil_conductivity": None}, (None, NORMAL)),
+        # Temperature: more than two weekly hours above/below the limits
+        (
+            TEMPERATURE_STATUS,
+            {"temperature_above_threshold_weekly_duration": 3.0},
+            (True, "above"),
+        ),
+        (
+            TEMPERATURE_STATUS,
+            {"temperature_below_threshold_weekly_duration": 3.0},
+            (True, "below"),
+        ),
+        (
+            TEMPERATURE_STATUS,
+            {"temperature_above_threshold_weekly_duration": 2.0},
+            (False, NORMAL),
+        ),
+        (
+            TEMPERATURE_STATUS,
+            {
+                "temperature_above_threshold_weekly_duration": 3.0,
+                "temperature_below_threshold_weekly_duration": 4.0,
+            },
+            (True, "above"),
+        ),
+        (
+            TEMPERATURE_STATUS,
+            {"temperature_below_threshold_weekly_duration": 2.0},
+            (False, NORMAL),
+        ),
+        (
+            TEMPERATURE_STATUS,
+            {"temperature_below_threshold_weekly_duration": None},
+            (None, NORMAL),
+        ),
+        # Humidity
+        (
+            HUMIDITY_STATUS,
+            {"humidity_above_threshold_weekly_duration": 2.5},
+            (True, "above"),
+        ),
+        (
+            HUMIDITY_STATUS,
+            {"humidity_below_threshold_weekly_duration": 2.5},
+            (True, "below"),
+        ),
+        (
+            HUMIDITY_STATUS,
+            {"humidity_above_threshold_weekly_duration": 2.0},
+            (False, NORMAL),
+        ),
+        (
+            HUMIDITY_STATUS,
+            {"humidity_below_threshold_weekly_duration": 2.0},
+            (False, NORMAL),
+        ),
+        (
+            HUMIDITY_STATUS,
+            {
+                "humidity_above_threshold_weekly_duration": 2.5,
+                "humidity_below_threshold_weekly_duration": 5.0,
+            },
+            (True, "above"),
+        ),
+        (
+            HUMIDITY_STATUS,
+            {"humidity_above_threshold_weekly_duration": None},
+            (None, NORMAL),
+        ),
+        # Battery: low below 10%
+        (BATTERY_LEVEL_STATUS, {"monitor_battery_level": 5.0}, (True, "low")),
+        (BATTERY_LEVEL_STATUS, {"monitor_battery_level": 9.0}, (True, "low")),
+        (BATTERY_LEVEL_STATUS, {"monitor_battery_level": 9.99}, (True, "low")),
+        (BATTERY_LEVEL_STATUS, {"monitor_battery_level": 0.01}, (True, "low")),
+        (BATTERY_LEVEL_STATUS, {"monitor_battery_level": 0.0}, (True, "low")),
+        (BATTERY_LEVEL_STATUS, {"monitor_battery_level": -5.0}, (True, "low")),
+        (BATTERY_LEVEL_STATUS, {"monitor_battery_level": 10.0}, (False, NORMAL)),
+        (BATTERY_LEVEL_STATUS, {"monitor_battery_level": 10.1}, (False, NORMAL)),
+        (BATTERY_LEVEL_STATUS, {"monitor_battery_level": 100.0}, (False, NORMAL)),
+        (BATTERY_LEVEL_STATUS, {"monitor_battery_level": 150.0}, (False, NORMAL)),
+        (BATTERY_LEVEL_STATUS, {"monitor_battery_level": None}, (None, NORMAL)),
+        # Daily light integral
+        (DLI_STATUS, {"daily_light_integral_weekly_average": 30.0}, (True, "above")),
+        (DLI_STATUS, {"daily_light_integral_weekly_average": 5.0}, (True, "below")),
+        (DLI_STATUS, {"daily_light_integral_weekly_average": 25.0}, (False, NORMAL)),
+        (DLI_STATUS, {"daily_light_integral_weekly_average": 10.0}, (False, NORMAL)),
+        (DLI_STATUS, {"min_dli": None}, (None, NORMAL)),
+        (DLI_STATUS, {"max_dli": None}, (None, NORMAL)),
+        (
+            DLI_STATUS,
+            {
+                "daily_light_integral_weekly_average": None,
+                "min_dli": None,
+                "max_dli": None,
+            },
+            (None, NORMAL),
+        ),
+    ],
+)
+def test_rule_evaluation(rule, values, expected):
+    """Test the state and status of each rule around its limits."""
+    inputs = {**MOISTURE, **CONDUCTIVITY, **TEMPERATURE, **HUMIDITY, **BATTERY, **DLI}
+
+    assert rule.evaluate({**inputs, **values}, now=NOW) == expected
+
+
+@pytest.mark.parametrize(
+    ("rule", "values", "window", "expected_when_ignoring"),
+    [
+        (
+            SOIL_MOISTURE_STATUS,
+            {"soil_moisture_mirror": 20.0},
+            "soil_moisture_ignore_until",
+            (False, NORMAL),
+        ),
+        (
+            SOIL_MOISTURE_STATUS,
+            {"soil_moisture_mirror": 80.0},
+            "soil_moisture_ignore_until",
+            (False, NORMAL),
+        ),
+        (
+            TEMPERATURE_STATUS,
+            {"temperature_above_threshold_weekly_duration": 3.0},
+            "temperature_high_threshold_ignore_until",
+            (False, NORMAL),
+        ),
+        (
+            TEMPERATURE_STATUS,
+            {"temperature_below_threshold_weekly_duration": 3.0},
+            "temperature_low_threshold_ignore_until",
+            (False, NORMAL),
+        ),
+        (
+            HUMIDITY_STATUS,
+            {"humidity_above_threshold_weekly_duration": 3.0},
+            "humidity_high_threshold_ignore_until",
+            (False, NORMAL),
+        ),
+        (
+            HUMIDITY_STATUS,
+            {"humidity_below_threshold_weekly_duration": 3.0},
+            "humidity_ignore_until",
+            (False, NORMAL),
+        ),
+        (
+            BATTERY_LEVEL_STATUS,
+            {"monitor_battery_level": 5.0},
+            "monitor_battery_low_threshold_ignore_until",
+            (False, NORMAL),
+        ),
+        (
+            DLI_STATUS,
+            {"daily_light_integral_weekly_average": 30.0},
+            "daily_light_integral_high_threshold_ignore_until",
+            (False, NORMAL),
+        ),
+        (
+            DLI_STATUS,
+            {"daily_light_integral_weekly_average": 5.0},
+            "daily_light_integral_low_threshold_ignore_until",
+            (False, NORMAL),
+        ),
+        # A window only covers its own condition
+        (
+            TEMPERATURE_STATUS,
+            {"temperature_below_threshold_weekly_duration": 3.0},
+            "temperature_high_threshold_ignore_until",
+            (True, "below"),
+        ),
+        (
+            HUMIDITY_STATUS,
+            {"humidity_above_threshold_weekly_duration": 3.0},
+            "humidity_ignore_until",
+            (True, "above"),
+        ),
+        (
+            DLI_STATUS,
+            {"daily_light_integral_weekly_average": 30.0},
+            "daily_light_integral_low_threshold_ignore_until",
+            (True, "above"),
+        ),
+    ],
+)
+def test_ignore_until_windows(rule, values, window, expected_when_ignoring):
+    """Test that future ignore-until windows suppress problems, past ones don't."""
+    inputs = {**MOISTURE, **TEMPERATURE, **HUMIDITY, **BATTERY, **DLI, **values}
+    problem = rule.evaluate(inputs, now=NOW)
+    assert problem[0] is True
+
+    assert rule.evaluate({**inputs, window: FUTURE}, now=NOW) == expected_when_ignoring
+    assert rule.evaluate({**inputs, window: PAST}, now=NOW) == problem
+    assert rule.evaluate({**inputs, window: None}, now=NOW) == problem
+
+
+@pytest.mark.parametrize(
+    ("rule", "values"),
+    [
+        (SOIL_MOISTURE_STATUS, {**MOISTURE, "soil_moisture_mirror": 80.0}),
+        (
+            SOIL_CONDUCTIVITY_STATUS,
+            {**CONDUCTIVITY, "soil_conductivity_mirror": 2500.0},
+        ),
+    ],
+)
+def test_high_readings_suppressed_after_watering(rule, values):
+    """Test that high readings within 24 hours of watering are expected."""
+    recent = NOW - timedelta(hours=2)
+    old = NOW - timedelta(hours=25)
+
+    assert rule.evaluate({**values, WATERED_ROLE: recent}, now=NOW) == (False, NORMAL)
+    assert rule.evaluate({**values, WATERED_ROLE: old}, now=NOW) == (True, "high")
+    assert rule.evaluate(values, now=NOW) == (True, "high")
+
+
+def test_low_readings_not_suppressed_after_watering():
+    """Test that watering only suppresses the high condition."""
+    values = {**MOISTURE, "soil_moisture_mirror": 20.0, WATERED_ROLE: NOW}
+
+    assert SOIL_MOISTURE_STATUS.evaluate(values, now=NOW) == (True, "low")
+
+
+@pytest.mark.parametrize(
+    ("rule", "values"),
+    [
+        (SOIL_MOISTURE_STATUS, {**MOISTURE, "soil_moisture_mirror": "80"}),
+        (
+            SOIL_CONDUCTIVITY_STATUS,
+            {**CONDUCTIVITY, "soil_conductivity_mirror": "2500"},
+        ),
+    ],
+)
+def test_watered_input_suppresses_high_readings(location, rule, values):
+    """Test that the location's watered timestamp suppresses high readings."""
+    location.set(**values, **{WATERED_ROLE: STATE_UNKNOWN})
+    monitor = location.monitor(rule)
+    location.attach(monitor)
+    assert (monitor.is_on, monitor.status) == (True, "high")
+
+    location.fire(WATERED_ROLE, NOW - timedelta(hours=2))
+    assert (monitor.is_on, monitor.status) == (False, NORMAL)
+
+    location.fire(WATERED_ROLE, STATE_UNAVAILABLE)
+    assert (monitor.is_on, monitor.status) == (True, "high")
+
+    location.fire(WATERED_ROLE, NOW - timedelta(hours=25))
+    assert (monitor.is_on, monitor.status) == (True, "high")
+
+
+@pytest.mark.parametrize(
+    ("rule", "status", "icon"),
+    [
+        (SOIL_MOISTURE_STATUS, "low", "mdi:water-minus"),
+        (SOIL_MOISTURE_STATUS, "high", "mdi:water-plus"),
+        (SOIL_MOISTURE_STATUS, "water_soon", "mdi:watering-can"),
+        (SOIL_CONDUCTIVITY_STATUS, "low", "mdi:flash-off"),
+        (SOIL_CONDUCTIVITY_STATUS, "high", "mdi:flash-alert"),
+        (TEMPERATURE_STATUS, "above", "mdi:thermometer-high"),
+        (TEMPERATURE_STATUS, "below", "mdi:thermometer-low"),
+        (HUMIDITY_STATUS, "above", "mdi:water-percent"),
+        (HUMIDITY_STATUS, "below", "mdi:water-percent-alert"),
+        (BATTERY_LEVEL_STATUS, "low", "mdi:battery-alert"),
+        (DLI_STATUS, "above", "mdi:white-balance-sunny"),
+        (DLI_STATUS, "below", "mdi:sun-compass"),
+    ],
+)
+def test_problem_icons(location, rule, status, icon):
+    """Test the icon of each problem status."""
+    monitor = location.monitor(rule)
+    monitor._state = True
+    monitor._status = status
+
+    assert monitor.icon == icon
+
+
+def test_soil_moisture_attributes(location):
+    """Test the soil moisture monitor attributes while low."""
+    location.set(**{**MOISTURE, "soil_moisture_mirror": "25"})
+    monitor = location.monitor(SOIL_MOISTURE_STATUS, "sensor.test_moisture")
+    location.attach(monitor)
+
+    assert monitor.is_on is True
+    assert monitor.extra_state_attributes == {
+        "type": "Critical",
+        "message": "Soil Moisture Low",
+        "task": True,
+        "tags": ["test_garden", "zone_a"],
+        "moisture_status": "low",
+        "current_soil_moisture": 25.0,
+        "minimum_soil_moisture_threshold": 30.0,
+        "maximum_soil_moisture_threshold": 70.0,
+        "source_entity": "sensor.test_moisture",
+        "water_soon_threshold": 35.0,
+    }
+
+
+@pytest.mark.parametrize(
+    ("moisture", "alert_type", "message"),
+    [
+        ("25", "Critical", "Soil Moisture Low"),
+        ("75", "Critical", "Soil Moisture High"),
+        ("32", "Warning", "Soil Moisture Water_soon"),
+        ("50", "Critical", "Soil Moisture Normal"),
+    ],
+)
+def test_soil_moisture_alert_types(location, moisture, alert_type, message):
+    """Test that water soon is a warning and the other statuses critical."""
+    location.set(**{**MOISTURE, "soil_moisture_mirror": moisture})
+    monitor = location.monitor(SOIL_MOISTURE_STATUS)
+    location.attach(monitor)
+
+    attrs = monitor.extra_state_attributes
+    assert attrs["type"] == alert_type
+    assert attrs["message"] == message
+    assert attrs["task"] is True
+
+
+@pytest.mark.parametrize(
+    ("level", "state", "icon", "alert"),
+    [
+        ("5", True, "mdi:battery-alert", ("Critical", "Battery level low (< 10%)")),
+        ("80", False, "mdi:battery", ("Normal", "Battery level normal")),
+    ],
+)
+def test_battery_attributes(location, level, state, icon, alert):
+    """Test the battery monitor's alert attributes."""
+    alert_type, message = alert
+    location.set(monitor_battery_level=level)
+    monitor = location.monitor(BATTERY_LEVEL_STATUS, "sensor.test_battery")
+    location.attach(monitor)
+
+    assert monitor.is_on is state
+    assert monitor.icon == icon
+    assert monitor.extra_state_attributes == {
+        "type": alert_type,
+        "message": message,
+        "task": state,
+        "tags": ["test_garden", "zone_a"],
+        "current_battery_level": float(level),
+        "source_entity": "sensor.test_battery",
+    }
+
+
+def test_temperature_attributes_with_ignore_windows(location):
+    """Test the duration attributes and both ignore-until windows."""
+    location.set(
+        temperature_above_threshold_weekly_duration="3.0",
+        temperature_below_threshold_weekly_duration="0.5",
+        temperature_high_threshold_ignore_until=FUTURE,
+        temperature_low_threshold_ignore_until=PAST,
+    )
+    monitor = location.monitor(TEMPERATURE_STATUS)
+    location.attach(monitor)
+
+    attrs = monitor.extra_state_attributes
+    assert monitor.is_on is False
+    assert attrs["temperature_status"] == NORMAL
+    assert attrs["message"] == "Temperature Normal"
+    assert attrs["above_threshold_hours"] == 3.0
+    assert attrs["below_threshold_hours"] == 0.5
+    assert attrs["threshold_hours"] == 2.0
+    assert attrs["high_threshold_ignore_until"] == FUTURE.isoformat()
+    assert attrs["currently_ignoring_high"] is True
+    assert attrs["low_threshold_ignore_until"] == PAST.isoformat()
+    assert attrs["currently_ignoring_low"] is False
+    assert "source_entity" not in attrs
+
+
+def test_dli_attributes(location):
+    """Test the daily light integral monitor's attributes."""
+    location.set(daily_light_integral_weekly_average="30", min_dli="10", max_dli="25")
+    monitor = location.monitor(DLI_STATUS)
+    location.attach(monitor)
+
+    attrs = monitor.extra_state_attributes
+    assert attrs["dli_status"] == "above"
+    assert attrs["message"] == "Daily Light Integral Above"
+    assert attrs["weekly_average_dli"] == 30.0
+    assert attrs["minimum_dli_threshold"] == 10.0
+    assert attrs["maximum_dli_threshold"] == 25.0
+    assert "high_threshold_ignore_until" not in attrs
+
+
+def test_attributes_cached_until_input_changes(location):
+    """Test that the attributes are only rebuilt after an input change."""
+    location.set(**MOISTURE)
+    monitor = location.monitor(SOIL_MOISTURE_STATUS)
+    location.attach(monitor)
+
+    attrs = monitor.extra_state_attributes
+    assert monitor.extra_state_attributes is attrs
+
+    location.fire("soil_moisture_mirror", "25")
+
+    assert monitor.extra_state_attributes is not attrs
+    assert monitor.extra_state_attributes["current_soil_moisture"] == 25.0
+    assert monitor.extra_state_attributes["moisture_status"] == "low"
+
+
+def test_attributes_kept_when_another_rule_input_changes(location):
+    """Test that an input only another rule reads keeps the cached attributes."""
+    location.set(**MOISTURE, **BATTERY)
+    moisture = location.monitor(SOIL_MOISTURE_STATUS)
+    battery = location.monitor(BATTERY_LEVEL_STATUS)
+    location.attach(moisture, battery)
+    attrs = moisture.extra_state_attributes
+
+    location.fire("monitor_battery_level", "5")
+
+    assert moisture.extra_state_attributes is attrs
+    assert moisture._attribute_cache.builds == 1
+
+
+def test_attributes_rebuilt_when_ignore_window_ends(location):
+    """Test that the ignoring flag is refreshed once its window has passed."""
+    window = SOIL_MOISTURE_STATUS.ignore_windows[0]
+    location.set(**MOISTURE, **{window.role: FUTURE})
+    monitor = location.monitor(SOIL_MOISTURE_STATUS)
+    location.attach(monitor)
+    assert monitor.extra_state_attributes[window.ignoring_attribute] is True
+
+    with patch(
+        "custom_components.plant_assistant.binary_sensor.dt_util.now",
+        return_value=FUTURE + timedelta(minutes=1),
+    ):
+        assert monitor.extra_state_attributes[window.ignoring_attribute] is False
+
+
+def test_missing_inputs_are_unknown(location):
+    """Test that unresolved inputs leave the monitor unknown."""
+    location.set(soil_moisture_mirror="50")
+    monitor = location.monitor(SOIL_MOISTURE_STATUS)
+    location.attach(monitor)
+
+    assert monitor.is_on is None
+    attrs = monitor.extra_state_attributes
+    assert attrs["minimum_soil_moisture_threshold"] is None
+    assert "water_soon_threshold" not in attrs
+
+
+@pytest.mark.parametrize("state", [STATE_UNAVAILABLE, STATE_UNKNOWN, "not a number"])
+@pytest.mark.parametrize(
+    ("rule", "values", "role"),
+    [
+        (SOIL_MOISTURE_STATUS, MOISTURE, "soil_moisture_mirror"),
+        (SOIL_MOISTURE_STATUS, MOISTURE, "max_soil_moisture"),
+        (SOIL_CONDUCTIVITY_STATUS, CONDUCTIVITY, "soil_conductivity_mirror"),
+        (SOIL_CONDUCTIVITY_STATUS, CONDUCTIVITY, "min_soil_conductivity"),
+        (
+            TEMPERATURE_STATUS,
+            TEMPERATURE,
+            "temperature_above_threshold_weekly_duration",
+        ),
+        (HUMIDITY_STATUS, HUMIDITY, "humidity_below_threshold_weekly_duration"),
+        (BATTERY_LEVEL_STATUS, BATTERY, "monitor_battery_level"),
+        (DLI_STATUS, DLI, "daily_light_integral_weekly_average"),
+        (DLI_STATUS, DLI, "max_dli"),
+    ],
+)
+def test_unreadable_input_makes_monitor_unknown(location, rule, values, role, state):
+    """Test that a non-numeric input state leaves the monitor unknown."""
+    location.set(**values)
+    monitor = location.monitor(rule)
+    location.attach(monitor)
+    assert monitor.is_on is False
+
+    location.fire(role, state)
+    assert (monitor.is_on, monitor.status) == (None, NORMAL)
+
+    location.fire(role, str(int(values[role])))
+    assert (monitor.is_on, monitor.status) == (False, NORMAL)
+
+
+def test_one_subscription_per_input(location):
+    """Test that the monitors of a location share one subscription per input."""
+    location.set(**MOISTURE, **TEMPERATURE, soil_moisture_ignore_until=FUTURE)
+    moisture = location.monitor(SOIL_MOISTURE_STATUS)
+    temperature = location.monitor(TEMPERATURE_STATUS)
+    location.attach(moisture, temperature)
+
+    tracked = set(location.listeners)
+    assert location.track.call_count == len(tracked)
+    assert tracked == {
+        _entity_id(role)
+        for role in (*MOISTURE, *TEMPERATURE, "soil_moisture_ignore_until")
+    }
+    assert location.evaluator.entity_id("min_soil_moisture") == _entity_id(
+        "min_soil_moisture"
+    )
+
+
+def test_input_change_evaluates_only_dependent_monitors(location):
+    """Test that a change re-evaluates the monitors reading that input."""
+    location.set(**MOISTURE, **TEMPERATURE)
+    moisture = location.monitor(SOIL_MOISTURE_STATUS)
+    temperature = location.monitor(TEMPERATURE_STATUS)
+    location.attach(moisture, temperature)
+    moisture.async_write_ha_state.reset_mock()
+    temperature.async_write_ha_state.reset_mock()
+
+    location.fire("soil_moisture_mirror", "25")
+
+    assert moisture.is_on is True
+    assert moisture.status == "low"
+    moisture.async_write_ha_state.assert_called_once()
+    temperature.async_write_ha_state.assert_not_called()
+
+    location.fire("soil_moisture_mirror", "80")
+    assert moisture.status == "high"
+
+    location.fire("min_soil_moisture", None)
+    assert moisture.is_on is None
+
+    location.fire("temperature_below_threshold_weekly_duration", "4")
+    assert temperature.is_on is True
+    assert temperature.status == "below"
+
+
+def test_ignore_until_change_schedules_expiry(location):
+    """Test that a future ignore-until window registers its expiry."""
+    location.set(
+        monitor_battery_level="5", monitor_battery_low_threshold_ignore_until=PAST
+    )
+    monitor = location.monitor(BATTERY_LEVEL_STATUS)
+    location.attach(monitor)
+    assert monitor.is_on is True
+    location.scheduler.async_schedule.assert_not_called()
+
+    location.fire("monitor_battery_low_threshold_ignore_until", FUTURE)
+
+    assert monitor.is_on is False
+    key, deadline, action = location.scheduler.async_schedule.call_args.args
+    assert key is location.evaluator
+    assert deadline == FUTURE
+
+    location.fire("monitor_battery_low_threshold_ignore_until", STATE_UNAVAILABLE)
+    assert monitor.is_on is True
+
+    monitor.async_write_ha_state.reset_mock()
+    action()
+    monitor.async_write_ha_state.assert_called_once()
+
+
+@pytest.mark.parametrize("cleared", [STATE_UNAVAILABLE, STATE_UNKNOWN, None])
+@pytest.mark.parametrize(
+    ("rule", "values", "status"),
+    [
+        (SOIL_MOISTURE_STATUS, {**MOISTURE, "soil_moisture_mirror": 20.0}, "low"),
+        (
+            TEMPERATURE_STATUS,
+            {**TEMPERATURE, "temperature_above_threshold_weekly_duration": 3.0},
+            "above",
+        ),
+        (
+            TEMPERATURE_STATUS,
+            {**TEMPERATURE, "temperature_below_threshold_weekly_duration": 3.0},
+            "below",
+        ),
+        (
+            HUMIDITY_STATUS,
+            {**HUMIDITY, "humidity_above_threshold_weekly_duration": 3.0},
+            "above",
+        ),
+        (
+            HUMIDITY_STATUS,
+            {**HUMIDITY, "humidity_below_threshold_weekly_duration": 3.0},
+            "below",
+        ),
+        (BATTERY_LEVEL_STATUS, {"monitor_battery_level": 5.0}, "low"),
+        (DLI_STATUS, {**DLI, "daily_light_integral_weekly_average": 30.0}, "above"),
+        (DLI_STATUS, {**DLI, "daily_light_integral_weekly_average": 5.0}, "below"),
+    ],
+)
+def test_ignore_until_input_changes(location, rule, values, status, cleared):
+    """Test setting, expiring and clearing an ignore-until entity."""
+    condition = rule.condition(status)
+    window = condition.ignore or rule.ignore
+    location.set(**values, **{window.role: PAST})
+    monitor = location.monitor(rule)
+    location.attach(monitor)
+
+    attrs = monitor.extra_state_attributes
+    assert (monitor.is_on, monitor.status) == (True, status)
+    assert attrs[window.attribute] == PAST.isoformat()
+    assert attrs[window.ignoring_attribute] is False
+
+    location.fire(window.role, FUTURE)
+
+    attrs = monitor.extra_state_attributes
+    assert (monitor.is_on, monitor.status) == (False, NORMAL)
+    assert attrs[window.attribute] == FUTURE.isoformat()
+    assert attrs[window.ignoring_attribute] is True
+
+    location.fire(window.role, cleared)
+
+    attrs = monitor.extra_state_attributes
+    assert (monitor.is_on, monitor.status) == (True, status)
+    assert window.attribute not in attrs
+    assert window.ignoring_attribute not in attrs
+
+
+def test_watering_lookup_skipped_for_esphome_zones(mock_hass):
+    """Test that ESPHome zones don't track the watered timestamp."""
+    fake = FakeLocation(mock_hass, has_esphome_device=True)
+    fake.set(**MOISTURE, **{WATERED_ROLE: NOW})
+    with (
+        patch(f"{MODULE}.async_find_location_entity", side_effect=fake.find),
+        patch(f"{MULTIPLEXER_MODULE}.async_track_state_change_event", fake.track),
+    ):
+        monitor = fake.monitor(SOIL_MOISTURE_STATUS)
+        fake.attach(monitor)
+
+    assert _entity_id("soil_moisture_mirror") in fake.listeners
+    assert _entity_id(WATERED_ROLE) not in fake.listeners
+
+
+def test_detach_unsubscribes_after_last_monitor(location):
+    """Test that the subscription ends when the last monitor is removed."""
+    location.set(**MOISTURE, **BATTERY)
+    moisture = location.monitor(SOIL_MOISTURE_STATUS)
+    battery = location.monitor(BATTERY_LEVEL_STATUS)
+    location.attach(moisture, battery)
+
+    location.evaluator.async_detach(moisture)
+    for unsubscribe in location.unsubscribes.values():
+        unsubscribe.assert_not_called()
+    location.fire("soil_moisture_mirror", "10")
+    moisture.async_write_ha_state.assert_called_once()
+
+    location.evaluator.async_detach(battery)
+    for unsubscribe in location.unsubscribes.values():
+        unsubscribe.assert_called_once()
+    assert not location.evaluator.subscribed
+
+
+def test_unload_releases_removed_location(location):
+    """Test that removing the location unsubscribes and forgets the inputs."""
+    location.set(**MOISTURE)
+    monitor = location.monitor(SOIL_MOISTURE_STATUS)
+    location.attach(monitor)
+
+    async_get_reconfigure_manager(location.hass)._async_forget_subentry(
+        location.evaluator.subentry_id
+    )
+
+    for unsubscribe in location.unsubscribes.values():
+        unsubscribe.assert_called_once()
+    assert not location.evaluator.subscribed
+    assert not location.evaluator.values
+    assert location.evaluator.entity_id("soil_moisture_mirror") is None
+
+
+@pytest.mark.parametrize(
+    ("states", "available"),
+    [
+        ({"sensor.source": "50"}, True),
+        ({}, False),
+    ],
+)
+def test_available_follows_source(location, states, available):
+    """Test that a monitor is available while its source entity exists."""
+    location.states.update(states)
+    monitor = location.monitor(SOIL_MOISTURE_STATUS)
+
+    assert monitor.available is available
+
+
+def test_dli_monitor_always_available(location):
+    """Test that the monitor of derived sensors is always available."""
+    assert location.monitor(DLI_STATUS).available is True
+
+
+@pytest.mark.parametrize(
+    ("last_state", "attributes", "expected"),
+    [
+        ("on", {"moisture_status": "low"}, (True, "low")),
+        ("off", {"moisture_status": NORMAL}, (False, NORMAL)),
+        ("on", {}, (True, NORMAL)),
+        (STATE_UNAVAILABLE, {"moisture_status": "low"}, (None, NORMAL)),
+        (None, {}, (None, NORMAL)),
+    ],
+)
+async def test_restore_previous_state(location, last_state, attributes, expected):
+    """Test restoring the state and status after a restart."""
+    monitor = location.monitor(SOIL_MOISTURE_STATUS)
+    restored = None
+    if last_state is not None:
+        restored = MagicMock()
+        restored.state = last_state
+        restored.attributes = attributes
+    monitor.async_get_last_state = AsyncMock(return_value=restored)
+
+    await monitor._restore_previous_state()
+
+    assert (monitor.is_on, monitor.status) == expected
+
+
+@pytest.mark.parametrize(
+    ("rule", "last_state", "attributes", "expected"),
+    [
+        (
+            SOIL_CONDUCTIVITY_STATUS,
+            "on",
+            {"conductivity_status": "high"},
+            (True, "high"),
+        ),
+        (
+            TEMPERATURE_STATUS,
+            "on",
+            {"temperature_status": "below"},
+            (True, "below"),
+        ),
+        (HUMIDITY_STATUS, "on", {"humidity_status": "above"}, (True, "above")),
+        (HUMIDITY_STATUS, "off", {"humidity_status": NORMAL}, (False, NORMAL)),
+        (BATTERY_LEVEL_STATUS, "on", {}, (True, NORMAL)),
+        (BATTERY_LEVEL_STATUS, "off", {}, (False, NORMAL)),
+        (BATTERY_LEVEL_STATUS, STATE_UNKNOWN, {}, (None, NORMAL)),
+        (DLI_STATUS, "on", {"dli_status": "below"}, (True, "below")),
+    ],
+)
+async def test_restore_previous_state_per_rule(
+    location, rule, last_state, attributes, expected
+):
+    """Test that each monitor restores its state and its own status attribute."""
+    monitor = location.monitor(rule)
+    restored = MagicMock()
+    restored.state = last_state
+    restored.attributes = attributes
+    monitor.async_get_last_state = AsyncMock(return_value=restored)
+
+    await monitor._restore_previous_state()
+
+    assert (monitor.is_on, monitor.status) == expected
+
+
+async def test_added_to_hass_attaches_and_removal_detaches(location):
+    """Test the monitor's lifecycle on the shared evaluator."""
+    location.set(**{**MOISTURE, "soil_moisture_mirror": "25"})
+    monitor = location.monitor(SOIL_MOISTURE_STATUS)
+    monitor.async_get_last_state = AsyncMock(return_value=None)
+
+    await monitor.async_added_to_hass()
+
+    assert monitor.is_on is True
+    monitor.async_write_ha_state.assert_called_once()
+    assert set(location.listeners) == {_entity_id(role) for role in MOISTURE}
+
+    for remove in monitor._on_remove:
+        remove()
+    for unsubscribe in location.unsubscribes.values():
+        unsubscribe.assert_called_once()
+
+
+async def test_create_threshold_monitors_skips_missing_sources(location):
+    """Test that monitors are only created for sources the location has."""
+    location.set(soil_moisture_mirror="50", monitor_battery_level="80")
+
+    with patch(
+        "custom_components.plant_assistant.binary_sensor.async_find_location_entity",
+        side_effect=location.find,
+    ):
+        monitors = await _create_threshold_monitors(
+            location.evaluator, "Zone A", "test_location"
+        )
+
+    assert [monitor.rule for monitor in monitors] == [
+        SOIL_MOISTURE_STATUS,
+        BATTERY_LEVEL_STATUS,
+        DLI_STATUS,
+    ]
+    assert monitors[0].source_entity_id == _entity_id("soil_moisture_mirror")
+    assert monitors[-1].source_entity_id is None
@@ -0,0 +1,137 @@
+"""Tests for the columnar plant threshold store."""
+
+import math
+
+import pytest
+
+from custom_components.plant_assistant import aggregation, dli
+from custom_components.plant_assistant.const import AGGREGATED_SENSOR_MAPPINGS
+from custom_components.plant_assistant.threshold_store import (
+    PlantThresholdStore,
+    aggregate_locations,
+    compile_metric_specs,
+    threshold_float,
+)
+
+KEYS = ("minimum_light", "maximum_light", "minimum_temperature")
+
+PLANTS = {
+    "sensor.p1": {"minimum_light": 1000, "maximum_light": "30000"},
+    "sensor.p2": {"minimum_light": "2500", "maximum_light": 20000},
+    "sensor.p3": {"minimum_light": None, "maximum_light": "not-a-number"},
+    "sensor.p4": {"minimum_light": float("nan"), "maximum_light": float("inf")},
+    "sensor.p5": {"minimum_light": -5, "maximum_light": 50000},
+}
+
+
+@pytest.fixture
+def store():
+    """Create a store holding the sample plants."""
+    store = PlantThresholdStore(KEYS)
+    for entity_id, attributes in PLANTS.items():
+        store.set_row(entity_id, attributes)
+    return store
+
+
+def test_threshold_float():
+    """Test that unusable values become NaN."""
+    assert threshold_float("12.5") == 12.5
+    for value in (None, "abc", [], float("inf"), float("nan")):
+        assert math.isnan(threshold_float(value))
+
+
+def test_matches_list_of_dicts_helpers(store):
+    """Test that the store agrees with the aggregation and dli helpers."""
+    plants = list(PLANTS.values())
+
+    assert store.aggregate("max", "minimum_light") == aggregation.max_of_mins(
+        plants, "minimum_light"
+    )
+    assert store.aggregate("min", "maximum_light") == aggregation.min_of_maxs(
+        plants, "maximum_light"
+    )
+    assert store.aggregate("avg", "minimum_light") == aggregation.avg_metric(
+        plants, "minimum_light"
+    )
+    assert store.aggregate(
+        "max", "minimum_light", convert_to_dli=True
+    ) == dli.max_of_mins_dli(plants, "minimum_light")
+    assert store.aggregate(
+        "min", "maximum_light", convert_to_dli=True
+    ) == dli.min_of_maxs_dli(plants, "maximum_light")
+
+
+def test_empty_column_aggregates_to_none(store):
+    """Test that a column without usable values aggregates to None."""
+    assert store.aggregate("max", "minimum_temperature") is None
+    assert store.aggregate("avg", "minimum_temperature") is None
+    assert store.aggregate("max", "unknown_key") is None
+
+
+def test_set_row_reports_changes(store):
+    """Test that only real value changes are reported."""
+    assert not store.set_row("sensor.p1", dict(PLANTS["sensor.p1"]))
+    # Missing values stay missing even though NaN != NaN
+    assert not store.set_row("sensor.p3", {"maximum_light": "still-not-a-number"})
+    assert store.set_row("sensor.p1", {"minimum_light": 4000})
+
+    assert store.aggregate("max", "minimum_light") == 4000
+    assert store.aggregate("min", "maximum_light") == 20000
+
+
+def test_discard_row_keeps_columns_dense(store):
+    """Test that removing a row moves the last row into its place."""
+    assert store.discard_row("sensor.p2")
+    assert not store.discard_row("sensor.p2")
+
+    assert len(store) == 4
+    assert "sensor.p5" in store
+    assert len(store.column("minimum_light")) == 4
+    assert store.aggregate("max", "minimum_light") == 1000
+    assert store.set_row("sensor.p5", {"minimum_light": 3000})
+    assert store.aggregate("max", "minimum_light") == 3000
+
+
+def test_rows_skip_plants_without_values(store):
+    """Test that rows only include stored values."""
+    assert store.rows() == [
+        {"minimum_light": 1000.0, "maximum_light": 30000.0},
+        {"minimum_light": 2500.0, "maximum_light": 20000.0},
+        {"minimum_light": -5.0, "maximum_light": 50000.0},
+    ]
+
+
+def test_aggregate_metrics_covers_every_config(store):
+    """Test that every configured metric gets a value in one pass."""
+    configs = {
+        "min_light": AGGREGATED_SENSOR_MAPPINGS["min_light"],
+        "max_dli": AGGREGATED_SENSOR_MAPPINGS["max_dli"],
+        "broken": {"aggregation_type": "median", "plant_attr_min": "minimum_light"},
+    }
+
+    results = store.aggregate_metrics(configs)
+
+    assert results == {
+        "min_light": 2500.0,
+        "max_dli": dli.lux_to_dli(20000.0),
+        "broken": None,
+    }
+    assert [spec.metric_key for spec in compile_metric_specs(configs)] == [
+        "min_light",
+        "max_dli",
+    ]
+
+
+def test_aggregate_locations(store):
+    """Test that the batch mode computes every location's metrics."""
+    other = PlantThresholdStore(KEYS)
+    other.set_row("sensor.other", {"minimum_temperature": 8})
+
+    results = aggregate_locations(
+        {"bed": store, "pot": other}, AGGREGATED_SENSOR_MAPPINGS
+    )
+
+    assert results["bed"]["min_light"] == 2500.0
+    assert results["pot"]["min_temperature"] == 8.0
+    assert results["pot"]["min_light"] is None
+    assert set(results["pot"]) == set(AGGREGATED_SENSOR_MAPPINGS)
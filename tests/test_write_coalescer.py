@@ -0,0 +1,134 @@
+"""Tests for coalesced entity state writes."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from custom_components.plant_assistant.const import DOMAIN, WRITE_COALESCER_KEY
+from custom_components.plant_assistant.write_coalescer import (
+    CoalescedWriteMixin,
+    StateWriteCoalescer,
+    async_get_write_coalescer,
+    async_unload_write_coalescer,
+)
+
+
+@pytest.fixture
+def mock_hass():
+    """Create a mock Home Assistant instance."""
+    hass = MagicMock()
+    hass.data = {}
+    return hass
+
+
+class _Base:
+    """Stand-in for Entity that records state writes."""
+
+    def __init__(self, hass):
+        self.hass = hass
+        self.writes = 0
+        self.async_on_remove = MagicMock()
+
+    def async_write_ha_state(self):
+        self.writes += 1
+
+
+class _Entity(CoalescedWriteMixin, _Base):
+    """Entity using the write coalescer."""
+
+
+class TestStateWriteCoalescer:
+    """Test merging writes within one flush."""
+
+    def test_burst_writes_once_per_flush(self, mock_hass):
+        """Test that repeated writes in one tick are merged."""
+        first = _Entity(mock_hass)
+        second = _Entity(mock_hass)
+
+        for _ in range(3):
+            first.async_write_ha_state()
+        second.async_write_ha_state()
+
+        coalescer = mock_hass.data[DOMAIN][WRITE_COALESCER_KEY]
+        assert first.writes == 0
+        mock_hass.loop.call_soon.assert_called_once_with(coalescer.async_flush)
+
+        coalescer.async_flush()
+
+        assert first.writes == 1
+        assert second.writes == 1
+        assert coalescer.as_dict() == {
+            "debounce": 0.0,
+            "pending": 0,
+            "flushes": 1,
+            "writes": 2,
+            "suppressed_writes": 2,
+        }
+
+    def test_write_after_flush_is_not_suppressed(self, mock_hass):
+        """Test that a write after a flush schedules another flush."""
+        entity = _Entity(mock_hass)
+        coalescer = async_get_write_coalescer(mock_hass)
+
+        entity.async_write_ha_state()
+        coalescer.async_flush()
+        entity.async_write_ha_state()
+        coalescer.async_flush()
+
+        assert entity.writes == 2
+        assert coalescer.suppressed_writes == 0
+        assert mock_hass.loop.call_soon.call_count == 2
+
+    def test_debounce_uses_call_later(self, mock_hass):
+        """Test that a configured debounce delays the flush."""
+        coalescer = StateWriteCoalescer(mock_hass, debounce=0.25)
+        write = MagicMock()
+
+        with patch(
+            "custom_components.plant_assistant.write_coalescer.async_call_later"
+        ) as call_later:
+            coalescer.async_mark_dirty("entity", write)
+            coalescer.async_mark_dirty("entity", write)
+
+        call_later.assert_called_once_with(
+            mock_hass, 0.25, coalescer._async_flush_later
+        )
+        coalescer._async_flush_later(None)
+        write.assert_called_once()
+
+    def test_failing_write_does_not_block_others(self, mock_hass):
+        """Test that one failing write does not stop the flush."""
+        coalescer = StateWriteCoalescer(mock_hass)
+        write = MagicMock()
+        coalescer.async_mark_dirty("failing", MagicMock(side_effect=RuntimeError))
+        coalescer.async_mark_dirty("other", write)
+
+        coalescer.async_flush()
+
+        write.assert_called_once()
+
+    def test_discard_drops_pending_write(self, mock_hass):
+        """Test that a removed entity's pending write is dropped."""
+        coalescer = StateWriteCoalescer(mock_hass)
+        write = MagicMock()
+        coalescer.async_mark_dirty("entity", write)
+
+        coalescer.async_discard("entity")
+        coalescer.async_flush()
+
+        write.assert_not_called()
+        assert coalescer.flushes == 0
+
+
+def test_unload_cancels_pending_flush(mock_hass):
+    """Test that unloading cancels the flush and drops the coalescer."""
+    handle = MagicMock()
+    mock_hass.loop.call_soon.return_value = handle
+    entity = _Entity(mock_hass)
+    entity.async_write_ha_state()
+
+    async_unload_write_coalescer(mock_hass)
+
+    handle.cancel.assert_called_once()
+    assert WRITE_COALESCER_KEY not in mock_hass.data[DOMAIN]
+    assert entity.writes == 0